@@ -0,0 +1,115 @@
+"""Benchmark biosim startup cost with ``python -X importtime``.
+
+Runs each scenario in a fresh interpreter several times and reports:
+
+- import time: the summed cumulative time of top-level imports, minus the
+  same figure for an empty interpreter (``site`` and friends);
+- the modules with the largest self time on the median run (excluding those
+  an empty interpreter imports too);
+- which heavy optional dependencies (NumPy, PyYAML, FastAPI, ...) were loaded.
+
+Scenarios: ``import biosim``, ``biosim.BioWorld`` (first use of the core),
+``python -m biosim --help`` (CLI argument parsing).
+
+Usage:
+    python benchmarks/bench_import_time.py --repeat 10
+    python benchmarks/bench_import_time.py --json --max-ms 50   # exits 1 above the budget
+
+``--max-ms`` applies to ``import biosim`` so CI can track regressions.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+SCENARIOS: Dict[str, List[str]] = {
+    "import biosim": ["-c", "import biosim"],
+    "biosim.BioWorld": ["-c", "import biosim; biosim.BioWorld"],
+    "python -m biosim --help": ["-m", "biosim", "--help"],
+}
+HEAVY = ("numpy", "yaml", "fastapi", "starlette", "uvicorn", "orjson", "onnxruntime")
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def run_once(args: List[str]) -> Tuple[float, List[Tuple[int, str]], List[str]]:
+    """Return (total top-level import microseconds, [(self_us, module)], heavy modules loaded)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    selfs: List[Tuple[int, str]] = []
+    loaded = set()
+    for line in proc.stderr.splitlines():
+        m = _LINE.match(line)
+        if not m:
+            continue
+        self_us, cumulative_us, indent, name = int(m.group(1)), int(m.group(2)), m.group(3), m.group(4)
+        if len(indent) == 1:  # top-level import (depth 0 is printed with one space)
+            total += cumulative_us
+        selfs.append((self_us, name))
+        root = name.split(".")[0]
+        if root in HEAVY:
+            loaded.add(root)
+    return float(total), selfs, sorted(loaded)
+
+
+def measure(args: List[str], repeat: int, exclude: Set[str] = frozenset()) -> Dict[str, object]:
+    runs = [run_once(args) for _ in range(repeat)]
+    totals = [r[0] for r in runs]
+    median_run = sorted(runs, key=lambda r: r[0])[len(runs) // 2]
+    return {
+        "median_us": statistics.median(totals),
+        "min_us": min(totals),
+        "top": sorted((entry for entry in median_run[1] if entry[1] not in exclude), reverse=True)[:8],
+        "heavy": median_run[2],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if `import biosim` exceeds this")
+    args = parser.parse_args()
+
+    baseline = measure(["-c", "pass"], args.repeat)["median_us"]
+    startup = {module for _, module in run_once(["-c", "pass"])[1]}
+    results: Dict[str, Dict[str, object]] = {}
+    for name, argv in SCENARIOS.items():
+        result = measure(argv, args.repeat, startup)
+        result["net_ms"] = max(0.0, (result["median_us"] - baseline) / 1000.0)  # type: ignore[operator]
+        results[name] = result
+
+    if args.json:
+        print(json.dumps({"baseline_ms": baseline / 1000.0, "scenarios": results}, indent=2))
+    else:
+        print(f"interpreter baseline: {baseline / 1000.0:.1f} ms (subtracted)")
+        for name, result in results.items():
+            print(f"\n{name}: {result['net_ms']:.1f} ms (min {result['min_us'] / 1000.0:.1f} ms raw)")
+            print(f"  heavy modules: {', '.join(result['heavy']) or 'none'}")  # type: ignore[arg-type]
+            for self_us, module in result["top"]:  # type: ignore[union-attr]
+                print(f"  {self_us / 1000.0:7.2f} ms  {module}")
+
+    if args.max_ms is not None and results["import biosim"]["net_ms"] > args.max_ms:  # type: ignore[operator]
+        print(f"\n`import biosim` exceeds {args.max_ms} ms budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""Benchmark SimUI SSE fan-out with many concurrent clients.
+
+Starts an Interface on a local uvicorn server, connects N streaming clients to
+``/api/stream`` and reports:
+
+- idle CPU: process CPU time per second while clients are connected and the
+  simulation is not running (polling loops show up here);
+- delivery latency: time from the publisher broadcasting a tick to each client
+  receiving it (p50/p95/max);
+- CPU per second while a run is streaming.
+
+Usage:
+    python benchmarks/bench_sse_clients.py --clients 200 --duration 5
+
+Requires the UI extras plus httpx (``pip install 'biosim[ui]' httpx``).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+import biosim  # noqa: E402
+from biosim.simui import Interface  # noqa: E402
+
+
+class Ticker(biosim.BioModule):
+    def __init__(self, sleep: float) -> None:
+        self.min_dt = 0.01
+        self._sleep = sleep
+        self._points: List[List[float]] = []
+
+    def advance_to(self, t: float) -> None:
+        self._points.append([t, len(self._points)])
+        if self._sleep:
+            time.sleep(self._sleep)
+
+    def get_outputs(self):
+        return {}
+
+    def visualize(self):
+        return {"render": "timeseries", "data": {"series": [{"name": "n", "points": self._points[-200:]}]}}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _client(url: str, published: Dict[int, float], latencies: List[float], ready: asyncio.Event, counter: List[int]) -> None:
+    async with httpx.AsyncClient(timeout=None) as client:
+        async with client.stream("GET", url) as response:
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                received = time.perf_counter()
+                msg = json.loads(line[6:])
+                if msg.get("type") == "snapshot":
+                    counter[0] += 1
+                    if counter[0] >= counter[1]:
+                        ready.set()
+                elif msg.get("type") == "tick":
+                    sent = published.get(int(msg["data"]["event"]["id"]))
+                    if sent is not None:
+                        latencies.append(received - sent)
+
+
+def _pct(values: List[float], q: float) -> float:
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    world = biosim.BioWorld()
+    world.add_biomodule("ticker", Ticker(sleep=args.step_sleep))
+    ui = Interface(world, publish_fps=args.fps)
+
+    published: Dict[int, float] = {}
+    original = ui._broadcast_tick
+
+    def timed_broadcast(record):
+        published[int(record["id"])] = time.perf_counter()
+        original(record)
+
+    ui._broadcast_tick = timed_broadcast  # type: ignore[method-assign]
+
+    app = FastAPI()
+    ui.mount(app, "/ui")
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    url = f"http://127.0.0.1:{port}/ui/api/stream"
+    latencies: List[float] = []
+    ready = asyncio.Event()
+    counter = [0, args.clients]
+    tasks = [asyncio.create_task(_client(url, published, latencies, ready, counter)) for _ in range(args.clients)]
+    await asyncio.wait_for(ready.wait(), timeout=60)
+
+    # Idle window: clients connected, nothing running.
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    await asyncio.sleep(args.idle)
+    idle_cpu = (time.process_time() - cpu0) / (time.perf_counter() - wall0)
+
+    # Streaming window.
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    ui._runner.start_run(duration=args.duration, tick_dt=0.01)
+    while ui._runner.status()["running"]:
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(0.5)  # let the last frames drain
+    run_wall = time.perf_counter() - wall0
+    run_cpu = (time.process_time() - cpu0) / run_wall
+
+    for t in tasks:
+        t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    server.should_exit = True
+    thread.join(timeout=5)
+    ui.close()
+
+    ms = [x * 1000.0 for x in latencies]
+    print(f"clients={args.clients} fps={args.fps} frames={len(published)} deliveries={len(ms)}")
+    print(f"idle cpu: {idle_cpu * 100:.1f}% of one core over {args.idle:.1f}s")
+    print(f"run cpu:  {run_cpu * 100:.1f}% of one core over {run_wall:.1f}s (client parsing included)")
+    if ms:
+        print(
+            f"latency ms: p50={statistics.median(ms):.2f} p95={_pct(ms, 0.95):.2f} max={max(ms):.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=5.0, help="simulated run duration")
+    parser.add_argument("--step-sleep", type=float, default=0.002, help="wall time per module step")
+    parser.add_argument("--idle", type=float, default=3.0, help="idle measurement window in seconds")
+    parser.add_argument("--fps", type=float, default=30.0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ import { ApiProvider, useApi } from "./app/providers";
 import { UiProvider, useUi, isJsonControl, isNumberControl } from "./app/ui";
 import type { EventRecord, RunStatus, Snapshot, TickData, UiSpec } from "./types/api";
 import type { SSEMessage, SSESubscription, SimulationApi } from "./lib/api";
+import { applyVisualsDelta, emptyVisualsState, visualsFromState } from "./lib/visualsDelta";
 import type { ChatAdapter } from "./types/chat";
 import Sidebar from "./components/Sidebar";
 import MainContent from "./components/MainContent";
@@ -46,6 +47,7 @@ function SimulationView({
   const [leftDrawerOpen, setLeftDrawerOpen] = useState(false);
   const [rightDrawerOpen, setRightDrawerOpen] = useState(false);
   const sseRef = useRef<SSESubscription | null>(null);
+  const visualsStateRef = useRef(emptyVisualsState());
   const storageKeyRef = useRef<string | null>(null);
 
   const readStoredControls = (key: string): Record<string, number | string> | null => {
@@ -118,14 +120,24 @@ function SimulationView({
         case "snapshot": {
           const snap = msg.data as Snapshot;
           if (snap?.status) actions.setStatus(snap.status);
-          if (Array.isArray(snap?.visuals)) actions.setVisuals(snap.visuals);
+          if (snap?.visuals_delta) {
+            visualsStateRef.current = applyVisualsDelta(emptyVisualsState(), snap.visuals_delta);
+            actions.setVisuals(visualsFromState(visualsStateRef.current));
+          } else if (Array.isArray(snap?.visuals)) actions.setVisuals(snap.visuals);
           if (Array.isArray(snap?.events)) actions.setEvents(snap.events);
           break;
         }
         case "tick": {
           const tick = msg.data as TickData;
           if (tick?.status) actions.setStatus(tick.status);
-          if (Array.isArray(tick?.visuals)) actions.setVisuals(tick.visuals);
+          if (tick?.visuals_delta) {
+            const delta = tick.visuals_delta;
+            // Unchanged modules are omitted, so an empty delta means nothing to re-render.
+            if (delta.keyframe || delta.removed.length > 0 || Object.keys(delta.modules).length > 0) {
+              visualsStateRef.current = applyVisualsDelta(visualsStateRef.current, delta);
+              actions.setVisuals(visualsFromState(visualsStateRef.current));
+            }
+          } else if (Array.isArray(tick?.visuals)) actions.setVisuals(tick.visuals);
           if (tick?.event) actions.appendEvent(tick.event);
           break;
         }
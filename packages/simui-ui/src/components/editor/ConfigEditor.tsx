@@ -20,7 +20,7 @@ import dagre from 'dagre'
 import ModuleNode, { type ModuleNodeData } from './ModuleNode'
 import ModulePalette from './ModulePalette'
 import PropertiesPanel from './PropertiesPanel'
-import type { Api, ConfigGraph, GraphNode, GraphEdge, ModuleRegistry, ModuleSpec } from '../../lib/api'
+import type { Api, ConfigGraph, GraphNode, GraphEdge, ModuleRegistry, ModuleSpec, WiringPattern, WiringRule } from '../../lib/api'
 
 interface ConfigEditorProps {
   api: Api
@@ -82,6 +82,7 @@ const apiGraphToFlow = (
         args: n.data.args,
         inputs: n.data.inputs.length > 0 ? n.data.inputs : (spec?.inputs || []),
         outputs: n.data.outputs.length > 0 ? n.data.outputs : (spec?.outputs || []),
+        replicas: n.data.replicas,
       } as ModuleNodeData,
     }
   })
@@ -92,6 +93,8 @@ const apiGraphToFlow = (
     sourceHandle: e.sourceHandle,
     target: e.target,
     targetHandle: e.targetHandle,
+    data: e.data,
+    label: e.data?.rule ? (e.data.rule.rule ?? 'all_to_all') : e.data?.pattern ? 'pattern' : undefined,
     type: 'smoothstep',
     animated: false,
     style: { stroke: 'var(--primary-muted)', strokeWidth: 2 },
@@ -116,6 +119,7 @@ const flowToApiGraph = (
         args: data.args,
         inputs: data.inputs,
         outputs: data.outputs,
+        ...(data.replicas ? { replicas: data.replicas } : {}),
       },
     }
   })
@@ -126,6 +130,8 @@ const flowToApiGraph = (
     sourceHandle: e.sourceHandle || '',
     target: e.target,
     targetHandle: e.targetHandle || '',
+    ...(e.data?.rule ? { data: { rule: e.data.rule as WiringRule } } : {}),
+    ...(e.data?.pattern ? { data: { pattern: e.data.pattern as WiringPattern } } : {}),
   }))
 
   return { nodes: apiNodes, edges: apiEdges, meta }
@@ -7,13 +7,14 @@ export interface ModuleNodeData {
   args: Record<string, unknown>
   inputs: string[]
   outputs: string[]
+  replicas?: number
   selected?: boolean
   [key: string]: unknown
 }
 
 const ModuleNode: React.FC<NodeProps> = ({ data, selected }) => {
   const nodeData = data as unknown as ModuleNodeData
-  const { label, moduleType, inputs, outputs } = nodeData
+  const { label, moduleType, inputs, outputs, replicas } = nodeData
 
   // Extract just the class name from the full path
   const className = moduleType.split('.').pop() || moduleType
@@ -55,6 +56,7 @@ const ModuleNode: React.FC<NodeProps> = ({ data, selected }) => {
         }}
       >
         {label}
+        {replicas ? <span style={{ marginLeft: '8px', fontWeight: 500, opacity: 0.85 }}>×{replicas}</span> : null}
       </div>
 
       {/* Class name */}
@@ -157,7 +157,7 @@ describe("createSimuiApi", () => {
     source.onerror?.(new Event("error"));
     sub.close();
 
-    expect(source.url).toBe("http://localhost:8080/api/stream");
+    expect(source.url).toBe("http://localhost:8080/api/stream?delta=1");
     expect(onMessage).toHaveBeenCalledWith({ type: "heartbeat", data: { ok: true } });
     expect(onError).toHaveBeenCalled();
     expect(errorSpy).toHaveBeenCalled();
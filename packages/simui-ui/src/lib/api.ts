@@ -1,4 +1,5 @@
 import type { EventRecord, ModuleVisuals, RunLogEntry, RunStatus, Snapshot, UiSpec } from "../types/api";
+import { decodeBinaryFrame } from "./binaryFrame";
 
 export type SSEMessage = {
   type: "snapshot" | "event" | "status" | "tick" | "heartbeat";
@@ -41,15 +42,28 @@ export interface GraphNode {
     args: Record<string, unknown>;
     inputs: string[];
     outputs: string[];
+    replicas?: number;
   };
 }
 
+export interface WiringRule {
+  rule?: 'all_to_all' | 'one_to_one' | 'random_k';
+  k?: number;
+  seed?: number | string;
+}
+
+export interface WiringPattern {
+  from: string;
+  to: string[];
+}
+
 export interface GraphEdge {
   id: string;
   source: string;
   sourceHandle: string;
   target: string;
   targetHandle: string;
+  data?: { rule?: WiringRule; pattern?: WiringPattern };
 }
 
 export interface GraphMeta {
@@ -112,6 +126,7 @@ export interface SimulationApi {
   resume: () => Promise<unknown>;
   reset: () => Promise<unknown>;
   subscribeSSE: (onMessage: (msg: SSEMessage) => void, onError?: (err: Event) => void) => SSESubscription;
+  subscribeWS?: (onMessage: (msg: SSEMessage) => void, onError?: (err: Event) => void) => SSESubscription;
   logs?: (sinceSeq?: number) => Promise<{ items: RunLogEntry[]; total: number }>;
   editor?: SimulationEditorApi;
 }
@@ -154,7 +169,8 @@ export function createSimuiApi(baseUrl: string): SimulationApi {
   }
 
   function subscribeSSE(onMessage: (msg: SSEMessage) => void, onError?: (err: Event) => void): SSESubscription {
-    const eventSource = new EventSource(`${base}/api/stream`);
+    // Ask for delta-encoded visuals; see applyVisualsDelta for the client side.
+    const eventSource = new EventSource(`${base}/api/stream?delta=1`);
     eventSource.onmessage = (event) => {
       try {
         const msg = JSON.parse(event.data) as SSEMessage;
@@ -172,6 +188,27 @@ export function createSimuiApi(baseUrl: string): SimulationApi {
     };
   }
 
+  function subscribeWS(onMessage: (msg: SSEMessage) => void, onError?: (err: Event) => void): SSESubscription {
+    // Binary channel: numeric arrays arrive as typed-array views (see binaryFrame.ts).
+    const url = new URL(`${base}/api/ws?delta=1`, window.location.href);
+    url.protocol = url.protocol === "https:" ? "wss:" : "ws:";
+    const socket = new WebSocket(url.toString());
+    socket.binaryType = "arraybuffer";
+    socket.onmessage = (event) => {
+      try {
+        onMessage(decodeBinaryFrame<SSEMessage>(event.data as ArrayBuffer));
+      } catch (error) {
+        console.error("Failed to decode WebSocket frame:", error);
+      }
+    };
+    socket.onerror = (err) => {
+      if (onError) onError(err);
+    };
+    return {
+      close: () => socket.close(),
+    };
+  }
+
   return {
     // Simulation API
     spec: () => get("/api/spec"),
@@ -192,6 +229,7 @@ export function createSimuiApi(baseUrl: string): SimulationApi {
     resume: () => post("/api/resume", {}),
     reset: () => post("/api/reset", {}),
     subscribeSSE,
+    subscribeWS,
 
     // Editor API
     editor: {
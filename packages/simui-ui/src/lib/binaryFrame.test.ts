@@ -0,0 +1,35 @@
+import { describe, expect, it } from "vitest";
+
+import { decodeBinaryFrame, isNDArray } from "./binaryFrame";
+
+function buildFrame(message: unknown, buffers: Array<{ dtype: string; shape: number[]; values: Float32Array }>): ArrayBuffer {
+  let offset = 0;
+  const specs = buffers.map((b) => {
+    const spec = { dtype: b.dtype, shape: b.shape, offset, length: b.values.length };
+    offset += Math.ceil(b.values.byteLength / 8) * 8;
+    return spec;
+  });
+  const header = new TextEncoder().encode(JSON.stringify({ message, buffers: specs }));
+  const base = Math.ceil((4 + header.length) / 8) * 8;
+  const out = new ArrayBuffer(base + offset);
+  new DataView(out).setUint32(0, header.length, true);
+  new Uint8Array(out, 4, header.length).set(header);
+  buffers.forEach((b, i) => new Float32Array(out, base + specs[i].offset, b.values.length).set(b.values));
+  return out;
+}
+
+describe("decodeBinaryFrame", () => {
+  it("replaces placeholders with typed array views", () => {
+    const frame = buildFrame(
+      { type: "tick", data: { points: { $ndarray: 0 }, label: "x" } },
+      [{ dtype: "float32", shape: [2, 2], values: new Float32Array([0, 1, 1, 2]) }],
+    );
+    const msg = decodeBinaryFrame<{ type: string; data: { points: unknown; label: string } }>(frame);
+    expect(msg.type).toBe("tick");
+    expect(msg.data.label).toBe("x");
+    expect(isNDArray(msg.data.points)).toBe(true);
+    const points = msg.data.points as { data: Float32Array; shape: number[] };
+    expect(points.shape).toEqual([2, 2]);
+    expect(Array.from(points.data)).toEqual([0, 1, 1, 2]);
+  });
+});
@@ -0,0 +1,68 @@
+/**
+ * Decoder for binary frames sent by `/api/ws` (see `biosim/simui/binary.py`).
+ *
+ * Layout: uint32 LE header length, JSON header, zero padding to an 8-byte
+ * boundary, then 8-byte aligned little-endian buffers. Arrays in the message
+ * are `{"$ndarray": i}` placeholders; they are replaced by `NDArray` views
+ * over the received buffer, so numeric payloads are never parsed.
+ */
+export type TypedArray =
+  | Float32Array
+  | Float64Array
+  | Int8Array
+  | Uint8Array
+  | Int16Array
+  | Uint16Array
+  | Int32Array
+  | Uint32Array
+  | BigInt64Array
+  | BigUint64Array;
+
+export type NDArray = { data: TypedArray; shape: number[] };
+
+type BufferSpec = { dtype: string; shape: number[]; offset: number; length: number };
+
+const CONSTRUCTORS: Record<string, new (buffer: ArrayBuffer, byteOffset: number, length: number) => TypedArray> = {
+  float32: Float32Array,
+  float64: Float64Array,
+  int8: Int8Array,
+  uint8: Uint8Array,
+  int16: Int16Array,
+  uint16: Uint16Array,
+  int32: Int32Array,
+  uint32: Uint32Array,
+  int64: BigInt64Array,
+  uint64: BigUint64Array,
+};
+
+export function isNDArray(value: unknown): value is NDArray {
+  return !!value && typeof value === "object" && ArrayBuffer.isView((value as NDArray).data) && Array.isArray((value as NDArray).shape);
+}
+
+export function decodeBinaryFrame<T = unknown>(buffer: ArrayBuffer): T {
+  const view = new DataView(buffer);
+  const headerLength = view.getUint32(0, true);
+  const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength))) as {
+    message: unknown;
+    buffers: BufferSpec[];
+  };
+  const base = 4 + headerLength + ((8 - ((4 + headerLength) % 8)) % 8);
+  const arrays: NDArray[] = header.buffers.map((spec) => {
+    const Ctor = CONSTRUCTORS[spec.dtype];
+    if (!Ctor) throw new Error(`Unsupported dtype in binary frame: ${spec.dtype}`);
+    return { data: new Ctor(buffer, base + spec.offset, spec.length), shape: spec.shape };
+  });
+  const restore = (value: unknown): unknown => {
+    if (Array.isArray(value)) return value.map(restore);
+    if (value && typeof value === "object") {
+      const obj = value as Record<string, unknown>;
+      const keys = Object.keys(obj);
+      if (keys.length === 1 && keys[0] === "$ndarray") return arrays[obj.$ndarray as number];
+      const out: Record<string, unknown> = {};
+      for (const key of keys) out[key] = restore(obj[key]);
+      return out;
+    }
+    return value;
+  };
+  return restore(header.message) as T;
+}
@@ -0,0 +1,47 @@
+import { describe, expect, it } from "vitest";
+
+import { applyVisualsDelta, emptyVisualsState, visualsFromState } from "./visualsDelta";
+
+const ts = (points: number[][]) => ({ render: "timeseries", data: { series: [{ name: "v", points }] } });
+
+describe("applyVisualsDelta", () => {
+  it("applies keyframes, appends and removals", () => {
+    let state = applyVisualsDelta(emptyVisualsState(), {
+      seq: 1,
+      keyframe: true,
+      order: ["a", "b"],
+      modules: {
+        a: { module: "A", rev: 1, visuals: [ts([[0, 1]])] },
+        b: { module: "B", rev: 2, visuals: [{ render: "bar", data: {} }] },
+      },
+      removed: [],
+    });
+    state = applyVisualsDelta(state, {
+      seq: 2,
+      keyframe: false,
+      order: ["a"],
+      modules: { a: { module: "A", rev: 3, base: 1, append: { "0": { "0": [[1, 2]] } } } },
+      removed: ["b"],
+    });
+    expect(visualsFromState(state)).toEqual([{ module: "A", visuals: [ts([[0, 1], [1, 2]])] }]);
+  });
+
+  it("ignores appends against a stale base", () => {
+    const state = applyVisualsDelta(emptyVisualsState(), {
+      seq: 1,
+      keyframe: true,
+      order: ["a"],
+      modules: { a: { module: "A", rev: 5, visuals: [ts([[0, 1]])] } },
+      removed: [],
+    });
+    const next = applyVisualsDelta(state, {
+      seq: 2,
+      keyframe: false,
+      order: ["a"],
+      modules: { a: { module: "A", rev: 7, base: 6, append: { "0": { "0": [[2, 3]] } } } },
+      removed: [],
+    });
+    expect(next.modules.a.rev).toBe(5);
+    expect(visualsFromState(next)[0].visuals).toEqual([ts([[0, 1]])]);
+  });
+});
@@ -0,0 +1,54 @@
+import type { ModuleVisuals, VisualSpec, VisualsDelta } from "../types/api";
+
+type ModuleEntry = { module: string; rev: number; visuals: VisualSpec[] };
+
+export type VisualsState = {
+  order: string[];
+  modules: Record<string, ModuleEntry>;
+};
+
+export function emptyVisualsState(): VisualsState {
+  return { order: [], modules: {} };
+}
+
+function appendPoints(visual: VisualSpec, perSeries: Record<string, unknown[]>): VisualSpec {
+  const series = Array.isArray(visual.data?.series) ? (visual.data.series as Array<Record<string, unknown>>) : [];
+  const nextSeries = series.map((s, si) => {
+    const extra = perSeries[String(si)];
+    if (!extra || extra.length === 0) return s;
+    const points = Array.isArray(s.points) ? (s.points as unknown[]) : [];
+    return { ...s, points: points.concat(extra) };
+  });
+  return { ...visual, data: { ...visual.data, series: nextSeries } };
+}
+
+/**
+ * Apply a `visuals_delta` message from `/api/stream?delta=1`.
+ *
+ * Keyframes replace the whole state. Appends are applied only when the local
+ * revision matches the delta's `base`; otherwise the module keeps its stale
+ * visuals until the next full update or keyframe arrives.
+ */
+export function applyVisualsDelta(state: VisualsState, delta: VisualsDelta): VisualsState {
+  const modules: Record<string, ModuleEntry> = delta.keyframe ? {} : { ...state.modules };
+  for (const name of delta.removed || []) delete modules[name];
+  for (const [name, update] of Object.entries(delta.modules || {})) {
+    if (update.visuals) {
+      modules[name] = { module: update.module, rev: update.rev, visuals: update.visuals };
+      continue;
+    }
+    const current = modules[name];
+    if (!current || current.rev !== update.base || !update.append) continue;
+    const visuals = current.visuals.map((v, vi) => {
+      const perSeries = update.append![String(vi)];
+      return perSeries ? appendPoints(v, perSeries) : v;
+    });
+    modules[name] = { module: update.module, rev: update.rev, visuals };
+  }
+  const order = (delta.order || state.order).filter((name) => name in modules);
+  return { order, modules };
+}
+
+export function visualsFromState(state: VisualsState): ModuleVisuals[] {
+  return state.order.map((name) => ({ module: state.modules[name].module, visuals: state.modules[name].visuals }));
+}
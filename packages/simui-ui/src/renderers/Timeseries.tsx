@@ -1,6 +1,19 @@
 import React, { useMemo } from 'react'
+import { isNDArray, type NDArray } from '../lib/binaryFrame'
 
-type Series = { name?: string; points: Array<[number, number]> }
+// Points arrive as JSON pairs (SSE) or as an (n, 2) typed-array view (binary WebSocket).
+type Series = { name?: string; points: Array<[number, number]> | NDArray }
+
+function pointCount(points: Series['points'] | undefined): number {
+  if (!points) return 0
+  return isNDArray(points) ? (points.shape[0] ?? 0) : Array.isArray(points) ? points.length : 0
+}
+
+function pointAt(points: Series['points'], i: number): [number, number] {
+  if (isNDArray(points)) return [Number(points.data[2 * i]), Number(points.data[2 * i + 1])]
+  const p = points[i]
+  return [Number(p?.[0]) || 0, Number(p?.[1]) || 0]
+}
 
 export default function Timeseries({ data, isFullscreen }: { data: { series?: Series[] }; isFullscreen?: boolean }) {
   const W = 520, H = 240
@@ -14,10 +27,9 @@ export default function Timeseries({ data, isFullscreen }: { data: { series?: Se
     let yMax = 1
 
     for (const s of series) {
-      const points = Array.isArray(s?.points) ? s.points : []
-      for (const p of points) {
-        const x = Number(p?.[0]) || 0
-        const y = Number(p?.[1]) || 0
+      const n = pointCount(s?.points)
+      for (let i = 0; i < n; i++) {
+        const [x, y] = pointAt(s.points, i)
         if (x < xMin) xMin = x
         if (x > xMax) xMax = x
         if (y < yMin) yMin = y
@@ -35,7 +47,15 @@ export default function Timeseries({ data, isFullscreen }: { data: { series?: Se
 
   const sx = (x: number) => ML + ((x - xMin) / (xMax - xMin)) * (W - ML - MR)
   const sy = (y: number) => MT + (1 - (y - yMin) / (yMax - yMin)) * (H - MT - MB)
-  const poly = (s: Series) => (s.points || []).map((p) => `${sx(p[0])},${sy(p[1])}`).join(' ')
+  const poly = (s: Series) => {
+    const n = pointCount(s.points)
+    const out: string[] = new Array(n)
+    for (let i = 0; i < n; i++) {
+      const [x, y] = pointAt(s.points, i)
+      out[i] = `${sx(x)},${sy(y)}`
+    }
+    return out.join(' ')
+  }
   const ticks = (lo: number, hi: number, count = 5) => Array.from({ length: count + 1 }, (_, i) => lo + (i * (hi - lo)) / count)
 
   const containerStyle: React.CSSProperties = isFullscreen
@@ -75,14 +75,32 @@ export type RunLogEntry = {
   truncated: boolean
 }
 
+export type ModuleVisualsUpdate = {
+  module: string
+  rev: number
+  visuals?: VisualSpec[]
+  base?: number
+  append?: Record<string, Record<string, unknown[]>>
+}
+
+export type VisualsDelta = {
+  seq: number
+  keyframe: boolean
+  order: string[]
+  modules: Record<string, ModuleVisualsUpdate>
+  removed: string[]
+}
+
 export type Snapshot = {
   status: RunStatus
-  visuals: ModuleVisuals[]
+  visuals?: ModuleVisuals[]
+  visuals_delta?: VisualsDelta
   events: EventRecord[]
 }
 
 export type TickData = {
   status: RunStatus
-  visuals: ModuleVisuals[]
+  visuals?: ModuleVisuals[]
+  visuals_delta?: VisualsDelta
   event: EventRecord
 }
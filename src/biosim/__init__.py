@@ -5,23 +5,26 @@ from __future__ import annotations
 
 import importlib
 from types import ModuleType
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .__about__ import __version__
-from .world import BioWorld, WorldEvent
-from .modules import BioModule
-from .signals import BioSignal, SignalMetadata
-from .visuals import VisualSpec, validate_visual_spec, normalize_visuals
-from .wiring import (
-    WiringBuilder,
-    build_from_spec,
-    load_wiring,
-    load_wiring_toml,
-    load_wiring_yaml,
-)
 
 if TYPE_CHECKING:  # pragma: no cover
     from . import simui as simui
+    from .modules import BioModule, PureModule, VectorizableModule
+    from .onnx import OnnxClassifierModule
+    from .signals import BioSignal, SignalMetadata
+    from .visuals import VisualSpec, normalize_visuals, validate_visual_spec
+    from .wiring import (
+        WiringBuilder,
+        build_from_spec,
+        load_wiring,
+        load_wiring_toml,
+        load_wiring_yaml,
+        reload_wiring,
+        update_from_spec,
+    )
+    from .world import BioWorld, WorldEvent
 
 __all__ = [
     "__version__",
@@ -31,6 +34,8 @@ __all__ = [
     "validate_visual_spec",
     "normalize_visuals",
     "BioModule",
+    "VectorizableModule",
+    "PureModule",
     "BioSignal",
     "SignalMetadata",
     "WiringBuilder",
@@ -38,20 +43,48 @@ __all__ = [
     "load_wiring",
     "load_wiring_toml",
     "load_wiring_yaml",
+    "reload_wiring",
+    "update_from_spec",
     "OnnxClassifierModule",
 ]
 
+# Public name -> defining submodule. Resolved on first access (PEP 562) so that
+# `import biosim` and `python -m biosim --help` do not pay for NumPy & co.
+_LAZY_ATTRS = {
+    "BioWorld": ".world",
+    "WorldEvent": ".world",
+    "BioModule": ".modules",
+    "VectorizableModule": ".modules",
+    "PureModule": ".modules",
+    "BioSignal": ".signals",
+    "SignalMetadata": ".signals",
+    "VisualSpec": ".visuals",
+    "validate_visual_spec": ".visuals",
+    "normalize_visuals": ".visuals",
+    "WiringBuilder": ".wiring",
+    "build_from_spec": ".wiring",
+    "load_wiring": ".wiring",
+    "load_wiring_toml": ".wiring",
+    "load_wiring_yaml": ".wiring",
+    "reload_wiring": ".wiring",
+    "update_from_spec": ".wiring",
+    "OnnxClassifierModule": ".onnx",
+}
+# Optional namespaces, imported on attribute access so `import biosim` does not require extras.
+_LAZY_SUBMODULES = {"simui", "onnx"}
 
-def __getattr__(name: str) -> ModuleType:
-    # Lazily import optional namespaces so `import biosim` does not require extras.
-    if name == "simui":
-        return importlib.import_module(".simui", __name__)
-    if name == "onnx":
-        return importlib.import_module(".onnx", __name__)
-    if name == "OnnxClassifierModule":
-        return getattr(importlib.import_module(".onnx", __name__), name)
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        globals()[name] = value  # later lookups skip __getattr__
+        return value
+    if name in _LAZY_SUBMODULES:
+        module: ModuleType = importlib.import_module(f".{name}", __name__)
+        return module
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def __dir__() -> list[str]:
-    return sorted([*__all__, "onnx", "simui"])
+    return sorted([*__all__, *_LAZY_SUBMODULES])
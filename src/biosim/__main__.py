@@ -8,7 +8,10 @@ Run any YAML/TOML config directly without needing a separate demo script.
 Usage:
     python -m biosim config.yaml                    # Run headless
     python -m biosim config.yaml --simui            # Launch SimUI dashboard
+    python -m biosim config.yaml --simui --sessions # One independent world per browser session
     python -m biosim config.yaml --duration 10.0
+    python -m biosim config.yaml --no-cache         # Always simulate (skip the results cache)
+    python -m biosim compile config.yaml            # Precompile for fast production launches
 
 YAML config format (simplified):
     meta:
@@ -35,32 +38,47 @@ from typing import Any, Dict
 
 
 def load_config(path: Path) -> Dict[str, Any]:
-    """Load YAML or TOML config file."""
-    suffix = path.suffix.lower()
-    if suffix in {".yaml", ".yml"}:
+    """Load the compiled (parsed once, validated, normalized) spec, cached next to the config.
+
+    A cache that cannot be used is ignored and the config is parsed afresh.
+    """
+    if path.suffix.lower() not in {".yaml", ".yml", ".toml", ".tml"}:
+        print(f"Error: Unsupported config format: {path.suffix.lower()}", file=sys.stderr)
+        sys.exit(1)
+    from biosim.compiled import load_compiled
+
+    try:
         try:
-            import yaml
-        except ImportError:
-            print("Error: PyYAML required. Install with: pip install pyyaml", file=sys.stderr)
-            sys.exit(1)
-        with path.open("r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
-    if suffix in {".toml", ".tml"}:
+            return load_compiled(path)
+        except ValueError:
+            return load_compiled(path, use_cache=False)
+    except (ImportError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def compile_main(argv: list[str]) -> int:
+    """``python -m biosim compile``: write compiled configs ahead of time."""
+    parser = argparse.ArgumentParser(
+        prog="python -m biosim compile",
+        description="Validate configs (including class paths) and cache their compiled form "
+        "in __biosim_cache__/ next to each config.",
+    )
+    parser.add_argument("configs", type=Path, nargs="+", help="YAML or TOML config files")
+    args = parser.parse_args(argv)
+
+    from biosim.compiled import compile_config
+
+    status = 0
+    for config in args.configs:
         try:
-            import tomllib  # type: ignore
-        except ImportError:
-            try:
-                import tomli as tomllib  # type: ignore
-            except ImportError:
-                print(
-                    "Error: TOML support requires Python 3.11+ or tomli. Install with: pip install tomli",
-                    file=sys.stderr,
-                )
-                sys.exit(1)
-        with path.open("rb") as f:
-            return tomllib.load(f)
-    print(f"Error: Unsupported config format: {suffix}", file=sys.stderr)
-    sys.exit(1)
+            target = compile_config(config)
+        except (OSError, ValueError, ImportError, TypeError, AttributeError) as e:
+            print(f"Error: {config}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        print(f"Compiled {config} -> {target}")
+    return status
 
 
 def create_world() -> "BioWorld":
@@ -76,7 +94,7 @@ def run_headless(world: "BioWorld", duration: float, tick_dt: float | None) -> N
 
     world.run(duration=duration, tick_dt=tick_dt)
 
-    print("Simulation complete.")
+    print("Simulation complete (restored from results cache)." if world.last_run_cached else "Simulation complete.")
     print("-" * 40)
 
     visuals = world.collect_visuals()
@@ -102,8 +120,14 @@ def run_simui(
     port: int,
     host: str,
     open_browser: bool,
+    sessions: bool = False,
 ) -> None:
-    """Launch SimUI with the configured world."""
+    """Launch SimUI with the configured world.
+
+    With ``sessions=True`` every browser session gets its own world built from
+    the compiled spec ``config`` (see ``biosim.simui.sessions``); ``world`` is
+    only used to validate the config.
+    """
     try:
         from biosim.simui import Interface, Number, Button, EventLog, VisualsPanel
     except ImportError as e:
@@ -126,6 +150,32 @@ def run_simui(
         VisualsPanel(refresh="auto", interval_ms=500),
     ]
 
+    if sessions:
+        from biosim.simui.sessions import SessionHost
+
+        def world_factory() -> "BioWorld":
+            import biosim
+
+            session_world = create_world()
+            session_world.result_store = world.result_store
+            biosim.build_from_spec(session_world, config)
+            return session_world
+
+        session_host = SessionHost(
+            world_factory,
+            interface_kwargs=dict(
+                title=title,
+                description=description,
+                controls=controls,
+                outputs=outputs,
+                config_path=config_path,
+            ),
+        )
+        print(f"Starting SimUI sessions: http://{host}:{port}/ui/new")
+        print("Press Ctrl+C to stop.")
+        session_host.launch(host=host, port=port, open_browser=open_browser)
+        return
+
     ui = Interface(
         world,
         title=title,
@@ -142,6 +192,9 @@ def run_simui(
 
 
 def main() -> None:
+    if sys.argv[1:2] == ["compile"]:
+        sys.exit(compile_main(sys.argv[2:]))
+
     parser = argparse.ArgumentParser(
         prog="python -m biosim",
         description="Run biosim simulations from YAML/TOML config files.",
@@ -151,6 +204,7 @@ Examples:
   python -m biosim wiring.yaml --simui
   python -m biosim config.yaml --duration 10.0
   python -m biosim config.yaml --simui --port 8080 --open
+  python -m biosim compile config.yaml
         """,
     )
 
@@ -195,18 +249,39 @@ Examples:
         help="Open browser automatically when starting SimUI",
     )
 
+    parser.add_argument(
+        "--sessions",
+        action="store_true",
+        help="With --simui, host an independent world per browser session at /ui/new",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        dest="no_cache",
+        help="Always simulate instead of restoring identical runs from the results cache "
+        "($BIOSIM_CACHE_DIR, default ~/.cache/biosim/results). Runs are keyed by the config and "
+        "the source of every module class; a restored run emits no tick events and modules "
+        "do not advance (modules with cacheable = False are never restored)",
+    )
+
     args = parser.parse_args()
 
     if not args.config.exists():
         print(f"Error: Config file not found: {args.config}", file=sys.stderr)
         sys.exit(1)
 
+    # Parsed once: the same compiled spec builds the world and feeds the UI metadata.
     config = load_config(args.config)
 
     world = create_world()
+    if not args.no_cache:
+        from biosim.results import ResultStore
+
+        world.result_store = ResultStore()
 
     import biosim
-    biosim.load_wiring(world, args.config)
+    biosim.build_from_spec(world, config)
 
     try:
         module_count = len(world.module_names)
@@ -228,6 +303,7 @@ Examples:
             port=args.port,
             host=args.host,
             open_browser=args.open_browser,
+            sessions=args.sessions,
         )
     else:
         run_headless(world, duration=args.duration, tick_dt=tick_dt)
@@ -0,0 +1,193 @@
+"""Compiled wiring configs.
+
+Parsing a YAML config is the slowest part of a short CLI run. The compiled form
+of a config is its spec normalized into the explicit shape ``build_from_spec``
+consumes (every module as ``{class, args, min_dt?, priority, replicas?}``,
+every wiring entry as ``{from, to, rule?, k?, seed?}``) after validation;
+replica groups stay compact and are expanded only when a world is built. It is
+cached as JSON next to the config in ``__biosim_cache__/<config name>.json``,
+keyed by a hash of the file contents and the biosim version, much like
+``__pycache__``: an unchanged config is loaded with a JSON parse instead of
+YAML, and an edited one is recompiled.
+
+``python -m biosim compile config.yaml`` writes the cache ahead of time (and
+also checks that every class path imports to a BioModule) so production
+launches never parse YAML.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Mapping
+
+from .__about__ import __version__
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = "__biosim_cache__"
+FORMAT = 1
+
+
+def compiled_path(config: str | Path) -> Path:
+    """Where the compiled form of ``config`` is cached."""
+    p = Path(config)
+    return p.parent / CACHE_DIR_NAME / f"{p.name}.json"
+
+
+def parse_config(path: str | Path, data: bytes | None = None) -> Dict[str, Any]:
+    """Parse a YAML/TOML config (YAML with the libyaml C loader when available)."""
+    p = Path(path)
+    raw = p.read_bytes() if data is None else data
+    suffix = p.suffix.lower()
+    if suffix in {".toml", ".tml"}:
+        try:
+            import tomllib  # type: ignore[attr-defined]
+        except Exception:  # pragma: no cover - fallback for <3.11
+            try:
+                import tomli as tomllib  # type: ignore
+            except Exception as exc:  # pragma: no cover
+                raise ImportError("TOML support requires Python 3.11+ or 'tomli' installed") from exc
+        return tomllib.loads(raw.decode("utf-8"))
+    if suffix in {".yaml", ".yml"}:
+        try:
+            import yaml  # type: ignore
+        except Exception as exc:  # pragma: no cover
+            raise ImportError("YAML support requires 'pyyaml' installed") from exc
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data_obj = yaml.load(raw, Loader=loader)
+        if data_obj is None:
+            return {}
+        if not isinstance(data_obj, Mapping):
+            raise ValueError("YAML wiring must load to a mapping/dict")
+        return dict(data_obj)
+    raise ValueError(f"Unsupported wiring file type: {suffix}")
+
+
+def compile_spec(spec: Mapping[str, Any], *, resolve: bool = False) -> Dict[str, Any]:
+    """Validate ``spec`` and return it in normalized form.
+
+    Other top-level keys (``meta``, ...) are kept. With ``resolve=True`` every
+    class path is imported and checked to be a BioModule subclass. Raises
+    ValueError (or ImportError/TypeError when resolving) for invalid specs.
+    """
+    from .wiring import (
+        _expand_rule,
+        _expanded_modules,
+        _module_entries,
+        _replica_count,
+        _replica_groups,
+        _wiring_section,
+        expand_wiring,
+    )
+
+    modules: Dict[str, Dict[str, Any]] = {}
+    for name, entry in _module_entries(spec).items():
+        if isinstance(entry, str):
+            entry = {"class": entry}
+        if not isinstance(entry, Mapping):
+            raise ValueError(f"Invalid module entry for '{name}'")
+        cls_path = entry.get("class")
+        if not isinstance(cls_path, str) or "." not in cls_path.strip("."):
+            raise ValueError(f"Invalid class for module '{name}'")
+        args = entry.get("args") or {}
+        if not isinstance(args, Mapping):
+            raise ValueError(f"Invalid args for module '{name}'")
+        compiled: Dict[str, Any] = {"class": cls_path, "args": dict(args), "priority": int(entry.get("priority", 0))}
+        if "min_dt" in entry:
+            compiled["min_dt"] = float(entry["min_dt"])
+        count = _replica_count(name, entry)
+        if count is not None:
+            compiled["replicas"] = count  # kept compact; expanded when a world is built
+        modules[str(name)] = compiled
+
+    wiring: List[Dict[str, Any]] = []
+    names = list(_expanded_modules(spec))
+    groups = _replica_groups(spec)
+    for entry in _wiring_section(spec):
+        for src, to in _expand_rule(entry, groups):
+            try:
+                expand_wiring(src, to, names)  # patterns are kept; this only checks they resolve
+            except KeyError as e:
+                raise ValueError(f"Wiring {src} -> {to}: {e.args[0]}") from None
+        compiled_entry = {"from": entry["from"], "to": list(entry["to"])}
+        compiled_entry.update({key: entry[key] for key in ("rule", "k", "seed") if key in entry})
+        wiring.append(compiled_entry)
+
+    if resolve:
+        from .modules import BioModule
+        from .wiring import _import_from_string
+
+        for name, entry in modules.items():
+            cls = _import_from_string(entry["class"])
+            if not (isinstance(cls, type) and issubclass(cls, BioModule)):
+                raise TypeError(f"Module '{name}': {entry['class']} is not a BioModule class")
+
+    out = dict(spec)
+    out["modules"] = modules
+    out["wiring"] = wiring
+    return out
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _write(path: Path, payload: Dict[str, Any]) -> bool:
+    from .visuals import encode_json
+
+    try:
+        body = encode_json(payload)
+    except (TypeError, ValueError):
+        logger.debug("Compiled config for %s is not JSON-serializable; not cached", path)
+        return False
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(body)
+        os.replace(tmp, path)
+    except OSError:
+        logger.debug("Could not write compiled config %s", path, exc_info=True)
+        return False
+    return True
+
+
+def load_compiled(path: str | Path, *, use_cache: bool = True) -> Dict[str, Any]:
+    """Return the compiled spec of the config at ``path``, reading it exactly once.
+
+    A cached compilation with a matching content hash is used as is; otherwise
+    the config is parsed, compiled and (best effort) written to the cache.
+    """
+    p = Path(path)
+    data = p.read_bytes()
+    key = _digest(data)
+    cache = compiled_path(p)
+    if use_cache:
+        try:
+            cached = json.loads(cache.read_bytes())
+            if cached.get("format") == FORMAT and cached.get("biosim") == __version__ and cached.get("hash") == key:
+                return cached["spec"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+    spec = compile_spec(parse_config(p, data))
+    if use_cache:
+        _write(cache, {"format": FORMAT, "biosim": __version__, "hash": key, "spec": spec})
+    return spec
+
+
+def compile_config(path: str | Path) -> Path:
+    """Compile ``path`` ahead of time, checking its class paths; returns the cache file.
+
+    Raises OSError if the cache cannot be written.
+    """
+    p = Path(path)
+    data = p.read_bytes()
+    spec = compile_spec(parse_config(p, data), resolve=True)
+    target = compiled_path(p)
+    if not _write(target, {"format": FORMAT, "biosim": __version__, "hash": _digest(data), "spec": spec}):
+        raise OSError(f"Could not write compiled config {target}")
+    return target
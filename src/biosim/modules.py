@@ -14,6 +14,9 @@ class BioModule(ABC):
 
     # Minimum time step for this module (in BioWorld's canonical time unit).
     min_dt: float = 0.0
+    # Whether runs may be restored from a results cache instead of simulated.
+    # Set False for unseeded randomness or side effects (e.g. recording files).
+    cacheable: bool = True
 
     def setup(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Initialize the module for a run. Default is a no-op."""
@@ -69,5 +72,137 @@ class BioModule(ABC):
     # rendered by a browser client. Return either a single dict or a list of
     # dicts with the fixed shape: {"render": <type>, "data": <payload>}.
     # Default returns None (no visuals).
+    #
+    # BioWorld caches the normalized result per module. Set ``visual_version``
+    # (attribute or property) to any comparable value that changes whenever the
+    # visuals should be re-rendered; when left as None the cache is keyed on the
+    # module's last advance time.
+    visual_version: Optional[Any] = None
+
     def visualize(self) -> Optional["VisualSpec" | List["VisualSpec"]]:
         return None
+
+
+class VectorizableModule(BioModule):
+    """BioModule whose instances can be advanced together by one class-level call.
+
+    A subclass describes its per-instance state with :meth:`initial_state` and
+    implements :meth:`advance_batch`, which advances *all* instances at once on
+    NumPy arrays stacked along axis 0. BioWorld fuses instances of the same
+    class, ``min_dt`` and priority into one scheduled entity whose state lives
+    in the stacked arrays; each instance keeps its name for wiring, outputs and
+    visuals, and reads its row through :attr:`state`. An instance that is not
+    fused (e.g. the only one of its class) is advanced as a batch of one, so
+    subclasses do not implement ``advance_to``.
+
+    Input ports an instance received no signal on this step are filled with
+    ``batch_input_default``. Returned output arrays must be new arrays (state
+    arrays are updated in place), since rows of them are handed out as signals.
+    Members of a batch are advanced simultaneously, so when they are wired to
+    each other they see each other's outputs from the previous step.
+    """
+
+    batch_input_default: Any = 0.0
+
+    def initial_state(self) -> Dict[str, Any]:
+        """Return this instance's initial state as ``{key: scalar or array}``."""
+        return {}
+
+    @classmethod
+    @abstractmethod
+    def advance_batch(cls, states: Dict[str, Any], inputs: Dict[str, Any], t: float) -> Dict[str, Any]:
+        """Advance every instance to ``t``.
+
+        ``states`` maps state keys to arrays of shape ``(n, ...)`` to update in
+        place; ``inputs`` maps input ports to arrays of shape ``(n, ...)``.
+        Returns ``{output port: array of shape (n, ...)}``.
+        """
+        raise NotImplementedError  # pragma: no cover - abstract
+
+    def setup(self, config: Optional[Dict[str, Any]] = None) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        import numpy as np
+
+        states = {key: np.asarray([value]) for key, value in self.initial_state().items()}
+        self._bind_batch(states, 0)
+        self._pending_inputs: Dict[str, Any] = {}
+        self._outputs: Dict[str, BioSignal] = {}
+
+    def _bind_batch(self, states: Dict[str, Any], index: int) -> None:
+        # Called by BioWorld when this instance's row moves into (or out of) a fused batch.
+        self._batch_states = states
+        self._batch_index = index
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        """This instance's row of the (possibly fused) state arrays."""
+        i = self._batch_index
+        return {key: batch_row(values, i) for key, values in self._batch_states.items()}
+
+    def get_state(self) -> Dict[str, Any]:
+        return self.state
+
+    def set_inputs(self, signals: Dict[str, BioSignal]) -> None:
+        self._pending_inputs = {port: signal.value for port, signal in signals.items()}
+
+    def advance_to(self, t: float) -> None:
+        import numpy as np
+
+        default = self.batch_input_default
+        ports = set(self.inputs()) | set(self._pending_inputs)
+        inputs = {port: np.asarray([self._pending_inputs.get(port, default)]) for port in ports}
+        self._pending_inputs = {}
+        outputs = type(self).advance_batch(self._batch_states, inputs, t) or {}
+        name = getattr(self, "_world_name", type(self).__name__)
+        self._outputs = {
+            port: BioSignal(source=name, name=port, value=batch_row(values, 0), time=t)
+            for port, values in outputs.items()
+        }
+
+    def get_outputs(self) -> Dict[str, BioSignal]:
+        return dict(self._outputs)
+
+
+def batch_row(values: Any, index: int) -> Any:
+    """Row ``index`` of a stacked array; 0-d rows become Python scalars."""
+    row = values[index]
+    return row.item() if getattr(row, "ndim", None) == 0 else row
+
+
+class PureModule(BioModule):
+    """Stateless adapter (scale, threshold, select-field, ...) between real models.
+
+    Its outputs are a function of its current input values only, given by
+    :meth:`transform`. BioWorld collapses linear chains of pure modules, each
+    fed by exactly one connection, into one composed function that is
+    evaluated when a consumer collects its inputs: such modules are not
+    scheduled and have no entries in the signal store (``get_outputs`` on the
+    world returns ``{}`` for them). A pure module with several incoming
+    connections runs like any other module on its ``min_dt``.
+    """
+
+    @abstractmethod
+    def transform(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Map ``{input port: value}`` to ``{output port: value}``."""
+        raise NotImplementedError  # pragma: no cover - abstract
+
+    def setup(self, config: Optional[Dict[str, Any]] = None) -> None:
+        self._input_values: Dict[str, Any] = {}
+        self._outputs: Dict[str, BioSignal] = {}
+
+    def set_inputs(self, signals: Dict[str, BioSignal]) -> None:
+        self._input_values = {port: signal.value for port, signal in signals.items()}
+
+    def advance_to(self, t: float) -> None:
+        if not self._input_values:
+            return
+        name = getattr(self, "_world_name", type(self).__name__)
+        self._outputs = {
+            port: BioSignal(source=name, name=port, value=value, time=t)
+            for port, value in self.transform(self._input_values).items()
+        }
+
+    def get_outputs(self) -> Dict[str, BioSignal]:
+        return dict(self._outputs)
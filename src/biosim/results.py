@@ -0,0 +1,216 @@
+"""Content-addressed store for run results.
+
+``BioWorld.run`` can memoize runs that start from a freshly set-up world: the
+resolved spec (module classes and constructor args, ``min_dt``, priorities,
+wiring, setup config, duration and the biosim version) is hashed into a key
+together with the contents of every module class's source files, and the final
+state of the run (time, module outputs and visuals) is stored under it. A later
+run with the same key restores that state instead of simulating; editing a
+module's code changes the key.
+
+Seeds are covered through module args; a module whose args are unknown (added
+without ``args=``), whose class has no source file, or that sets
+``cacheable = False`` (unseeded randomness, side effects such as recording
+files) makes the world uncacheable. Entries are JSON files evicted
+least-recently-used once the store exceeds ``max_bytes`` or ``max_entries``.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from .__about__ import __version__
+from .visuals import encode_json
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .world import BioWorld
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 1000
+
+
+def default_cache_dir() -> Path:
+    """``$BIOSIM_CACHE_DIR``, else ``$XDG_CACHE_HOME/biosim/results`` (``~/.cache`` by default)."""
+    env = os.environ.get("BIOSIM_CACHE_DIR")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "biosim" / "results"
+
+
+# path -> ((mtime_ns, size), digest): source files are only re-read when they change.
+_source_digests: Dict[str, Any] = {}
+_source_lock = threading.Lock()
+
+
+def _file_digest(path: str) -> Optional[str]:
+    try:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with _source_lock:
+            cached = _source_digests.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        with open(path, "rb") as fh:
+            digest = hashlib.blake2b(fh.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+    with _source_lock:
+        _source_digests[path] = (stamp, digest)
+    return digest
+
+
+def class_source_digest(cls: type) -> Optional[str]:
+    """Content hash of the source files defining ``cls`` and its bases, or None if one has no source."""
+    digests = []
+    for klass in cls.__mro__:
+        if klass is object:
+            continue
+        try:
+            path = inspect.getsourcefile(klass)
+        except TypeError:
+            return None
+        digest = _file_digest(path) if path else None
+        if digest is None:
+            return None
+        digests.append(digest)
+    return hashlib.blake2b("".join(digests).encode("ascii"), digest_size=16).hexdigest()
+
+
+def run_key(world: "BioWorld", duration: float) -> Optional[str]:
+    """Hash of everything that determines a run's result, or None if the world is not cacheable."""
+    spec = world.resolved_spec()
+    if spec is None:
+        return None
+    try:
+        payload = encode_json({"biosim": __version__, "duration": float(duration), **spec})
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+
+class ResultStore:
+    """On-disk LRU of run results keyed by :func:`run_key`."""
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.max_bytes = int(max_bytes)
+        self.max_entries = int(max_entries)
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return data if isinstance(data, dict) else None
+
+    def put(self, key: str, data: Dict[str, Any]) -> bool:
+        """Store ``data`` under ``key``. Returns False if it is not JSON-serializable."""
+        try:
+            body = encode_json(data)
+        except (TypeError, ValueError):
+            logger.debug("Run result for %s is not serializable; not cached", key)
+            return False
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(body)
+                os.replace(tmp, self._path(key))
+            except OSError:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+            self._evict()
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.root.glob("*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.root.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        while entries and (total > self.max_bytes or len(entries) > self.max_entries):
+            _, size, path = entries.pop(0)
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+
+
+def signal_to_record(signal: Any) -> Dict[str, Any]:
+    """JSON-friendly form of a BioSignal (arrays keep their dtype and shape)."""
+    from dataclasses import asdict
+
+    value = signal.value
+    record: Dict[str, Any] = {"time": signal.time, "metadata": asdict(signal.metadata)}
+    dtype = getattr(value, "dtype", None)
+    if dtype is not None and hasattr(value, "tolist"):
+        record["value"] = value.tolist()
+        record["dtype"] = str(dtype)
+        record["shape"] = list(getattr(value, "shape", ()))
+    else:
+        record["value"] = value
+    return record
+
+
+def signal_from_record(source: str, name: str, record: Dict[str, Any]) -> Any:
+    from .signals import BioSignal, SignalMetadata
+
+    value = record.get("value")
+    if "dtype" in record:
+        import numpy as np
+
+        value = np.asarray(value, dtype=record["dtype"]).reshape(record.get("shape") or ())
+        if value.ndim == 0:
+            value = value[()]
+    return BioSignal(
+        source=source,
+        name=name,
+        value=value,
+        time=float(record.get("time", 0.0)),
+        metadata=SignalMetadata(**(record.get("metadata") or {})),
+    )
@@ -7,9 +7,18 @@ with consistent semantics.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Optional
-import numpy as np
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
+
+def _is_ndarray(value: Any) -> bool:
+    # NumPy is imported lazily: if it has not been imported, nothing can be an ndarray.
+    np_mod = sys.modules.get("numpy")
+    return np_mod is not None and isinstance(value, np_mod.ndarray)
 
 
 @dataclass
@@ -75,12 +84,12 @@ class BioSignal:
     @property
     def is_scalar(self) -> bool:
         """Check if the value is a scalar (not an array)."""
-        return not isinstance(self.value, (np.ndarray, list, tuple))
+        return not self.is_array
 
     @property
     def is_array(self) -> bool:
         """Check if the value is an array."""
-        return isinstance(self.value, (np.ndarray, list, tuple))
+        return isinstance(self.value, (list, tuple)) or _is_ndarray(self.value)
 
     def as_float(self) -> float:
         """Get the value as a float. Raises if not scalar."""
@@ -90,6 +99,8 @@ class BioSignal:
 
     def as_array(self) -> np.ndarray:
         """Get the value as a numpy array."""
+        import numpy as np
+
         if isinstance(self.value, np.ndarray):
             return self.value
         return np.asarray(self.value)
@@ -97,7 +108,7 @@ class BioSignal:
     def to_dict(self) -> dict:
         """Convert to a JSON-serializable dictionary."""
         value = self.value
-        if isinstance(value, np.ndarray):
+        if _is_ndarray(value):
             value = value.tolist()
 
         return {
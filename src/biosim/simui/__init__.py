@@ -1,13 +1,10 @@
-try:
-    from .interface import Interface, Number, Button, EventLog, VisualsPanel
-except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency path
-    # Provide a clear error when UI extras aren't installed.
-    missing = getattr(exc, "name", None)
-    if missing in {"fastapi", "starlette", "uvicorn"}:
-        raise ImportError(
-            "SimUI requires optional UI dependencies. Install with `pip install 'biosim[ui]'`."
-        ) from exc
-    raise
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .interface import Button, EventLog, Interface, Number, VisualsPanel
 
 __all__ = [
     "Interface",
@@ -16,3 +13,27 @@ __all__ = [
     "EventLog",
     "VisualsPanel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily (PEP 562) so submodules such as `biosim.simui.registry` can be
+    # imported without FastAPI.
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        interface = importlib.import_module(".interface", __name__)
+    except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency path
+        # Provide a clear error when UI extras aren't installed.
+        missing = getattr(exc, "name", None)
+        if missing in {"fastapi", "starlette", "uvicorn"}:
+            raise ImportError(
+                "SimUI requires optional UI dependencies. Install with `pip install 'biosim[ui]'`."
+            ) from exc
+        raise
+    value = getattr(interface, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -0,0 +1,96 @@
+"""Static asset serving for the SimUI bundle.
+
+``python -m biosim.simui.build`` writes content-hashed copies of the bundle
+(``app.<hash>.js``) with precompressed ``.gz``/``.br`` siblings and a
+``manifest.json`` mapping logical names to hashed ones. Hashed files never
+change, so they are served with ``Cache-Control: immutable``; everything else
+(e.g. a plain ``app.js`` from an older build) must be revalidated.
+"""
+from __future__ import annotations
+
+import json
+import mimetypes
+import os
+import stat
+from pathlib import Path
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from .build import MANIFEST_NAME
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# (Accept-Encoding token, file suffix), preferred first
+_PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+def load_manifest(static_dir: Path) -> Dict[str, str]:
+    """Return the logical -> hashed asset name map, or {} for unhashed builds."""
+    try:
+        data = json.loads((static_dir / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    return {k: v for k, v in data.items() if isinstance(v, str) and (static_dir / v).is_file()}
+
+
+def asset_url(manifest: Dict[str, str], name: str) -> str:
+    """Relative URL of ``name`` under the static mount, preferring the hashed copy."""
+    return f"static/{manifest.get(name, name)}"
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """``StaticFiles`` that serves ``.br``/``.gz`` siblings and sets cache headers."""
+
+    def __init__(self, *, directory: str | os.PathLike[str], manifest: Optional[Dict[str, str]] = None) -> None:
+        super().__init__(directory=directory)
+        self._immutable = set((manifest or {}).values())
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        full_path = str(full_path)
+        name = os.path.basename(full_path)
+        request_headers = Headers(scope=scope)
+        accept = request_headers.get("accept-encoding", "")
+        accepted = {token.split(";")[0].strip().lower() for token in accept.split(",")}
+        response: Optional[Response] = None
+        for encoding, suffix in _PRECOMPRESSED:
+            if encoding not in accepted:
+                continue
+            try:
+                compressed_stat = os.stat(full_path + suffix)
+            except OSError:
+                continue
+            if not stat.S_ISREG(compressed_stat.st_mode):
+                continue
+            media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            # Validators follow the uncompressed file, with a per-encoding ETag.
+            plain = FileResponse(full_path, stat_result=stat_result).headers
+            response = FileResponse(
+                full_path + suffix,
+                status_code=status_code,
+                stat_result=compressed_stat,
+                media_type=media_type,
+                headers={
+                    "Content-Encoding": encoding,
+                    "ETag": f'{plain["etag"][:-1]}-{encoding}"',
+                    "Last-Modified": plain["last-modified"],
+                },
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                response = NotModifiedResponse(response.headers)
+            break
+        if response is None:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = IMMUTABLE if name in self._immutable else REVALIDATE
+        return response
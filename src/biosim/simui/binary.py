@@ -0,0 +1,162 @@
+"""Binary frame encoding for the SimUI WebSocket channel.
+
+Large numeric arrays (NumPy arrays, lists of numbers, lists of equal-length
+number lists) are moved out of the JSON message into raw little-endian buffers
+that browsers can view directly as typed arrays.
+
+Frame layout (all integers little-endian)::
+
+    uint32  header_length
+    bytes   header (UTF-8 JSON), zero-padded so the data section starts on an 8-byte boundary
+    bytes   buffer 0 (zero-padded to 8 bytes), buffer 1, ...
+
+The header is ``{"message": <message>, "buffers": [...]}``. Every extracted
+array is replaced in ``message`` by ``{"$ndarray": <index>}`` and described in
+``buffers`` as ``{"dtype", "shape", "offset", "length"}`` where ``offset`` is a
+byte offset from the start of the data section and ``length`` the element
+count. Because every buffer is 8-byte aligned, clients can create typed-array
+views over the received ``ArrayBuffer`` without copying.
+"""
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..visuals import encode_json
+
+# dtype name -> matching JavaScript typed array
+SUPPORTED_DTYPES = {
+    "float32": "Float32Array",
+    "float64": "Float64Array",
+    "int8": "Int8Array",
+    "uint8": "Uint8Array",
+    "int16": "Int16Array",
+    "uint16": "Uint16Array",
+    "int32": "Int32Array",
+    "uint32": "Uint32Array",
+    "int64": "BigInt64Array",
+    "uint64": "BigUint64Array",
+}
+
+_ALIGN = 8
+
+
+def _as_array(value: Any, min_elements: int, list_dtype: str) -> Optional[np.ndarray]:
+    """Return ``value`` as a contiguous little-endian array, or None to keep it as JSON."""
+    if isinstance(value, np.ndarray):
+        arr = value
+        if arr.size < min_elements or arr.dtype.kind not in "biuf":
+            return None
+        if arr.dtype.kind == "b":
+            arr = arr.astype(np.uint8)
+        elif arr.dtype.name not in SUPPORTED_DTYPES:
+            arr = arr.astype(np.float64)
+    elif isinstance(value, list) and len(value) > 0:
+        first = value[0]
+        all_int = True
+        if isinstance(first, (int, float)) and not isinstance(first, bool):
+            if len(value) < min_elements:
+                return None
+            for v in value:
+                if isinstance(v, bool) or not isinstance(v, (int, float)):
+                    return None
+                all_int = all_int and isinstance(v, int)
+        elif isinstance(first, (list, tuple)) and first:
+            width = len(first)
+            if len(value) * width < min_elements:
+                return None
+            for row in value:
+                if not isinstance(row, (list, tuple)) or len(row) != width:
+                    return None
+                for v in row:
+                    if isinstance(v, bool) or not isinstance(v, (int, float)):
+                        return None
+                    all_int = all_int and isinstance(v, int)
+        else:
+            return None
+        if all_int:
+            try:
+                arr = np.asarray(value, dtype=np.int64)
+            except OverflowError:
+                return None  # beyond int64: JSON keeps it exact
+        else:
+            arr = np.asarray(value, dtype=list_dtype)
+    else:
+        return None
+    return np.ascontiguousarray(arr.astype(arr.dtype.newbyteorder("<"), copy=False))
+
+
+def _extract(value: Any, arrays: List[np.ndarray], min_elements: int, list_dtype: str) -> Any:
+    arr = _as_array(value, min_elements, list_dtype)
+    if arr is not None:
+        arrays.append(arr)
+        return {"$ndarray": len(arrays) - 1}
+    if isinstance(value, dict):
+        return {k: _extract(v, arrays, min_elements, list_dtype) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_extract(v, arrays, min_elements, list_dtype) for v in value]
+    return value
+
+
+def _pad(n: int) -> int:
+    return (-n) % _ALIGN
+
+
+def encode_binary_frame(message: Dict[str, Any], *, min_elements: int = 64, list_dtype: str = "float64") -> bytes:
+    """Encode a message as a binary frame, extracting numeric arrays.
+
+    Arrays with fewer than ``min_elements`` elements stay inline in the JSON
+    header. Lists of Python ints are packed as int64 (kept inline if a value
+    does not fit); lists with any float are packed as ``list_dtype``, float64
+    by default so values survive exactly as they would in JSON; pass
+    ``"float32"`` to halve their size where that precision is enough. NumPy
+    arrays keep their dtype when it maps to a JavaScript typed array.
+    """
+    arrays: List[np.ndarray] = []
+    body = _extract(message, arrays, min_elements, list_dtype)
+
+    descriptors: List[Dict[str, Any]] = []
+    offset = 0
+    for arr in arrays:
+        descriptors.append(
+            {"dtype": arr.dtype.name, "shape": list(arr.shape), "offset": offset, "length": int(arr.size)}
+        )
+        offset += arr.nbytes + _pad(arr.nbytes)
+    try:
+        header = encode_json({"message": body, "buffers": descriptors})
+    except (TypeError, ValueError):
+        # Event payloads may carry arbitrary objects (e.g. exceptions); send them as strings.
+        header = json.dumps({"message": body, "buffers": descriptors}, default=str, separators=(",", ":")).encode("utf-8")
+
+    parts = [struct.pack("<I", len(header)), header, b"\0" * _pad(4 + len(header))]
+    for arr in arrays:
+        parts.append(arr.tobytes())
+        parts.append(b"\0" * _pad(arr.nbytes))
+    return b"".join(parts)
+
+
+def decode_binary_frame(frame: bytes) -> Dict[str, Any]:
+    """Decode a frame produced by :func:`encode_binary_frame` (arrays become NumPy arrays)."""
+    (header_len,) = struct.unpack_from("<I", frame, 0)
+    header = json.loads(frame[4 : 4 + header_len])
+    base = 4 + header_len + _pad(4 + header_len)
+    arrays = [
+        np.frombuffer(
+            frame, dtype=np.dtype(d["dtype"]).newbyteorder("<"), count=d["length"], offset=base + d["offset"]
+        ).reshape(d["shape"])
+        for d in header["buffers"]
+    ]
+
+    def _restore(value: Any) -> Any:
+        if isinstance(value, dict):
+            if set(value) == {"$ndarray"}:
+                return arrays[value["$ndarray"]]
+            return {k: _restore(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [_restore(v) for v in value]
+        return value
+
+    return _restore(header["message"])
@@ -0,0 +1,167 @@
+"""Delta encoding of module visuals for the SimUI SSE stream.
+
+Tick messages for delta-capable clients carry only the modules whose visuals
+changed since the previous broadcast. Timeseries visuals whose series only grew
+are sent as appended points. Every ``keyframe_interval`` deltas a full keyframe
+is emitted so clients that missed a message can recover.
+
+Delta message shape (``visuals_delta``)::
+
+    {
+      "seq": 12,                 # increments per delta/keyframe
+      "keyframe": false,
+      "order": ["a", "b"],       # world module names in display order
+      "modules": {
+        "a": {"module": "Cls", "rev": 7, "visuals": [...]},                 # full replace
+        "b": {"module": "Cls", "rev": 9, "base": 8, "append": {"0": {"1": [[t, v], ...]}}},
+      },
+      "removed": ["c"],
+    }
+
+``append`` maps visual index -> series index -> new points. Clients apply an
+append only when their current revision for the module equals ``base``;
+otherwise they keep the stale visuals until the next full update or keyframe.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..visuals import encode_json
+from ..world import ModuleVisuals
+
+
+@dataclass
+class _SentVisuals:
+    revision: int
+    # Per visual: None when it is not appendable, else (render, header bytes, series state)
+    # where series state is a list of (name, point count, encoded last point).
+    layout: List[Optional[Tuple[bytes, List[Tuple[Any, int, Optional[bytes]]]]]] = field(default_factory=list)
+
+
+def _timeseries_layout(spec: Dict[str, Any]) -> Optional[Tuple[bytes, List[Tuple[Any, int, Optional[bytes]]]]]:
+    if spec.get("render") != "timeseries":
+        return None
+    data = spec.get("data") or {}
+    series = data.get("series")
+    if not isinstance(series, list):
+        return None
+    state: List[Tuple[Any, int, Optional[bytes]]] = []
+    for s in series:
+        if not isinstance(s, dict):
+            return None
+        points = s.get("points")
+        if points is None or not hasattr(points, "__len__"):
+            return None
+        n = len(points)
+        last = encode_json(points[n - 1]) if n else None
+        state.append((s.get("name"), n, last))
+    header = encode_json(
+        {
+            "description": spec.get("description"),
+            "data": {k: v for k, v in data.items() if k != "series"},
+            "series": [{k: v for k, v in s.items() if k != "points"} for s in series],
+        }
+    )
+    return header, state
+
+
+def _layout(visuals: Sequence[Dict[str, Any]]) -> List[Optional[Tuple[bytes, List[Tuple[Any, int, Optional[bytes]]]]]]:
+    return [_timeseries_layout(v) for v in visuals]
+
+
+class VisualDeltaEncoder:
+    """Stateful encoder producing per-module visual deltas between broadcasts."""
+
+    def __init__(self, keyframe_interval: int = 50) -> None:
+        self._keyframe_interval = max(1, int(keyframe_interval))
+        self._sent: Dict[str, _SentVisuals] = {}
+        self._since_keyframe = 0
+        self._seq = 0
+
+    def reset(self) -> None:
+        """Forget what was sent; the next delta is a keyframe."""
+        self._sent.clear()
+        self._since_keyframe = 0
+
+    def keyframe(self, entries: Sequence[ModuleVisuals]) -> Dict[str, Any]:
+        """Build a full keyframe without touching the delta state."""
+        return {
+            "seq": self._seq,
+            "keyframe": True,
+            "order": [mv.name for mv in entries],
+            "modules": {mv.name: self._full(mv) for mv in entries},
+            "removed": [],
+        }
+
+    def delta(self, entries: Sequence[ModuleVisuals]) -> Dict[str, Any]:
+        """Build the delta against the previous broadcast and remember the new state."""
+        self._seq += 1
+        force = not self._sent or self._since_keyframe >= self._keyframe_interval
+        if force:
+            self._since_keyframe = 0
+        else:
+            self._since_keyframe += 1
+
+        modules: Dict[str, Any] = {}
+        seen = set()
+        for mv in entries:
+            seen.add(mv.name)
+            prev = self._sent.get(mv.name)
+            if not force and prev is not None and prev.revision == mv.revision:
+                continue
+            layout = _layout(mv.visuals)
+            append = None if force or prev is None else self._append(prev.layout, layout, mv.visuals)
+            if append is not None:
+                modules[mv.name] = {"module": mv.module, "rev": mv.revision, "base": prev.revision, "append": append}
+            else:
+                modules[mv.name] = self._full(mv)
+            self._sent[mv.name] = _SentVisuals(revision=mv.revision, layout=layout)
+
+        removed = [name for name in self._sent if name not in seen]
+        for name in removed:
+            del self._sent[name]
+
+        return {
+            "seq": self._seq,
+            "keyframe": force,
+            "order": [mv.name for mv in entries],
+            "modules": modules,
+            "removed": removed,
+        }
+
+    @staticmethod
+    def _full(mv: ModuleVisuals) -> Dict[str, Any]:
+        return {"module": mv.module, "rev": mv.revision, "visuals": mv.visuals}
+
+    @staticmethod
+    def _append(
+        prev_layout: List[Optional[Tuple[bytes, List[Tuple[Any, int, Optional[bytes]]]]]],
+        layout: List[Optional[Tuple[bytes, List[Tuple[Any, int, Optional[bytes]]]]]],
+        visuals: Sequence[Dict[str, Any]],
+    ) -> Optional[Dict[str, Dict[str, List[Any]]]]:
+        """Return appended points per visual/series, or None when a full update is needed."""
+        if len(prev_layout) != len(layout):
+            return None
+        out: Dict[str, Dict[str, List[Any]]] = {}
+        for vi, (old, new) in enumerate(zip(prev_layout, layout)):
+            if old is None or new is None:
+                # Non-timeseries visuals changed (revision moved); cannot express as append.
+                return None
+            old_header, old_series = old
+            new_header, new_series = new
+            if old_header != new_header or len(old_series) != len(new_series):
+                return None
+            series = visuals[vi]["data"]["series"]
+            per_series: Dict[str, List[Any]] = {}
+            for si, ((old_name, old_n, old_last), (new_name, new_n, _)) in enumerate(zip(old_series, new_series)):
+                if old_name != new_name or new_n < old_n:
+                    return None
+                points = series[si]["points"]
+                if old_n and encode_json(points[old_n - 1]) != old_last:
+                    return None
+                if new_n > old_n:
+                    per_series[str(si)] = list(points[old_n:new_n])
+            if per_series:
+                out[str(vi)] = per_series
+        return out
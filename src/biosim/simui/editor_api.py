@@ -9,12 +9,14 @@ import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
 from pydantic import BaseModel
 
 from .graph import (
     ConfigGraph,
     auto_layout,
+    diff_graphs,
     graph_to_json,
     graph_to_yaml,
     json_to_graph,
@@ -22,6 +24,7 @@ from .graph import (
     save_config_file,
     yaml_to_graph,
 )
+from .http_cache import cached_response, make_etag
 from .registry import get_default_registry
 
 if TYPE_CHECKING:
@@ -146,6 +149,7 @@ def build_editor_router(
     get_config_path: Callable[[], Optional[Path]] | None = None,
     get_world: Callable[[], "BioWorld"] | None = None,
     reload_world: Callable[[Optional[Path]], bool] | None = None,
+    warm_registry: Callable[[], Any] | None = None,
 ) -> APIRouter:
     """Build the FastAPI router for config editor endpoints.
 
@@ -153,6 +157,7 @@ def build_editor_router(
         get_config_path: Callback to get the current simulation's config path
         get_world: Callback to get the current BioWorld instance
         reload_world: Callback to reload the world from a config file
+        warm_registry: Called before the module list is served (starts registry discovery)
 
     Returns:
         FastAPI router with editor endpoints
@@ -160,10 +165,13 @@ def build_editor_router(
     router = APIRouter(prefix="/editor", tags=["editor"])
 
     @router.get("/modules")
-    def get_modules() -> Dict[str, Any]:
-        """Get the module registry with all available BioModules."""
+    def get_modules(request: Request) -> Response:
+        """Get the module registry with all available BioModules (ETag-cached)."""
+        if warm_registry is not None:
+            warm_registry()
         registry = get_default_registry()
-        return registry.to_json()
+        etag = make_etag("registry", id(registry), registry.version)
+        return cached_response(request, etag, registry.to_json_bytes)
 
     @router.get("/current")
     def get_current_config() -> Dict[str, Any]:
@@ -204,13 +212,17 @@ def build_editor_router(
     def apply_config(request: ApplyConfigRequest) -> Dict[str, Any]:
         """Apply a configuration to the running simulation.
 
-        This saves the config to disk and reloads the simulation with the new config.
+        This saves the config to disk and updates the simulation to match it.
+        The graph is diffed against the current config first: if only layout or
+        meta changed the world is left alone, otherwise ``reload_world`` rewires
+        it (the Interface only rebuilds changed modules and edges).
 
         Args:
             request: ApplyConfigRequest with graph and optional save_path
 
         Returns:
-            {"ok": True/False, "path": resolved_path, "error": optional_error_message}
+            {"ok": True/False, "path": resolved_path, "changes": graph diff,
+             "reloaded": bool, "error": optional_error_message}
         """
         if not reload_world:
             raise HTTPException(
@@ -240,16 +252,29 @@ def build_editor_router(
             # Convert to internal graph model
             graph = json_to_graph(request.graph.model_dump())
 
+            # Diff against the config the world was built from (before overwriting it)
+            current_path = get_config_path() if get_config_path else None
+            old_graph = ConfigGraph()
+            if current_path and current_path.exists():
+                try:
+                    old_graph = load_config_file(current_path)
+                except Exception:
+                    logger.warning("Could not load current config %s for diffing", current_path)
+            changes = diff_graphs(old_graph, graph)
+
             # Save to file
             save_config_file(graph, resolved)
 
-            # Reload the world
+            if current_path is not None and Path(current_path) == resolved and not any(changes.values()):
+                return {"ok": True, "path": str(resolved), "changes": changes, "reloaded": False}
+
+            # Rewire the world
             success = reload_world(resolved)
 
             if success:
-                return {"ok": True, "path": str(resolved)}
+                return {"ok": True, "path": str(resolved), "changes": changes, "reloaded": True}
             else:
-                return {"ok": False, "path": str(resolved), "error": "Failed to reload world"}
+                return {"ok": False, "path": str(resolved), "changes": changes, "error": "Failed to reload world"}
         except HTTPException:
             raise
         except Exception as e:
@@ -0,0 +1,147 @@
+"""Event storage for the SimUI: an id-indexed ring buffer and an on-disk event log.
+
+Event ids are consecutive integers, so the ring locates a record by
+``id - first_id`` and ``since_id`` queries cost O(returned items) instead of a
+scan over the whole buffer.
+
+The optional event log is append-only JSONL, one record per line. Every
+``index_every`` records an ``{"id", "offset"}`` entry is appended to a sidecar
+``<log>.idx`` file; readers bisect that sparse index and seek, so paging
+through millions of events from past runs reads only the requested page.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+from .fanout import encode_message
+
+INDEX_SUFFIX = ".idx"
+
+
+class EventRing:
+    """Fixed-capacity buffer of event records with consecutive ``id`` values."""
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = max(1, int(capacity))
+        self._slots: List[Optional[Dict[str, Any]]] = [None] * self._capacity
+        self._first_id = 1  # id of the oldest retained record
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_id(self) -> int:
+        """Id of the newest record (``first_id - 1`` when empty)."""
+        return self._first_id + self._count - 1
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a record whose ``id`` is ``last_id + 1`` (or any id when empty)."""
+        rid = int(record["id"])
+        if self._count == 0:
+            self._first_id = rid
+        elif rid != self.last_id + 1:
+            raise ValueError(f"Event id {rid} does not follow {self.last_id}")
+        self._slots[rid % self._capacity] = record
+        if self._count == self._capacity:
+            self._first_id += 1
+        else:
+            self._count += 1
+
+    def clear(self) -> None:
+        self._slots = [None] * self._capacity
+        self._count = 0
+
+    def since(self, since_id: Optional[int], limit: int = 0) -> List[Dict[str, Any]]:
+        """Records with ``id > since_id``; with ``limit > 0`` only the newest ``limit`` of them."""
+        if self._count == 0:
+            return []
+        last = self.last_id
+        start = self._first_id if since_id is None else max(self._first_id, int(since_id) + 1)
+        if limit > 0:
+            start = max(start, last - limit + 1)
+        cap = self._capacity
+        return [self._slots[i % cap] for i in range(start, last + 1)]  # type: ignore[misc]
+
+
+class EventLogWriter:
+    """Append-only JSONL event log with a sparse ``id -> byte offset`` sidecar index."""
+
+    def __init__(self, path: str | Path, *, index_every: int = 1024) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._index_every = max(1, int(index_every))
+        self._file: IO[bytes] = open(self.path, "ab")
+        self._index: IO[bytes] = open(self.path.with_name(self.path.name + INDEX_SUFFIX), "ab")
+        self._offset = self._file.tell()
+        self._written = 0
+
+    def append(self, record: Dict[str, Any]) -> None:
+        if self._written % self._index_every == 0:
+            self._index.write(encode_message({"id": record["id"], "offset": self._offset}) + b"\n")
+        line = encode_message(record) + b"\n"
+        self._file.write(line)
+        self._offset += len(line)
+        self._written += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+        self._index.close()
+
+
+def _load_index(path: Path) -> Tuple[List[int], List[int]]:
+    ids: List[int] = []
+    offsets: List[int] = []
+    try:
+        with open(path.with_name(path.name + INDEX_SUFFIX), "rb") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # Torn write at the end of a crashed run
+                ids.append(int(entry["id"]))
+                offsets.append(int(entry["offset"]))
+    except FileNotFoundError:
+        pass
+    return ids, offsets
+
+
+def read_event_log(path: str | Path, since_id: Optional[int] = None, limit: int = 200) -> Dict[str, Any]:
+    """Read the first ``limit`` records with ``id > since_id`` from an event log.
+
+    Returns ``{"events", "next_since_id"}`` like ``/api/events``; pass
+    ``next_since_id`` back to fetch the following page.
+    """
+    path = Path(path)
+    after = int(since_id) if since_id is not None else None
+    ids, offsets = _load_index(path)
+    offset = 0
+    if after is not None and ids:
+        i = bisect.bisect_right(ids, after + 1) - 1
+        if i >= 0:
+            offset = offsets[i]
+    events: List[Dict[str, Any]] = []
+    with open(path, "rb") as fh:
+        fh.seek(offset)
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            if after is not None and int(record["id"]) <= after:
+                continue
+            events.append(record)
+            if limit > 0 and len(events) >= limit:
+                break
+    next_since_id = int(events[-1]["id"]) if events else (after or 0)
+    return {"events": events, "next_since_id": next_since_id}
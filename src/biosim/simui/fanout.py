@@ -0,0 +1,205 @@
+"""Fan-out of SimUI stream messages to SSE and WebSocket subscribers.
+
+Every broadcast message is wrapped in a :class:`Frame` that encodes it at most
+once per wire format (SSE text or binary frame); all subscribers share the
+resulting bytes. Each :class:`Subscriber` owns a bounded queue and a
+backpressure policy deciding what happens when the client falls behind:
+
+- ``"drop-oldest"`` (default): the oldest queued frame is discarded.
+- ``"keep-latest"``: a queued tick is replaced by the newer tick, so a slow
+  client always renders the latest state; other events queue as in
+  ``drop-oldest``.
+- ``"block"``: the publisher waits for room, and the simulation waits for the
+  publisher (see ``Interface._listener``). Nothing is dropped; use it for
+  lossless export clients.
+
+Dropped frames are counted per subscriber and reported by ``stats()``.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from queue import Empty
+from typing import Any, Deque, Dict, Hashable, List, Optional
+
+from ..visuals import encode_json
+from .binary import encode_binary_frame
+
+SUBSCRIBER_POLICIES = ("drop-oldest", "keep-latest", "block")
+
+# Encoding keys: ("sse",) or ("binary", min_elements)
+SSE_ENCODING = ("sse",)
+
+_subscriber_ids = itertools.count(1)
+
+
+def encode_message(obj: Any) -> bytes:
+    """Encode a message for the wire; unknown payload values (e.g. exceptions) become strings."""
+    try:
+        return encode_json(obj)
+    except (TypeError, ValueError):
+        return json.dumps(obj, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def encode_for(message: Dict[str, Any], encoding: Hashable) -> bytes:
+    """Encode ``message`` in the given wire format."""
+    if encoding == SSE_ENCODING:
+        return b"data: " + encode_message(message) + b"\n\n"
+    _, min_elements = encoding  # type: ignore[misc]
+    return encode_binary_frame(message, min_elements=min_elements)
+
+
+class Frame:
+    """A broadcast message with its encodings cached per wire format."""
+
+    __slots__ = ("message", "is_tick", "_encoded", "_lock")
+
+    def __init__(self, message: Dict[str, Any]) -> None:
+        self.message = message
+        self.is_tick = message.get("type") == "tick"
+        self._encoded: Dict[Hashable, bytes] = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding: Hashable = SSE_ENCODING) -> bytes:
+        data = self._encoded.get(encoding)
+        if data is None:
+            with self._lock:
+                data = self._encoded.get(encoding)
+                if data is None:
+                    data = encode_for(self.message, encoding)
+                    self._encoded[encoding] = data
+        return data
+
+
+class Subscriber:
+    """Bounded frame queue for one streaming client.
+
+    ``offer`` is called from the publisher thread. Consumers either read
+    synchronously (``get``/``get_nowait``) or, when ``loop`` is given, await
+    ``next_frame`` which is woken via ``call_soon_threadsafe`` only when data
+    arrives.
+    """
+
+    def __init__(
+        self,
+        *,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        maxsize: int = 100,
+        policy: str = "drop-oldest",
+        delta: bool = False,
+        encoding: Hashable = SSE_ENCODING,
+    ) -> None:
+        if policy not in SUBSCRIBER_POLICIES:
+            raise ValueError(f"Unknown backpressure policy {policy!r}; expected one of {SUBSCRIBER_POLICIES}")
+        self.id = next(_subscriber_ids)
+        self.policy = policy
+        self.delta = delta
+        self.encoding = encoding
+        self.delivered = 0
+        self.dropped = 0
+        self.connected_at = time.time()
+        self._maxsize = max(1, int(maxsize))
+        self._items: Deque[Frame] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._loop = loop
+        self._ready = asyncio.Event() if loop is not None else None
+
+    # ---- producer side -------------------------------------------------
+    def offer(self, frame: Frame) -> None:
+        """Queue ``frame`` according to the backpressure policy."""
+        with self._cond:
+            if self._closed:
+                return
+            if self.policy == "block":
+                while len(self._items) >= self._maxsize and not self._closed:
+                    self._cond.wait(0.1)
+                if self._closed:
+                    return
+            elif self.policy == "keep-latest" and frame.is_tick:
+                for i, queued in enumerate(self._items):
+                    if queued.is_tick:
+                        del self._items[i]
+                        self.dropped += 1
+                        break
+            if len(self._items) >= self._maxsize:
+                self._items.popleft()
+                self.dropped += 1
+            self._items.append(frame)
+            self._cond.notify_all()
+        self._wake()
+
+    def close(self) -> None:
+        """Stop accepting frames and release a publisher blocked on this subscriber."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._loop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)  # type: ignore[union-attr]
+        except RuntimeError:
+            pass  # Loop closed; the subscriber is going away
+
+    # ---- consumer side -------------------------------------------------
+    def get_frame_nowait(self) -> Frame:
+        with self._cond:
+            if not self._items:
+                raise Empty
+            frame = self._items.popleft()
+            self.delivered += 1
+            self._cond.notify_all()
+            return frame
+
+    def get_nowait(self) -> Dict[str, Any]:
+        return self.get_frame_nowait().message
+
+    def get(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        with self._cond:
+            self._cond.wait_for(lambda: self._items or self._closed, timeout)
+        return self.get_nowait()
+
+    def empty(self) -> bool:
+        with self._cond:
+            return not self._items
+
+    async def next_frame(self, timeout: Optional[float] = None) -> Frame:
+        """Wait for the next frame; raises ``asyncio.TimeoutError`` after ``timeout``."""
+        assert self._ready is not None, "next_frame requires a subscriber bound to a loop"
+        while True:
+            self._ready.clear()
+            try:
+                return self.get_frame_nowait()
+            except Empty:
+                pass
+            await asyncio.wait_for(self._ready.wait(), timeout)
+
+    def drain_frames(self) -> List[Frame]:
+        """Return every queued frame without waiting."""
+        with self._cond:
+            frames = list(self._items)
+            self._items.clear()
+            self.delivered += len(frames)
+            self._cond.notify_all()
+            return frames
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            queued = len(self._items)
+        return {
+            "id": self.id,
+            "transport": "sse" if self.encoding == SSE_ENCODING else "ws",
+            "delta": self.delta,
+            "policy": self.policy,
+            "queued": queued,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "connected_at": self.connected_at,
+        }
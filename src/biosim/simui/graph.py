@@ -4,13 +4,16 @@
 """Graph model and YAML conversion utilities for config editor."""
 from __future__ import annotations
 
-from collections import defaultdict
+import hashlib
+import threading
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from ..wiring import _is_pattern, expand_wiring, replica_name
 from .registry import get_default_registry
 
 
@@ -30,6 +33,7 @@ class GraphNode:
     args: Dict[str, Any] = field(default_factory=dict)
     inputs: List[str] = field(default_factory=list)
     outputs: List[str] = field(default_factory=list)
+    replicas: Optional[int] = None  # A replica group is shown as a single node
 
 
 @dataclass
@@ -40,6 +44,8 @@ class GraphEdge:
     source_handle: str  # Output port name
     target: str  # Target node id
     target_handle: str  # Input port name
+    rule: Optional[Dict[str, Any]] = None  # Replica wiring rule ({"rule": ..., "k": ..., "seed": ...})
+    pattern: Optional[Dict[str, Any]] = None  # Pattern entry ({"from": ..., "to": [...]}) the edge was drawn from
 
 
 @dataclass
@@ -122,10 +128,23 @@ def yaml_to_graph(yaml_content: str) -> ConfigGraph:
                 inputs=inputs,
                 outputs=outputs,
             )
+            replicas = entry.get("replicas") if isinstance(entry, dict) else None
+            if isinstance(replicas, int) and not isinstance(replicas, bool) and replicas > 0:
+                node.replicas = replicas
             graph.nodes.append(node)
 
     # Build a map for quick node lookup
     node_map = {n.id: n for n in graph.nodes}
+    # Patterns may match replica names; their edges are drawn on the group node.
+    owner = {n.id: n.id for n in graph.nodes}
+    members: Dict[str, List[str]] = {}
+    for n in graph.nodes:
+        members[n.id] = [n.id]
+        if n.replicas:
+            members[n.id] = [replica_name(n.id, i) for i in range(n.replicas)]
+            for name in members[n.id]:
+                owner.setdefault(name, n.id)
+    names = list(owner)
 
     # Parse wiring section
     wiring_section = config.get("wiring", [])
@@ -150,15 +169,36 @@ def yaml_to_graph(yaml_content: str) -> ConfigGraph:
             except ValueError:
                 continue
 
+            targets = [t for t in targets if isinstance(t, str)]
+            rule = {key: entry[key] for key in ("rule", "k", "seed") if key in entry} or None
+            pattern_src = _is_pattern(src_name)
+            pattern = None
+            if rule is None and (pattern_src or any(_is_pattern(t) or "{" in t for t in targets)):
+                # Pattern wiring: show the concrete edges it expands to.
+                try:
+                    expanded = expand_wiring(src, targets, names)
+                except (KeyError, ValueError):
+                    continue
+                pairs, exact = _collapse_pattern(expanded, owner, members)
+                if not exact:
+                    pattern = {"from": src, "to": list(targets)}
+                    pairs = [(source, target, None) for source, target, _ in pairs]
+            else:
+                # Module and replica group refs: one edge per entry target (the rule rides along).
+                pairs = [(src, t, rule) for t in targets]
+
             # Ensure source node has this output port listed
             if src_name in node_map:
                 src_node = node_map[src_name]
                 if src_port not in src_node.outputs:
                     src_node.outputs.append(src_port)
 
-            for target in targets:
-                if not isinstance(target, str):
-                    continue
+            for source, target, edge_rule in pairs:
+                if pattern_src:
+                    src_name, src_port = source.split(".", 1)
+                    src_node = node_map[src_name]
+                    if src_port not in src_node.outputs:
+                        src_node.outputs.append(src_port)
                 try:
                     tgt_name, tgt_port = _parse_ref(target)
                 except ValueError:
@@ -177,12 +217,45 @@ def yaml_to_graph(yaml_content: str) -> ConfigGraph:
                     source_handle=src_port,
                     target=tgt_name,
                     target_handle=tgt_port,
+                    rule=dict(edge_rule) if edge_rule else None,
+                    pattern=pattern,
                 )
                 graph.edges.append(edge)
 
     return graph
 
 
+def _collapse_pattern(
+    expanded: List[Tuple[str, str]], owner: Dict[str, str], members: Dict[str, List[str]]
+) -> Tuple[List[Tuple[str, str, Optional[Dict[str, Any]]]], bool]:
+    """Map a pattern's concrete connections onto node-level edges.
+
+    Each edge between group nodes gets the rule that reproduces exactly its
+    connections (``all_to_all`` as no rule, or ``one_to_one``). The second item
+    is False when some edge matches neither; the caller then keeps the pattern
+    entry on the edges and that entry is what gets written back.
+    """
+    concrete: Dict[Tuple[str, str], set] = {}
+    for source, target in expanded:
+        source_name, source_port = source.split(".", 1)
+        target_name, target_port = target.split(".", 1)
+        pair = (f"{owner[source_name]}.{source_port}", f"{owner[target_name]}.{target_port}")
+        concrete.setdefault(pair, set()).add((source_name, target_name))
+
+    pairs: List[Tuple[str, str, Optional[Dict[str, Any]]]] = []
+    exact = True
+    for (source, target), links in concrete.items():
+        sources, targets = members[source.split(".", 1)[0]], members[target.split(".", 1)[0]]
+        if links == {(s, t) for s in sources for t in targets}:
+            pairs.append((source, target, None))
+        elif len(sources) == len(targets) and links == set(zip(sources, targets)):
+            pairs.append((source, target, {"rule": "one_to_one"}))
+        else:
+            pairs.append((source, target, None))
+            exact = False
+    return pairs, exact
+
+
 def graph_to_yaml(graph: ConfigGraph) -> str:
     """Convert a ConfigGraph back to YAML.
 
@@ -216,19 +289,28 @@ def graph_to_yaml(graph: ConfigGraph) -> str:
                 modules[node.id] = {
                     "class": node.type,
                 }
+            if node.replicas:
+                modules[node.id]["replicas"] = node.replicas
         config["modules"] = modules
 
-    # Build wiring section - group by source for cleaner output
+    # Build wiring section - group by source (and rule) for cleaner output
     if graph.edges:
-        wiring_map: Dict[str, List[str]] = defaultdict(list)
+        wiring_map: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], List[str]] = defaultdict(list)
+        patterns: List[Dict[str, Any]] = []
         for edge in graph.edges:
+            if edge.pattern:
+                # Edges collapsed from a pattern no rule reproduces: write the pattern once.
+                if edge.pattern not in patterns:
+                    patterns.append(edge.pattern)
+                continue
             src_ref = f"{edge.source}.{edge.source_handle}"
             tgt_ref = f"{edge.target}.{edge.target_handle}"
-            wiring_map[src_ref].append(tgt_ref)
+            wiring_map[(src_ref, tuple((edge.rule or {}).items()))].append(tgt_ref)
 
         wiring: List[Dict[str, Any]] = []
-        for src_ref, targets in wiring_map.items():
-            wiring.append({"from": src_ref, "to": targets})
+        for (src_ref, rule), targets in wiring_map.items():
+            wiring.append({"from": src_ref, "to": targets, **dict(rule)})
+        wiring.extend({"from": p["from"], "to": list(p["to"])} for p in patterns)
         config["wiring"] = wiring
 
     # Custom YAML representer for cleaner output
@@ -245,6 +327,36 @@ def graph_to_yaml(graph: ConfigGraph) -> str:
     return yaml.dump(config, Dumper=CleanDumper, sort_keys=False, default_flow_style=False)
 
 
+def diff_graphs(old: ConfigGraph, new: ConfigGraph) -> Dict[str, List[str]]:
+    """Compare the modules and wiring of two graphs.
+
+    Positions and meta are ignored, so an empty diff means the world does not
+    need to change. Edges are reported as ``"src.port -> dst.port"``.
+    """
+    old_nodes = {n.id: (n.type, n.args, n.replicas) for n in old.nodes}
+    new_nodes = {n.id: (n.type, n.args, n.replicas) for n in new.nodes}
+
+    def edge_ref(e: GraphEdge) -> str:
+        ref = f"{e.source}.{e.source_handle} -> {e.target}.{e.target_handle}"
+        if e.rule:
+            ref += " (" + ", ".join(f"{key}={value}" for key, value in e.rule.items()) + ")"
+        if e.pattern:
+            ref += f" (pattern={e.pattern['from']} -> {', '.join(e.pattern['to'])})"
+        return ref
+
+    def edge_refs(graph: ConfigGraph) -> List[str]:
+        return list(dict.fromkeys(edge_ref(e) for e in graph.edges))
+
+    old_edges, new_edges = edge_refs(old), edge_refs(new)
+    return {
+        "added": [name for name in new_nodes if name not in old_nodes],
+        "removed": [name for name in old_nodes if name not in new_nodes],
+        "changed": [name for name in new_nodes if name in old_nodes and new_nodes[name] != old_nodes[name]],
+        "added_edges": [e for e in new_edges if e not in set(old_edges)],
+        "removed_edges": [e for e in old_edges if e not in set(new_edges)],
+    }
+
+
 def load_config_file(path: str | Path) -> ConfigGraph:
     """Load a YAML config file and convert to graph.
 
@@ -299,6 +411,7 @@ def graph_to_json(graph: ConfigGraph) -> Dict[str, Any]:
                 "args": node.args,
                 "inputs": node.inputs,
                 "outputs": node.outputs,
+                **({"replicas": node.replicas} if node.replicas else {}),
             },
         }
         for node in graph.nodes
@@ -311,6 +424,8 @@ def graph_to_json(graph: ConfigGraph) -> Dict[str, Any]:
             "sourceHandle": edge.source_handle,
             "target": edge.target,
             "targetHandle": edge.target_handle,
+            **({"data": {"rule": edge.rule}} if edge.rule else {}),
+            **({"data": {"pattern": edge.pattern}} if edge.pattern else {}),  # never both
         }
         for edge in graph.edges
     ]
@@ -361,6 +476,7 @@ def json_to_graph(data: Dict[str, Any]) -> ConfigGraph:
             args=data_section.get("args", {}),
             inputs=data_section.get("inputs", []),
             outputs=data_section.get("outputs", []),
+            replicas=data_section.get("replicas") or None,
         )
         graph.nodes.append(node)
 
@@ -376,16 +492,40 @@ def json_to_graph(data: Dict[str, Any]) -> ConfigGraph:
             source_handle=edge_data.get("sourceHandle", ""),
             target=edge_data.get("target", ""),
             target_handle=edge_data.get("targetHandle", ""),
+            rule=(edge_data.get("data") or {}).get("rule") or None,
+            pattern=(edge_data.get("data") or {}).get("pattern") or None,
         )
         graph.edges.append(edge)
 
     return graph
 
 
+# Layouts by structure hash (node ids, edges, node size); positions only depend on those.
+_LAYOUT_CACHE_SIZE = 32
+_layout_cache: "OrderedDict[str, Dict[str, Tuple[float, float]]]" = OrderedDict()
+_layout_lock = threading.Lock()
+
+
+def _structure_key(graph: ConfigGraph, node_width: float, node_height: float) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{node_width}x{node_height}\0".encode())
+    for node in graph.nodes:
+        h.update(node.id.encode())
+        h.update(b"\0")
+    h.update(b"\1")
+    for edge in graph.edges:
+        h.update(f"{edge.source}\0{edge.target}\0".encode())
+    return h.hexdigest()
+
+
 def auto_layout(graph: ConfigGraph, node_width: float = 200, node_height: float = 100) -> ConfigGraph:
-    """Apply automatic layout to graph nodes using a simple layered algorithm.
+    """Apply a layered (Sugiyama-style) left-to-right layout to graph nodes.
 
-    This is a basic left-to-right layout. For better results, use dagre on the frontend.
+    Cycles are broken by reversing DFS back edges, nodes are layered by
+    longest path, and the order within each layer is chosen by barycenter
+    sweeps to reduce edge crossings. Positions are cached by the graph's
+    structure (node ids and edges), so laying out an unchanged graph again is
+    a dictionary lookup.
 
     Args:
         graph: ConfigGraph to layout
@@ -398,45 +538,164 @@ def auto_layout(graph: ConfigGraph, node_width: float = 200, node_height: float
     if not graph.nodes:
         return graph
 
-    # Build dependency graph
-    node_ids = {n.id for n in graph.nodes}
-    incoming: Dict[str, set] = {n.id: set() for n in graph.nodes}
-    outgoing: Dict[str, set] = {n.id: set() for n in graph.nodes}
+    key = _structure_key(graph, node_width, node_height)
+    with _layout_lock:
+        positions = _layout_cache.get(key)
+        if positions is not None:
+            _layout_cache.move_to_end(key)
+    if positions is None:
+        positions = _layered_positions(graph, node_width, node_height)
+        with _layout_lock:
+            _layout_cache[key] = positions
+            while len(_layout_cache) > _LAYOUT_CACHE_SIZE:
+                _layout_cache.popitem(last=False)
+
+    for node in graph.nodes:
+        x, y = positions[node.id]
+        node.position = Position(x=x, y=y)
+    return graph
+
 
+def _layered_positions(graph: ConfigGraph, node_width: float, node_height: float) -> Dict[str, Tuple[float, float]]:
+    ids = list(dict.fromkeys(n.id for n in graph.nodes))
+    index = {node_id: i for i, node_id in enumerate(ids)}
+    n = len(ids)
+    succ: List[List[int]] = [[] for _ in range(n)]
+    seen_edges = set()
     for edge in graph.edges:
-        if edge.source in node_ids and edge.target in node_ids:
-            outgoing[edge.source].add(edge.target)
-            incoming[edge.target].add(edge.source)
-
-    # Topological sort to determine layers
-    layers: List[List[str]] = []
-    remaining = set(node_ids)
-
-    while remaining:
-        # Find nodes with no incoming edges from remaining nodes
-        layer = []
-        for node_id in remaining:
-            deps = incoming[node_id] & remaining
-            if not deps:
-                layer.append(node_id)
-
-        if not layer:
-            # Cycle detected - just add remaining nodes
-            layer = list(remaining)
-
-        layers.append(layer)
-        remaining -= set(layer)
-
-    # Assign positions
+        u, v = index.get(edge.source), index.get(edge.target)
+        if u is None or v is None or u == v or (u, v) in seen_edges:
+            continue
+        seen_edges.add((u, v))
+        succ[u].append(v)
+
+    # 1. Cycle breaking: reverse the back edges of an iterative DFS.
+    state = [0] * n  # 0 = unvisited, 1 = on stack, 2 = done
+    reversed_edges = set()
+    for root in range(n):
+        if state[root]:
+            continue
+        state[root] = 1
+        stack = [(root, 0)]
+        while stack:
+            u, i = stack[-1]
+            if i < len(succ[u]):
+                stack[-1] = (u, i + 1)
+                v = succ[u][i]
+                if state[v] == 1:
+                    reversed_edges.add((u, v))
+                elif state[v] == 0:
+                    state[v] = 1
+                    stack.append((v, 0))
+            else:
+                state[u] = 2
+                stack.pop()
+    dag: List[List[int]] = [[] for _ in range(n)]
+    for u in range(n):
+        for v in succ[u]:
+            if (u, v) in reversed_edges:
+                if (v, u) not in seen_edges:
+                    dag[v].append(u)
+            else:
+                dag[u].append(v)
+
+    # 2. Longest-path layering in topological (Kahn) order: O(V + E).
+    indegree = [0] * n
+    for u in range(n):
+        for v in dag[u]:
+            indegree[v] += 1
+    layer = [0] * n
+    queue = [u for u in range(n) if indegree[u] == 0]
+    for u in queue:  # the list grows while iterating
+        for v in dag[u]:
+            layer[v] = max(layer[v], layer[u] + 1)
+            indegree[v] -= 1
+            if indegree[v] == 0:
+                queue.append(v)
+
+    # Pull every node with successors right, next to its nearest successor
+    # (reverse topological order keeps this linear); this shortens long edges.
+    for u in reversed(queue):
+        if dag[u]:
+            layer[u] = min(layer[v] for v in dag[u]) - 1
+    compact = {depth: i for i, depth in enumerate(sorted(set(layer)))}
+    layer = [compact[depth] for depth in layer]
+
+    # 3. Crossing reduction: alternate down/up barycenter sweeps, keep the best order.
+    # Long edges are not split into dummy nodes: a node's barycenter uses the
+    # relative position (0..1) of its neighbours in whichever layer they are in.
+    preds: List[List[int]] = [[] for _ in range(n)]
+    for u in range(n):
+        for v in dag[u]:
+            preds[v].append(u)
+    order: List[List[int]] = [[] for _ in range(max(layer) + 1)]
+    for u in range(n):
+        order[layer[u]].append(u)
+    rel = [0.0] * n
+    for nodes in order:
+        _place(nodes, rel)
+    best = [list(nodes) for nodes in order]
+    best_crossings = _count_crossings(order, dag, layer)
+    for sweep in range(8):
+        if best_crossings == 0:
+            break
+        sweep_layers = range(1, len(order)) if sweep % 2 == 0 else range(len(order) - 2, -1, -1)
+        neighbours = preds if sweep % 2 == 0 else dag
+        for depth in sweep_layers:
+            _barycenter_sort(order[depth], neighbours, rel)
+        crossings = _count_crossings(order, dag, layer)
+        if crossings < best_crossings:
+            best_crossings = crossings
+            best = [list(nodes) for nodes in order]
+
+    # 4. Coordinates: one column per layer, centred vertically.
     x_spacing = node_width + 80
     y_spacing = node_height + 40
-    node_map = {n.id: n for n in graph.nodes}
-
-    for layer_idx, layer in enumerate(layers):
-        x = layer_idx * x_spacing + 50
-        for row_idx, node_id in enumerate(layer):
-            y = row_idx * y_spacing + 50
-            if node_id in node_map:
-                node_map[node_id].position = Position(x=x, y=y)
-
-    return graph
+    tallest = max(len(column) for column in best)
+    positions: Dict[str, Tuple[float, float]] = {}
+    for depth, column in enumerate(best):
+        offset = (tallest - len(column)) / 2.0
+        for row, u in enumerate(column):
+            positions[ids[u]] = (depth * x_spacing + 50, (row + offset) * y_spacing + 50)
+    return positions
+
+
+def _place(nodes: List[int], rel: List[float]) -> None:
+    """Record each node's relative position (0..1) within its layer."""
+    scale = 1.0 / len(nodes) if nodes else 0.0
+    for i, u in enumerate(nodes):
+        rel[u] = (i + 0.5) * scale
+
+
+def _barycenter_sort(nodes: List[int], neighbours: List[List[int]], rel: List[float]) -> None:
+    """Reorder ``nodes`` by the mean relative position of their ``neighbours``."""
+    keys: Dict[int, float] = {}
+    for u in nodes:
+        adjacent = neighbours[u]
+        keys[u] = sum(rel[v] for v in adjacent) / len(adjacent) if adjacent else rel[u]  # unconnected: stay put
+    nodes.sort(key=keys.__getitem__)
+    _place(nodes, rel)
+
+
+def _count_crossings(order: List[List[int]], dag: List[List[int]], layer: List[int]) -> int:
+    """Crossings among edges between adjacent layers (inversion count with a Fenwick tree)."""
+    total = 0
+    for depth in range(len(order) - 1):
+        upper, lower = order[depth], order[depth + 1]
+        position = {u: i for i, u in enumerate(lower)}
+        below = depth + 1
+        targets = sorted((i, position[v]) for i, u in enumerate(upper) for v in dag[u] if layer[v] == below)
+        size = len(lower)
+        tree = [0] * (size + 1)
+        for seen, (_, p) in enumerate(targets):
+            # earlier edges (further up) that end strictly below p cross this one
+            j, not_greater = p + 1, 0
+            while j > 0:
+                not_greater += tree[j]
+                j -= j & -j
+            total += seen - not_greater
+            j = p + 1
+            while j <= size:
+                tree[j] += 1
+                j += j & -j
+    return total
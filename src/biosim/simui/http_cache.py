@@ -0,0 +1,183 @@
+"""Conditional GET and compression helpers for SimUI read endpoints.
+
+ETags are built from cheap version counters (world structure, visual
+revisions, run status, registry) rather than from the body, so a matching
+``If-None-Match`` is answered with ``304 Not Modified`` before anything is
+computed or serialized. A per-process token is mixed in so counters that
+restart with the server never collide with ETags cached by clients.
+
+Bodies of at least ``COMPRESS_MIN_SIZE`` bytes are compressed with brotli
+(when the optional ``brotli`` package is installed) or gzip, depending on the
+client's ``Accept-Encoding``. Compressed variants of ETagged bodies are kept in
+a small LRU so an unchanged resource is compressed once. Each encoding gets its
+own ETag suffix (``"<tag>-gzip"``) as strong validators must differ per
+representation.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:  # Optional: better ratios than gzip for JSON
+    import brotli as _brotli  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    _brotli = None
+
+_BOOT_TOKEN = os.urandom(6).hex()
+
+# Clients may reuse a cached body but must revalidate it every time.
+CACHE_CONTROL = "no-cache"
+
+COMPRESS_MIN_SIZE = 1024
+_ENCODINGS = ("br", "gzip")
+
+
+def make_etag(*parts: Any) -> str:
+    """Return a strong ETag for the given version parts."""
+    digest = hashlib.blake2b(repr((_BOOT_TOKEN,) + parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def _encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    return etag if encoding is None else f'{etag[:-1]}-{encoding}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's ``If-None-Match`` matches ``etag`` or one of its encoded variants.
+
+    Uses weak comparison, as RFC 9110 requires for ``If-None-Match``.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    variants = {etag, *(_encoded_etag(etag, e) for e in _ENCODINGS)}
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in variants:
+            return True
+    return False
+
+
+def accepted_encoding(request: Request, *, allow_brotli: bool = True) -> Optional[str]:
+    """Pick ``"br"`` or ``"gzip"`` from ``Accept-Encoding`` (None if neither is acceptable)."""
+    header = request.headers.get("accept-encoding", "")
+    accepted = set()
+    for item in header.split(","):
+        token, _, params = item.strip().partition(";")
+        if params.replace(" ", "").lower() in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(token.strip().lower())
+    if allow_brotli and _brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return _brotli.compress(body, quality=5)  # type: ignore[union-attr]
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+class _CompressedBodies:
+    """Small LRU of compressed bodies keyed by (etag, encoding)."""
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self._maxsize = maxsize
+        self._items: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, etag: str, encoding: str, body: bytes) -> bytes:
+        key = (etag, encoding)
+        with self._lock:
+            data = self._items.get(key)
+            if data is not None:
+                self._items.move_to_end(key)
+                return data
+        data = compress(body, encoding)
+        with self._lock:
+            self._items[key] = data
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+        return data
+
+
+_compressed_bodies = _CompressedBodies()
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"})
+
+
+def body_response(
+    request: Request,
+    body: bytes,
+    *,
+    etag: Optional[str] = None,
+    media_type: str = "application/json",
+    min_size: int = COMPRESS_MIN_SIZE,
+) -> Response:
+    """Build a response, compressing ``body`` when it is large enough and the client accepts it."""
+    headers = {"Vary": "Accept-Encoding"}
+    encoding = accepted_encoding(request) if min_size > 0 and len(body) >= min_size else None
+    if encoding is not None:
+        body = _compressed_bodies.get(etag, encoding, body) if etag else compress(body, encoding)
+        headers["Content-Encoding"] = encoding
+    if etag is not None:
+        headers["ETag"] = _encoded_etag(etag, encoding)
+        headers["Cache-Control"] = CACHE_CONTROL
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def cached_response(
+    request: Request,
+    etag: str,
+    body: Callable[[], bytes],
+    media_type: str = "application/json",
+    min_size: int = COMPRESS_MIN_SIZE,
+) -> Response:
+    """Answer 304 if the client has ``etag``, else build the body and tag it."""
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return body_response(request, body(), etag=etag, media_type=media_type, min_size=min_size)
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes], level: int = 1) -> AsyncIterator[bytes]:
+    """Gzip a byte stream, flushing after every chunk so each SSE message arrives immediately."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    try:
+        async for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()  # run the wrapped generator's cleanup (e.g. unsubscribe)
+
+
+class BodyCache:
+    """Keeps the last encoded body per key so unchanged resources are encoded once."""
+
+    def __init__(self) -> None:
+        self._bodies: Dict[str, Tuple[str, bytes]] = {}
+
+    def get(self, key: str, etag: str, build: Callable[[], bytes]) -> bytes:
+        cached: Optional[Tuple[str, bytes]] = self._bodies.get(key)
+        if cached is not None and cached[0] == etag:
+            return cached[1]
+        body = build()
+        self._bodies[key] = (etag, body)
+        return body
@@ -3,24 +3,44 @@ import asyncio
 import json
 import threading
 import time
-from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from queue import Queue, Empty
-from typing import Any, Deque, Dict, List, Optional, Sequence, Set
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 import logging
+import queue
 
-from fastapi import APIRouter, FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import APIRouter, FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 
 from ..__about__ import __version__
 from ..world import BioWorld, WorldEvent
-from .runner import SimulationManager
+from .assets import PrecompressedStaticFiles, asset_url, load_manifest
+from .delta import VisualDeltaEncoder
+from .events import EventLogWriter, EventRing, read_event_log
+from .fanout import SSE_ENCODING, SUBSCRIBER_POLICIES, Frame, Subscriber, encode_for, encode_message
+from .http_cache import (
+    COMPRESS_MIN_SIZE,
+    BodyCache,
+    accepted_encoding,
+    body_response,
+    cached_response,
+    gzip_stream,
+    make_etag,
+)
+from .runner import RunLimitReached, SimulationManager
+from .registry import get_default_registry
 from .editor_api import build_editor_router
 
 logger = logging.getLogger(__name__)
 
+# Events after which the on-disk event log is flushed so other readers see the run
+_FLUSH_EVENTS = frozenset(
+    e.value for e in (WorldEvent.FINISHED, WorldEvent.ERROR, WorldEvent.PAUSED, WorldEvent.STOPPED)
+)
+# Event log writer queue markers: start a new file / close and exit.
+_LOG_ROTATE = object()
+_LOG_STOP = object()
+
 
 # ----------------------------- Components ---------------------------------
 
@@ -54,6 +74,26 @@ class VisualsPanel:
 # ------------------------------- Interface --------------------------------
 
 
+def _run_params(params: Dict[str, Any]) -> Tuple[float, Optional[float]]:
+    """Validate ``duration``/``tick_dt`` from a run or job request body."""
+    duration = params.get("duration")
+    tick_dt = params.get("tick_dt")
+    try:
+        duration_f = float(duration)
+    except Exception:
+        raise HTTPException(status_code=400, detail="'duration' must be a number")
+    if duration_f <= 0:
+        raise HTTPException(status_code=400, detail="'duration' must be positive")
+    try:
+        tick_f = float(tick_dt) if tick_dt is not None else None
+    except Exception:
+        raise HTTPException(status_code=400, detail="'tick_dt' must be a number")
+    if tick_f is not None and tick_f <= 0:
+        raise HTTPException(status_code=400, detail="'tick_dt' must be positive")
+    return duration_f, tick_f
+
+
+
 class Interface:
     """Python-first UI interface that can be launched or mounted.
 
@@ -72,6 +112,13 @@ class Interface:
         outputs: Sequence[Any] | None = None,
         mount_path: str = "/ui",
         config_path: str | Path | None = None,
+        delta_keyframe_interval: int = 50,
+        publish_fps: float = 30.0,
+        event_log_dir: str | Path | None = None,
+        compress_min_size: int = COMPRESS_MIN_SIZE,
+        job_concurrency: int = 1,
+        run_slots: Optional[threading.Semaphore] = None,
+        registry_packs: Sequence[Tuple[str, str]] | None = None,
     ) -> None:
         self._world = world
         self._title = title
@@ -90,26 +137,79 @@ class Interface:
                 event_limit = max(1, int(out.limit))
                 break
         self._event_limit = event_limit
-        self._events: Deque[Dict[str, Any]] = deque(maxlen=self._event_limit)
+        self._events = EventRing(self._event_limit)
         self._events_lock = threading.Lock()
         self._event_seq: int = 0
 
+        # Optional on-disk event log: one JSONL file per run (see events.py). The
+        # sim thread only queues records; a writer thread does the file I/O.
+        self._event_log_dir: Path | None = Path(event_log_dir) if event_log_dir else None
+        self._event_log: Optional[EventLogWriter] = None
+        self._event_log_runs = 0
+        self._event_log_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._event_log_writer: Optional[threading.Thread] = None
+
         # Register listener
-        self._world.on(self._listener)
+        self._world.on(self._listener, replay_safe=True)
 
         # Runtime snapshot fields
         self._last_step = None
 
-        # Runner (status is polled by frontend)
-        self._runner = SimulationManager(self._world)
+        # Runner (status is polled by frontend). Queued jobs get a fresh world built from
+        # config_path (so they can override module args and run in parallel); without a
+        # config they run one at a time on this world.
+        self._runner = SimulationManager(
+            self._world,
+            world_factory=self._job_world if self._config_path else None,
+            job_concurrency=job_concurrency,
+            on_job_start=self._clear_event_buffers,
+            run_slots=run_slots,
+        )
 
-        # SSE subscribers: each subscriber gets a Queue for pushed events
-        self._sse_subscribers: Set[Queue[Dict[str, Any]]] = set()
+        # Stream subscribers (SSE and WebSocket), see fanout.py for backpressure policies.
+        # Delta subscribers receive visuals as per-module deltas (see delta.py).
+        self._sse_subscribers: Set[Any] = set()
+        self._sse_delta_subscribers: Set[Any] = set()
         self._sse_lock = threading.Lock()
+        self._lossless_subscribers = 0
+        self._visual_delta = VisualDeltaEncoder(keyframe_interval=delta_keyframe_interval)
+        self._visual_delta_lock = threading.Lock()
+
+        # Publisher: the sim thread only records the latest tick; a separate thread
+        # turns it into at most `publish_fps` SSE frames per second.
+        self._publish_fps = max(0.0, float(publish_fps))
+        self._latest_tick: Optional[Dict[str, Any]] = None
+        self._published_tick: Optional[Dict[str, Any]] = None
+        self._pending_events: List[Dict[str, Any]] = []
+        self._publish_lock = threading.Lock()
+        self._tick_published = threading.Condition(self._events_lock)
+        self._publish_wakeup = threading.Event()
+        self._publisher_stop = threading.Event()
+        self._publisher: Optional[threading.Thread] = None
+
+        # HTTP readers use snapshots the world publishes at tick boundaries, never live modules.
+        self._attach_world_snapshots()
+
+        # Encoded bodies of ETag-cached endpoints; bodies of at least
+        # compress_min_size bytes are gzip/brotli-compressed (0 disables).
+        self._http_bodies = BodyCache()
+        self._compress_min_size = max(0, int(compress_min_size))
+        self._asset_manifest: Dict[str, str] = {}  # set by mount() from static/manifest.json
+
+        # (pack_path, category) pairs the editor registry discovers on first use.
+        self._registry_packs = [(str(pack), str(category)) for pack, category in registry_packs or ()]
+        self._registry_warm: Optional[threading.Thread] = None
+        self._registry_warmed = False
+        self._registry_lock = threading.Lock()
 
         # Routing / app (must be inside __init__)
         self._router = self._build_router()
 
+    def _attach_world_snapshots(self) -> None:
+        if self._world.snapshot_interval is None:
+            self._world.snapshot_interval = 1.0 / self._publish_fps if self._publish_fps > 0 else 0.0
+            self._world.publish_snapshot()
+
     # ---- Public API ------------------------------------------------------
     def launch(self, host: str = "127.0.0.1", port: int = 7860, open_browser: bool = False) -> None:
         """Start a managed uvicorn server to serve the UI.
@@ -137,100 +237,327 @@ class Interface:
             raise RuntimeError(
                 f"SimUI static bundle missing at {app_js}. Install the package with UI assets or build the frontend."
             )
-        app.mount(f"{mount_at}/static", StaticFiles(directory=str(static_dir)), name="bsim_simui_static")
+        self._asset_manifest = load_manifest(static_dir)
+        app.mount(
+            f"{mount_at}/static",
+            PrecompressedStaticFiles(directory=str(static_dir), manifest=self._asset_manifest),
+            name="bsim_simui_static",
+        )
         # API + index
         app.include_router(self._router, prefix=mount_at)
 
+    def warm_registry(self) -> Optional[threading.Thread]:
+        """Register the configured ``registry_packs`` in the editor registry, once.
+
+        Called when the editor first asks for modules. Runs on a background
+        thread; packs whose sources are unchanged since the last run are served
+        from the on-disk registry cache without importing.
+        """
+        with self._registry_lock:
+            if not self._registry_warmed:
+                self._registry_warmed = True
+                if self._registry_packs:
+                    self._registry_warm = get_default_registry().warm(self._registry_packs)
+            return self._registry_warm
+
     def close(self) -> None:
         try:
             self._world.off(self._listener)
         except Exception:
             pass
+        self._runner.close_jobs()
+        self._publisher_stop.set()
+        self._publish_wakeup.set()
+        with self._events_lock:
+            self._tick_published.notify_all()
+            writer = self._event_log_writer
+            self._event_log_writer = None
+        if writer is not None:
+            self._event_log_queue.put(_LOG_STOP)
+            writer.join(timeout=5.0)
 
     # ---- Internal: event listener and buffers ---------------------------
     def _listener(self, event: WorldEvent, payload: Dict[str, Any]) -> None:
-        self._event_seq += 1
         event_name = event.value if hasattr(event, "value") else str(event)
-        record = {
-            "id": self._event_seq,
-            "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            "event": event_name,
-            "payload": payload,
-        }
+        ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        # O(1) hand-off to the publisher; UI work never runs on the sim thread.
+        has_subscribers = bool(self._sse_subscribers or self._sse_delta_subscribers)
         with self._events_lock:
+            if event == WorldEvent.TICK:
+                # Lossless ("block") subscribers: hold the sim until the previous tick is published.
+                while (
+                    self._lossless_subscribers
+                    and self._latest_tick is not None
+                    and self._latest_tick is not self._published_tick
+                    and not self._publisher_stop.is_set()
+                ):
+                    self._tick_published.wait(0.1)
+            # Ids are assigned under the same lock as the append so they stay consecutive.
+            self._event_seq += 1
+            record = {"id": self._event_seq, "ts": ts, "event": event_name, "payload": payload}
             self._events.append(record)
+            if self._event_log_dir is not None:
+                self._queue_event_log(record)
             if event == WorldEvent.TICK:
                 self._last_step = payload
+                self._latest_tick = record
+            elif has_subscribers:
+                self._pending_events.append(record)
+        if has_subscribers:
+            self._publish_wakeup.set()
+
+    # ---- Internal: SSE publisher ----------------------------------------
+    def _ensure_publisher(self) -> None:
+        """Start the publisher thread on first use."""
+        if self._publisher is not None and self._publisher.is_alive():
+            return
+        self._publisher_stop.clear()
+        self._publisher = threading.Thread(target=self._publisher_loop, name="simui-publisher", daemon=True)
+        self._publisher.start()
+
+    def _publisher_loop(self) -> None:
+        while not self._publisher_stop.is_set():
+            self._publish_wakeup.wait()
+            if self._publisher_stop.is_set():
+                break
+            self._publish_wakeup.clear()
+            try:
+                self._publish_frame()
+            except Exception:
+                logger.exception("SimUI publisher failed to publish a frame")
+            if self._publish_fps > 0 and not self._lossless_subscribers:
+                # Cap the frame rate; ticks arriving meanwhile coalesce into the next frame.
+                self._publisher_stop.wait(1.0 / self._publish_fps)
+
+    def _publish_frame(self) -> None:
+        """Fan out pending events and the latest tick (if new) to SSE subscribers."""
+        with self._publish_lock:
+            with self._events_lock:
+                tick = self._latest_tick
+                if tick is self._published_tick:
+                    tick = None
+                pending, self._pending_events = self._pending_events, []
+            tick_id = int(tick["id"]) if tick is not None else None
+            for record in pending:
+                if tick_id is not None and int(record["id"]) > tick_id:
+                    self._broadcast_tick(tick)
+                    tick_id = None
+                # Other events just push the event record
+                self._broadcast_sse({"type": "event", "data": record})
+            if tick_id is not None:
+                self._broadcast_tick(tick)  # type: ignore[arg-type]
+            if tick is not None:
+                with self._events_lock:
+                    self._published_tick = tick
+                    self._tick_published.notify_all()
 
-        # Push to SSE subscribers
-        if event == WorldEvent.TICK:
-            # On STEP, send a tick with status, visuals, and the event
-            self._broadcast_sse({
+    def _broadcast_tick(self, record: Dict[str, Any]) -> None:
+        """Send a tick with status, visuals, and the event."""
+        with self._sse_lock:
+            want_full = bool(self._sse_subscribers)
+            want_delta = bool(self._sse_delta_subscribers)
+        if not want_full and not want_delta:
+            return
+        status = self._runner.status()
+        full_msg = None
+        delta_msg = None
+        if want_full:
+            full_msg = {
                 "type": "tick",
-                "data": {
-                    "status": self._runner.status(),
-                    "visuals": self._collect_visuals_safe(),
-                    "event": record,
-                },
-            })
-        else:
-            # Other events just push the event record
-            self._broadcast_sse({
-                "type": "event",
-                "data": record,
-            })
+                "data": {"status": status, "visuals": self._collect_visuals_safe(), "event": record},
+            }
+        if want_delta:
+            delta_msg = {
+                "type": "tick",
+                "data": {"status": status, "visuals_delta": self._visuals_delta_safe(), "event": record},
+            }
+        self._broadcast_sse(full_msg, delta_msg)
+
+    def _clear_event_buffers(self) -> None:
+        """Drop buffered events and any frame the publisher has not sent yet."""
+        with self._events_lock:
+            self._events.clear()
+            self._event_seq = 0
+            self._pending_events = []
+            self._latest_tick = None
+            self._tick_published.notify_all()
+            if self._event_log_writer is not None:
+                self._event_log_queue.put(_LOG_ROTATE)
+        self._last_step = None
 
     def _collect_visuals_safe(self) -> List[Dict[str, Any]]:
-        """Collect visuals with error handling."""
+        """Collect visuals from the last published world snapshot, with error handling."""
         try:
-            collected = self._world.collect_visuals()
-            return [
-                {
-                    "module": entry.get("module"),
-                    "visuals": [
-                        {
-                            "render": v["render"],
-                            "data": v["data"],
-                            **({"description": v["description"]} if "description" in v else {}),
-                        }
-                        for v in entry.get("visuals", [])
-                    ],
-                }
-                for entry in collected
-            ]
+            return [{"module": mv.module, "visuals": list(mv.visuals)} for mv in self._world.snapshot().visuals]
         except Exception:
             return []
 
+    def _visuals_delta_safe(self) -> Dict[str, Any]:
+        """Build the next visuals delta; on error fall back to an empty delta."""
+        with self._visual_delta_lock:
+            try:
+                return self._visual_delta.delta(self._world.snapshot().visuals)
+            except Exception:
+                logger.exception("Failed to build visuals delta")
+                self._visual_delta.reset()
+                return {"seq": 0, "keyframe": False, "order": [], "modules": {}, "removed": []}
+
+    def _snapshot_json(self, *, delta: bool = False) -> bytes:
+        """Encode the full snapshot (status, visuals, events), reusing cached visual bytes.
+
+        With ``delta`` the visuals are sent as a keyframe so the client can apply
+        subsequent tick deltas on top of it.
+        """
+        st = self._runner.status()
+        ev = self._events_since(None, 0)  # limit=0 => no limit
+        world_snapshot = self._world.snapshot()
+        if delta:
+            with self._visual_delta_lock:
+                keyframe = self._visual_delta.keyframe(world_snapshot.visuals)
+            visuals = b',"visuals_delta":' + encode_message(keyframe)
+        else:
+            visuals = b',"visuals":' + world_snapshot.visuals_json
+        return b'{"status":' + encode_message(st) + visuals + b',"events":' + encode_message(ev.get("events", [])) + b"}"
+
     def _events_since(self, since_id: Optional[int], limit: int) -> Dict[str, Any]:
         with self._events_lock:
-            items = list(self._events)
-        if since_id is not None:
-            items = [e for e in items if int(e.get("id", 0)) > int(since_id)]
-        if limit > 0:
-            items = items[-limit:]
+            items = self._events.since(since_id, limit)
         next_since_id = int(items[-1]["id"]) if items else (int(since_id) if since_id is not None else 0)
         return {"events": items, "next_since_id": next_since_id}
 
-    def _broadcast_sse(self, message: Dict[str, Any]) -> None:
-        """Push a message to all SSE subscribers."""
+    # ---- Internal: on-disk event log --------------------------------------
+    def _queue_event_log(self, record: Any) -> None:
+        """Hand ``record`` to the writer thread, starting it on first use (caller holds ``_events_lock``)."""
+        if self._event_log_writer is None:
+            self._event_log_writer = threading.Thread(
+                target=self._event_log_loop, name="simui-event-log", daemon=True
+            )
+            self._event_log_writer.start()
+        self._event_log_queue.put(record)
+
+    def _event_log_loop(self) -> None:
+        while True:
+            item = self._event_log_queue.get()
+            if item is _LOG_STOP:
+                self._close_event_log()
+                return
+            if item is _LOG_ROTATE:
+                self._close_event_log()
+            elif isinstance(item, threading.Event):
+                if self._event_log is not None:
+                    self._event_log.flush()
+                item.set()
+            elif self._event_log_dir is not None:
+                self._append_event_log(item)
+
+    def _sync_event_log(self) -> None:
+        """Wait until records queued so far are written and flushed."""
+        with self._events_lock:
+            if self._event_log_writer is None:
+                return
+            done = threading.Event()
+            self._event_log_queue.put(done)
+        done.wait(timeout=5.0)
+
+    def _append_event_log(self, record: Dict[str, Any]) -> None:
+        """Append to the current run's log (runs on the writer thread)."""
+        try:
+            if self._event_log is None:
+                self._event_log_runs += 1
+                name = time.strftime("run-%Y%m%dT%H%M%S", time.gmtime()) + f"-{self._event_log_runs}.jsonl"
+                self._event_log = EventLogWriter(self._event_log_dir / name)  # type: ignore[operator]
+            self._event_log.append(record)
+            if record["event"] in _FLUSH_EVENTS:
+                self._event_log.flush()
+        except Exception:
+            logger.exception("Failed to write event log; disabling it")
+            self._event_log_dir = None
+            self._close_event_log()
+
+    def _close_event_log(self) -> None:
+        if self._event_log is not None:
+            try:
+                self._event_log.close()
+            finally:
+                self._event_log = None
+
+    def _event_log_path(self, name: str) -> Path:
+        if self._event_log_dir is None:
+            raise HTTPException(status_code=404, detail="Event log is disabled")
+        path = self._event_log_dir / name
+        if Path(name).name != name or path.suffix != ".jsonl" or not path.is_file():
+            raise HTTPException(status_code=404, detail=f"Unknown event log: {name}")
+        return path
+
+    def _broadcast_sse(self, message: Optional[Dict[str, Any]], delta_message: Optional[Dict[str, Any]] = None) -> None:
+        """Push a message to all stream subscribers.
+
+        Delta subscribers receive ``delta_message`` when given, else ``message``.
+        Each message is encoded once per wire format and the bytes are shared;
+        encoding happens here on the publisher thread, not in the event loop.
+        Blocking subscribers are fed outside the lock so they can unsubscribe.
+        """
+        frame = Frame(message) if message is not None else None
+        delta_frame = Frame(delta_message) if delta_message is not None else frame
         with self._sse_lock:
-            for q in list(self._sse_subscribers):
-                try:
-                    q.put_nowait(message)
-                except Exception:
-                    pass  # Queue full or closed
+            targets = [(q, frame) for q in self._sse_subscribers]
+            targets += [(q, delta_frame) for q in self._sse_delta_subscribers]
+        for q, f in targets:
+            if f is None:
+                continue
+            try:
+                f.encoded(q.encoding)
+                q.offer(f)
+            except Exception:
+                logger.debug("Failed to deliver frame to subscriber %r", q, exc_info=True)
 
-    def _subscribe_sse(self) -> Queue[Dict[str, Any]]:
-        """Create and register a new SSE subscriber queue."""
-        q: Queue[Dict[str, Any]] = Queue(maxsize=100)
+    def _subscribe_sse(
+        self,
+        *,
+        delta: bool = False,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        policy: str = "drop-oldest",
+        encoding: Any = SSE_ENCODING,
+        maxsize: int = 100,
+    ) -> Subscriber:
+        """Create and register a new stream subscriber.
+
+        With ``loop`` async consumers can ``await q.next_frame()`` and are woken
+        only when data arrives; otherwise ``q.get()`` blocks the calling thread.
+        ``policy`` is one of ``SUBSCRIBER_POLICIES`` (see fanout.py).
+        """
+        q = Subscriber(loop=loop, maxsize=maxsize, policy=policy, delta=delta, encoding=encoding)
         with self._sse_lock:
-            self._sse_subscribers.add(q)
+            if delta:
+                if not self._sse_delta_subscribers:
+                    # Deltas were not tracked while nobody listened; restart from a keyframe.
+                    with self._visual_delta_lock:
+                        self._visual_delta.reset()
+                self._sse_delta_subscribers.add(q)
+            else:
+                self._sse_subscribers.add(q)
+            if policy == "block":
+                self._lossless_subscribers += 1
+        self._ensure_publisher()
         return q
 
-    def _unsubscribe_sse(self, q: Queue[Dict[str, Any]]) -> None:
-        """Remove an SSE subscriber queue."""
+    def _unsubscribe_sse(self, q: Any) -> None:
+        """Remove a stream subscriber and release a publisher blocked on it."""
         with self._sse_lock:
+            registered = q in self._sse_subscribers or q in self._sse_delta_subscribers
             self._sse_subscribers.discard(q)
+            self._sse_delta_subscribers.discard(q)
+            if registered and getattr(q, "policy", None) == "block":
+                self._lossless_subscribers -= 1
+        if isinstance(q, Subscriber):
+            q.close()
+        with self._events_lock:
+            self._tick_published.notify_all()
+
+    def _subscriber_stats(self) -> List[Dict[str, Any]]:
+        with self._sse_lock:
+            subs = [q for q in (*self._sse_subscribers, *self._sse_delta_subscribers) if isinstance(q, Subscriber)]
+        return sorted((q.stats() for q in subs), key=lambda s: s["id"])
 
     # ---- Internal: API router -------------------------------------------
     def _build_router(self) -> APIRouter:
@@ -240,7 +567,12 @@ class Interface:
         def index() -> str:
             # Minimal HTML that loads the compiled frontend bundle.
             static_dir = Path(__file__).with_suffix("").parent / "static"
-            app_css = ("<link rel='stylesheet' href='static/app.css'>" if (static_dir / "app.css").exists() else "")
+            manifest = self._asset_manifest
+            app_css = (
+                f"<link rel='stylesheet' href='{asset_url(manifest, 'app.css')}'>"
+                if (static_dir / "app.css").exists()
+                else ""
+            )
             return (
                 "<!doctype html><html><head><meta charset='utf-8'>"
                 f"<title>{self._title}</title>"
@@ -249,62 +581,85 @@ class Interface:
                 "</head><body>"
                 "<div id='app'></div>"
                 "<script>window.__BSIM_UI__ = { mountPath: location.pathname.replace(/\\/$/, '') };</script>"
-                "<script type='module' src='static/app.js'></script>"
+                f"<script type='module' src='{asset_url(manifest, 'app.js')}'></script>"
                 "</body></html>"
             )
 
         @router.get("/api/spec")
-        def spec() -> Dict[str, Any]:
-            try:
-                modules = list(self._world.module_names)  # type: ignore[attr-defined]
-            except Exception:
-                modules = []
-            controls = [self._ctrl_to_spec(c) for c in self._controls]
-            controls = [c for c in controls if c is not None]
-            outputs = [self._out_to_spec(o) for o in self._outputs]
-            outputs = [o for o in outputs if o is not None]
-            return {
-                "version": "2",
-                "bsim_version": __version__,
-                "title": self._title,
-                "description": self._description,
-                "controls": controls,
-                "outputs": outputs,
-                "modules": modules,
-            }
+        def spec(request: Request) -> Response:
+            etag = make_etag("spec", id(self._world), self._world.structure_version)
+            return cached_response(
+                request,
+                etag,
+                lambda: self._http_bodies.get("spec", etag, lambda: encode_message(self._spec())),
+                min_size=self._compress_min_size,
+            )
 
         @router.post("/api/run")
         def run(params: Dict[str, Any]) -> JSONResponse:
-            duration = params.get("duration")
-            tick_dt = params.get("tick_dt")
-            try:
-                duration_f = float(duration)
-            except Exception:
-                raise HTTPException(status_code=400, detail="'duration' must be a number")
-            if duration_f <= 0:
-                raise HTTPException(status_code=400, detail="'duration' must be positive")
-            try:
-                tick_f = float(tick_dt) if tick_dt is not None else None
-            except Exception:
-                raise HTTPException(status_code=400, detail="'tick_dt' must be a number")
-            if tick_f is not None and tick_f <= 0:
-                raise HTTPException(status_code=400, detail="'tick_dt' must be positive")
+            duration_f, tick_f = _run_params(params)
 
             def _on_start() -> None:
                 # Clear backend event buffers for a fresh run view (before the worker thread starts emitting).
-                with self._events_lock:
-                    self._events.clear()
-                    self._event_seq = 0
-                self._last_step = None
+                self._clear_event_buffers()
 
-            started = self._runner.start_run(duration=duration_f, tick_dt=tick_f, on_start=_on_start)
+            try:
+                started = self._runner.start_run(duration=duration_f, tick_dt=tick_f, on_start=_on_start)
+            except RunLimitReached:
+                return JSONResponse({"ok": False, "reason": "too_many_running"}, status_code=429)
             if not started:
                 return JSONResponse({"ok": False, "reason": "already_running"}, status_code=409)
             return JSONResponse({"ok": True}, status_code=202)
 
+        @router.post("/api/jobs")
+        def submit_job(params: Dict[str, Any]) -> JSONResponse:
+            duration_f, tick_f = _run_params(params)
+            args = params.get("args") or {}
+            if not isinstance(args, dict) or not all(isinstance(v, dict) for v in args.values()):
+                raise HTTPException(status_code=400, detail="'args' must map module names to {arg: value}")
+            unknown = sorted(set(args) - set(self._world.module_names))
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"Unknown modules in 'args': {unknown}")
+            try:
+                priority = int(params.get("priority", 0))
+            except Exception:
+                raise HTTPException(status_code=400, detail="'priority' must be an integer")
+            try:
+                job = self._runner.submit_job(duration=duration_f, tick_dt=tick_f, args=args, priority=priority)
+            except (ValueError, RuntimeError) as exc:
+                raise HTTPException(status_code=400, detail=str(exc))
+            return JSONResponse(
+                {"ok": True, "id": job.id, "state": job.state, "position": self._runner.queue_position(job.id)},
+                status_code=202,
+            )
+
+        @router.get("/api/jobs")
+        def list_jobs() -> Dict[str, Any]:
+            return {"jobs": [job.to_dict(include_result=False) for job in self._runner.jobs()]}
+
+        @router.get("/api/jobs/{job_id}")
+        def get_job(job_id: str) -> Response:
+            job = self._runner.get_job(job_id)
+            if job is None:
+                raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+            data = job.to_dict()
+            data["position"] = self._runner.queue_position(job_id)
+            return Response(content=encode_message(data), media_type="application/json")
+
+        @router.delete("/api/jobs/{job_id}")
+        def cancel_job(job_id: str) -> Dict[str, Any]:
+            if self._runner.get_job(job_id) is None:
+                raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+            if not self._runner.cancel_job(job_id):
+                return {"ok": False, "reason": "already_finished"}
+            return {"ok": True}
+
         @router.get("/api/status")
-        def status() -> Dict[str, Any]:
-            return self._runner.status()
+        def status(request: Request) -> Response:
+            etag = make_etag("status", id(self._runner), self._runner.version)
+            return cached_response(
+                request, etag, lambda: encode_message(self._runner.status()), min_size=self._compress_min_size
+            )
 
         @router.get("/api/state")
         def state() -> Dict[str, Any]:
@@ -335,94 +690,130 @@ class Interface:
             return {"ok": True}
 
         @router.get("/api/events")
-        def events(since_id: Optional[int] = None, limit: int = 200) -> Dict[str, Any]:
+        def events(request: Request, since_id: Optional[int] = None, limit: int = 200) -> Response:
             limit = max(0, min(self._event_limit, int(limit)))
-            return self._events_since(since_id, limit)
+            body = encode_message(self._events_since(since_id, limit))
+            return body_response(request, body, min_size=self._compress_min_size)
+
+        @router.get("/api/event-logs")
+        def event_logs() -> Dict[str, Any]:
+            # Runs recorded by the on-disk event log, newest first
+            if self._event_log_dir is None or not self._event_log_dir.is_dir():
+                return {"logs": []}
+            self._sync_event_log()
+            files = sorted(self._event_log_dir.glob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True)
+            return {"logs": [{"name": p.name, "size": p.stat().st_size} for p in files]}
+
+        @router.get("/api/event-logs/{name}")
+        def event_log(name: str, since_id: Optional[int] = None, limit: int = 200) -> Dict[str, Any]:
+            self._sync_event_log()
+            path = self._event_log_path(name)
+            return read_event_log(path, since_id, max(1, min(10_000, int(limit))))
 
         @router.get("/api/visuals")
-        def visuals() -> List[Dict[str, Any]]:
-            collected = self._world.collect_visuals()
-            # ensure visuals are normalized JSON-friendly
-            out: List[Dict[str, Any]] = []
-            for entry in collected:
-                out.append({
-                    "module": entry.get("module"),
-                    "visuals": [
-                        {
-                            "render": v["render"],
-                            "data": v["data"],
-                            **({"description": v["description"]} if "description" in v else {}),
-                        }
-                        for v in entry.get("visuals", [])
-                    ],
-                })
-            return out
+        def visuals(request: Request) -> Response:
+            # Visuals are validated and encoded once per module version by the world;
+            # the ETag only changes when some module's visual revision does.
+            world_snapshot = self._world.snapshot()
+            etag = make_etag("visuals", id(self._world), [(mv.name, mv.revision) for mv in world_snapshot.visuals])
+            return cached_response(
+                request, etag, lambda: world_snapshot.visuals_json, min_size=self._compress_min_size
+            )
 
         @router.get("/api/snapshot")
-        def snapshot() -> Dict[str, Any]:
+        def snapshot(request: Request) -> Response:
             # Full snapshot: status, all visuals, and all events since start
-            st = self._runner.status()
-            vis = visuals()
-            ev = self._events_since(None, 0)  # limit=0 => no limit
-            return {"status": st, "visuals": vis, "events": ev.get("events", [])}
+            return body_response(request, self._snapshot_json(), min_size=self._compress_min_size)
 
         @router.get("/api/stream")
-        async def stream(request: Request) -> StreamingResponse:  # pragma: no cover - async SSE generator
-            """SSE endpoint for real-time event streaming."""
-            queue = self._subscribe_sse()
+        async def stream(
+            request: Request, delta: bool = False, policy: str = "drop-oldest"
+        ) -> StreamingResponse:  # pragma: no cover - async SSE generator
+            """SSE endpoint for real-time event streaming.
+
+            With ``?delta=1`` tick messages carry ``visuals_delta`` (per-module
+            deltas with periodic keyframes) instead of the full ``visuals`` list.
+            ``?policy=`` selects the backpressure policy (see fanout.py). When the
+            initial snapshot is at least ``compress_min_size`` bytes and the
+            client accepts gzip, the stream is gzipped with a flush per write.
+            """
+            if policy not in SUBSCRIBER_POLICIES:
+                raise HTTPException(status_code=400, detail=f"policy must be one of {list(SUBSCRIBER_POLICIES)}")
+            queue = self._subscribe_sse(delta=delta, loop=asyncio.get_running_loop(), policy=policy)
+            initial = b'data: {"type":"snapshot","data":' + self._snapshot_json(delta=delta) + b"}\n\n"
+            compressed = (
+                self._compress_min_size > 0
+                and len(initial) >= self._compress_min_size
+                and accepted_encoding(request, allow_brotli=False) == "gzip"
+            )
 
             async def event_generator():
                 try:
                     # Send initial snapshot
-                    st = self._runner.status()
-                    vis_data = visuals()
-                    ev = self._events_since(None, 0)
-                    init_msg = {
-                        "type": "snapshot",
-                        "data": {"status": st, "visuals": vis_data, "events": ev.get("events", [])},
-                    }
-                    yield f"data: {json.dumps(init_msg)}\n\n"
-
-                    # Event loop with adaptive heartbeat
-                    last_activity = time.time()
+                    yield initial
+
+                    # Wake only when the publisher delivers data; heartbeat after 2s idle.
                     while True:
-                        if await request.is_disconnected():
-                            break
-
-                        # Drain all available messages
-                        sent_any = False
-                        while True:
-                            try:
-                                msg = queue.get_nowait()
-                                yield f"data: {json.dumps(msg)}\n\n"
-                                sent_any = True
-                                last_activity = time.time()
-                            except Empty:
+                        try:
+                            frame = await queue.next_frame(timeout=2.0)
+                        except asyncio.TimeoutError:
+                            if await request.is_disconnected():
                                 break
-
-                        if sent_any:
-                            # Brief yield to allow more messages to accumulate
-                            await asyncio.sleep(0.05)
-                        else:
-                            # No messages - send heartbeat if needed
-                            now = time.time()
-                            if now - last_activity > 2.0:
-                                # Send heartbeat every 2s when idle
-                                yield f"data: {json.dumps({'type': 'heartbeat', 'data': self._runner.status()})}\n\n"
-                                last_activity = now
-                            await asyncio.sleep(0.1)
+                            yield encode_for({"type": "heartbeat", "data": self._runner.status()}, SSE_ENCODING)
+                            continue
+                        # Frames are pre-encoded once for all clients; drain ready ones into one write
+                        chunks = [frame.encoded()] + [f.encoded() for f in queue.drain_frames()]
+                        yield b"".join(chunks)
                 finally:
                     self._unsubscribe_sse(queue)
 
-            return StreamingResponse(
-                event_generator(),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "X-Accel-Buffering": "no",
-                },
+            headers = {
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
+                "Vary": "Accept-Encoding",
+            }
+            if compressed:
+                headers["Content-Encoding"] = "gzip"
+            body = gzip_stream(event_generator()) if compressed else event_generator()
+            return StreamingResponse(body, media_type="text/event-stream", headers=headers)
+
+        @router.websocket("/api/ws")
+        async def ws(
+            websocket: WebSocket, delta: bool = False, min_elements: int = 64, policy: str = "drop-oldest"
+        ) -> None:
+            """Binary streaming channel carrying the same messages as ``/api/stream``.
+
+            Each message is one binary frame (see ``binary.py``): a JSON header
+            plus raw little-endian buffers for numeric arrays with at least
+            ``min_elements`` elements, ready to be viewed as typed arrays.
+            """
+            if policy not in SUBSCRIBER_POLICIES:
+                await websocket.close(code=1008)
+                return
+            await websocket.accept()
+            encoding = ("binary", int(min_elements))
+            queue = self._subscribe_sse(
+                delta=delta, loop=asyncio.get_running_loop(), policy=policy, encoding=encoding
             )
+            try:
+                snapshot = json.loads(self._snapshot_json(delta=delta))
+                await websocket.send_bytes(encode_for({"type": "snapshot", "data": snapshot}, encoding))
+                while True:
+                    try:
+                        data = (await queue.next_frame(timeout=2.0)).encoded(encoding)
+                    except asyncio.TimeoutError:
+                        data = encode_for({"type": "heartbeat", "data": self._runner.status()}, encoding)
+                    await websocket.send_bytes(data)
+            except (WebSocketDisconnect, RuntimeError):
+                pass
+            finally:
+                self._unsubscribe_sse(queue)
+
+        @router.get("/api/subscribers")
+        def subscribers() -> Dict[str, Any]:
+            # Per-client stream stats, including dropped-frame counters
+            return {"subscribers": self._subscriber_stats()}
 
         @router.post("/api/reset")
         def reset() -> Dict[str, Any]:
@@ -431,10 +822,8 @@ class Interface:
                 self._runner.reset()
             except Exception:
                 pass
-            with self._events_lock:
-                self._events.clear()
-                self._event_seq = 0
-            self._last_step = None
+            self._world.invalidate_visuals()
+            self._clear_event_buffers()
             return {"ok": True}
 
         # Include the config editor API router
@@ -442,19 +831,62 @@ class Interface:
             get_config_path=lambda: self._config_path,
             get_world=lambda: self._world,
             reload_world=self._reload_world,
+            warm_registry=self.warm_registry,
         )
         router.include_router(editor_router, prefix="/api")
 
         return router
 
+    def _spec(self) -> Dict[str, Any]:
+        try:
+            modules = list(self._world.module_names)  # type: ignore[attr-defined]
+        except Exception:
+            modules = []
+        controls = [self._ctrl_to_spec(c) for c in self._controls]
+        controls = [c for c in controls if c is not None]
+        outputs = [self._out_to_spec(o) for o in self._outputs]
+        outputs = [o for o in outputs if o is not None]
+        return {
+            "version": "2",
+            "bsim_version": __version__,
+            "title": self._title,
+            "description": self._description,
+            "controls": controls,
+            "outputs": outputs,
+            "modules": modules,
+        }
+
+    # ---- Jobs -------------------------------------------------------------
+    def _job_world(self, overrides: Mapping[str, Mapping[str, Any]]) -> BioWorld:
+        """Build a fresh world from the config file with per-module arg overrides applied."""
+        from ..wiring import build_from_spec, load_spec
+
+        if self._config_path is None:
+            raise ValueError("No config path to build job worlds from")
+        spec = load_spec(self._config_path)
+        modules = dict(spec.get("modules") or {})
+        for name, args in overrides.items():
+            entry = modules.get(name)
+            if entry is None:
+                raise ValueError(f"Unknown module in args: {name}")
+            if isinstance(entry, str):
+                entry = {"class": entry}
+            modules[name] = {**entry, "args": {**(entry.get("args") or {}), **args}}
+        spec["modules"] = modules
+        world = BioWorld()
+        world.result_store = self._world.result_store
+        build_from_spec(world, spec)
+        return world
+
     # ---- Config reload ----------------------------------------------------
     def _reload_world(self, new_config_path: Path | None = None) -> bool:
-        """Reload the world from config file.
+        """Update the world to match a config file.
 
-        This clears existing modules and rewires from the config.
-        Returns True on success, False on failure.
+        Only added or changed modules are re-instantiated and only changed
+        connections are rewired; untouched modules keep their state (see
+        ``wiring.update_from_spec``). Returns True on success, False on failure.
         """
-        import biosim
+        from ..wiring import reload_wiring
 
         config_path = new_config_path or self._config_path
         if not config_path or not config_path.exists():
@@ -465,26 +897,22 @@ class Interface:
             # Stop any running simulation
             self._runner.reset()
 
-            # Clear existing modules from the world
-            for module in list(self._world._biomodule_listeners.keys()):
-                self._world.remove_biomodule(module)
-
-            # Clear signal routes
-            self._world._signal_routes.clear()
-
-            # Reload wiring from config
-            biosim.load_wiring(self._world, config_path)
+            changes = reload_wiring(self._world, config_path)
 
             # Update stored config path
             self._config_path = config_path
 
             # Clear event buffers
-            with self._events_lock:
-                self._events.clear()
-                self._event_seq = 0
-            self._last_step = None
-
-            logger.info(f"Reloaded world from {config_path}")
+            self._clear_event_buffers()
+
+            logger.info(
+                "Reloaded world from %s: added=%s removed=%s replaced=%s kept=%d",
+                config_path,
+                changes["added"],
+                changes["removed"],
+                changes["replaced"],
+                len(changes["kept"]),
+            )
             return True
         except Exception:
             logger.exception(f"Failed to reload world from {config_path}")
@@ -1,16 +1,35 @@
 # SPDX-FileCopyrightText: 2025-present Demi <bjaiye1@gmail.com>
 #
 # SPDX-License-Identifier: MIT
-"""Module registry for config editor - introspects available BioModules."""
+"""Module registry for config editor - introspects available BioModules.
+
+Introspection imports packs and instantiates classes, which is slow for large
+packs. A :class:`RegistryCache` keeps the resulting specs on disk keyed by the
+pack's source files (path, mtime, size and content hash), so unchanged packs
+are registered without being imported.
+"""
 from __future__ import annotations
 
+import hashlib
 import inspect
+import json
 import logging
-from dataclasses import dataclass, field
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from importlib import import_module
-from typing import Any, Dict, List, Optional, Set, Type, get_type_hints
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type, get_type_hints
 
+from ..__about__ import __version__
 from ..modules import BioModule
+from ..visuals import encode_json
 
 logger = logging.getLogger(__name__)
 
@@ -168,13 +187,64 @@ def discover_pack_modules(pack_path: str, category: str) -> Dict[str, ModuleSpec
     Returns:
         Dict mapping class paths to ModuleSpec objects
     """
+    return _discover_pack(pack_path, category)[0]
+
+
+class _ClassTimeout(BaseException):
+    """Raised by the per-class alarm; a BaseException so introspection fallbacks do not swallow it."""
+
+
+@contextmanager
+def _time_limit(seconds: Optional[float]):
+    """Interrupt the enclosed block after ``seconds`` (main thread on POSIX only; otherwise no limit)."""
+    if (
+        not seconds
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def _alarm(signum, frame):
+        raise _ClassTimeout()
+
+    previous = signal.signal(signal.SIGALRM, _alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _discover_pack(
+    pack_path: str,
+    category: str,
+    *,
+    class_timeout: Optional[float] = None,
+    timings: Optional[Dict[str, float]] = None,
+    failures: Optional[Dict[str, str]] = None,
+) -> Tuple[Dict[str, ModuleSpec], Optional[List[str]]]:
+    """Like ``discover_pack_modules`` but also return the source files the result depends on.
+
+    The file list is None when the pack could not be imported (nothing to cache).
+    Per-class introspection times and failures (including classes that exceed
+    ``class_timeout``) are recorded into ``timings``/``failures`` when given.
+    """
     registry: Dict[str, ModuleSpec] = {}
+    timings = {} if timings is None else timings
+    failures = {} if failures is None else failures
 
     try:
         pack = import_module(pack_path)
     except ImportError as e:
         logger.warning(f"Could not import pack {pack_path}: {e}")
-        return registry
+        failures[pack_path] = f"{type(e).__name__}: {e}"
+        return registry, None
+    files: Set[str] = set()
+    pack_file = getattr(pack, "__file__", None)
+    if pack_file:
+        files.add(os.path.abspath(pack_file))
 
     # Get all exported names from __all__ or dir
     names = getattr(pack, "__all__", None) or dir(pack)
@@ -183,42 +253,481 @@ def discover_pack_modules(pack_path: str, category: str) -> Dict[str, ModuleSpec
         if name.startswith("_"):
             continue
 
+        class_path = f"{pack_path}.{name}"
+        started = time.perf_counter()
         try:
             obj = getattr(pack, name)
             if isinstance(obj, type) and issubclass(obj, BioModule) and obj is not BioModule:
-                class_path = f"{pack_path}.{name}"
-                spec = introspect_module(obj, class_path, category)
+                with _time_limit(class_timeout):
+                    spec = introspect_module(obj, class_path, category)
+                timings[class_path] = time.perf_counter() - started
                 registry[class_path] = spec
+                try:
+                    files.add(os.path.abspath(inspect.getsourcefile(obj) or ""))
+                except TypeError:  # pragma: no cover - builtins/extension classes have no source
+                    pass
+        except _ClassTimeout:
+            timings[class_path] = time.perf_counter() - started
+            failures[class_path] = f"timed out after {class_timeout:g}s"
+            logger.warning(f"Introspecting {class_path} timed out after {class_timeout:g}s")
         except Exception as e:
+            failures[class_path] = f"{type(e).__name__}: {e}"
             logger.debug(f"Could not process {name} from {pack_path}: {e}")
 
-    return registry
+    files.discard(os.path.abspath(""))
+    return registry, sorted(files)
+
+
+@dataclass
+class PackReport:
+    """Outcome of discovering one pack with :meth:`ModuleRegistry.register_packs`.
+
+    ``status`` is ``"ok"``, ``"cached"``, ``"error"`` (import failed or the worker
+    died) or ``"timeout"`` (the pack exceeded ``pack_timeout``; its worker is killed).
+    ``failures`` maps class paths that could not be introspected to the reason,
+    and ``class_seconds`` holds per-class introspection times.
+    """
+
+    pack_path: str
+    category: str
+    status: str
+    seconds: float
+    modules: int = 0
+    error: Optional[str] = None
+    slow: bool = False
+    failures: Dict[str, str] = field(default_factory=dict)
+    class_seconds: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _discover_worker(conn: Any, pack_path: str, category: str, class_timeout: Optional[float]) -> None:
+    """Process-pool entry point: discover one pack and send plain dicts back over ``conn``."""
+    timings: Dict[str, float] = {}
+    failures: Dict[str, str] = {}
+    modules, files = _discover_pack(
+        pack_path, category, class_timeout=class_timeout, timings=timings, failures=failures
+    )
+    payload = {
+        "modules": {path: _spec_to_dict(spec) for path, spec in modules.items()},
+        "files": files,
+        "timings": timings,
+        "failures": failures,
+    }
+    try:
+        conn.send(payload)
+    except Exception:
+        # Arg defaults that cannot be pickled travel as strings, as they would in the cache.
+        conn.send(json.loads(json.dumps(payload, default=str)))
+    finally:
+        conn.close()
+
+
+def default_registry_cache_path() -> Path:
+    """``$BIOSIM_REGISTRY_CACHE``, else ``$XDG_CACHE_HOME/biosim/registry.json`` (``~/.cache`` by default)."""
+    env = os.environ.get("BIOSIM_REGISTRY_CACHE")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "biosim" / "registry.json"
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as fh:
+        return hashlib.blake2b(fh.read(), digest_size=16).hexdigest()
+
+
+def _spec_to_dict(spec: ModuleSpec) -> Dict[str, Any]:
+    data = asdict(spec)
+    data["inputs"] = sorted(spec.inputs)
+    data["outputs"] = sorted(spec.outputs)
+    return data
+
+
+def _spec_from_dict(data: Dict[str, Any], category: str) -> ModuleSpec:
+    return ModuleSpec(
+        class_path=data["class_path"],
+        name=data["name"],
+        category=category,
+        description=data.get("description"),
+        inputs=set(data.get("inputs") or ()),
+        outputs=set(data.get("outputs") or ()),
+        args=[ArgSpec(**{"type": "any", **arg}) for arg in data.get("args") or ()],
+    )
+
+
+class RegistryCache:
+    """On-disk cache of introspected pack specs, keyed by the pack's source files.
+
+    An entry is fresh while every recorded file has the same mtime and size,
+    or failing that the same content hash. Entries from another biosim version
+    are ignored. Arg defaults that are not JSON values are stored as strings.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path is not None else default_registry_cache_path()
+        self._lock = threading.Lock()
+        self._packs: Optional[Dict[str, Any]] = None
+
+    def _entries(self) -> Dict[str, Any]:
+        if self._packs is None:
+            packs: Dict[str, Any] = {}
+            try:
+                data = json.loads(self.path.read_bytes())
+                if data.get("format") == self.FORMAT and data.get("biosim") == __version__:
+                    packs = dict(data.get("packs") or {})
+            except (OSError, ValueError, AttributeError):
+                pass
+            self._packs = packs
+        return self._packs
+
+    def load_pack(self, pack_path: str, category: str) -> Optional[Dict[str, ModuleSpec]]:
+        """Return cached specs for ``pack_path`` if its source files are unchanged, else None."""
+        with self._lock:
+            entry = self._entries().get(pack_path)
+            files = dict(entry.get("files") or {}) if entry else {}
+        if not files:
+            return None
+        touched = False
+        for path, (mtime_ns, size, digest) in list(files.items()):
+            try:
+                st = os.stat(path)
+                if st.st_mtime_ns == mtime_ns and st.st_size == size:
+                    continue
+                if st.st_size != size or _file_digest(path) != digest:
+                    return None
+            except OSError:
+                return None
+            files[path] = [st.st_mtime_ns, size, digest]  # same content, new mtime
+            touched = True
+        if touched:
+            with self._lock:
+                if self._entries().get(pack_path) is entry:
+                    self._entries()[pack_path] = {**entry, "files": files}
+            self._save()
+        try:
+            return {path: _spec_from_dict(spec, category) for path, spec in entry["modules"].items()}
+        except (KeyError, TypeError, AttributeError):
+            return None
+
+    def store_pack(self, pack_path: str, modules: Dict[str, ModuleSpec], files: Iterable[str]) -> None:
+        stamps: Dict[str, List[Any]] = {}
+        for path in files:
+            try:
+                st = os.stat(path)
+                stamps[path] = [st.st_mtime_ns, st.st_size, _file_digest(path)]
+            except OSError:
+                return  # cannot validate later; do not cache
+        with self._lock:
+            self._entries()[pack_path] = {
+                "files": stamps,
+                "modules": {path: _spec_to_dict(spec) for path, spec in modules.items()},
+            }
+        self._save()
+
+    def _save(self) -> None:
+        with self._lock:
+            payload = {"format": self.FORMAT, "biosim": __version__, "packs": self._entries()}
+            try:
+                body = encode_json(payload)
+            except (TypeError, ValueError):
+                body = json.dumps(payload, default=str, separators=(",", ":")).encode("utf-8")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(body)
+                os.replace(tmp, self.path)
+            except OSError:
+                logger.warning("Could not write registry cache %s", self.path, exc_info=True)
+
+
+ENTRY_POINT_GROUP = "biosim.modules"
+MANIFEST_NAMES = ("biosim-modules.json", "biosim-modules.toml")
+
+
+def pack_manifest(pack_path: str, category: str) -> Dict[str, Any]:
+    """Build the static manifest for a pack by introspecting it (run at packaging time).
+
+    Write it to ``biosim-modules.json`` inside the package and advertise each
+    class as a ``biosim.modules`` entry point named like its manifest key, so the
+    editor can list the modules without importing the pack.
+    """
+    modules: Dict[str, Any] = {}
+    for spec in discover_pack_modules(pack_path, category).values():
+        data = _spec_to_dict(spec)
+        for key in ("class_path", "category"):
+            data.pop(key)
+        modules[data.pop("name")] = data
+    return json.loads(json.dumps({"category": category, "modules": modules}, default=str))
+
+
+def _read_manifest(dist: Any) -> Dict[str, Any]:
+    """The distribution's biosim manifest (located from its file list, never imported)."""
+    for file in dist.files or ():
+        if file.name not in MANIFEST_NAMES:
+            continue
+        try:
+            text = file.read_text(encoding="utf-8")
+            if file.name.endswith(".toml"):
+                try:
+                    import tomllib  # type: ignore[attr-defined]
+                except Exception:  # pragma: no cover - fallback for <3.11
+                    import tomli as tomllib  # type: ignore
+                data = tomllib.loads(text)
+            else:
+                data = json.loads(text)
+        except Exception as e:
+            logger.warning(f"Could not read {file} from {dist.metadata['Name']}: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+    return {}
+
+
+def entry_point_specs(group: str = ENTRY_POINT_GROUP) -> Dict[str, ModuleSpec]:
+    """Specs for every module advertised under the ``group`` entry point, without importing any.
+
+    An entry point ``Name = "pkg.mod:Class"`` becomes class path ``pkg.mod.Class``
+    (what wiring configs reference). Ports, args and description come from the
+    manifest entry under the same name; the category is the manifest's
+    ``category`` or the distribution name. Modules missing from the manifest are
+    listed with unknown ports.
+    """
+    from importlib.metadata import entry_points
+
+    specs: Dict[str, ModuleSpec] = {}
+    manifests: Dict[str, Dict[str, Any]] = {}
+    for ep in entry_points(group=group):
+        if not ep.attr:
+            logger.warning(f"Entry point {ep.name} = {ep.value!r} does not name a class; skipped")
+            continue
+        dist = ep.dist
+        dist_name = dist.metadata["Name"] if dist is not None else ep.module.split(".")[0]
+        if dist_name not in manifests:
+            manifests[dist_name] = _read_manifest(dist) if dist is not None else {}
+        manifest = manifests[dist_name]
+        category = str(manifest.get("category") or dist_name)
+        class_path = f"{ep.module}.{ep.attr}"
+        entry = dict((manifest.get("modules") or {}).get(ep.name) or {})
+        entry.setdefault("name", ep.attr.rsplit(".", 1)[-1])
+        entry["class_path"] = class_path
+        try:
+            specs[class_path] = _spec_from_dict(entry, category)
+        except TypeError as e:
+            logger.warning(f"Invalid manifest entry for {ep.name} in {dist_name}: {e}")
+            specs[class_path] = ModuleSpec(class_path=class_path, name=entry["name"], category=category)
+    return specs
 
 
 class ModuleRegistry:
     """Central registry of available BioModule classes."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, cache: Optional[RegistryCache] = None) -> None:
         self._registry: Dict[str, ModuleSpec] = {}
         self._categories: Dict[str, List[str]] = {}  # category -> [class_paths]
+        self._version = 0
+        self._json_bytes: Optional[Tuple[int, bytes]] = None
+        self._cache = cache
+        self._reports: Dict[str, PackReport] = {}
+        # Packs may be registered from a warming thread while requests read the registry.
+        self._lock = threading.RLock()
 
     def register_pack(self, pack_path: str, category: str) -> None:
-        """Register all modules from a pack."""
-        modules = discover_pack_modules(pack_path, category)
-        self._registry.update(modules)
-
-        if category not in self._categories:
-            self._categories[category] = []
-        self._categories[category].extend(modules.keys())
+        """Register all modules from a pack (from the cache when its files are unchanged)."""
+        modules = self._cache.load_pack(pack_path, category) if self._cache is not None else None
+        if modules is None:
+            modules, files = _discover_pack(pack_path, category)
+            if self._cache is not None and files is not None:
+                self._cache.store_pack(pack_path, modules, files)
+        self._add_pack(category, modules)
+
+    def _add_pack(self, category: str, modules: Dict[str, ModuleSpec]) -> None:
+        with self._lock:
+            self._registry.update(modules)
+            paths = self._categories.setdefault(category, [])
+            paths.extend(p for p in modules if p not in paths)
+            self._version += 1
+
+    def register_packs(
+        self,
+        packs: Sequence[Tuple[str, str]],
+        *,
+        workers: Optional[int] = None,
+        pack_timeout: Optional[float] = 60.0,
+        class_timeout: Optional[float] = 10.0,
+        slow_seconds: float = 5.0,
+        on_report: Optional[Callable[[PackReport], None]] = None,
+    ) -> List[PackReport]:
+        """Discover ``(pack_path, category)`` pairs in parallel worker processes.
+
+        Cached packs are registered first without importing. The rest are
+        imported in up to ``workers`` processes (default: CPU count); each pack
+        is added to the registry (bumping ``version``) as soon as its worker
+        finishes, so the editor sees results stream in. A worker running longer
+        than ``pack_timeout`` seconds is killed, and a class whose introspection
+        exceeds ``class_timeout`` seconds is skipped (POSIX only). Errors,
+        timeouts and packs slower than ``slow_seconds`` are logged with their
+        timings; every pack's :class:`PackReport` is passed to ``on_report`` and
+        returned in completion order.
+        """
+        reports: List[PackReport] = []
+
+        def _done(report: PackReport) -> None:
+            report.slow = report.seconds >= slow_seconds
+            if report.status in ("error", "timeout"):
+                logger.warning(
+                    "Pack %s %s after %.2fs: %s", report.pack_path, report.status, report.seconds, report.error
+                )
+            elif report.slow:
+                slowest = sorted(report.class_seconds.items(), key=lambda item: -item[1])[:3]
+                logger.warning(
+                    "Pack %s took %.2fs (slowest classes: %s)",
+                    report.pack_path,
+                    report.seconds,
+                    ", ".join(f"{path} {secs:.2f}s" for path, secs in slowest) or "n/a",
+                )
+            for path, reason in report.failures.items():
+                logger.info("Skipped %s in pack %s: %s", path, report.pack_path, reason)
+            with self._lock:
+                self._reports[report.pack_path] = report
+            reports.append(report)
+            if on_report is not None:
+                on_report(report)
+
+        todo: List[Tuple[str, str]] = []
+        for pack_path, category in packs:
+            started = time.perf_counter()
+            cached = self._cache.load_pack(pack_path, category) if self._cache is not None else None
+            if cached is None:
+                todo.append((pack_path, category))
+                continue
+            self._add_pack(category, cached)
+            _done(PackReport(pack_path, category, "cached", time.perf_counter() - started, modules=len(cached)))
+        if not todo:
+            return reports
+
+        # spawn: workers must not inherit the server's threads and locks through fork().
+        ctx = multiprocessing.get_context("spawn")
+        limit = max(1, min(len(todo), workers or os.cpu_count() or 1))
+        active: Dict[Any, Tuple[Any, str, str, float]] = {}  # conn -> (process, pack, category, started)
+        try:
+            while todo or active:
+                while todo and len(active) < limit:
+                    pack_path, category = todo.pop(0)
+                    recv, send = ctx.Pipe(duplex=False)
+                    proc = ctx.Process(
+                        target=_discover_worker,
+                        args=(send, pack_path, category, class_timeout),
+                        name=f"biosim-discover-{pack_path}",
+                        daemon=True,
+                    )
+                    proc.start()
+                    send.close()  # so a crashed worker reads as EOF
+                    active[recv] = (proc, pack_path, category, time.perf_counter())
+
+                wait_for: Optional[float] = None
+                if pack_timeout is not None:
+                    now = time.perf_counter()
+                    wait_for = max(0.0, min(started + pack_timeout for _, _, _, started in active.values()) - now)
+                for conn in multiprocessing.connection.wait(list(active), timeout=wait_for):
+                    proc, pack_path, category, started = active.pop(conn)
+                    try:
+                        result = conn.recv()
+                    except (EOFError, OSError):
+                        result = None
+                    conn.close()
+                    proc.join()
+                    elapsed = time.perf_counter() - started
+                    if result is None:
+                        _done(PackReport(pack_path, category, "error", elapsed, error=f"worker exited with code {proc.exitcode}"))
+                        continue
+                    modules = {path: _spec_from_dict(spec, category) for path, spec in result["modules"].items()}
+                    failures = dict(result["failures"])
+                    if result["files"] is None:
+                        _done(PackReport(pack_path, category, "error", elapsed, error=failures.pop(pack_path, None), failures=failures))
+                        continue
+                    if self._cache is not None:
+                        self._cache.store_pack(pack_path, modules, result["files"])
+                    self._add_pack(category, modules)
+                    _done(PackReport(
+                        pack_path, category, "ok", elapsed,
+                        modules=len(modules), failures=failures, class_seconds=dict(result["timings"]),
+                    ))
+
+                if pack_timeout is not None:
+                    now = time.perf_counter()
+                    for conn, (proc, pack_path, category, started) in list(active.items()):
+                        if now - started >= pack_timeout:
+                            del active[conn]
+                            proc.kill()
+                            proc.join()
+                            conn.close()
+                            _done(PackReport(
+                                pack_path, category, "timeout", now - started,
+                                error=f"discovery exceeded {pack_timeout:g}s",
+                            ))
+        finally:
+            for conn, (proc, *_rest) in active.items():
+                proc.kill()
+                proc.join()
+                conn.close()
+        return reports
+
+    def register_entry_points(self, group: str = ENTRY_POINT_GROUP) -> int:
+        """Register modules advertised by installed distributions (see :func:`entry_point_specs`).
+
+        Nothing is imported; a class is imported only when a wiring instantiates
+        it. Returns the number of modules registered.
+        """
+        by_category: Dict[str, Dict[str, ModuleSpec]] = {}
+        for path, spec in entry_point_specs(group).items():
+            by_category.setdefault(spec.category, {})[path] = spec
+        for category, modules in by_category.items():
+            self._add_pack(category, modules)
+        return sum(len(modules) for modules in by_category.values())
+
+    def pack_reports(self) -> Dict[str, PackReport]:
+        """Latest :class:`PackReport` per pack registered through ``register_packs``/``warm``."""
+        with self._lock:
+            return dict(self._reports)
 
     def register_module(self, cls: Type[BioModule], class_path: str, category: str = "custom") -> None:
         """Register a single module class."""
         spec = introspect_module(cls, class_path, category)
-        self._registry[class_path] = spec
-
-        if category not in self._categories:
-            self._categories[category] = []
-        self._categories[category].append(class_path)
+        with self._lock:
+            self._registry[class_path] = spec
+
+            if category not in self._categories:
+                self._categories[category] = []
+            self._categories[category].append(class_path)
+            self._version += 1
+
+    def warm(self, packs: Sequence[Tuple[str, str]], *, background: bool = True, **options: Any) -> Optional[threading.Thread]:
+        """Run :meth:`register_packs` for ``(pack_path, category)`` pairs, by default on a daemon thread.
+
+        ``options`` are passed to ``register_packs``. Returns the thread when ``background``.
+        """
+
+        def _run() -> None:
+            try:
+                self.register_packs(packs, **options)
+            except Exception:
+                logger.exception("Failed to warm module registry")
+
+        if not background:
+            _run()
+            return None
+        thread = threading.Thread(target=_run, name="biosim-registry-warm", daemon=True)
+        thread.start()
+        return thread
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever modules are registered."""
+        return self._version
 
     def get(self, class_path: str) -> Optional[ModuleSpec]:
         """Get a module spec by class path."""
@@ -226,19 +735,24 @@ class ModuleRegistry:
 
     def all_modules(self) -> Dict[str, ModuleSpec]:
         """Get all registered modules."""
-        return dict(self._registry)
+        with self._lock:
+            return dict(self._registry)
 
     def by_category(self) -> Dict[str, List[ModuleSpec]]:
         """Get modules grouped by category."""
         result: Dict[str, List[ModuleSpec]] = {}
-        for category, paths in self._categories.items():
-            result[category] = [self._registry[p] for p in paths if p in self._registry]
+        with self._lock:
+            for category, paths in self._categories.items():
+                result[category] = [self._registry[p] for p in paths if p in self._registry]
         return result
 
     def to_json(self) -> Dict[str, Any]:
         """Convert registry to JSON-serializable format."""
+        with self._lock:
+            registry = dict(self._registry)
+            categories = {cat: list(paths) for cat, paths in self._categories.items()}
         modules: Dict[str, Any] = {}
-        for path, spec in self._registry.items():
+        for path, spec in registry.items():
             modules[path] = {
                 "name": spec.name,
                 "category": spec.category,
@@ -258,19 +772,35 @@ class ModuleRegistry:
                 ],
             }
 
-        categories = {cat: list(paths) for cat, paths in self._categories.items()}
-
         return {"modules": modules, "categories": categories}
 
+    def to_json_bytes(self) -> bytes:
+        """``to_json()`` encoded once per registry version."""
+        cached = self._json_bytes
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        payload = self.to_json()
+        try:
+            data = encode_json(payload)
+        except (TypeError, ValueError):
+            # Arg defaults can be arbitrary objects; show them as strings.
+            data = json.dumps(payload, default=str, separators=(",", ":")).encode("utf-8")
+        self._json_bytes = (self._version, data)
+        return data
+
 
 # Global registry instance
 _default_registry: Optional[ModuleRegistry] = None
 
 
 def get_default_registry() -> ModuleRegistry:
-    """Get the default module registry, creating it if needed."""
+    """Get the default module registry (backed by the on-disk cache), creating it if needed."""
     global _default_registry
     if _default_registry is None:
-        _default_registry = ModuleRegistry()
-        # Models are self-contained in their own directories (models/models/)
+        _default_registry = ModuleRegistry(cache=RegistryCache())
+        # Installed plugins are listed from entry-point metadata, without importing them.
+        try:
+            _default_registry.register_entry_points()
+        except Exception:
+            logger.exception("Failed to read biosim module entry points")
     return _default_registry
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+# Builds a fresh world for a job from per-module arg overrides ({module: {arg: value}}).
+WorldFactory = Callable[[Mapping[str, Mapping[str, Any]]], "BioWorld"]
+
+JOB_STATES = ("queued", "running", "succeeded", "failed", "cancelled")
+
+
+class RunLimitReached(RuntimeError):
+    """``start_run`` found every shared run slot taken."""
 
 
 @dataclass
@@ -22,15 +34,91 @@ class RunStatus:
     progress_pct: Optional[float] = None
 
 
+@dataclass
+class Job:
+    """A queued batch run. Higher ``priority`` runs first; FIFO within a priority."""
+
+    id: str
+    duration: float
+    tick_dt: Optional[float]
+    args: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    priority: int = 0
+    state: str = "queued"
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    cancel_requested: bool = False
+    _stop: Optional[Callable[[], None]] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.state in ("succeeded", "failed", "cancelled")
+
+    def to_dict(self, *, include_result: bool = True) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "id": self.id,
+            "state": self.state,
+            "priority": self.priority,
+            "duration": self.duration,
+            "tick_dt": self.tick_dt,
+            "args": self.args,
+            "submitted_at": _ts(self.submitted_at),
+            "started_at": _ts(self.started_at),
+            "finished_at": _ts(self.finished_at),
+            "error": {"message": self.error} if self.error else None,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
 class SimulationManager:
-    """Runs world.run in a background thread and tracks status."""
+    """Runs world.run in a background thread and tracks status.
+
+    Besides interactive runs (``start_run``), the manager owns a priority job
+    queue (``submit_job``). With a ``world_factory`` every job runs on its own
+    fresh world, up to ``job_concurrency`` at a time, and may override module
+    args. Without one, jobs run one after another on the shared world, waiting
+    for any interactive run to finish first.
+
+    ``run_slots`` is a semaphore shared by several managers (e.g. the sessions
+    of a ``SessionHost``): every simulation, interactive or job, holds a slot
+    while it runs. ``start_run`` raises :class:`RunLimitReached` when none is
+    free; queued jobs wait for one.
+    """
 
-    def __init__(self, world: "BioWorld") -> None:
+    def __init__(
+        self,
+        world: "BioWorld",
+        *,
+        world_factory: Optional[WorldFactory] = None,
+        job_concurrency: int = 1,
+        job_history: int = 256,
+        on_job_start: Optional[Callable[[], None]] = None,
+        run_slots: Optional[threading.Semaphore] = None,
+    ) -> None:
         self._world = world
+        self._run_slots = run_slots
         self._lock = threading.Lock()
         self._thread: Optional[threading.Thread] = None
         self._status = RunStatus()
         self._stop_requested = False
+        # Bumped on every status change so readers can answer conditional requests cheaply.
+        self._version = 0
+
+        # Job queue: heap of (-priority, seq, job id); cancelled entries are skipped on pop.
+        self._world_factory = world_factory
+        self._job_concurrency = max(1, int(job_concurrency)) if world_factory is not None else 1
+        self._job_history = max(1, int(job_history))
+        self._on_job_start = on_job_start
+        self._jobs: Dict[str, Job] = {}
+        self._job_heap: List[Tuple[int, int, str]] = []
+        self._job_seq = itertools.count()
+        self._jobs_cv = threading.Condition()
+        self._job_workers: List[threading.Thread] = []
+        self._jobs_closed = False
 
     # External API ---------------------------------------------------------
     def start_run(
@@ -40,18 +128,29 @@ class SimulationManager:
         tick_dt: Optional[float],
         on_start: Optional[Callable[[], None]] = None,
     ) -> bool:
-        """Attempt to start a background run. Returns False if already running."""
+        """Attempt to start a background run. Returns False if already running.
+
+        Raises RunLimitReached when ``run_slots`` has no free slot.
+        """
         with self._lock:
             if self._status.running:
                 return False
+            if self._run_slots is not None and not self._run_slots.acquire(blocking=False):
+                raise RunLimitReached("Too many simulations are running")
             if on_start is not None:
                 on_start()
             self._status = RunStatus(running=True, started_at=time.time(), tick_count=0, error=None)
+            self._version += 1
             self._stop_requested = False
             self._thread = threading.Thread(target=self._worker, args=(duration, tick_dt), daemon=True)
             self._thread.start()
             return True
 
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever ``status()`` may return something different."""
+        return self._version
+
     def status(self) -> Dict[str, Any]:
         st = self._status
         data: Dict[str, Any] = {
@@ -97,6 +196,7 @@ class SimulationManager:
             pass
         with self._lock:
             self._status.paused = True
+            self._version += 1
 
     def resume(self) -> None:
         try:
@@ -105,6 +205,7 @@ class SimulationManager:
             pass
         with self._lock:
             self._status.paused = False
+            self._version += 1
 
     def reset(self) -> None:
         """Reset internal status if not running."""
@@ -116,9 +217,216 @@ class SimulationManager:
         with self._lock:
             if not self._status.running:
                 self._status = RunStatus()
+                self._version += 1
+
+    # Job queue ----------------------------------------------------------
+    @property
+    def accepts_job_args(self) -> bool:
+        """True if jobs may override module args (requires a world factory)."""
+        return self._world_factory is not None
+
+    def submit_job(
+        self,
+        *,
+        duration: float,
+        tick_dt: Optional[float] = None,
+        args: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        priority: int = 0,
+    ) -> Job:
+        """Queue a run and return its job. Raises ValueError if ``args`` cannot be applied."""
+        overrides = {str(k): dict(v) for k, v in (args or {}).items()}
+        if overrides and self._world_factory is None:
+            raise ValueError("Arg overrides require a world factory (e.g. an Interface with a config_path)")
+        job = Job(id=uuid.uuid4().hex[:12], duration=duration, tick_dt=tick_dt, args=overrides, priority=int(priority))
+        with self._jobs_cv:
+            if self._jobs_closed:
+                raise RuntimeError("Job queue is closed")
+            self._jobs[job.id] = job
+            heapq.heappush(self._job_heap, (-job.priority, next(self._job_seq), job.id))
+            self._prune_jobs()
+            self._ensure_job_workers()
+            self._jobs_cv.notify()
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        with self._jobs_cv:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[Job]:
+        with self._jobs_cv:
+            return sorted(self._jobs.values(), key=lambda j: j.submitted_at)
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        """0-based position of a queued job in run order, or None if it is not queued."""
+        with self._jobs_cv:
+            order = [jid for _, _, jid in sorted(self._job_heap) if getattr(self._jobs.get(jid), "state", None) == "queued"]
+            return order.index(job_id) if job_id in order else None
+
+    def cancel_job(self, job_id: str) -> bool:
+        """Cancel a queued or running job. Returns False if unknown or already finished."""
+        with self._jobs_cv:
+            job = self._jobs.get(job_id)
+            if job is None or job.done:
+                return False
+            job.cancel_requested = True
+            if job.state == "queued":
+                job.state = "cancelled"
+                job.finished_at = time.time()
+                return True
+            stop = job._stop
+        if stop is not None:
+            stop()
+        return True
+
+    def close_jobs(self) -> None:
+        """Cancel all pending and running jobs and stop the job workers."""
+        with self._jobs_cv:
+            self._jobs_closed = True
+            pending = [j.id for j in self._jobs.values() if not j.done]
+            self._jobs_cv.notify_all()
+        for job_id in pending:
+            self.cancel_job(job_id)
+
+    def _ensure_job_workers(self) -> None:
+        self._job_workers = [t for t in self._job_workers if t.is_alive()]
+        while len(self._job_workers) < self._job_concurrency:
+            t = threading.Thread(target=self._job_loop, name="biosim-job-worker", daemon=True)
+            self._job_workers.append(t)
+            t.start()
+
+    def _prune_jobs(self) -> None:
+        finished = [j for j in self._jobs.values() if j.done]
+        excess = len(self._jobs) - self._job_history
+        if excess <= 0:
+            return
+        finished.sort(key=lambda j: j.finished_at or 0.0)
+        for job in finished[:excess]:
+            del self._jobs[job.id]
+
+    def _next_job(self) -> Optional[Job]:
+        with self._jobs_cv:
+            while True:
+                if self._jobs_closed:
+                    return None
+                while self._job_heap:
+                    _, _, job_id = heapq.heappop(self._job_heap)
+                    job = self._jobs.get(job_id)
+                    if job is not None and job.state == "queued":
+                        job.state = "running"
+                        job.started_at = time.time()
+                        return job
+                self._jobs_cv.wait()
+
+    def _job_loop(self) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            try:
+                if self._world_factory is not None:
+                    result = self._run_job_isolated(job)
+                else:
+                    result = self._run_job_shared(job)
+                error = None
+            except Exception as exc:
+                result, error = None, str(exc)
+            with self._jobs_cv:
+                job._stop = None
+                job.result = result
+                job.error = error or job.error
+                job.finished_at = time.time()
+                if job.cancel_requested:
+                    job.state = "cancelled"
+                else:
+                    job.state = "failed" if job.error else "succeeded"
+                self._prune_jobs()
+
+    def _acquire_slot(self, job: Job) -> bool:
+        """Wait for a run slot; False if the job is cancelled or the queue closes first."""
+        if self._run_slots is None:
+            return True
+        while not self._run_slots.acquire(timeout=0.05):
+            with self._jobs_cv:
+                if job.cancel_requested or self._jobs_closed:
+                    return False
+        return True
+
+    def _run_job_isolated(self, job: Job) -> Dict[str, Any]:
+        if not self._acquire_slot(job):
+            return {"tick_count": 0, "sim_time": 0.0, "visuals": []}
+        try:
+            return self._run_job_in_fresh_world(job)
+        finally:
+            if self._run_slots is not None:
+                self._run_slots.release()
+
+    def _run_job_in_fresh_world(self, job: Job) -> Dict[str, Any]:
+        from biosim.world import WorldEvent  # lazy to avoid circulars
+
+        world = self._world_factory(job.args)  # type: ignore[misc]
+        ticks = 0
+
+        def _counter(ev, payload):
+            nonlocal ticks
+            if ev == WorldEvent.TICK:
+                ticks += 1
+
+        with self._jobs_cv:
+            job._stop = world.request_stop
+            cancelled = job.cancel_requested
+        if cancelled:
+            return {"tick_count": 0, "sim_time": world.current_time, "visuals": []}
+        wall = time.perf_counter()
+        world.on(_counter, replay_safe=True)
+        try:
+            world.run(duration=job.duration, tick_dt=job.tick_dt)
+        finally:
+            world.off(_counter)
+        return {
+            "tick_count": ticks,
+            "sim_time": world.current_time,
+            "wall_seconds": time.perf_counter() - wall,
+            "visuals": world.collect_visuals(),
+        }
+
+    def _run_job_shared(self, job: Job) -> Optional[Dict[str, Any]]:
+        # Wait for the shared world and a run slot to be free (interactive runs keep priority).
+        while True:
+            try:
+                if self.start_run(duration=job.duration, tick_dt=job.tick_dt, on_start=self._on_job_start):
+                    break
+            except RunLimitReached:
+                pass
+            with self._jobs_cv:
+                if job.cancel_requested or self._jobs_closed:
+                    return None
+                self._jobs_cv.wait(0.05)
+        wall = time.perf_counter()
+        with self._jobs_cv:
+            job._stop = self.request_stop
+            cancelled = job.cancel_requested
+        if cancelled:
+            self.request_stop()
+        self.join()
+        st = self.status()
+        if st.get("error"):
+            job.error = st["error"]["message"]
+        return {
+            "tick_count": st["tick_count"],
+            "sim_time": self._world.current_time,
+            "wall_seconds": time.perf_counter() - wall,
+            "visuals": self._world.collect_visuals(),
+        }
 
     # Internal -------------------------------------------------------------
     def _worker(self, duration: float, tick_dt: Optional[float]) -> None:
+        try:
+            self._run_worker(duration, tick_dt)
+        finally:
+            if self._run_slots is not None:
+                self._run_slots.release()
+
+    def _run_worker(self, duration: float, tick_dt: Optional[float]) -> None:
         try:
             from biosim.world import WorldEvent  # lazy to avoid circulars
 
@@ -131,8 +439,9 @@ class SimulationManager:
                     elif ev == WorldEvent.RESUMED:
                         self._status.paused = False
                     _update_progress(self._status, payload)
+                    self._version += 1
 
-            self._world.on(_counter)
+            self._world.on(_counter, replay_safe=True)
             try:
                 self._world.run(duration=duration, tick_dt=tick_dt)
             finally:
@@ -142,10 +451,12 @@ class SimulationManager:
                 self._status.error = str(exc)
                 self._status.running = False
                 self._status.finished_at = time.time()
+                self._version += 1
             return
         with self._lock:
             self._status.running = False
             self._status.finished_at = time.time()
+            self._version += 1
 
 
 def _coerce_float(value: Any) -> Optional[float]:
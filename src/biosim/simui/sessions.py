@@ -0,0 +1,424 @@
+"""Multi-session SimUI host.
+
+A :class:`SessionHost` serves many independent worlds behind one server. Each
+session owns its own ``BioWorld``, ``Interface`` and ``SimulationManager`` and
+is reached under ``<mount>/s/<session id>/``, so the regular SimUI frontend
+works unchanged.
+
+Limits:
+
+- ``max_sessions``: live sessions; creating one more evicts the least recently
+  used idle session, or fails with 503 when all are running.
+- ``max_running``: simulations running at once across all sessions, runs and
+  queued jobs alike; further ``POST .../api/run`` calls get 429 and jobs wait
+  in their queue for a slot.
+- ``max_memory_mb``: process resident memory. New sessions first evict idle
+  sessions and are refused (503) while the process stays above the limit.
+  Memory is measured for the whole process, not per session.
+- ``idle_ttl``: seconds without requests after which an idle (not running)
+  session is evicted. Open requests, including SSE and WebSocket streams,
+  keep a session alive.
+
+Evicted sessions are checkpointed to ``checkpoint_dir`` (when set) as JSON
+with their config path and last snapshot (status, visuals, events), served at
+``GET <mount>/sessions/<id>/checkpoint`` for export. Live module state is not
+serialized, so visiting an evicted session id resets it: the session is
+rebuilt from the world factory at t=0, its checkpoint is deleted, and
+``GET <mount>/sessions`` lists it with ``"reset": true``.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
+from starlette.concurrency import run_in_threadpool
+from starlette.types import Receive, Scope, Send
+
+from ..world import BioWorld
+from .interface import Interface
+
+logger = logging.getLogger(__name__)
+
+
+def process_rss_mb() -> Optional[float]:
+    """Resident memory of this process in MiB, or None when it cannot be measured."""
+    try:
+        with open("/proc/self/statm") as fh:
+            pages = int(fh.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil  # type: ignore
+
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
+@dataclass
+class _Session:
+    id: str
+    interface: Interface
+    app: FastAPI
+    created: float
+    last_access: float
+    restored: bool = False  # rebuilt after eviction, starting over at t=0
+    active: int = 0  # requests in flight, streams included
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def running(self) -> bool:
+        return bool(self.interface._runner.status().get("running"))
+
+
+class SessionHost:
+    """Hosts independent SimUI sessions, each with its own world, behind one app."""
+
+    def __init__(
+        self,
+        world_factory: Callable[[], BioWorld],
+        *,
+        interface_kwargs: Optional[Dict[str, Any]] = None,
+        mount_path: str = "/ui",
+        idle_ttl: float = 900.0,
+        max_sessions: int = 32,
+        max_running: int = 4,
+        max_memory_mb: Optional[float] = None,
+        checkpoint_dir: str | Path | None = None,
+        memory_probe: Callable[[], Optional[float]] = process_rss_mb,
+    ) -> None:
+        self._world_factory = world_factory
+        self._interface_kwargs = dict(interface_kwargs or {})
+        self._mount_path = mount_path.rstrip("/") or "/ui"
+        self._idle_ttl = float(idle_ttl)
+        self._max_sessions = max(1, int(max_sessions))
+        self._max_running = max(1, int(max_running))
+        self._max_memory_mb = max_memory_mb
+        self._checkpoint_dir: Path | None = Path(checkpoint_dir) if checkpoint_dir else None
+        self._memory_probe = memory_probe
+        self._sessions: Dict[str, _Session] = {}
+        self._creating = 0  # sessions being built outside the lock, counted against max_sessions
+        self._run_slots = threading.BoundedSemaphore(self._max_running)
+        self._evicted: Dict[str, Dict[str, Any]] = {}  # id -> checkpoint summary
+        self._lock = threading.RLock()
+        self._reaper_stop = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+        self._router = self._build_router()
+
+    # ---- Public API ------------------------------------------------------
+    def launch(self, host: str = "127.0.0.1", port: int = 7860, open_browser: bool = False) -> None:
+        """Serve the host with uvicorn (blocking)."""
+        import uvicorn
+
+        app = FastAPI()
+        self.mount(app, self._mount_path)
+        if open_browser:
+            try:
+                import webbrowser
+
+                webbrowser.open(f"http://{host}:{port}{self._mount_path}/new")
+            except Exception:
+                pass
+        uvicorn.run(app, host=host, port=port)
+
+    def mount(self, app: FastAPI, path: Optional[str] = None) -> None:
+        mount_at = (path or self._mount_path).rstrip("/")
+        self._mount_path = mount_at
+        app.include_router(self._router, prefix=mount_at)
+        app.mount(f"{mount_at}/s", self._dispatch, name="bsim_simui_sessions")
+        self._ensure_reaper()
+
+    def close(self) -> None:
+        self._reaper_stop.set()
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            self._shutdown(session)
+
+    def create_session(self, session_id: Optional[str] = None) -> _Session:
+        """Create a session (evicting idle ones if limits require it).
+
+        The world is built outside the host lock, so other sessions stay
+        reachable meanwhile. Recreating an evicted id resets that session.
+        """
+        with self._lock:
+            self._make_room()
+            self._creating += 1
+        sid = session_id or uuid.uuid4().hex[:12]
+        try:
+            world = self._world_factory()
+            ui = Interface(
+                world,
+                mount_path=f"{self._mount_path}/s/{sid}",
+                run_slots=self._run_slots,
+                **self._interface_kwargs,
+            )
+            app = FastAPI()
+            ui.mount(app, "/")
+        finally:
+            with self._lock:
+                self._creating -= 1
+        now = time.monotonic()
+        session = _Session(id=sid, interface=ui, app=app, created=now, last_access=now)
+        with self._lock:
+            existing = self._sessions.get(sid)
+            if existing is None:
+                evicted = self._evicted.pop(sid, None)
+                if evicted is not None or (
+                    self._checkpoint_dir is not None and self._checkpoint_path(sid).exists()
+                ):
+                    session.restored = True
+                self._sessions[sid] = session
+        if existing is not None:  # a concurrent request rebuilt it first
+            self._shutdown(session)
+            return existing
+        if session.restored:
+            self._drop_checkpoint(sid)
+            logger.info("Reset evicted SimUI session %s", sid)
+        else:
+            logger.info("Created SimUI session %s", sid)
+        return session
+
+    def evict(self, session_id: str) -> bool:
+        """Checkpoint and drop a session. Returns False if it is unknown."""
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is None:
+                return False
+            self._evicted[session_id] = self._checkpoint(session)
+        self._shutdown(session)
+        logger.info("Evicted SimUI session %s", session_id)
+        return True
+
+    def reap(self, now: Optional[float] = None) -> List[str]:
+        """Evict sessions idle for longer than ``idle_ttl``; returns their ids."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            stale = [
+                s.id
+                for s in self._sessions.values()
+                if not s.running and not s.active and now - s.last_access > self._idle_ttl
+            ]
+        for sid in stale:
+            self.evict(sid)
+        return stale
+
+    def sessions(self) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            live = [
+                {
+                    "id": s.id,
+                    "state": "running" if s.running else "idle",
+                    "idle_seconds": round(now - s.last_access, 3),
+                    "age_seconds": round(now - s.created, 3),
+                    "restored": s.restored,
+                    "reset": s.restored,
+                    "url": f"{self._mount_path}/s/{s.id}/",
+                }
+                for s in self._sessions.values()
+            ]
+            evicted = [{"id": sid, "state": "evicted", **info} for sid, info in self._evicted.items()]
+        return live + evicted
+
+    # ---- Internal: limits ------------------------------------------------
+    def _over_memory(self) -> bool:
+        if self._max_memory_mb is None:
+            return False
+        rss = self._memory_probe()
+        return rss is not None and rss > self._max_memory_mb
+
+    def _make_room(self) -> None:
+        """Evict LRU idle sessions until a new one fits; raise 503 if impossible."""
+        while len(self._sessions) + self._creating >= self._max_sessions or self._over_memory():
+            idle = sorted(
+                (s for s in self._sessions.values() if not s.running and not s.active), key=lambda s: s.last_access
+            )
+            if not idle:
+                reason = "memory limit reached" if self._over_memory() else "session limit reached"
+                raise HTTPException(status_code=503, detail=f"Cannot create session: {reason}")
+            self.evict(idle[0].id)
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+        self._reaper_stop.clear()
+        self._reaper = threading.Thread(target=self._reaper_loop, name="simui-session-reaper", daemon=True)
+        self._reaper.start()
+
+    def _reaper_loop(self) -> None:
+        interval = max(1.0, min(30.0, self._idle_ttl / 4))
+        while not self._reaper_stop.wait(interval):
+            try:
+                self.reap()
+            except Exception:
+                logger.exception("Session reaper failed")
+
+    # ---- Internal: checkpoints -------------------------------------------
+    def _checkpoint(self, session: _Session) -> Dict[str, Any]:
+        ui = session.interface
+        config_path = ui._config_path
+        info: Dict[str, Any] = {
+            "evicted_at": time.time(),
+            "config_path": str(config_path) if config_path else None,
+            "checkpoint": False,
+        }
+        if self._checkpoint_dir is None:
+            return info
+        try:
+            self._checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            path = self._checkpoint_path(session.id)
+            head = json.dumps({"id": session.id, **info, "checkpoint": True})[:-1].encode("utf-8")
+            path.write_bytes(head + b',"snapshot":' + ui._snapshot_json() + b"}")
+            info["checkpoint"] = True
+        except Exception:
+            logger.exception("Failed to checkpoint session %s", session.id)
+        return info
+
+    def _checkpoint_path(self, session_id: str) -> Path:
+        return self._checkpoint_dir / f"{session_id}.json"  # type: ignore[operator]
+
+    def _drop_checkpoint(self, session_id: str) -> None:
+        if self._checkpoint_dir is None:
+            return
+        try:
+            self._checkpoint_path(session_id).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.warning("Could not delete checkpoint of session %s", session_id, exc_info=True)
+
+    @staticmethod
+    def _shutdown(session: _Session) -> None:
+        try:
+            session.interface._runner.reset()
+        except Exception:
+            pass
+        session.interface.close()
+
+    # ---- Internal: routing ----------------------------------------------
+    def _lookup(self, session_id: str) -> Optional[_Session]:
+        """Find a session and mark a request as in flight on it (see :meth:`_release`)."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            evicted = session is None and (
+                session_id in self._evicted
+                or (
+                    self._checkpoint_dir is not None
+                    and Path(session_id).name == session_id
+                    and self._checkpoint_path(session_id).exists()
+                )
+            )
+        if evicted:
+            session = self.create_session(session_id)
+        if session is not None:
+            with self._lock:
+                session.active += 1
+                session.last_access = time.monotonic()
+        return session
+
+    def _release(self, session: _Session) -> None:
+        with self._lock:
+            session.active -= 1
+            session.last_access = time.monotonic()
+
+    async def _dispatch(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI app mounted at ``<mount>/s`` that forwards to the session's own app."""
+        if scope["type"] not in ("http", "websocket"):
+            return
+        root = scope.get("root_path", "")
+        path = scope["path"]
+        full_paths = bool(root) and path.startswith(root)
+        rel = path[len(root):] if full_paths else path
+        sid, slash, rest = rel.lstrip("/").partition("/")
+        try:
+            # Restoring an evicted session builds a world; keep that off the event loop.
+            session = await run_in_threadpool(self._lookup, sid) if sid else None
+        except HTTPException as exc:
+            if scope["type"] == "http":
+                await JSONResponse({"detail": exc.detail}, status_code=exc.status_code)(scope, receive, send)
+            return
+        if session is None:
+            if scope["type"] == "http":
+                await JSONResponse({"detail": f"Unknown session: {sid}"}, status_code=404)(scope, receive, send)
+            return
+        try:
+            if scope["type"] == "http" and not slash:
+                # The SPA loads static/ and api/ relative to the page URL.
+                await RedirectResponse(url=f"{root}/{sid}/", status_code=307)(scope, receive, send)
+                return
+            child = dict(scope)
+            child["root_path"] = f"{root}/{sid}"
+            if not full_paths:
+                child["path"] = "/" + rest
+            # The run limit is enforced by the session's runner (shared run slots).
+            await session.app(child, receive, send)
+        finally:
+            self._release(session)
+
+    def _build_router(self) -> APIRouter:
+        router = APIRouter()
+
+        @router.get("/", response_class=HTMLResponse)
+        def index() -> str:
+            rows = "".join(
+                f"<li><a href='s/{s['id']}/'>{s['id']}</a> ({s['state']})</li>"
+                for s in self.sessions()
+                if s["state"] != "evicted"
+            )
+            return (
+                "<!doctype html><html><head><meta charset='utf-8'><title>BioSim sessions</title></head><body>"
+                "<h1>BioSim sessions</h1><p><a href='new'>New session</a></p>"
+                f"<ul>{rows}</ul></body></html>"
+            )
+
+        @router.get("/new")
+        def new_session() -> RedirectResponse:
+            session = self.create_session()
+            return RedirectResponse(url=f"s/{session.id}/", status_code=303)
+
+        @router.post("/sessions")
+        def create() -> Dict[str, Any]:
+            session = self.create_session()
+            return {"id": session.id, "url": f"{self._mount_path}/s/{session.id}/"}
+
+        @router.get("/sessions")
+        def list_sessions() -> Dict[str, Any]:
+            return {
+                "sessions": self.sessions(),
+                "limits": {
+                    "max_sessions": self._max_sessions,
+                    "max_running": self._max_running,
+                    "max_memory_mb": self._max_memory_mb,
+                    "idle_ttl": self._idle_ttl,
+                },
+                "memory_mb": self._memory_probe(),
+            }
+
+        @router.delete("/sessions/{session_id}")
+        def delete(session_id: str) -> Dict[str, Any]:
+            if not self.evict(session_id):
+                raise HTTPException(status_code=404, detail=f"Unknown session: {session_id}")
+            return {"ok": True}
+
+        @router.get("/sessions/{session_id}/checkpoint")
+        def checkpoint(session_id: str) -> Response:
+            if self._checkpoint_dir is None:
+                raise HTTPException(status_code=404, detail="Checkpointing is disabled")
+            path = self._checkpoint_path(session_id)
+            if Path(session_id).name != session_id or not path.is_file():
+                raise HTTPException(status_code=404, detail=f"No checkpoint for session: {session_id}")
+            return Response(content=path.read_bytes(), media_type="application/json")
+
+        return router
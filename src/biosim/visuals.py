@@ -3,6 +3,11 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
 import json
 
+try:  # optional fast encoder
+    import orjson as _orjson  # type: ignore
+except Exception:  # pragma: no cover - depends on the environment
+    _orjson = None
+
 
 class VisualSpec(TypedDict, total=False):
     """Renderer-agnostic visual specification for browser clients.
@@ -20,41 +25,88 @@ class VisualSpec(TypedDict, total=False):
 Visuals = Union[VisualSpec, List[VisualSpec]]
 
 
-def validate_visual_spec(spec: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
-    """Validate that a dict conforms to the VisualSpec shape and is JSON-serializable.
+def _json_default(obj: Any) -> Any:
+    """Fallback for values the JSON encoder does not handle natively.
 
-    Returns (ok, error_message). When ok is False, error_message contains a brief reason.
+    NumPy arrays and scalars are detected structurally (``tolist``) so this
+    module does not need to import NumPy.
     """
+    tolist = getattr(obj, "tolist", None)
+    if callable(tolist):
+        return tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def encode_json(obj: Any) -> bytes:
+    """Encode a value as compact UTF-8 JSON.
+
+    Uses ``orjson`` when installed and the standard library otherwise. NumPy
+    arrays and scalars are converted to plain lists/numbers. Raises TypeError
+    or ValueError when the value is not serializable.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(
+            obj,
+            default=_json_default,
+            option=_orjson.OPT_SERIALIZE_NUMPY | _orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+
+def _check_visual_shape(spec: Any) -> Optional[str]:
     if not isinstance(spec, dict):
-        return False, "visual must be a dict"
+        return "visual must be a dict"
     if "render" not in spec:
-        return False, "missing 'render' key"
+        return "missing 'render' key"
     if "data" not in spec:
-        return False, "missing 'data' key"
+        return "missing 'data' key"
     render = spec["render"]
     if not isinstance(render, str) or not render:
-        return False, "'render' must be a non-empty string"
-    data = spec["data"]
-    if not isinstance(data, dict):
-        return False, "'data' must be a dict"
+        return "'render' must be a non-empty string"
+    if not isinstance(spec["data"], dict):
+        return "'data' must be a dict"
     if "description" in spec and not isinstance(spec["description"], str):
-        return False, "'description' must be a string"
-    # Check JSON serializability (best-effort)
+        return "'description' must be a string"
+    return None
+
+
+def _visual_payload(spec: Dict[str, Any]) -> Dict[str, Any]:
+    # Only the fields the UI relies on are kept.
+    payload: Dict[str, Any] = {"render": spec["render"], "data": spec["data"]}
+    if "description" in spec:
+        payload["description"] = spec["description"]
+    return payload
+
+
+def encode_visual_spec(spec: Dict[str, Any]) -> Tuple[Optional[bytes], Optional[str]]:
+    """Validate a visual spec and encode its normalized form in a single pass.
+
+    Returns (payload, error_message). On success payload holds the JSON bytes
+    of ``{"render", "data"[, "description"]}`` and error_message is None.
+    """
+    error = _check_visual_shape(spec)
+    if error is not None:
+        return None, error
     try:
-        # Include optional fields that the UI may rely on.
-        payload: Dict[str, Any] = {"render": render, "data": data}
-        if "description" in spec:
-            payload["description"] = spec["description"]
-        json.dumps(payload)
-    except TypeError as exc:
-        return False, f"data not JSON-serializable: {exc}"
-    return True, None
+        return encode_json(_visual_payload(spec)), None
+    except (TypeError, ValueError) as exc:
+        return None, f"data not JSON-serializable: {exc}"
 
 
-def normalize_visuals(visuals: Visuals) -> List[VisualSpec]:
-    """Normalize a single VisualSpec or list into a list of VisualSpec.
+def validate_visual_spec(spec: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Validate that a dict conforms to the VisualSpec shape and is JSON-serializable.
 
-    Invalid entries are filtered out.
+    Returns (ok, error_message). When ok is False, error_message contains a brief reason.
+    """
+    payload, error = encode_visual_spec(spec)
+    return payload is not None, error
+
+
+def normalize_and_encode_visuals(visuals: Visuals) -> Tuple[List[VisualSpec], bytes]:
+    """Normalize visuals and return them together with their encoded JSON array.
+
+    Each spec is encoded exactly once; the returned bytes are the JSON list of
+    the normalized specs and can be reused by any consumer that needs JSON.
     """
     items: List[Dict[str, Any]]
     if isinstance(visuals, list):
@@ -62,11 +114,18 @@ def normalize_visuals(visuals: Visuals) -> List[VisualSpec]:
     else:
         items = [visuals]  # type: ignore[list-item]
     out: List[VisualSpec] = []
+    parts: List[bytes] = []
     for v in items:
-        ok, _ = validate_visual_spec(v)
-        if ok:
-            normed: Dict[str, Any] = {"render": v["render"], "data": v["data"]}
-            if "description" in v and isinstance(v["description"], str):
-                normed["description"] = v["description"]
-            out.append(normed)  # type: ignore[arg-type]
-    return out
+        payload, _ = encode_visual_spec(v)
+        if payload is not None:
+            out.append(_visual_payload(v))  # type: ignore[arg-type]
+            parts.append(payload)
+    return out, b"[" + b",".join(parts) + b"]"
+
+
+def normalize_visuals(visuals: Visuals) -> List[VisualSpec]:
+    """Normalize a single VisualSpec or list into a list of VisualSpec.
+
+    Invalid entries are filtered out.
+    """
+    return normalize_and_encode_visuals(visuals)[0]
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import random
+import re
 from dataclasses import dataclass, field
 from importlib import import_module
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from .modules import BioModule
-from .world import BioWorld
+from .world import BioWorld, resolve_min_dt
 
 
 def _parse_ref(ref: str) -> Tuple[str, str]:
@@ -20,49 +22,145 @@ def _parse_ref(ref: str) -> Tuple[str, str]:
     return parts[0], parts[1]
 
 
+_pattern_cache: Dict[str, "re.Pattern[str]"] = {}
+
+
+def _is_pattern(name: str) -> bool:
+    return "*" in name or "?" in name
+
+
+def _name_regex(pattern: str) -> "re.Pattern[str]":
+    """Compile a module-name glob (``*`` and ``?``) into a regex capturing each wildcard."""
+    rx = _pattern_cache.get(pattern)
+    if rx is None:
+        parts = ["(.*)" if ch == "*" else "(.)" if ch == "?" else re.escape(ch) for ch in pattern]
+        rx = _pattern_cache[pattern] = re.compile("".join(parts) + r"\Z")
+    return rx
+
+
+def _match_names(pattern: str, names: Sequence[str]) -> List[Tuple[str, Tuple[str, ...]]]:
+    rx = _name_regex(pattern)
+    out = []
+    for name in names:
+        m = rx.match(name)
+        if m is not None:
+            out.append((name, m.groups()))
+    return out
+
+
+def expand_wiring(src_ref: str, dst_refs: Iterable[str], names: Sequence[str]) -> List[Tuple[str, str]]:
+    """Expand a (possibly pattern-based) wiring entry into concrete ``(src, dst)`` refs.
+
+    Module names in ``src_ref`` and ``dst_refs`` may use ``*``/``?`` wildcards,
+    matched against ``names`` in order. Destinations may refer to the source
+    match: ``{i}`` is the text matched by the source's first wildcard and
+    ``{name}`` the source module name. So ``from: "pop_*.spikes"`` with
+    ``to: ["mon_{i}.in"]`` wires ``pop_3`` to ``mon_3``; a destination that
+    still contains wildcards fans out to every matching module. Ports are not
+    checked here. Raises KeyError for unknown modules or patterns matching none.
+    """
+    return _expand(src_ref, dst_refs, names, set(names))
+
+
+def _expand(src_ref: str, dst_refs: Iterable[str], names: Sequence[str], known: Set[str]) -> List[Tuple[str, str]]:
+    src_name, src_port = _parse_ref(src_ref)
+    if _is_pattern(src_name):
+        sources = _match_names(src_name, names)
+        if not sources:
+            raise KeyError(f"connect {src_ref}: pattern matches no modules")
+    else:
+        if src_name not in known:
+            raise KeyError(f"connect {src_ref}: unknown module name '{src_name}'")
+        sources = [(src_name, ())]
+
+    dst_parsed = [(ref, *_parse_ref(ref)) for ref in dst_refs]
+    out: List[Tuple[str, str]] = []
+    for name, groups in sources:
+        src = f"{name}.{src_port}"
+        for dst_ref, dst_name, dst_port in dst_parsed:
+            if "{" in dst_name:
+                dst_name = dst_name.replace("{i}", groups[0] if groups else "").replace("{name}", name)
+            if _is_pattern(dst_name):
+                targets = [target for target, _ in _match_names(dst_name, names)]
+                if not targets:
+                    raise KeyError(f"connect {src} -> {dst_ref}: pattern matches no modules")
+            else:
+                if dst_name not in known:
+                    raise KeyError(f"connect {src} -> {dst_ref}: unknown module '{dst_name}'")
+                targets = [dst_name]
+            out.extend((src, f"{target}.{dst_port}") for target in targets)
+    return out
+
+
 @dataclass
 class WiringBuilder:
     world: BioWorld
     registry: Dict[str, BioModule] = field(default_factory=dict)
     _pending_connections: List[Tuple[str, List[str]]] = field(default_factory=list)
 
-    def add(self, name: str, module: BioModule, *, min_dt: Optional[float] = None, priority: int = 0) -> "WiringBuilder":
+    def add(
+        self,
+        name: str,
+        module: BioModule,
+        *,
+        min_dt: Optional[float] = None,
+        priority: int = 0,
+        args: Optional[Mapping[str, Any]] = None,
+    ) -> "WiringBuilder":
         if name in self.registry and self.registry[name] is not module:
             raise ValueError(f"Module name already registered: {name}")
         self.registry[name] = module
-        self.world.add_biomodule(name, module, min_dt=min_dt, priority=priority)
+        self.world.add_biomodule(name, module, min_dt=min_dt, priority=priority, args=args)
         return self
 
     def connect(self, src_ref: str, dst_refs: Iterable[str]) -> "WiringBuilder":
+        """Queue a connection; refs may use patterns (see :func:`expand_wiring`)."""
         self._pending_connections.append((src_ref, list(dst_refs)))
         return self
 
+    def connect_many(self, connections: Iterable[Tuple[str, Union[str, Iterable[str]]]]) -> "WiringBuilder":
+        """Queue many ``(src, dst)`` or ``(src, [dst, ...])`` connections at once."""
+        for src_ref, dst in connections:
+            self._pending_connections.append((src_ref, [dst] if isinstance(dst, str) else list(dst)))
+        return self
+
     def apply(self) -> None:
+        self.world.connect_many(self.resolve())
+        self._pending_connections.clear()
+
+    def resolve(self) -> List[Tuple[str, str]]:
+        """Expand patterns and validate pending connections against declared ports.
+
+        Returns concrete ``(src, dst)`` refs. Each module's port sets are read once.
+        """
+        names = list(self.registry)
+        known = set(names)
+        outputs: Dict[str, Set[str]] = {}
+        inputs: Dict[str, Set[str]] = {}
+        resolved: List[Tuple[str, str]] = []
         for src_ref, dst_refs in self._pending_connections:
-            src_name, src_port = _parse_ref(src_ref)
-            src_mod = self.registry.get(src_name)
-            if src_mod is None:
-                raise KeyError(f"connect {src_ref}: unknown module name '{src_name}'")
-            # Validate source port if declared
-            declared_out = set(src_mod.outputs())
-            if declared_out and src_port not in declared_out:
-                raise ValueError(
-                    f"connect {src_ref}: module '{src_name}' has no output port '{src_port}'. "
-                    f"Declared outputs: {sorted(declared_out)}"
-                )
-            for dst_ref in dst_refs:
-                dst_name, dst_port = _parse_ref(dst_ref)
-                dst_mod = self.registry.get(dst_name)
-                if dst_mod is None:
-                    raise KeyError(f"connect {src_ref} -> {dst_ref}: unknown module '{dst_name}'")
-                declared_in = set(dst_mod.inputs())
+            for src, dst in _expand(src_ref, dst_refs, names, known):
+                src_name, _, src_port = src.partition(".")
+                declared_out = outputs.get(src_name)
+                if declared_out is None:
+                    declared_out = outputs[src_name] = set(self.registry[src_name].outputs())
+                # Validate ports if declared
+                if declared_out and src_port not in declared_out:
+                    raise ValueError(
+                        f"connect {src_ref}: module '{src_name}' has no output port '{src_port}'. "
+                        f"Declared outputs: {sorted(declared_out)}"
+                    )
+                dst_name, _, dst_port = dst.partition(".")
+                declared_in = inputs.get(dst_name)
+                if declared_in is None:
+                    declared_in = inputs[dst_name] = set(self.registry[dst_name].inputs())
                 if declared_in and dst_port not in declared_in:
                     raise ValueError(
-                        f"connect {src_ref} -> {dst_ref}: module '{dst_name}' has no input port '{dst_port}'. "
+                        f"connect {src_ref} -> {dst}: module '{dst_name}' has no input port '{dst_port}'. "
                         f"Declared inputs: {sorted(declared_in)}"
                     )
-                self.world.connect(f"{src_name}.{src_port}", f"{dst_name}.{dst_port}")
-        self._pending_connections.clear()
+                resolved.append((src, dst))
+        return resolved
 
 
 def _import_from_string(path: str) -> Any:
@@ -79,51 +177,273 @@ def build_from_spec(world: BioWorld, spec: Mapping[str, Any]) -> WiringBuilder:
     Spec format (keys optional):
     - modules: mapping of name -> one of:
         - dotted path string (e.g., "biosim.packs.neuro.IzhikevichPopulation")
-        - {class: dotted, args: {...}, min_dt: float, priority: int}
-    - wiring: list of {from: str, to: [str, ...]}
+        - {class: dotted, args: {...}, min_dt: float, priority: int, replicas: int}
+    - wiring: list of {from: str, to: [str, ...], rule: str, k: int, seed: int}
+
+    An entry with ``replicas: N`` builds N modules ``<name>_0`` .. ``<name>_<N-1>``
+    (``{i}`` in args is the index); wiring refs to the group are paired by
+    ``rule``: ``all_to_all`` (default), ``one_to_one`` or ``random_k``.
     """
     builder = WiringBuilder(world)
 
+    for name, entry in _expanded_modules(spec).items():
+        cls, kwargs, min_dt, priority = _resolve_module_entry(name, entry)
+        builder.add(name, _instantiate(name, cls, kwargs), min_dt=min_dt, priority=priority, args=kwargs)
+    for src, to in _wiring_entries(spec):
+        builder.connect(src, to)
+    builder.apply()
+    return builder
+
+
+def update_from_spec(world: BioWorld, spec: Mapping[str, Any]) -> Dict[str, List[str]]:
+    """Change ``world`` in place so it matches ``spec``, touching as little as possible.
+
+    Modules whose class, args, ``min_dt`` and priority are unchanged are kept
+    with their state; added or changed modules are (re)instantiated, and only
+    connections that differ are added or removed. New modules and wiring are
+    validated before the world is modified. Returns the names of added,
+    removed, replaced and kept modules and the connections made and dropped
+    (as ``"src -> dst"``).
+    """
+    entries = _expanded_modules(spec)
+    resolved = {name: _resolve_module_entry(name, entry) for name, entry in entries.items()}
+
+    kept: List[str] = []
+    for name, (cls, kwargs, min_dt, priority) in resolved.items():
+        current = world.module_spec(name) if name in world.module_names else None
+        if current is None or type(current["module"]) is not cls:
+            continue
+        same_min_dt = (
+            current["min_dt"] == min_dt
+            if min_dt is not None
+            else current["min_dt"] == getattr(current["module"], "min_dt", None)
+        )
+        if current["args"] == dict(kwargs) and same_min_dt and current["priority"] == priority:
+            kept.append(name)
+    removed = [name for name in world.module_names if name not in resolved]
+    replaced = [name for name in resolved if name in world.module_names and name not in kept]
+    added = [name for name in resolved if name not in world.module_names]
+    fresh = {name: _instantiate(name, resolved[name][0], resolved[name][1]) for name in replaced + added}
+    for name, module in fresh.items():
+        resolve_min_dt(name, module, resolved[name][2])
+
+    registry: Dict[str, BioModule] = {name: world.module_spec(name)["module"] for name in kept}
+    registry.update(fresh)
+    builder = WiringBuilder(world, registry=registry)
+    for src, to in _wiring_entries(spec):
+        builder.connect(src, to)
+    desired = list(dict.fromkeys(builder.resolve()))
+
+    before = set(world.connections())
+    wanted = set(desired)
+    # Removing a module drops its connections; edges of replaced modules are re-made below.
+    for name in removed + replaced:
+        world.remove_biomodule(name)
+    remaining = set(world.connections())
+    for src, dst in remaining - wanted:
+        world.disconnect(src, dst)
+    for name in replaced + added:
+        _, kwargs, min_dt, priority = resolved[name]
+        world.add_biomodule(name, fresh[name], min_dt=min_dt, priority=priority, args=kwargs)
+    world.connect_many([(src, dst) for src, dst in desired if (src, dst) not in remaining])
+    return {
+        "added": added,
+        "removed": removed,
+        "replaced": replaced,
+        "kept": kept,
+        "connected": [f"{src} -> {dst}" for src, dst in desired if (src, dst) not in before],
+        "disconnected": sorted(f"{src} -> {dst}" for src, dst in before - wanted),
+    }
+
+
+def reload_wiring(world: BioWorld, path: str | Path) -> Dict[str, List[str]]:
+    """Incrementally update ``world`` from a YAML/TOML file (see :func:`update_from_spec`)."""
+    return update_from_spec(world, load_spec(path))
+
+
+def _module_entries(spec: Mapping[str, Any]) -> Mapping[str, Any]:
     modules_section = spec.get("modules") if isinstance(spec, Mapping) else None
-    if isinstance(modules_section, Mapping):
-        for name, entry in modules_section.items():
-            min_dt = None
-            priority = 0
-            if isinstance(entry, str):
-                cls = _import_from_string(entry)
-                module = cls()
-            elif isinstance(entry, Mapping):
-                cls_path = entry.get("class")
-                if not isinstance(cls_path, str):
-                    raise ValueError(f"Invalid class for module '{name}'")
-                cls = _import_from_string(cls_path)
-                kwargs = entry.get("args") or {}
-                if not isinstance(kwargs, Mapping):
-                    raise ValueError(f"Invalid args for module '{name}'")
-                module = cls(**dict(kwargs))
-                if "min_dt" in entry:
-                    min_dt = float(entry["min_dt"])
-                if "priority" in entry:
-                    priority = int(entry["priority"])
-            else:
-                raise ValueError(f"Invalid module entry for '{name}'")
-            if not isinstance(module, BioModule):
-                raise TypeError(f"Module '{name}' is not a BioModule: {type(module)!r}")
-            builder.add(name, module, min_dt=min_dt, priority=priority)
+    return modules_section if isinstance(modules_section, Mapping) else {}
+
+
+# Replica groups: a module entry with ``replicas: N`` stands for N modules named
+# ``<name>_0`` .. ``<name>_<N-1>``. Strings in its args may contain ``{i}`` (or
+# ``{i:03d}``), replaced by the replica index; an arg that is exactly ``"{i}"``
+# becomes the integer index. The spec itself stays compact: replicas are only
+# expanded when a world is built from it.
+REPLICA_RULES = ("all_to_all", "one_to_one", "random_k")
+_INDEX_TEMPLATE = re.compile(r"\{i(?::([^{}]*))?\}")
+
+
+def replica_name(group: str, index: int) -> str:
+    """Name of replica ``index`` of the replica group ``group`` (``col`` -> ``col_3``)."""
+    return f"{group}_{index}"
 
+
+def _template(value: Any, index: int) -> Any:
+    if isinstance(value, str):
+        if value == "{i}":
+            return index
+        return _INDEX_TEMPLATE.sub(lambda m: format(index, m.group(1) or ""), value)
+    if isinstance(value, Mapping):
+        return {k: _template(v, index) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_template(v, index) for v in value]
+    return value
+
+
+def _replica_count(name: str, entry: Any) -> Optional[int]:
+    if not isinstance(entry, Mapping) or "replicas" not in entry:
+        return None
+    count = entry["replicas"]
+    if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+        raise ValueError(f"Invalid replicas for module '{name}': expected a positive integer")
+    return count
+
+
+def _replica_groups(spec: Mapping[str, Any]) -> Dict[str, int]:
+    """Replica group name -> replica count."""
+    groups: Dict[str, int] = {}
+    for name, entry in _module_entries(spec).items():
+        count = _replica_count(name, entry)
+        if count is not None:
+            groups[name] = count
+    return groups
+
+
+def _expanded_modules(spec: Mapping[str, Any]) -> Dict[str, Any]:
+    """``modules`` entries with each replica group expanded to one entry per replica."""
+    out: Dict[str, Any] = {}
+    for name, entry in _module_entries(spec).items():
+        count = _replica_count(name, entry)
+        if count is None:
+            if name in out:
+                raise ValueError(f"Module name '{name}' clashes with a replica")
+            out[name] = entry
+            continue
+        base = {k: v for k, v in entry.items() if k != "replicas"}
+        args = base.get("args")
+        for i in range(count):
+            replica = replica_name(name, i)
+            if replica in out:
+                raise ValueError(f"Replica '{replica}' of '{name}' clashes with another module")
+            out[replica] = dict(base, args=_template(args, i)) if args else base
+    return out
+
+
+def _resolve_module_entry(name: str, entry: Any) -> Tuple[Any, Mapping[str, Any], Optional[float], int]:
+    """Return ``(cls, args, min_dt, priority)`` for a ``modules`` entry."""
+    min_dt = None
+    priority = 0
+    kwargs: Mapping[str, Any] = {}
+    if isinstance(entry, str):
+        cls = _import_from_string(entry)
+    elif isinstance(entry, Mapping):
+        cls_path = entry.get("class")
+        if not isinstance(cls_path, str):
+            raise ValueError(f"Invalid class for module '{name}'")
+        cls = _import_from_string(cls_path)
+        kwargs = entry.get("args") or {}
+        if not isinstance(kwargs, Mapping):
+            raise ValueError(f"Invalid args for module '{name}'")
+        if "min_dt" in entry:
+            min_dt = float(entry["min_dt"])
+        if "priority" in entry:
+            priority = int(entry["priority"])
+    else:
+        raise ValueError(f"Invalid module entry for '{name}'")
+    return cls, kwargs, min_dt, priority
+
+
+def _instantiate(name: str, cls: Any, kwargs: Mapping[str, Any]) -> BioModule:
+    module = cls(**dict(kwargs))
+    if not isinstance(module, BioModule):
+        raise TypeError(f"Module '{name}' is not a BioModule: {type(module)!r}")
+    return module
+
+
+def _wiring_section(spec: Mapping[str, Any]) -> List[Mapping[str, Any]]:
     wiring_section = spec.get("wiring") if isinstance(spec, Mapping) else None
+    out: List[Mapping[str, Any]] = []
     if isinstance(wiring_section, list):
         for entry in wiring_section:
             if not isinstance(entry, Mapping):
                 raise ValueError("Invalid wiring entry")
-            src = entry.get("from")
-            to = entry.get("to")
-            if not isinstance(src, str) or not isinstance(to, list):
+            if not isinstance(entry.get("from"), str) or not isinstance(entry.get("to"), list):
                 raise ValueError("Wiring entries require 'from' (str) and 'to' (list[str])")
-            builder.connect(src, to)
+            out.append(entry)
+    return out
 
-    builder.apply()
-    return builder
+
+def _wiring_entries(spec: Mapping[str, Any]) -> List[Tuple[str, List[str]]]:
+    """``(from, to)`` pairs of the ``wiring`` section, with replica-group entries expanded."""
+    groups = _replica_groups(spec)
+    out: List[Tuple[str, List[str]]] = []
+    for entry in _wiring_section(spec):
+        out.extend(_expand_rule(entry, groups))
+    return out
+
+
+def _ref_name(ref: Any) -> Any:
+    return ref.split(".", 1)[0] if isinstance(ref, str) else ref
+
+
+def _group_members(ref: str, groups: Mapping[str, int]) -> List[str]:
+    name, port = _parse_ref(ref)
+    if name in groups:
+        return [f"{replica_name(name, i)}.{port}" for i in range(groups[name])]
+    if _is_pattern(name) or "{" in name:
+        raise ValueError(f"Wiring rules take module or replica group refs, not patterns: '{ref}'")
+    return [ref]
+
+
+def _expand_rule(entry: Mapping[str, Any], groups: Mapping[str, int]) -> List[Tuple[str, List[str]]]:
+    """Expand one wiring entry whose refs name replica groups (or that sets a ``rule``).
+
+    A replica group ref (``col.out``) stands for that port on every replica, and
+    a plain module for a group of one. ``rule`` decides how the ``from`` group
+    is paired with each ``to`` group:
+
+    - ``all_to_all`` (default): every source feeds every destination;
+    - ``one_to_one``: source ``i`` feeds destination ``i`` (sizes must match);
+    - ``random_k``: each destination gets ``k`` distinct sources drawn with
+      ``random.Random(seed)`` (``seed`` defaults to 0, so rebuilds are stable).
+
+    Entries without groups or a rule are returned unchanged (patterns allowed).
+    """
+    src, to = entry["from"], list(entry["to"])
+    rule = entry.get("rule")
+    if rule is None and _ref_name(src) not in groups and not any(_ref_name(t) in groups for t in to):
+        return [(src, to)]
+    rule = rule or "all_to_all"
+    if rule not in REPLICA_RULES:
+        raise ValueError(f"Unknown wiring rule '{rule}'; expected one of {', '.join(REPLICA_RULES)}")
+    sources = _group_members(src, groups)
+    targets = [(ref, _group_members(ref, groups)) for ref in to]
+    if rule == "all_to_all":
+        everything = [dst for _, members in targets for dst in members]
+        return [(s, everything) for s in sources]
+
+    fan: Dict[str, List[str]] = {s: [] for s in sources}
+    if rule == "one_to_one":
+        for ref, members in targets:
+            if len(members) != len(sources):
+                raise ValueError(
+                    f"one_to_one wiring {src} -> {ref} needs groups of equal size "
+                    f"({len(sources)} vs {len(members)})"
+                )
+            for s, dst in zip(sources, members):
+                fan[s].append(dst)
+    else:
+        k = entry.get("k")
+        if isinstance(k, bool) or not isinstance(k, int) or not 1 <= k <= len(sources):
+            raise ValueError(f"random_k wiring from {src} needs 1 <= k <= {len(sources)}, got {k!r}")
+        rng = random.Random(entry.get("seed", 0))
+        for _, members in targets:
+            for dst in members:
+                for j in sorted(rng.sample(range(len(sources)), k)):
+                    fan[sources[j]].append(dst)
+    return [(s, dsts) for s, dsts in fan.items() if dsts]
 
 
 def load_wiring(world: BioWorld, path: str | Path) -> WiringBuilder:
@@ -136,9 +456,26 @@ def load_wiring(world: BioWorld, path: str | Path) -> WiringBuilder:
     raise ValueError(f"Unsupported wiring file type: {suffix}")
 
 
-def load_wiring_toml(world: BioWorld, path: str | Path) -> WiringBuilder:
+def load_spec(path: str | Path) -> Dict[str, Any]:
+    """Parse a YAML/TOML wiring file into a spec dict without building anything."""
     p = Path(path)
-    data: Dict[str, Any]
+    suffix = p.suffix.lower()
+    if suffix in {".toml", ".tml"}:
+        return _read_toml_spec(p)
+    if suffix in {".yaml", ".yml"}:
+        return _read_yaml_spec(p)
+    raise ValueError(f"Unsupported wiring file type: {suffix}")
+
+
+def load_wiring_toml(world: BioWorld, path: str | Path) -> WiringBuilder:
+    return build_from_spec(world, _read_toml_spec(Path(path)))
+
+
+def load_wiring_yaml(world: BioWorld, path: str | Path) -> WiringBuilder:
+    return build_from_spec(world, _read_yaml_spec(Path(path)))
+
+
+def _read_toml_spec(p: Path) -> Dict[str, Any]:
     try:
         import tomllib  # type: ignore[attr-defined]
     except Exception:  # pragma: no cover - fallback for <3.11
@@ -147,18 +484,17 @@ def load_wiring_toml(world: BioWorld, path: str | Path) -> WiringBuilder:
         except Exception as exc:  # pragma: no cover
             raise ImportError("TOML support requires Python 3.11+ or 'tomli' installed") from exc
     with p.open("rb") as f:
-        data = tomllib.load(f)
-    return build_from_spec(world, data)
+        return tomllib.load(f)
 
 
-def load_wiring_yaml(world: BioWorld, path: str | Path) -> WiringBuilder:
-    p = Path(path)
+def _read_yaml_spec(p: Path) -> Dict[str, Any]:
     try:
         import yaml  # type: ignore
     except Exception as exc:  # pragma: no cover
         raise ImportError("YAML support requires 'pyyaml' installed") from exc
     with p.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        # libyaml's C loader when PyYAML was built with it; same semantics as safe_load.
+        data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     if not isinstance(data, Mapping):
         raise ValueError("YAML wiring must load to a mapping/dict")
-    return build_from_spec(world, data)
+    return dict(data)
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
 import heapq
 import logging
 import threading
+import time
 
-from .modules import BioModule
+from .modules import BioModule, PureModule, VectorizableModule, batch_row
 from .signals import BioSignal
-from .visuals import normalize_visuals
+from .visuals import VisualSpec, encode_json, normalize_and_encode_visuals
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .results import ResultStore
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +46,89 @@ class ModuleEntry:
     min_dt: float
     priority: int = 0
     last_time: float = 0.0
+    # Constructor args, if known; required for run memoization (see results.py).
+    args: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class BatchGroup:
+    """Instances of one VectorizableModule class stepped as a single scheduled entity."""
+
+    key: str
+    cls: type
+    names: List[str]
+    min_dt: float
+    priority: int
+    # state key -> array stacked over ``names`` (axis 0)
+    states: Dict[str, Any]
+    input_ports: List[str]
+
+
+class _BatchSignals(Mapping[str, BioSignal]):
+    """Output signals of one batch member, created from its row on first access."""
+
+    __slots__ = ("_name", "_outputs", "_index", "_time", "_signals")
+
+    def __init__(self, name: str, outputs: Mapping[str, Any], index: int, t: float) -> None:
+        self._name = name
+        self._outputs = outputs
+        self._index = index
+        self._time = t
+        self._signals: Dict[str, BioSignal] = {}
+
+    def __getitem__(self, port: str) -> BioSignal:
+        signal = self._signals.get(port)
+        if signal is None:
+            value = batch_row(self._outputs[port], self._index)
+            signal = self._signals[port] = BioSignal(source=self._name, name=port, value=value, time=self._time)
+        return signal
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._outputs)
+
+    def __len__(self) -> int:
+        return len(self._outputs)
+
+
+_STALE_VISUALS = object()
+
+
+@dataclass
+class ModuleVisuals:
+    """Normalized visuals of one module, cached by BioWorld.
+
+    ``revision`` is drawn from a world-wide counter and only changes when the
+    encoded visuals actually change, so consumers can diff cheaply.
+    """
+
+    name: str
+    module: str
+    visuals: List[VisualSpec]
+    encoded: bytes
+    revision: int
+    version: Any = None
+
+
+@dataclass(frozen=True)
+class WorldSnapshot:
+    """Immutable view of the world published at a tick boundary.
+
+    Readers on other threads use it instead of touching live modules. Signal
+    values are shared with the signal store, so modules must not mutate
+    emitted values in place.
+    """
+
+    seq: int
+    time: float
+    progress: Mapping[str, float]
+    signals: Mapping[str, Mapping[str, BioSignal]]
+    visuals: Tuple[ModuleVisuals, ...]
+    visuals_json: bytes
+
+
+def _visuals_json(visuals: Tuple[ModuleVisuals, ...] | List[ModuleVisuals]) -> bytes:
+    parts = [b'{"module":' + encode_json(mv.module) + b',"visuals":' + mv.encoded + b"}" for mv in visuals]
+    return b"[" + b",".join(parts) + b"]"
 
 
 @dataclass
@@ -49,6 +138,37 @@ class Connection:
     target_module: str
     target_signal: str
     last_event_time: float = -1.0
+    # Set when the source is a collapsed chain of pure modules: the module and
+    # signal the chain starts from, and the composed transform of the chain.
+    route: Optional[Tuple[str, str, Callable[[Any], Any]]] = None
+
+
+def resolve_min_dt(name: str, module: BioModule, min_dt: Optional[float] = None) -> float:
+    """The step ``module`` gets in a world: ``min_dt`` if given, else the module's own.
+
+    Raises ValueError unless it is positive.
+    """
+    module_min_dt = min_dt if min_dt is not None else getattr(module, "min_dt", None)
+    if module_min_dt is None or module_min_dt <= 0:
+        raise ValueError(f"Module '{name}' must define a positive min_dt")
+    return float(module_min_dt)
+
+
+_NO_VALUE = object()
+
+
+def _compose(steps: List[Tuple[Callable[[Dict[str, Any]], Dict[str, Any]], str, str]]) -> Callable[[Any], Any]:
+    """Compose ``(transform, in_port, out_port)`` steps (applied in order) into one function."""
+
+    def composed(value: Any) -> Any:
+        for transform, in_port, out_port in steps:
+            outputs = transform({in_port: value})
+            if out_port not in outputs:
+                return _NO_VALUE
+            value = outputs[out_port]
+        return value
+
+    return composed
 
 
 class BioWorld:
@@ -64,24 +184,61 @@ class BioWorld:
         self._current_time: float = 0.0
         self._is_setup: bool = False
         self._listeners: List[Listener] = []
+        self._replay_safe_listeners: List[Listener] = []
         self._active_run_start: Optional[float] = None
         self._active_run_end: Optional[float] = None
+        # module name -> visuals from the last visualize() call
+        self._visual_cache: Dict[str, ModuleVisuals] = {}
+        self._visual_revision: int = 0
+        # Snapshot publishing: None disables it; otherwise the minimum wall-clock
+        # seconds between snapshots published during a run (0 = every tick).
+        self.snapshot_interval: Optional[float] = None
+        self._snapshot: Optional[WorldSnapshot] = None
+        self._snapshot_seq: int = 0
+        self._snapshot_published_at: float = 0.0
+        # Bumped whenever modules or connections change (used for HTTP ETags).
+        self._structure_version: int = 0
+        # Fuse VectorizableModule instances of the same class, min_dt and priority
+        # into batches at setup (see BatchGroup). Batches are keyed by a synthetic
+        # name in the scheduler; ``_batch_of`` maps member names to it.
+        self.fuse_batches: bool = True
+        self._batches: Dict[str, BatchGroup] = {}
+        self._batch_of: Dict[str, str] = {}
+        # Collapse chains of PureModules into routes on their consumers' connections.
+        # ``_inlined`` maps each collapsed module to its single incoming connection.
+        self.collapse_pure: bool = True
+        self._pure_names: Set[str] = set()
+        self._inlined: Dict[str, Connection] = {}
+        # Run memoization: runs from a freshly set-up world are looked up in and
+        # stored to ``result_store`` (None disables it).
+        self.result_store: Optional[ResultStore] = None
+        self.last_run_cached: bool = False
+        self._has_run: bool = False
+        self._replayed: bool = False
+        self._setup_config: Dict[str, Any] = {}
 
         self._stop_requested: bool = False
         self._run_event = threading.Event()
         self._run_event.set()
 
     # --- Listener management -----------------------------------------
-    def on(self, listener: Listener) -> None:
-        """Register a listener for runtime events."""
+    def on(self, listener: Listener, *, replay_safe: bool = False) -> None:
+        """Register a listener for runtime events.
+
+        A cached run emits only ``started`` and ``finished``; runs are only
+        restored from ``result_store`` while every listener is ``replay_safe``.
+        """
         self._listeners.append(listener)
+        if replay_safe:
+            self._replay_safe_listeners.append(listener)
 
     def off(self, listener: Listener) -> None:
         """Unregister a listener if present."""
-        try:
-            self._listeners.remove(listener)
-        except ValueError:
-            pass
+        for listeners in (self._listeners, self._replay_safe_listeners):
+            try:
+                listeners.remove(listener)
+            except ValueError:
+                pass
 
     def _emit(self, event: WorldEvent, payload: Optional[Dict[str, Any]] = None) -> None:
         data = payload or {}
@@ -113,17 +270,92 @@ class BioWorld:
         }
 
     # --- Module registration -----------------------------------------
-    def add_biomodule(self, name: str, module: BioModule, *, min_dt: Optional[float] = None, priority: int = 0) -> None:
+    def add_biomodule(
+        self,
+        name: str,
+        module: BioModule,
+        *,
+        min_dt: Optional[float] = None,
+        priority: int = 0,
+        args: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Register a module.
+
+        ``args`` are the constructor arguments the module was built with. They are
+        only recorded, so runs of this world can be memoized in ``result_store``.
+
+        Modules added to a world that is already set up are set up and
+        scheduled from the current time, so they join the next run.
+        """
         if name in self._modules and self._modules[name].module is not module:
             raise ValueError(f"Module name already registered: {name}")
+        is_new = name not in self._modules
+        module_min_dt = resolve_min_dt(name, module, min_dt)
         try:
             setattr(module, "_world_name", name)
         except Exception:  # pragma: no cover - defensive: setattr may fail on frozen modules
             pass
-        module_min_dt = min_dt if min_dt is not None else getattr(module, "min_dt", None)
-        if module_min_dt is None or module_min_dt <= 0:
-            raise ValueError(f"Module '{name}' must define a positive min_dt")
-        self._modules[name] = ModuleEntry(name=name, module=module, min_dt=float(module_min_dt), priority=priority)
+        self._modules[name] = ModuleEntry(
+            name=name,
+            module=module,
+            min_dt=module_min_dt,
+            priority=priority,
+            args=dict(args) if args is not None else None,
+        )
+        if isinstance(module, PureModule):
+            self._pure_names.add(name)
+        else:
+            self._pure_names.discard(name)
+        self._visual_cache.pop(name, None)
+        self._structure_version += 1
+        if self._is_setup and is_new:
+            entry = self._modules[name]
+            module.setup({})
+            entry.last_time = self._current_time
+            outputs = module.get_outputs() or {}
+            if outputs:
+                self._signal_store[name] = outputs
+            next_time = module.next_due_time(self._current_time)
+            if next_time <= self._current_time:
+                raise ValueError(f"Module '{name}' next_due_time({self._current_time}) must be > current time")
+            self._schedule(name, next_time)
+            self._refresh_routes()
+        self.publish_snapshot()
+
+    def module_spec(self, name: str) -> Dict[str, Any]:
+        """Return ``{"module", "args", "min_dt", "priority"}`` for a registered module."""
+        entry = self._modules[name]
+        return {"module": entry.module, "args": entry.args, "min_dt": entry.min_dt, "priority": entry.priority}
+
+    def remove_biomodule(self, name: str) -> BioModule:
+        """Unregister a module and drop every connection to or from it.
+
+        Other modules keep their state. Returns the removed module.
+        """
+        entry = self._modules.pop(name, None)
+        if entry is None:
+            raise KeyError(f"Unknown module '{name}'")
+        if name in self._batch_of:
+            self._unfuse(name, entry.module)
+        self._connections_by_target.pop(name, None)
+        for target in list(self._connections_by_target):
+            conns = [c for c in self._connections_by_target[target] if c.source_module != name]
+            if conns:
+                self._connections_by_target[target] = conns
+            else:
+                del self._connections_by_target[target]
+        if any(item[3] == name for item in self._queue):
+            self._queue = [item for item in self._queue if item[3] != name]
+            heapq.heapify(self._queue)
+        self._signal_store.pop(name, None)
+        self._visual_cache.pop(name, None)
+        self._structure_version += 1
+        self._pure_names.discard(name)
+        self._inlined.pop(name, None)
+        if self._is_setup:
+            self._refresh_routes()
+        self.publish_snapshot()
+        return entry.module
 
     # --- Wiring -------------------------------------------------------
     def connect(self, source: str, target: str) -> None:
@@ -151,14 +383,85 @@ class BioWorld:
             target_signal=dst_sig,
         )
         self._connections_by_target.setdefault(dst_mod, []).append(conn)
+        self._structure_version += 1
+        if self._is_setup:
+            self._refresh_routes()
+
+    def connect_many(self, connections: Iterable[Tuple[str, str]]) -> int:
+        """Connect many ``(source, target)`` refs at once; returns how many were added.
+
+        All references are validated before any connection is made, so a bad
+        entry leaves the world unchanged.
+        """
+        modules = self._modules
+        new: List[Connection] = []
+        for source, target in connections:
+            src_mod, sep, src_sig = source.partition(".")
+            dst_mod, sep2, dst_sig = target.partition(".")
+            if not (sep and sep2):
+                raise ValueError("Source and target must be in format 'module.signal'")
+            if src_mod not in modules:
+                raise KeyError(f"Unknown source module '{src_mod}'")
+            if dst_mod not in modules:
+                raise KeyError(f"Unknown target module '{dst_mod}'")
+            new.append(Connection(src_mod, src_sig, dst_mod, dst_sig))
+        by_target = self._connections_by_target
+        for conn in new:
+            conns = by_target.get(conn.target_module)
+            if conns is None:
+                by_target[conn.target_module] = [conn]
+            else:
+                conns.append(conn)
+        if new:
+            self._structure_version += 1
+            if self._is_setup:
+                self._refresh_routes()
+        return len(new)
+
+    def disconnect(self, source: str, target: str) -> bool:
+        """Remove a connection made with :meth:`connect`. Returns False if it did not exist."""
+        src_mod, _, src_sig = source.partition(".")
+        dst_mod, _, dst_sig = target.partition(".")
+        conns = self._connections_by_target.get(dst_mod, [])
+        kept = [
+            c
+            for c in conns
+            if (c.source_module, c.source_signal, c.target_signal) != (src_mod, src_sig, dst_sig)
+        ]
+        if len(kept) == len(conns):
+            return False
+        if kept:
+            self._connections_by_target[dst_mod] = kept
+        else:
+            del self._connections_by_target[dst_mod]
+        self._structure_version += 1
+        if self._is_setup:
+            self._refresh_routes()
+        return True
+
+    def connections(self) -> List[Tuple[str, str]]:
+        """Return every connection as ``("module.signal", "module.signal")`` pairs."""
+        return [
+            (f"{c.source_module}.{c.source_signal}", f"{c.target_module}.{c.target_signal}")
+            for conns in self._connections_by_target.values()
+            for c in conns
+        ]
 
     # --- Setup and scheduling ----------------------------------------
     def setup(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Initialize all registered modules and seed the scheduler."""
         config = config or {}
+        self._setup_config = config
         self._signal_store = {}
         self._queue = []
         self._current_time = 0.0
+        self._visual_cache = {}
+        self._snapshot = None
+        self._has_run = False
+        self._replayed = False
+        self._batches = {}
+        self._batch_of = {}
+        self._inlined = {}
 
         # Setup modules (priority order, higher first)
         sorted_entries = sorted(self._modules.values(), key=lambda e: -e.priority)
@@ -169,8 +472,16 @@ class BioWorld:
             if outputs:
                 self._signal_store[entry.name] = outputs
 
+        if self.fuse_batches:
+            self._fuse()
+        for key, batch in self._batches.items():
+            self._schedule(key, self._current_time + batch.min_dt)
+        self._refresh_routes()
+
         # Seed scheduler
         for entry in self._modules.values():
+            if entry.name in self._batch_of or entry.name in self._inlined:
+                continue
             next_time = entry.module.next_due_time(self._current_time)
             if next_time <= self._current_time:
                 raise ValueError(
@@ -179,37 +490,229 @@ class BioWorld:
             self._schedule(entry.name, next_time)
 
         self._is_setup = True
+        self.publish_snapshot()
 
     def _schedule(self, name: str, t: float) -> None:
         self._seq += 1
-        heapq.heappush(self._queue, (t, -self._modules[name].priority, self._seq, name))
+        entry = self._modules.get(name) or self._batches[name]
+        heapq.heappush(self._queue, (t, -entry.priority, self._seq, name))
+
+    # --- Batched modules -----------------------------------------------
+    def _fuse(self) -> None:
+        """Group VectorizableModule instances into batches (two or more per batch)."""
+        candidates: Dict[Tuple[type, float, int], List[ModuleEntry]] = {}
+        for entry in self._modules.values():
+            module = entry.module
+            cls = type(module)
+            if (
+                isinstance(module, VectorizableModule)
+                and cls.next_due_time is BioModule.next_due_time
+                and getattr(module, "min_dt", None) == entry.min_dt
+            ):
+                candidates.setdefault((cls, entry.min_dt, entry.priority), []).append(entry)
+        if not any(len(entries) > 1 for entries in candidates.values()):
+            return
+        import numpy as np
+
+        for (cls, min_dt, priority), entries in candidates.items():
+            if len(entries) < 2:
+                continue
+            modules = [e.module for e in entries]
+            states = {
+                key: np.concatenate([m._batch_states[key] for m in modules])  # type: ignore[attr-defined]
+                for key in modules[0]._batch_states  # type: ignore[attr-defined]
+            }
+            key = f"<batch {cls.__qualname__} min_dt={min_dt:g} priority={priority}>"
+            batch = BatchGroup(
+                key=key,
+                cls=cls,
+                names=[e.name for e in entries],
+                min_dt=min_dt,
+                priority=priority,
+                states=states,
+                input_ports=sorted(modules[0].inputs()),
+            )
+            for i, module in enumerate(modules):
+                module._bind_batch(states, i)  # type: ignore[attr-defined]
+                self._batch_of[module._world_name] = key  # type: ignore[attr-defined]
+            self._batches[key] = batch
+
+    def _unfuse(self, name: str, module: BioModule) -> None:
+        """Take ``name`` out of its batch; the module keeps a private copy of its row."""
+        import numpy as np
+
+        key = self._batch_of.pop(name)
+        batch = self._batches[key]
+        i = batch.names.index(name)
+        module._bind_batch({k: v[i : i + 1].copy() for k, v in batch.states.items()}, 0)  # type: ignore[attr-defined]
+        del batch.names[i]
+        batch.states = {k: np.delete(v, i, axis=0) for k, v in batch.states.items()}
+        for j, member in enumerate(batch.names):
+            self._modules[member].module._bind_batch(batch.states, j)  # type: ignore[attr-defined]
+        if not batch.names:
+            del self._batches[key]
+            self._queue = [item for item in self._queue if item[3] != key]
+            heapq.heapify(self._queue)
+
+    def _advance_batch(self, batch: BatchGroup, now: float) -> None:
+        import numpy as np
+
+        n = len(batch.names)
+        default = batch.cls.batch_input_default
+        columns: Dict[str, List[Any]] = {port: [default] * n for port in batch.input_ports}
+        by_target = self._connections_by_target
+        store = self._signal_store
+        for i, name in enumerate(batch.names):
+            for conn in by_target.get(name, ()):
+                route = conn.route
+                source_outputs = store.get(conn.source_module if route is None else route[0])
+                source_signal = (
+                    source_outputs.get(conn.source_signal if route is None else route[1]) if source_outputs else None
+                )
+                if source_signal is None:
+                    continue
+                if source_signal.metadata.kind == "event":
+                    if source_signal.time <= conn.last_event_time:
+                        continue
+                    conn.last_event_time = source_signal.time
+                value = source_signal.value
+                if route is not None:
+                    value = route[2](value)
+                    if value is _NO_VALUE:
+                        continue
+                column = columns.get(conn.target_signal)
+                if column is None:
+                    column = columns[conn.target_signal] = [default] * n
+                column[i] = value
+        inputs = {port: np.asarray(column) for port, column in columns.items()}
+        outputs = batch.cls.advance_batch(batch.states, inputs, now) or {}
+        modules = self._modules
+        for i, name in enumerate(batch.names):
+            if outputs:
+                store[name] = _BatchSignals(name, outputs, i, now)  # type: ignore[assignment]
+            modules[name].last_time = now
+
+    def batch_groups(self) -> Dict[str, List[str]]:
+        """Fused batches of the current setup: scheduler key -> member module names."""
+        return {key: list(batch.names) for key, batch in self._batches.items()}
+
+    # --- Pure module chains ----------------------------------------------
+    def _refresh_routes(self) -> None:
+        """Recompute which PureModules are collapsed and the routes through them.
+
+        A pure module fed by exactly one connection is collapsed: consumers read
+        through it (and any pure modules before it) with one composed function.
+        Modules that stop qualifying after a structural change are scheduled
+        again; newly collapsed ones leave the queue and the signal store.
+        """
+        inlined: Dict[str, Connection] = {}
+        if self.collapse_pure:
+            for name in self._pure_names:
+                incoming = self._connections_by_target.get(name, [])
+                if len(incoming) == 1:
+                    inlined[name] = incoming[0]
+        had_routes = bool(self._inlined)
+        # A cycle of pure modules has no real source; leave its members scheduled.
+        for name in list(inlined):
+            seen = set()
+            current = name
+            while current in inlined and current not in seen:
+                seen.add(current)
+                current = inlined[current].source_module
+            if current in seen:
+                for member in seen:
+                    inlined.pop(member, None)
+
+        if self._is_setup:
+            for name in set(self._inlined) - set(inlined):
+                if name in self._modules:
+                    self._schedule(name, self._modules[name].module.next_due_time(self._current_time))
+            collapsed = set(inlined) - set(self._inlined)
+            if collapsed:
+                self._queue = [item for item in self._queue if item[3] not in collapsed]
+                heapq.heapify(self._queue)
+        for name in inlined:
+            self._signal_store.pop(name, None)
+        self._inlined = inlined
+
+        if inlined or had_routes:
+            for conns in self._connections_by_target.values():
+                for conn in conns:
+                    conn.route = self._route(conn) if conn.source_module in inlined else None
+
+    def _route(self, conn: Connection) -> Tuple[str, str, Callable[[Any], Any]]:
+        steps: List[Tuple[Callable[[Dict[str, Any]], Dict[str, Any]], str, str]] = []
+        module, signal = conn.source_module, conn.source_signal
+        while module in self._inlined:
+            incoming = self._inlined[module]
+            steps.append((self._modules[module].module.transform, incoming.target_signal, signal))  # type: ignore[attr-defined]
+            module, signal = incoming.source_module, incoming.source_signal
+        steps.reverse()
+        return module, signal, _compose(steps)
 
     def _collect_inputs(self, target_name: str, now: float) -> Dict[str, BioSignal]:
         inputs: Dict[str, BioSignal] = {}
         for conn in self._connections_by_target.get(target_name, []):
-            source_outputs = self._signal_store.get(conn.source_module, {})
-            source_signal = source_outputs.get(conn.source_signal)
+            route = conn.route
+            if route is None:
+                source_outputs = self._signal_store.get(conn.source_module, {})
+                source_signal = source_outputs.get(conn.source_signal)
+            else:
+                source_signal = self._signal_store.get(route[0], {}).get(route[1])
             if source_signal is None:  # pragma: no cover - defensive: signal should exist if routed
                 continue
             if source_signal.metadata.kind == "event":
                 if source_signal.time <= conn.last_event_time:
                     continue
                 conn.last_event_time = source_signal.time
+            value = source_signal.value
+            if route is not None:
+                value = route[2](value)
+                if value is _NO_VALUE:
+                    continue
             inputs[conn.target_signal] = BioSignal(
                 source=conn.source_module,
                 name=conn.target_signal,
-                value=source_signal.value,
+                value=value,
                 time=now,
                 metadata=source_signal.metadata,
             )
         return inputs
 
     # --- Run loop ------------------------------------------------------
-    def run(self, duration: float, *, tick_dt: Optional[float] = None) -> None:
+    def run(self, duration: float, *, tick_dt: Optional[float] = None, use_cache: bool = True) -> None:
+        """Advance the simulation by ``duration``.
+
+        With a ``result_store`` set, a run from a freshly set-up world whose
+        resolved spec was run before restores the stored final state (time,
+        outputs, visuals) instead of simulating; ``last_run_cached`` tells which
+        happened. A restored run emits only ``started`` and ``finished`` (with
+        ``cached: true``): no ticks, and modules do not advance or produce side
+        effects. So a run is only restored while every listener was registered
+        with ``replay_safe=True`` (results are still stored otherwise), and the
+        store key covers module source code (see :mod:`biosim.results`). A run
+        after a restored one first re-simulates up to the restored time, without
+        events or cache lookups, and then continues from there. Pass
+        ``use_cache=False`` to always simulate.
+        """
         if not self._is_setup:
             self.setup()
+        if self._replayed:
+            self._catch_up()
+        self.last_run_cached = False
         if duration <= 0:
             return
+        key = None
+        if use_cache and self.result_store is not None and not self._has_run and self._current_time == 0.0:
+            from .results import run_key
+
+            key = run_key(self, duration)
+            replay_safe = all(listener in self._replay_safe_listeners for listener in self._listeners)
+            cached = self.result_store.get(key) if key is not None and replay_safe else None
+            if cached is not None and self._replay(cached):
+                return
+        self._has_run = True
+        completed = False
 
         # Floating point time accumulation can produce values like 0.30000000000000004
         # which should still be treated as "at" the requested end_time.
@@ -222,6 +725,7 @@ class BioWorld:
 
         self._stop_requested = False
         self._run_event.set()
+        self._publish_snapshot(force=True)
         self._emit(WorldEvent.STARTED, {"t": self._current_time, **self._progress_payload(self._current_time)})
 
         try:
@@ -229,7 +733,10 @@ class BioWorld:
                 if self._stop_requested:
                     raise SimulationStop()
 
-                self._run_event.wait()
+                if not self._run_event.is_set():
+                    # Paused: make sure readers see the state we stopped at.
+                    self._publish_snapshot(force=True)
+                    self._run_event.wait()
 
                 if self._stop_requested:
                     raise SimulationStop()
@@ -242,20 +749,25 @@ class BioWorld:
                     break
 
                 self._current_time = due_time
-                entry = self._modules[name]
+                batch = self._batches.get(name)
+                if batch is not None:
+                    self._advance_batch(batch, self._current_time)
+                    next_time = self._current_time + batch.min_dt
+                else:
+                    entry = self._modules[name]
 
-                inputs = self._collect_inputs(name, self._current_time)
-                if inputs:
-                    entry.module.set_inputs(inputs)
+                    inputs = self._collect_inputs(name, self._current_time)
+                    if inputs:
+                        entry.module.set_inputs(inputs)
 
-                entry.module.advance_to(self._current_time)
-                entry.last_time = self._current_time
+                    entry.module.advance_to(self._current_time)
+                    entry.last_time = self._current_time
 
-                outputs = entry.module.get_outputs() or {}
-                if outputs:
-                    self._signal_store[name] = outputs
+                    outputs = entry.module.get_outputs() or {}
+                    if outputs:
+                        self._signal_store[name] = outputs
 
-                next_time = entry.module.next_due_time(self._current_time)
+                    next_time = entry.module.next_due_time(self._current_time)
                 if next_time <= self._current_time:
                     raise ValueError(
                         f"Module '{name}' next_due_time({self._current_time}) must be > current time"
@@ -263,11 +775,15 @@ class BioWorld:
                 self._schedule(name, next_time)
 
                 if tick_dt is None:
+                    self._publish_snapshot()
                     self._emit(WorldEvent.TICK, {"t": self._current_time, "module": name, **self._progress_payload(self._current_time)})
                 else:
+                    if next_tick_time <= self._current_time + eps:
+                        self._publish_snapshot()
                     while next_tick_time <= self._current_time + eps:
                         self._emit(WorldEvent.TICK, {"t": next_tick_time, **self._progress_payload(next_tick_time)})
                         next_tick_time += tick_dt
+            completed = True
 
         except SimulationStop:
             self._emit(WorldEvent.STOPPED, {"t": self._current_time, **self._progress_payload(self._current_time)})
@@ -275,9 +791,128 @@ class BioWorld:
             self._emit(WorldEvent.ERROR, {"t": self._current_time, "error": exc, **self._progress_payload(self._current_time)})
             raise
         finally:
+            self._publish_snapshot(force=True)
             self._emit(WorldEvent.FINISHED, {"t": self._current_time, **self._progress_payload(self._current_time)})
             self._active_run_start = None
             self._active_run_end = None
+        if completed and key is not None and self.result_store is not None:
+            try:
+                self.result_store.put(key, self._result_record(key))
+            except Exception:
+                logger.exception("Failed to store run result %s", key)
+
+    # --- Memoization ---------------------------------------------------
+    def resolved_spec(self) -> Optional[Dict[str, Any]]:
+        """Everything besides duration that determines a run from t=0, or None if unknown.
+
+        Includes the config last passed to :meth:`setup`. A module added
+        without ``args`` or with ``cacheable = False``, or whose class has no
+        source file, makes the world unresolvable. ``source`` is a hash of the
+        class's source files, so edited module code gives a different spec.
+        """
+        from .results import class_source_digest
+
+        modules = []
+        for name in sorted(self._modules):
+            entry = self._modules[name]
+            if entry.args is None or not getattr(entry.module, "cacheable", True):
+                return None
+            cls = type(entry.module)
+            source = class_source_digest(cls)
+            if source is None:
+                return None
+            modules.append(
+                {
+                    "name": name,
+                    "class": f"{cls.__module__}.{cls.__qualname__}",
+                    "source": source,
+                    "args": entry.args,
+                    "min_dt": entry.min_dt,
+                    "priority": entry.priority,
+                }
+            )
+        wiring = sorted(
+            (c.source_module, c.source_signal, c.target_module, c.target_signal)
+            for conns in self._connections_by_target.values()
+            for c in conns
+        )
+        return {
+            "time_unit": self.time_unit,
+            "config": self._setup_config,
+            "modules": modules,
+            "wiring": wiring,
+        }
+
+    def _result_record(self, key: str) -> Dict[str, Any]:
+        from .results import signal_to_record
+
+        return {
+            "key": key,
+            "end_time": self._current_time,
+            "last_time": {name: entry.last_time for name, entry in self._modules.items()},
+            "outputs": {
+                name: {sig: signal_to_record(signal) for sig, signal in outputs.items()}
+                for name, outputs in self._signal_store.items()
+            },
+            "visuals": {mv.name: mv.visuals for mv in self.module_visuals()},
+        }
+
+    def _catch_up(self) -> None:
+        """Bring module state up to a replayed run's end time by simulating it silently."""
+        end_time = self._current_time
+        listeners, self._listeners = self._listeners, []
+        try:
+            self.setup(self._setup_config)
+            self.run(end_time, use_cache=False)
+        finally:
+            self._listeners = listeners
+
+    def _replay(self, record: Mapping[str, Any]) -> bool:
+        """Restore the final state of a stored run. Returns False if the record is unusable."""
+        from .results import signal_from_record
+
+        try:
+            end_time = float(record["end_time"])
+            signal_store = {
+                name: {sig: signal_from_record(name, sig, rec) for sig, rec in outputs.items()}
+                for name, outputs in record["outputs"].items()
+                if name in self._modules
+            }
+            last_time = {name: float(t) for name, t in record["last_time"].items() if name in self._modules}
+            visuals = {name: list(v) for name, v in record["visuals"].items() if name in self._modules}
+            encoded = {name: encode_json(v) for name, v in visuals.items()}
+        except Exception:
+            logger.warning("Ignoring unusable cached run result", exc_info=True)
+            return False
+
+        start_time = self._current_time
+        self._active_run_start = start_time
+        self._active_run_end = end_time
+        self._emit(WorldEvent.STARTED, {"t": start_time, "cached": True, **self._progress_payload(start_time)})
+        self._current_time = end_time
+        self._signal_store = signal_store
+        self._queue = []
+        for name, entry in self._modules.items():
+            entry.last_time = last_time.get(name, entry.last_time)
+        self._visual_cache = {}
+        for name, specs in visuals.items():
+            entry = self._modules[name]
+            self._visual_revision += 1
+            self._visual_cache[name] = ModuleVisuals(
+                name=name,
+                module=entry.module.__class__.__name__,
+                visuals=specs,
+                encoded=encoded[name],
+                revision=self._visual_revision,
+                version=self._visual_version(entry),
+            )
+        self._replayed = True
+        self.last_run_cached = True
+        self._publish_snapshot(force=True)
+        self._emit(WorldEvent.FINISHED, {"t": end_time, "cached": True, **self._progress_payload(end_time)})
+        self._active_run_start = None
+        self._active_run_end = None
+        return True
 
     # --- Cooperative controls -----------------------------------------
     def request_stop(self) -> None:
@@ -297,6 +932,11 @@ class BioWorld:
     def current_time(self) -> float:
         return self._current_time
 
+    @property
+    def structure_version(self) -> int:
+        """Counter that changes whenever modules or connections are added or removed."""
+        return self._structure_version
+
     @property
     def module_names(self) -> List[str]:
         return list(self._modules.keys())
@@ -304,25 +944,150 @@ class BioWorld:
     def get_outputs(self, name: str) -> Dict[str, BioSignal]:
         return self._signal_store.get(name, {})
 
-    def collect_visuals(self) -> List[Dict[str, Any]]:
-        """Collect visual specs from all attached modules."""
-        out: List[Dict[str, Any]] = []
-        for entry in self._modules.values():
-            module = entry.module
-            try:
-                visuals = module.visualize()  # type: ignore[attr-defined]
-            except Exception:
-                logger.exception("BioModule.visualize raised for %s", module.__class__.__name__)
-                continue
-            if not visuals:
-                continue
-            normed = normalize_visuals(visuals)
-            if not normed:
-                continue
-            out.append(
-                {
-                    "module": module.__class__.__name__,
-                    "visuals": normed,
-                }
-            )
+    # --- Snapshots -----------------------------------------------------
+    def _build_snapshot(self) -> WorldSnapshot:
+        self._snapshot_seq += 1
+        visuals = tuple(self.module_visuals())
+        return WorldSnapshot(
+            seq=self._snapshot_seq,
+            time=self._current_time,
+            progress=MappingProxyType(self._progress_payload(self._current_time)),
+            signals=MappingProxyType(
+                {name: MappingProxyType(dict(outputs)) for name, outputs in self._signal_store.items()}
+            ),
+            visuals=visuals,
+            visuals_json=_visuals_json(visuals),
+        )
+
+    def _publish_snapshot(self, *, force: bool = False) -> None:
+        """Publish a snapshot from the sim thread (rate-limited by ``snapshot_interval``).
+
+        Publishing is a single reference assignment, so readers always see
+        either the previous or the new snapshot, never a partial one.
+        """
+        if self.snapshot_interval is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._snapshot_published_at < self.snapshot_interval:
+            return
+        self._snapshot_published_at = now
+        self._snapshot = self._build_snapshot()
+
+    def publish_snapshot(self) -> None:
+        """Replace the published snapshot after a change made outside a run.
+
+        Call on the thread that owns the world; setup, module changes and
+        :meth:`invalidate_visuals` do so already. During a run the sim thread
+        publishes at the next tick instead.
+        """
+        if self.snapshot_interval is None or not self._is_setup:
+            self._snapshot = None
+        elif self._active_run_start is None:
+            self._publish_snapshot(force=True)
+
+    def snapshot(self) -> WorldSnapshot:
+        """Return the latest consistent snapshot of the world in O(1).
+
+        With ``snapshot_interval`` set this is the snapshot last published by
+        the thread that owns the world (at setup, run boundaries and ticks, and
+        after :meth:`invalidate_visuals`); it never touches live modules, so it
+        is safe to call from other threads. Before the first publication it is
+        an empty snapshot. With publishing disabled it is built from the
+        current state on the calling thread.
+        """
+        snap = self._snapshot
+        if snap is not None:
+            return snap
+        if self.snapshot_interval is None:
+            return self._build_snapshot()
+        return WorldSnapshot(
+            seq=0,
+            time=self._current_time,
+            progress=MappingProxyType({}),
+            signals=MappingProxyType({}),
+            visuals=(),
+            visuals_json=b"[]",
+        )
+
+    def _visual_version(self, entry: ModuleEntry) -> Any:
+        """Return the cache key for a module's visuals.
+
+        Modules may expose ``visual_version`` to control invalidation explicitly;
+        otherwise visuals are assumed to change only when the module advances,
+        gets inputs through :meth:`set_inputs` or is set up. Code that changes a
+        module some other way (setters, ``reset()``) calls
+        :meth:`invalidate_visuals`.
+        """
+        version = getattr(entry.module, "visual_version", None)
+        if version is None:
+            return ("last_time", entry.last_time)
+        return ("visual_version", version)
+
+    def _cached_visuals(self, name: str, entry: ModuleEntry) -> Optional[ModuleVisuals]:
+        version = self._visual_version(entry)
+        cached = self._visual_cache.get(name)
+        if cached is not None and cached.version == version:
+            return cached
+        module = entry.module
+        try:
+            visuals = module.visualize()  # type: ignore[attr-defined]
+        except Exception:
+            logger.exception("BioModule.visualize raised for %s", module.__class__.__name__)
+            return None
+        normed, encoded = normalize_and_encode_visuals(visuals) if visuals else ([], b"[]")
+        if cached is not None and cached.encoded == encoded:
+            revision = cached.revision
+        else:
+            self._visual_revision += 1
+            revision = self._visual_revision
+        cached = ModuleVisuals(
+            name=name,
+            module=module.__class__.__name__,
+            visuals=normed,
+            encoded=encoded,
+            revision=revision,
+            version=version,
+        )
+        self._visual_cache[name] = cached
+        return cached
+
+    def module_visuals(self) -> List[ModuleVisuals]:
+        """Return cached visuals for every module that currently has any."""
+        out: List[ModuleVisuals] = []
+        for name, entry in list(self._modules.items()):
+            cached = self._cached_visuals(name, entry)
+            if cached is not None and cached.visuals:
+                out.append(cached)
         return out
+
+    def collect_visuals(self) -> List[Dict[str, Any]]:
+        """Collect visual specs from all attached modules.
+
+        Normalized specs are cached per module and reused until the module's
+        visual version changes, so repeated calls between steps are cheap.
+        Callers get copies and may modify them.
+        """
+        return [{"module": mv.module, "visuals": copy.deepcopy(mv.visuals)} for mv in self.module_visuals()]
+
+    def invalidate_visuals(self, name: Optional[str] = None) -> None:
+        """Drop cached visuals of module ``name`` (all modules if None) so they are rebuilt."""
+        names = list(self._visual_cache) if name is None else [name]
+        for key in names:
+            cached = self._visual_cache.get(key)
+            if cached is not None:
+                # Keep the entry so an unchanged re-render keeps its revision.
+                cached.version = _STALE_VISUALS
+        self.publish_snapshot()
+
+    def set_inputs(self, name: str, signals: Mapping[str, BioSignal]) -> None:
+        """Deliver ``signals`` to module ``name`` outside the scheduler (e.g. from a UI control)."""
+        self._modules[name].module.set_inputs(dict(signals))
+        self.invalidate_visuals(name)
+
+    def collect_visuals_json(self) -> bytes:
+        """Return ``collect_visuals()`` encoded as JSON bytes.
+
+        Reuses the per-module encoded payloads from the visual cache, so specs
+        are serialized once per version regardless of how many callers ask.
+        """
+        return _visuals_json(self.module_visuals())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -20,3 +21,15 @@ if _examples not in sys.path:
 def biosim():
     import biosim as _bsim  # type: ignore
     return _bsim
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _registry_cache(tmp_path_factory):
+    """Keep the editor registry's on-disk cache out of the user's home directory."""
+    old = os.environ.get("BIOSIM_REGISTRY_CACHE")
+    os.environ["BIOSIM_REGISTRY_CACHE"] = str(tmp_path_factory.mktemp("registry") / "registry.json")
+    yield
+    if old is None:
+        os.environ.pop("BIOSIM_REGISTRY_CACHE", None)
+    else:
+        os.environ["BIOSIM_REGISTRY_CACHE"] = old
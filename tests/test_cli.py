@@ -8,6 +8,11 @@ import pytest
 from biosim.__main__ import load_config, create_world, run_headless, main
 
 
+@pytest.fixture(autouse=True)
+def _results_cache_dir(tmp_path, monkeypatch):
+    """Keep the CLI's default results cache out of the user's home directory."""
+    monkeypatch.setenv("BIOSIM_CACHE_DIR", str(tmp_path / "results-cache"))
+
 class TestLoadConfig:
     def test_yaml(self, tmp_path):
         p = tmp_path / "cfg.yaml"
@@ -25,7 +30,7 @@ class TestLoadConfig:
         p = tmp_path / "cfg.yaml"
         p.write_text("")
         result = load_config(p)
-        assert result == {}
+        assert result == {"modules": {}, "wiring": []}
 
     def test_toml(self, tmp_path):
         p = tmp_path / "cfg.toml"
@@ -94,6 +99,29 @@ class TestLoadConfig:
             result = load_config(p)
         assert result["meta"]["title"] == "test"
 
+    def test_unusable_cache_falls_back_to_fresh_parse(self, tmp_path):
+        import biosim.compiled as compiled
+
+        p = tmp_path / "cfg.yaml"
+        p.write_text("meta:\n  title: fresh\n")
+        real = compiled.load_compiled
+
+        def stale(path, *, use_cache=True):
+            if use_cache:
+                raise ValueError("stale compiled config")
+            return real(path, use_cache=use_cache)
+
+        with patch.object(compiled, "load_compiled", side_effect=stale):
+            assert load_config(p)["meta"]["title"] == "fresh"
+
+    def test_invalid_config_exits(self, tmp_path, capsys):
+        p = tmp_path / "cfg.yaml"
+        p.write_text("- not a mapping\n")
+        with pytest.raises(SystemExit) as exc_info:
+            load_config(p)
+        assert exc_info.value.code == 1
+        assert "mapping" in capsys.readouterr().err
+
 
 class TestCreateWorld:
     def test_creates_bioworld(self):
@@ -185,6 +213,41 @@ class TestRunSimui:
         captured = capsys.readouterr()
         assert "Starting SimUI" in captured.out
 
+    def test_simui_sessions(self, biosim, tmp_path, capsys):
+        """run_simui(sessions=True) should launch a SessionHost building worlds from the config."""
+        from biosim.__main__ import run_simui
+        from biosim.simui.sessions import SessionHost
+        from examples.wiring_builder_demo import Eye
+
+        cfg = tmp_path / "wiring.yaml"
+        cfg.write_text(f"""
+modules:
+  eye:
+    class: "{Eye.__module__}.{Eye.__name__}"
+    min_dt: 0.1
+""")
+        with patch.object(SessionHost, "launch", autospec=True) as mock_launch, patch(
+            "biosim.wiring._read_yaml_spec", side_effect=AssertionError("sessions re-parse the config")
+        ):
+            run_simui(
+                biosim.BioWorld(),
+                load_config(cfg),
+                config_path=cfg,
+                duration=5.0,
+                tick_dt=0.1,
+                port=9999,
+                host="127.0.0.1",
+                open_browser=False,
+                sessions=True,
+            )
+            mock_launch.assert_called_once()
+            session_host = mock_launch.call_args.args[0]
+            assert mock_launch.call_args.kwargs == {"host": "127.0.0.1", "port": 9999, "open_browser": False}
+            session = session_host.create_session()
+        assert session.interface._world.module_names == ["eye"]
+        session_host.close()
+        assert "Starting SimUI sessions" in capsys.readouterr().out
+
 
 class TestMain:
     def test_missing_config(self, tmp_path):
@@ -210,6 +273,78 @@ wiring:
         with patch("sys.argv", ["biosim", str(cfg), "--duration", "0.2", "--tick", "0.1"]):
             main()
 
+    def test_headless_results_cache(self, tmp_path, capsys):
+        """A repeated identical run is restored from the results cache unless --no-cache."""
+        from examples.wiring_builder_demo import Eye
+
+        cfg = tmp_path / "wiring.yaml"
+        cfg.write_text(f"""
+modules:
+  eye:
+    class: "{Eye.__module__}.{Eye.__name__}"
+    min_dt: 0.1
+""")
+        argv = ["biosim", str(cfg), "--duration", "0.3"]
+        with patch("sys.argv", argv):
+            main()
+        assert "restored from results cache" not in capsys.readouterr().out
+        with patch("sys.argv", argv):
+            main()
+        assert "restored from results cache" in capsys.readouterr().out
+        with patch("sys.argv", argv + ["--no-cache"]):
+            main()
+        assert "restored from results cache" not in capsys.readouterr().out
+        assert list((tmp_path / "results-cache").glob("*.json"))
+
+    def test_config_parsed_once_per_run(self, tmp_path):
+        """The CLI parses the config once and reuses the compiled spec on later runs."""
+        from examples.wiring_builder_demo import Eye
+
+        cfg = tmp_path / "wiring.yaml"
+        cfg.write_text(f"""
+modules:
+  eye:
+    class: "{Eye.__module__}.{Eye.__name__}"
+    min_dt: 0.1
+""")
+        argv = ["biosim", str(cfg), "--duration", "0.1", "--no-cache"]
+        import biosim.compiled as compiled
+
+        with patch("sys.argv", argv), patch.object(compiled, "parse_config", wraps=compiled.parse_config) as parse:
+            with patch("biosim.wiring._read_yaml_spec", side_effect=AssertionError("second parse")):
+                main()
+            assert parse.call_count == 1
+            main()
+            assert parse.call_count == 1
+        assert (tmp_path / "__biosim_cache__" / "wiring.yaml.json").is_file()
+
+    def test_unsupported_config_format(self, tmp_path):
+        cfg = tmp_path / "wiring.json"
+        cfg.write_text("{}")
+        with patch("sys.argv", ["biosim", str(cfg)]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        assert exc_info.value.code == 1
+
+    def test_compile_command(self, tmp_path, capsys):
+        from examples.wiring_builder_demo import Eye
+
+        good = tmp_path / "good.yaml"
+        good.write_text(f"modules:\n  eye: {Eye.__module__}.{Eye.__name__}\n")
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("modules:\n  x: no_such_pkg.Thing\n")
+        with patch("sys.argv", ["biosim", "compile", str(good)]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        assert exc_info.value.code == 0
+        assert "Compiled" in capsys.readouterr().out
+        assert (tmp_path / "__biosim_cache__" / "good.yaml.json").is_file()
+        with patch("sys.argv", ["biosim", "compile", str(good), str(bad)]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        assert exc_info.value.code == 1
+        assert "bad.yaml" in capsys.readouterr().err
+
     def test_tick_zero(self, tmp_path):
         """--tick 0 should result in tick_dt=None."""
         from examples.wiring_builder_demo import Eye
@@ -0,0 +1,140 @@
+"""Tests for biosim.compiled (compiled-config cache)."""
+import json
+from unittest.mock import patch
+
+import pytest
+
+from biosim.compiled import compile_config, compile_spec, compiled_path, load_compiled, parse_config
+from biosim.world import BioWorld
+from biosim.wiring import build_from_spec
+
+EYE = "examples.wiring_builder_demo.Eye"
+LGN = "examples.wiring_builder_demo.LGN"
+
+CONFIG = f"""
+meta:
+  title: Demo
+modules:
+  eye:
+    class: {EYE}
+    min_dt: 0.1
+  lgn: {LGN}
+wiring:
+  - from: eye.visual_stream
+    to: [lgn.retina]
+"""
+
+
+@pytest.fixture
+def config(tmp_path):
+    p = tmp_path / "wiring.yaml"
+    p.write_text(CONFIG)
+    return p
+
+
+def test_compile_spec_normalizes():
+    spec = compile_spec(parse_config("x.yaml", CONFIG.encode()))
+    assert spec["meta"] == {"title": "Demo"}
+    assert spec["modules"] == {
+        "eye": {"class": EYE, "args": {}, "priority": 0, "min_dt": 0.1},
+        "lgn": {"class": LGN, "args": {}, "priority": 0},
+    }
+    assert spec["wiring"] == [{"from": "eye.visual_stream", "to": ["lgn.retina"]}]
+
+
+@pytest.mark.parametrize(
+    "spec, message",
+    [
+        ({"modules": {"a": 42}}, "Invalid module entry"),
+        ({"modules": {"a": {"class": "NoDots"}}}, "Invalid class"),
+        ({"modules": {"a": {"class": EYE, "args": [1]}}}, "Invalid args"),
+        ({"modules": {"a": EYE}, "wiring": [{"from": "a.x", "to": ["b.y"]}]}, "unknown module 'b'"),
+    ],
+)
+def test_compile_spec_rejects_invalid(spec, message):
+    with pytest.raises(ValueError, match=message):
+        compile_spec(spec)
+
+
+def test_compile_spec_resolve_checks_classes():
+    compile_spec({"modules": {"eye": EYE}}, resolve=True)
+    with pytest.raises(TypeError, match="not a BioModule"):
+        compile_spec({"modules": {"bad": "pathlib.Path"}}, resolve=True)
+    with pytest.raises(ImportError):
+        compile_spec({"modules": {"bad": "no_such_pkg.Thing"}}, resolve=True)
+
+
+def test_load_compiled_parses_once_then_uses_cache(config):
+    spec = load_compiled(config)
+    cache = compiled_path(config)
+    assert cache.is_file()
+    assert json.loads(cache.read_text())["spec"] == spec
+
+    with patch("biosim.compiled.parse_config", side_effect=AssertionError("parsed again")):
+        assert load_compiled(config) == spec
+
+    world = BioWorld()
+    build_from_spec(world, spec)
+    assert world.module_names == ["eye", "lgn"]
+    assert world.connections() == [("eye.visual_stream", "lgn.retina")]
+
+
+def test_edited_config_is_recompiled(config):
+    load_compiled(config)
+    config.write_text(CONFIG.replace("min_dt: 0.1", "min_dt: 0.2"))
+    assert load_compiled(config)["modules"]["eye"]["min_dt"] == 0.2
+
+
+def test_stale_or_corrupt_cache_is_ignored(config):
+    cache = compiled_path(config)
+    cache.parent.mkdir()
+    cache.write_text("{not json")
+    assert load_compiled(config)["modules"]["eye"]["min_dt"] == 0.1
+    data = json.loads(cache.read_text())
+    data["biosim"] = "0.0.0-other"
+    data["spec"] = {"modules": {}}
+    cache.write_text(json.dumps(data))
+    assert "eye" in load_compiled(config)["modules"]
+
+
+def test_unwritable_cache_still_loads(config):
+    with patch("biosim.compiled.tempfile.mkstemp", side_effect=PermissionError("read-only")):
+        assert "eye" in load_compiled(config)["modules"]
+    assert not compiled_path(config).exists()
+    with patch("biosim.compiled.tempfile.mkstemp", side_effect=PermissionError("read-only")):
+        with pytest.raises(OSError):
+            compile_config(config)
+
+
+def test_use_cache_false_does_not_write(config):
+    load_compiled(config, use_cache=False)
+    assert not compiled_path(config).exists()
+
+
+def test_toml_and_unsupported(tmp_path):
+    p = tmp_path / "w.toml"
+    p.write_text(f'[modules.eye]\nclass = "{EYE}"\n')
+    assert load_compiled(p)["modules"]["eye"]["class"] == EYE
+    with pytest.raises(ValueError, match="Unsupported"):
+        parse_config(tmp_path / "w.json", b"{}")
+    with pytest.raises(ValueError, match="mapping"):
+        parse_config(tmp_path / "w.yaml", b"- 1\n")
+    assert parse_config(tmp_path / "w.yaml", b"") == {}
+
+
+def test_compile_config_writes_cache(config):
+    target = compile_config(config)
+    assert target == compiled_path(config)
+    with patch("biosim.compiled.parse_config", side_effect=AssertionError("parsed again")):
+        assert load_compiled(config)["modules"]["lgn"]["class"] == LGN
+
+
+def test_compile_spec_keeps_and_checks_patterns():
+    spec = {
+        "modules": {"eye_l": EYE, "lgn_l": LGN},
+        "wiring": [{"from": "eye_*.visual_stream", "to": ["lgn_{i}.retina"]}],
+    }
+    assert compile_spec(spec)["wiring"] == [{"from": "eye_*.visual_stream", "to": ["lgn_{i}.retina"]}]
+    spec["wiring"] = [{"from": "cam_*.visual_stream", "to": ["lgn_{i}.retina"]}]
+    with pytest.raises(ValueError, match="matches no modules"):
+        compile_spec(spec)
@@ -0,0 +1,59 @@
+"""Startup cost: `import biosim` and the CLI must not load heavy dependencies eagerly."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = str(Path(__file__).resolve().parents[1] / "src")
+HEAVY = ("numpy", "yaml", "fastapi", "uvicorn")
+
+
+def _loaded_after(code: str) -> set:
+    env = dict(os.environ, PYTHONPATH=SRC)
+    probe = f"{code}\nimport sys\nprint(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True)
+    last_line = out.stdout.splitlines()[-1]  # after any CLI output
+    return set(filter(None, last_line.split(",")))
+
+
+def test_import_biosim_is_lightweight():
+    assert _loaded_after("import biosim") == set()
+
+
+def test_core_api_does_not_need_numpy_yaml_or_fastapi():
+    code = "import biosim\nw = biosim.BioWorld()\nbiosim.WiringBuilder(w)\nimport biosim.simui.registry"
+    assert _loaded_after(code) == set()
+
+
+def test_cli_help_is_lightweight():
+    code = (
+        "import sys, runpy\nsys.argv = ['biosim', '--help']\n"
+        "try:\n    runpy.run_module('biosim', run_name='__main__')\nexcept SystemExit:\n    pass"
+    )
+    assert _loaded_after(code) == set()
+
+
+def test_lazy_attributes_resolve(biosim):
+    from biosim.world import BioWorld
+
+    assert biosim.BioWorld is BioWorld
+    assert "BioWorld" in dir(biosim) and "simui" in dir(biosim)
+    assert biosim.simui.Interface.__name__ == "Interface"
+    with pytest.raises(AttributeError):
+        biosim.not_a_thing
+    with pytest.raises(AttributeError):
+        biosim.simui.not_a_thing
+
+
+def test_signal_arrays_without_eager_numpy():
+    import numpy as np
+
+    from biosim.signals import BioSignal
+
+    arr = BioSignal(source="m", name="x", value=np.arange(3.0), time=0.0)
+    assert arr.is_array and not arr.is_scalar
+    assert arr.to_dict()["value"] == [0.0, 1.0, 2.0]
+    assert BioSignal(source="m", name="x", value=1.5, time=0.0).is_scalar
+    assert BioSignal(source="m", name="x", value=[1, 2], time=0.0).as_array().tolist() == [1, 2]
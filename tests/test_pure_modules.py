@@ -0,0 +1,170 @@
+"""PureModule chains collapsed into composed routes by BioWorld."""
+import pytest
+
+from biosim.modules import BioModule, PureModule
+from biosim.signals import BioSignal
+from biosim.world import BioWorld
+
+
+class Clock(BioModule):
+    def __init__(self):
+        self.min_dt = 0.1
+        self.t = 0.0
+
+    def advance_to(self, t: float) -> None:
+        self.t = t
+
+    def get_outputs(self):
+        return {"t": BioSignal(source="clock", name="t", value=self.t, time=self.t)}
+
+
+class Scale(PureModule):
+    def __init__(self, factor: float):
+        self.min_dt = 0.1
+        self.factor = factor
+        self.calls = 0
+
+    def transform(self, inputs):
+        self.calls += 1
+        return {"out": inputs["in"] * self.factor}
+
+
+class Threshold(PureModule):
+    def __init__(self, level: float):
+        self.min_dt = 0.1
+        self.level = level
+
+    def transform(self, inputs):
+        value = inputs.get("in")
+        return {"out": value > self.level} if value is not None else {}
+
+
+class Add(PureModule):
+    def __init__(self):
+        self.min_dt = 0.1
+
+    def transform(self, inputs):
+        return {"out": sum(inputs.values())}
+
+
+class Sink(BioModule):
+    def __init__(self, min_dt: float = 0.1):
+        self.min_dt = min_dt
+        self.seen = []
+
+    def set_inputs(self, signals):
+        self.seen.append(signals["in"].value)
+
+    def advance_to(self, t: float) -> None:
+        return
+
+    def get_outputs(self):
+        return {}
+
+
+def _chain(collapse=True, sink_dt=0.1):
+    world = BioWorld()
+    world.collapse_pure = collapse
+    world.add_biomodule("clock", Clock(), priority=3)
+    world.add_biomodule("scale", Scale(10.0), priority=2)
+    world.add_biomodule("thr", Threshold(2.5), priority=1)
+    world.add_biomodule("sink", Sink(sink_dt))
+    world.connect("clock.t", "scale.in")
+    world.connect("scale.out", "thr.in")
+    world.connect("thr.out", "sink.in")
+    return world
+
+
+def _scheduled(world):
+    return {item[3] for item in world._queue}
+
+
+def test_chain_is_collapsed_and_evaluated_at_consumer_time():
+    world = _chain(sink_dt=0.2)
+    world.run(1.0)
+    sink = world._modules["sink"].module
+    assert sink.seen == [False, True, True, True, True]  # t = 0.2, 0.4, ... scaled by 10 vs 2.5
+    assert _scheduled(world) == {"clock", "sink"}
+    assert world.get_outputs("scale") == {} and world.get_outputs("thr") == {}
+    assert world._modules["scale"].module.calls == 5  # only when the consumer steps
+
+
+def test_collapsed_matches_scheduled_chain():
+    collapsed, scheduled = _chain(), _chain(collapse=False)
+    collapsed.run(1.0)
+    scheduled.run(1.0)
+    assert collapsed._modules["sink"].module.seen == scheduled._modules["sink"].module.seen
+    assert _scheduled(scheduled) == {"clock", "scale", "thr", "sink"}
+
+
+def test_multi_input_pure_module_stays_scheduled_and_structure_changes_update_routes():
+    world = _chain()
+    world.add_biomodule("sum", Add(), priority=2)
+    world.connect("clock.t", "sum.in")
+    world.run(0.1)
+    assert "sum" not in _scheduled(world)
+
+    world.connect("clock.t", "sum.other")
+    assert "sum" in _scheduled(world)
+    world.run(0.1)
+    assert world.get_outputs("sum")["out"].value == pytest.approx(0.4)
+
+    world.disconnect("clock.t", "sum.other")
+    assert "sum" not in _scheduled(world) and world.get_outputs("sum") == {}
+
+    world.remove_biomodule("clock")  # scale loses its only input: scheduled again, nothing to compute
+    assert "scale" in _scheduled(world)
+    world.run(0.1)
+
+
+def test_missing_output_port_and_pure_cycles():
+    world = BioWorld()
+    world.add_biomodule("thr", Threshold(1.0))
+    world.add_biomodule("scale", Scale(2.0))
+    world.add_biomodule("sink", Sink())
+    world.connect("scale.out", "thr.in")
+    world.connect("thr.out", "scale.in")  # a cycle has no real source
+    world.connect("thr.out", "sink.in")
+    world.setup()
+    assert world._inlined == {}
+
+    world = BioWorld()
+    world.add_biomodule("clock", Clock())
+    world.add_biomodule("scale", Scale(2.0))
+    world.add_biomodule("sink", Sink())
+    world.connect("clock.t", "scale.in")
+    world.connect("scale.missing", "sink.in")
+    world.run(0.3)
+    assert world._modules["sink"].module.seen == []
+
+
+def test_batch_consumers_read_through_routes():
+    from biosim.modules import VectorizableModule
+
+    class Hold(VectorizableModule):
+        def __init__(self):
+            self.min_dt = 0.1
+
+        def initial_state(self):
+            return {"x": 0.0}
+
+        @classmethod
+        def advance_batch(cls, states, inputs, t):
+            states["x"][:] = inputs["in"]
+            return {"x": states["x"].copy()}
+
+    world = _chain()
+    for i in range(3):
+        world.add_biomodule(f"hold_{i}", Hold())
+        world.connect("scale.out", f"hold_{i}.in")
+    world.run(0.2)
+    assert len(world.batch_groups()) == 1
+    assert [world.get_outputs(f"hold_{i}")["x"].value for i in range(3)] == pytest.approx([2.0] * 3)
+
+
+def test_transform_is_abstract():
+    class NoTransform(PureModule):
+        pass
+
+    with pytest.raises(TypeError, match="transform"):
+        NoTransform()
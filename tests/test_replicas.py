@@ -0,0 +1,128 @@
+"""Replica groups (``replicas: N``) and rule-based wiring between them."""
+import pytest
+
+from biosim.compiled import compile_spec
+from biosim.modules import BioModule
+from biosim.wiring import _expanded_modules, _wiring_entries, build_from_spec, update_from_spec
+from biosim.world import BioWorld
+
+
+class Column(BioModule):
+    def __init__(self, seed: int = 0, label: str = "", gains=None):
+        self.min_dt = 0.1
+        self.seed = seed
+        self.label = label
+        self.gains = gains
+
+    def inputs(self):
+        return {"in"}
+
+    def outputs(self):
+        return {"out"}
+
+    def advance_to(self, t: float) -> None:
+        return
+
+    def get_outputs(self):
+        return {}
+
+
+COLUMN = f"{Column.__module__}.Column"
+
+
+def _spec(wiring, n=4, m=4):
+    return {
+        "modules": {
+            "col": {"class": COLUMN, "replicas": n, "args": {"seed": "{i}", "label": "col-{i:02d}", "gains": ["{i}"]}},
+            "inh": {"class": COLUMN, "replicas": m},
+            "hub": COLUMN,
+        },
+        "wiring": wiring,
+    }
+
+
+def test_replicas_expand_with_index_templated_args():
+    world = BioWorld()
+    build_from_spec(world, _spec([]))
+    assert world.module_names == [f"col_{i}" for i in range(4)] + [f"inh_{i}" for i in range(4)] + ["hub"]
+    col = world.module_spec("col_2")
+    assert col["args"] == {"seed": 2, "label": "col-02", "gains": [2]}
+    assert (col["module"].seed, col["module"].label) == (2, "col-02")
+    assert world.module_spec("inh_0")["args"] == {}
+
+
+def test_one_to_one_and_all_to_all():
+    world = BioWorld()
+    build_from_spec(world, _spec([{"from": "col.out", "to": ["inh.in"], "rule": "one_to_one"}]))
+    assert world.connections() == [(f"col_{i}.out", f"inh_{i}.in") for i in range(4)]
+
+    world = BioWorld()
+    build_from_spec(world, _spec([{"from": "col.out", "to": ["hub.in"]}, {"from": "hub.out", "to": ["inh.in"]}]))
+    assert sorted(world.connections()) == sorted(
+        [(f"col_{i}.out", "hub.in") for i in range(4)] + [("hub.out", f"inh_{i}.in") for i in range(4)]
+    )
+
+
+def test_random_k_is_seeded_and_fixed_in_degree():
+    entry = {"from": "col.out", "to": ["inh.in"], "rule": "random_k", "k": 2, "seed": 7}
+    pairs = [(s, d) for s, dsts in _wiring_entries(_spec([entry], n=10, m=20)) for d in dsts]
+    assert pairs == [(s, d) for s, dsts in _wiring_entries(_spec([entry], n=10, m=20)) for d in dsts]
+    in_degree = {}
+    for _, dst in pairs:
+        in_degree[dst] = in_degree.get(dst, 0) + 1
+    assert set(in_degree.values()) == {2} and len(in_degree) == 20
+    other = [(s, d) for s, dsts in _wiring_entries(_spec([dict(entry, seed=8)], n=10, m=20)) for d in dsts]
+    assert other != pairs
+
+
+@pytest.mark.parametrize(
+    "wiring, message",
+    [
+        ([{"from": "col.out", "to": ["inh.in"], "rule": "one_to_one"}], "equal size"),
+        ([{"from": "col.out", "to": ["inh.in"], "rule": "random_k", "k": 9}], "k <= 3"),
+        ([{"from": "col.out", "to": ["inh.in"], "rule": "ring"}], "Unknown wiring rule"),
+        ([{"from": "col.out", "to": ["mon_*.in"]}], "not patterns"),
+    ],
+)
+def test_invalid_rules(wiring, message):
+    with pytest.raises(ValueError, match=message):
+        build_from_spec(BioWorld(), _spec(wiring, n=3, m=5))
+
+
+def test_invalid_replicas_and_name_clashes():
+    with pytest.raises(ValueError, match="positive integer"):
+        _expanded_modules({"modules": {"col": {"class": COLUMN, "replicas": 0}}})
+    with pytest.raises(ValueError, match="clashes"):
+        _expanded_modules({"modules": {"col": {"class": COLUMN, "replicas": 2}, "col_1": COLUMN}})
+
+
+def test_compiled_spec_stays_compact():
+    entry = {"from": "col.out", "to": ["inh.in"], "rule": "random_k", "k": 2, "seed": 3}
+    compiled = compile_spec(_spec([entry]))
+    assert list(compiled["modules"]) == ["col", "inh", "hub"]
+    assert compiled["modules"]["col"]["replicas"] == 4
+    assert compiled["wiring"] == [entry]
+    world, direct = BioWorld(), BioWorld()
+    build_from_spec(world, compiled)
+    build_from_spec(direct, _spec([entry]))
+    assert world.connections() == direct.connections()
+    with pytest.raises(ValueError, match="equal size"):
+        compile_spec(_spec([{"from": "col.out", "to": ["inh.in"], "rule": "one_to_one"}], n=2))
+
+
+def test_update_from_spec_resizes_group():
+    world = BioWorld()
+    build_from_spec(world, _spec([{"from": "col.out", "to": ["inh.in"], "rule": "one_to_one"}]))
+    changes = update_from_spec(world, _spec([{"from": "col.out", "to": ["inh.in"], "rule": "one_to_one"}], n=5, m=5))
+    assert changes["added"] == ["col_4", "inh_4"] and changes["replaced"] == []
+    assert changes["connected"] == ["col_4.out -> inh_4.in"]
+
+
+def test_two_thousand_replicas_build_quickly():
+    import time
+
+    start = time.perf_counter()
+    world = BioWorld()
+    build_from_spec(world, _spec([{"from": "col.out", "to": ["inh.in"], "rule": "one_to_one"}], n=2000, m=2000))
+    assert time.perf_counter() - start < 3.0
+    assert len(world.connections()) == 2000
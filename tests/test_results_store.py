@@ -0,0 +1,193 @@
+"""Tests for biosim.results (run memoization)."""
+import os
+import time
+
+import numpy as np
+import pytest
+
+from biosim.results import ResultStore, default_cache_dir, run_key, signal_from_record, signal_to_record
+
+
+def _make_world(biosim, store=None, *, gain=1.0, args=True):
+    class Counter(biosim.BioModule):
+        calls = 0
+
+        def __init__(self, gain=1.0):
+            self.min_dt = 0.1
+            self.gain = gain
+            self.total = 0.0
+
+        def outputs(self):
+            return {"total"}
+
+        def advance_to(self, t):
+            Counter.calls += 1
+            self.total += self.gain
+
+        def get_outputs(self):
+            return {"total": biosim.BioSignal(source="c", name="total", value=np.array([self.total]), time=0.0)}
+
+        def visualize(self):
+            return {"render": "bar", "data": {"items": [{"label": "total", "value": self.total}]}}
+
+    world = biosim.BioWorld()
+    world.add_biomodule("c", Counter(gain=gain), args={"gain": gain} if args else None)
+    world.result_store = store
+    return world, Counter
+
+
+def test_default_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("BIOSIM_CACHE_DIR", str(tmp_path))
+    assert default_cache_dir() == tmp_path
+    monkeypatch.delenv("BIOSIM_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert default_cache_dir() == tmp_path / "xdg" / "biosim" / "results"
+
+
+def test_run_is_memoized(biosim, tmp_path):
+    store = ResultStore(tmp_path)
+    world, Counter = _make_world(biosim, store)
+    world.run(1.0, tick_dt=0.1)
+    assert world.last_run_cached is False
+    calls = Counter.calls
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    again, Counter2 = _make_world(biosim, store)
+    events = []
+    again.on(lambda ev, payload: events.append((ev.value, payload.get("cached"))), replay_safe=True)
+    again.run(1.0, tick_dt=0.1)
+    assert again.last_run_cached is True
+    assert Counter2.calls == 0
+    assert events == [("started", True), ("finished", True)]
+    assert again.current_time == pytest.approx(world.current_time)
+    restored = again.get_outputs("c")["total"].value
+    assert isinstance(restored, np.ndarray)
+    np.testing.assert_allclose(restored, world.get_outputs("c")["total"].value)
+    assert again.collect_visuals() == world.collect_visuals()
+    assert calls > 0
+
+    # The next run catches up silently to the restored time and continues from there.
+    starts = []
+    again.on(lambda ev, payload: starts.append(payload["t"]) if ev.value == "started" else None)
+    again.run(0.5)
+    assert again.last_run_cached is False
+    assert again.current_time == pytest.approx(1.5)
+    assert starts == [pytest.approx(1.0)]
+
+
+def test_second_run_after_replay_continues(biosim, tmp_path):
+    store = ResultStore(tmp_path)
+    plain, _ = _make_world(biosim)
+    plain.run(0.5)
+    plain.run(0.5)
+
+    warm, _ = _make_world(biosim, store)
+    warm.run(0.5)
+    world, _ = _make_world(biosim, store)
+    world.run(0.5)
+    assert world.last_run_cached is True
+    world.run(0.5)
+    assert world.last_run_cached is False
+    assert world.current_time == pytest.approx(1.0)
+    np.testing.assert_allclose(world.get_outputs("c")["total"].value, plain.get_outputs("c")["total"].value)
+
+
+def test_key_covers_args_and_duration(biosim):
+    a, _ = _make_world(biosim, gain=1.0)
+    b, _ = _make_world(biosim, gain=2.0)
+    assert run_key(a, 1.0) != run_key(b, 1.0)
+    assert run_key(a, 1.0) != run_key(a, 2.0)
+    assert run_key(a, 1.0) == run_key(_make_world(biosim, gain=1.0)[0], 1.0)
+    c, _ = _make_world(biosim, gain=1.0)
+    c.setup({"c": {"mode": "fast"}})
+    assert run_key(c, 1.0) != run_key(a, 1.0)
+
+
+def test_key_covers_module_source(biosim, tmp_path, monkeypatch):
+    import importlib
+    import sys
+
+    pkg = tmp_path / "src"
+    pkg.mkdir()
+    code = "from biosim import BioModule\n\nclass Edited(BioModule):\n    min_dt = 0.1\n\n" \
+        "    def advance_to(self, t):\n        pass\n\n    def get_outputs(self):\n        return {}\n"
+    (pkg / "edited_mod.py").write_text(code)
+    monkeypatch.syspath_prepend(str(pkg))
+    import edited_mod
+
+    def key():
+        world = biosim.BioWorld()
+        world.add_biomodule("e", sys.modules["edited_mod"].Edited(), args={})
+        return run_key(world, 1.0)
+
+    before = key()
+    assert before is not None and key() == before
+    (pkg / "edited_mod.py").write_text(code + "\n# edited\n")
+    importlib.reload(edited_mod)
+    assert key() != before
+    monkeypatch.delitem(sys.modules, "edited_mod")
+
+
+def test_listeners_and_uncacheable_modules_skip_restore(biosim, tmp_path):
+    store = ResultStore(tmp_path)
+    _make_world(biosim, store)[0].run(0.5)
+
+    world, Counter = _make_world(biosim, store)
+    ticks = []
+    world.on(lambda ev, payload: ticks.append(ev.value))  # wants every event
+    world.run(0.5)
+    assert world.last_run_cached is False and Counter.calls > 0 and "tick" in ticks
+
+    world, _ = _make_world(biosim, store)
+    world._modules["c"].module.cacheable = False
+    assert run_key(world, 0.5) is None
+
+
+def test_unknown_args_or_continued_runs_are_not_cached(biosim, tmp_path):
+    store = ResultStore(tmp_path)
+    world, _ = _make_world(biosim, store, args=False)
+    assert run_key(world, 1.0) is None
+    world.run(1.0)
+    assert not list(tmp_path.glob("*.json"))
+
+    world, _ = _make_world(biosim, store)
+    world.run(0.5)
+    world.run(0.5)  # continues from t=0.5: not a fresh run
+    assert len(list(tmp_path.glob("*.json"))) == 1
+    world, _ = _make_world(biosim, store)
+    world.run(0.5, use_cache=False)
+    assert world.last_run_cached is False
+
+
+def test_stopped_runs_are_not_stored(biosim, tmp_path):
+    store = ResultStore(tmp_path)
+    world, _ = _make_world(biosim, store)
+    world.on(lambda ev, payload: world.request_stop() if ev.value == "tick" else None)
+    world.run(1.0, tick_dt=0.1)
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_lru_limits(tmp_path):
+    store = ResultStore(tmp_path, max_entries=2)
+    for i, key in enumerate(["a", "b"]):
+        store.put(key, {"i": i})
+        os.utime(tmp_path / f"{key}.json", (time.time() - 100 + i, time.time() - 100 + i))
+    assert store.get("a") == {"i": 0}  # touch: b becomes least recently used
+    store.put("c", {"i": 2})
+    assert "b" not in store
+    assert "a" in store and "c" in store
+
+    small = ResultStore(tmp_path / "small", max_bytes=10)
+    small.put("big", {"payload": "x" * 100})
+    assert "big" not in small
+    assert small.put("bad", {"obj": object()}) is False
+    store.clear()
+    assert store.get("a") is None
+
+
+def test_signal_records_roundtrip(biosim):
+    sig = biosim.BioSignal(source="m", name="x", value=np.float32(1.5), time=0.2)
+    back = signal_from_record("m", "x", signal_to_record(sig))
+    assert back.value.dtype == np.float32 and back.value == 1.5
+    plain = signal_from_record("m", "y", signal_to_record(biosim.BioSignal(source="m", name="y", value=3, time=0.0)))
+    assert plain.value == 3
@@ -0,0 +1,76 @@
+import gzip
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from biosim.simui.assets import IMMUTABLE, PrecompressedStaticFiles, asset_url, load_manifest
+from biosim.simui.build import write_hashed_assets
+
+
+def _client(static_dir):
+    manifest = load_manifest(static_dir)
+    app = FastAPI()
+    app.mount("/static", PrecompressedStaticFiles(directory=str(static_dir), manifest=manifest))
+    return TestClient(app), manifest
+
+
+def test_hashed_asset_is_immutable_and_precompressed(tmp_path):
+    body = b"export const x = 1;\n" * 200
+    (tmp_path / "app.js").write_bytes(body)
+    write_hashed_assets(tmp_path)
+    client, manifest = _client(tmp_path)
+    url = "/" + asset_url(manifest, "app.js")
+    assert url != "/static/app.js"
+
+    r = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["cache-control"] == IMMUTABLE
+    assert r.headers["vary"] == "Accept-Encoding"
+    assert "javascript" in r.headers["content-type"]
+    assert r.content == body  # client transparently decodes
+    assert int(r.headers["content-length"]) == len(gzip.compress(body, compresslevel=9, mtime=0))
+
+
+def test_identity_when_not_accepted(tmp_path):
+    (tmp_path / "app.js").write_bytes(b"// js")
+    write_hashed_assets(tmp_path)
+    client, manifest = _client(tmp_path)
+    r = client.get("/" + asset_url(manifest, "app.js"), headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in r.headers
+    assert r.content == b"// js"
+
+
+def test_unhashed_asset_revalidates(tmp_path):
+    (tmp_path / "app.js").write_bytes(b"// js")
+    client, manifest = _client(tmp_path)
+    assert manifest == {}
+    assert asset_url(manifest, "app.js") == "static/app.js"
+    r = client.get("/static/app.js")
+    assert r.headers["cache-control"] == "no-cache"
+
+
+def test_manifest_ignores_missing_files(tmp_path):
+    (tmp_path / "manifest.json").write_text('{"app.js": "app.deadbeef00.js"}')
+    assert load_manifest(tmp_path) == {}
+
+
+def test_precompressed_variants_answer_conditional_gets(tmp_path):
+    (tmp_path / "app.js").write_bytes(b"export const y = 2;\n" * 200)
+    write_hashed_assets(tmp_path)
+    client, manifest = _client(tmp_path)
+    url = "/" + asset_url(manifest, "app.js")
+
+    plain = client.get(url, headers={"Accept-Encoding": "identity"})
+    gz = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert gz.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+    assert gz.headers["last-modified"] == plain.headers["last-modified"]
+
+    r = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": gz.headers["etag"]})
+    assert r.status_code == 304
+    assert r.headers["cache-control"] == IMMUTABLE
+    r = client.get(url, headers={"Accept-Encoding": "gzip", "If-Modified-Since": gz.headers["last-modified"]})
+    assert r.status_code == 304
+    # Another representation's validator does not match
+    r = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": plain.headers["etag"]})
+    assert r.status_code == 200
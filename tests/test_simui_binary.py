@@ -0,0 +1,78 @@
+"""Tests for biosim.simui.binary – binary WebSocket frames."""
+import json
+import struct
+
+import numpy as np
+
+from biosim.simui.binary import decode_binary_frame, encode_binary_frame
+
+
+def test_roundtrip_extracts_large_arrays():
+    points = [[float(i), i * 0.5] for i in range(100)]
+    heat = np.arange(200, dtype=np.float64).reshape(10, 20)
+    msg = {"type": "tick", "data": {"series": points, "heat": heat, "small": [1, 2, 3], "label": "x"}}
+    frame = encode_binary_frame(msg)
+    out = decode_binary_frame(frame)
+    assert out["type"] == "tick"
+    assert out["data"]["small"] == [1, 2, 3]
+    assert out["data"]["label"] == "x"
+    assert out["data"]["series"].dtype == np.float64
+    assert out["data"]["series"].shape == (100, 2)
+    np.testing.assert_array_equal(out["data"]["series"], np.asarray(points))
+    assert out["data"]["heat"].dtype == np.float64
+    np.testing.assert_array_equal(out["data"]["heat"], heat)
+
+
+def test_float_lists_keep_full_precision_unless_downcast():
+    values = [0.1 * i + 1e-9 for i in range(100)]
+    exact = decode_binary_frame(encode_binary_frame({"v": values}))["v"]
+    assert exact.tolist() == values
+    small = decode_binary_frame(encode_binary_frame({"v": values}, list_dtype="float32"))["v"]
+    assert small.dtype == np.float32
+    assert small.tolist() != values
+
+
+def test_int_lists_stay_int64():
+    ints = [2**53 + i for i in range(100)]
+    out = decode_binary_frame(encode_binary_frame({"i": ints, "rows": [[i, i * 2] for i in range(50)]}))
+    assert out["i"].dtype == np.int64
+    assert out["i"].tolist() == ints
+    assert out["rows"].dtype == np.int64
+    mixed = decode_binary_frame(encode_binary_frame({"m": [1] * 63 + [0.5]}))["m"]
+    assert mixed.dtype == np.float64
+    huge = [2**70] + list(range(99))
+    assert decode_binary_frame(encode_binary_frame({"h": huge}))["h"] == huge
+
+
+def test_buffers_are_aligned_and_described():
+    msg = {"a": np.arange(7, dtype=np.uint8), "b": np.ones(5, dtype=np.float64)}
+    frame = encode_binary_frame(msg, min_elements=1)
+    (header_len,) = struct.unpack_from("<I", frame, 0)
+    header = json.loads(frame[4 : 4 + header_len])
+    assert header["message"] == {"a": {"$ndarray": 0}, "b": {"$ndarray": 1}}
+    base = 4 + header_len
+    base += (-base) % 8
+    assert base % 8 == 0
+    assert [d["dtype"] for d in header["buffers"]] == ["uint8", "float64"]
+    assert all(d["offset"] % 8 == 0 for d in header["buffers"])
+    assert header["buffers"][1]["offset"] == 8
+    assert len(frame) == base + 8 + 40
+
+
+def test_unsupported_dtypes_are_converted():
+    msg = {"f16": np.arange(100, dtype=np.float16), "flags": np.ones(100, dtype=bool), "i64": np.arange(100)}
+    out = decode_binary_frame(encode_binary_frame(msg))
+    assert out["f16"].dtype == np.float64
+    assert out["flags"].dtype == np.uint8
+    assert out["i64"].dtype == np.int64  # maps to BigInt64Array
+
+
+def test_mixed_lists_stay_json():
+    msg = {"mixed": [1, "a"] * 50, "ragged": [[1, 2], [3]] * 50, "bools": [True] * 100}
+    out = decode_binary_frame(encode_binary_frame(msg))
+    assert out == msg
+
+
+def test_unserializable_payload_falls_back_to_str():
+    out = decode_binary_frame(encode_binary_frame({"error": RuntimeError("boom")}))
+    assert out["error"] == "boom"
@@ -211,3 +211,38 @@ class TestMain:
         static_dir = fake_file.parent / "static"
         assert (static_dir / "app.js").exists()
         assert not (static_dir / "app.css").exists()
+
+
+class TestHashedAssets:
+    def test_write_hashed_assets(self, tmp_path):
+        import gzip
+        import json
+
+        (tmp_path / "app.js").write_bytes(b"console.log('v1')")
+        (tmp_path / "app.css").write_bytes(b"body{}")
+        manifest = build_mod.write_hashed_assets(tmp_path)
+        hashed_js = manifest["app.js"]
+        assert hashed_js.startswith("app.") and hashed_js.endswith(".js") and hashed_js != "app.js"
+        assert (tmp_path / hashed_js).read_bytes() == b"console.log('v1')"
+        assert gzip.decompress((tmp_path / f"{hashed_js}.gz").read_bytes()) == b"console.log('v1')"
+        assert json.loads((tmp_path / "manifest.json").read_text()) == manifest
+
+        # A new bundle replaces the old hashed files
+        (tmp_path / "app.js").write_bytes(b"console.log('v2')")
+        manifest2 = build_mod.write_hashed_assets(tmp_path)
+        assert manifest2["app.js"] != hashed_js
+        assert not (tmp_path / hashed_js).exists()
+        assert not (tmp_path / f"{hashed_js}.gz").exists()
+        assert (tmp_path / manifest2["app.css"]).exists()
+
+    def test_assets_only(self, tmp_path, monkeypatch):
+        fake_file = tmp_path / "src" / "biosim" / "simui" / "build.py"
+        fake_file.parent.mkdir(parents=True)
+        fake_file.write_text("")
+        monkeypatch.setattr(build_mod, "__file__", str(fake_file))
+        static_dir = fake_file.parent / "static"
+        assert main(["--assets-only"]) == 1
+        static_dir.mkdir()
+        (static_dir / "app.js").write_bytes(b"// app")
+        assert main(["--assets-only"]) == 0
+        assert (static_dir / "manifest.json").exists()
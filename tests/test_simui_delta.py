@@ -0,0 +1,102 @@
+"""Tests for biosim.simui.delta – visual delta encoding for SSE."""
+from biosim.simui.delta import VisualDeltaEncoder
+from biosim.world import BioWorld, ModuleVisuals
+from biosim.modules import BioModule
+
+
+def _ts(points, name="v", title="T"):
+    return {"render": "timeseries", "data": {"title": title, "series": [{"name": name, "points": points}]}}
+
+
+def _mv(name, rev, visuals):
+    return ModuleVisuals(name=name, module="M", visuals=visuals, encoded=b"", revision=rev)
+
+
+def test_first_delta_is_keyframe():
+    enc = VisualDeltaEncoder()
+    out = enc.delta([_mv("a", 1, [_ts([[0, 1]])])])
+    assert out["keyframe"] is True
+    assert out["modules"]["a"]["visuals"][0]["render"] == "timeseries"
+    assert out["order"] == ["a"]
+
+
+def test_unchanged_modules_are_omitted():
+    enc = VisualDeltaEncoder()
+    entries = [_mv("a", 1, [_ts([[0, 1]])]), _mv("b", 2, [{"render": "bar", "data": {}}])]
+    enc.delta(entries)
+    out = enc.delta(entries)
+    assert out["keyframe"] is False
+    assert out["modules"] == {}
+    assert out["removed"] == []
+
+
+def test_timeseries_growth_is_sent_as_append():
+    enc = VisualDeltaEncoder()
+    points = [[0, 1]]
+    enc.delta([_mv("a", 1, [_ts(points)])])
+    points.extend([[1, 2], [2, 3]])
+    out = enc.delta([_mv("a", 2, [_ts(points)])])
+    assert out["modules"]["a"] == {"module": "M", "rev": 2, "base": 1, "append": {"0": {"0": [[1, 2], [2, 3]]}}}
+
+
+def test_changed_header_or_history_sends_full_update():
+    enc = VisualDeltaEncoder()
+    enc.delta([_mv("a", 1, [_ts([[0, 1]])])])
+    out = enc.delta([_mv("a", 2, [_ts([[0, 1], [1, 2]], title="Other")])])
+    assert "visuals" in out["modules"]["a"]
+    out = enc.delta([_mv("a", 3, [_ts([[0, 1], [1, 9], [2, 2]], title="Other")])])
+    assert "visuals" in out["modules"]["a"]
+
+
+def test_non_timeseries_change_sends_full_update():
+    enc = VisualDeltaEncoder()
+    enc.delta([_mv("a", 1, [{"render": "bar", "data": {"x": 1}}])])
+    out = enc.delta([_mv("a", 2, [{"render": "bar", "data": {"x": 2}}])])
+    assert out["modules"]["a"]["visuals"][0]["data"] == {"x": 2}
+
+
+def test_removed_modules_and_periodic_keyframes():
+    enc = VisualDeltaEncoder(keyframe_interval=2)
+    enc.delta([_mv("a", 1, []), _mv("b", 1, [])])
+    out = enc.delta([_mv("a", 1, [])])
+    assert out["removed"] == ["b"]
+    assert enc.delta([_mv("a", 1, [])])["keyframe"] is False
+    out = enc.delta([_mv("a", 1, [])])
+    assert out["keyframe"] is True
+    assert "a" in out["modules"]
+
+
+def test_keyframe_does_not_change_delta_state():
+    enc = VisualDeltaEncoder()
+    entries = [_mv("a", 1, [_ts([[0, 1]])])]
+    enc.delta(entries)
+    kf = enc.keyframe(entries)
+    assert kf["keyframe"] is True and "visuals" in kf["modules"]["a"]
+    assert enc.delta(entries)["modules"] == {}
+
+
+def test_world_revisions_drive_deltas():
+    class Grow(BioModule):
+        min_dt = 0.1
+
+        def __init__(self):
+            self.points = []
+
+        def advance_to(self, t):
+            self.points.append([t, len(self.points)])
+
+        def get_outputs(self):
+            return {}
+
+        def visualize(self):
+            return {"render": "timeseries", "data": {"series": [{"name": "n", "points": self.points}]}}
+
+    world = BioWorld()
+    world.add_biomodule("g", Grow())
+    enc = VisualDeltaEncoder()
+    world.run(duration=0.1)
+    enc.delta(world.module_visuals())
+    world.run(duration=0.2)
+    out = enc.delta(world.module_visuals())
+    assert list(out["modules"]["g"]["append"]["0"]["0"]) == [[0.2, 1], [0.30000000000000004, 2]]
+    assert enc.delta(world.module_visuals())["modules"] == {}
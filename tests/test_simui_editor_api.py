@@ -106,6 +106,25 @@ class TestGetModules:
         assert "modules" in data
         assert "categories" in data
 
+    def test_modules_conditional_get(self):
+        from biosim.simui.registry import get_default_registry
+
+        client = _make_app()
+        etag = client.get("/api/editor/modules").headers["etag"]
+        r = client.get("/api/editor/modules", headers={"If-None-Match": etag})
+        assert r.status_code == 304
+        assert r.content == b""
+        reg = get_default_registry()
+        with patch.object(reg, "to_json_bytes", side_effect=AssertionError("recomputed")):
+            assert client.get("/api/editor/modules", headers={"If-None-Match": etag}).status_code == 304
+        reg._version += 1
+        try:
+            r = client.get("/api/editor/modules", headers={"If-None-Match": etag})
+            assert r.status_code == 200
+            assert r.headers["etag"] != etag
+        finally:
+            reg._version -= 1
+
 
 class TestGetCurrentConfig:
     def test_no_callback(self):
@@ -221,6 +240,25 @@ class TestApplyConfig:
         r = client.post("/api/editor/apply", json={"graph": graph})
         assert r.json()["ok"] is True
 
+    def test_apply_layout_only_skips_reload(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        cfg = tmp_path / "current.yaml"
+        cfg.write_text("modules:\n  a:\n    class: my.A\n")
+        reloaded = []
+        client = _make_app(config_path=cfg, reload_fn=lambda p: (reloaded.append(p), True)[-1])
+        node = {"id": "a", "type": "my.A", "position": {"x": 40, "y": 10},
+                "data": {"args": {}, "inputs": [], "outputs": []}}
+        r = client.post("/api/editor/apply", json={"graph": {"nodes": [node], "edges": [], "meta": {"title": "T"}}})
+        assert r.json()["ok"] is True
+        assert r.json()["reloaded"] is False
+        assert reloaded == []
+
+        node["data"]["args"] = {"k": 1}
+        r = client.post("/api/editor/apply", json={"graph": {"nodes": [node], "edges": [], "meta": {}}})
+        assert r.json()["reloaded"] is True
+        assert r.json()["changes"]["changed"] == ["a"]
+        assert reloaded == [cfg]
+
     def test_apply_no_path(self):
         app = FastAPI()
         router = build_editor_router(
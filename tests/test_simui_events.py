@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from biosim.simui.events import EventLogWriter, EventRing, read_event_log
+
+
+def _rec(i):
+    return {"id": i, "event": "tick", "payload": {"t": i * 0.1}}
+
+
+class TestEventRing:
+    def test_since_returns_only_newer_records(self):
+        ring = EventRing(10)
+        for i in range(1, 6):
+            ring.append(_rec(i))
+        assert [r["id"] for r in ring.since(3)] == [4, 5]
+        assert [r["id"] for r in ring.since(None)] == [1, 2, 3, 4, 5]
+        assert ring.since(5) == []
+
+    def test_limit_keeps_newest(self):
+        ring = EventRing(10)
+        for i in range(1, 8):
+            ring.append(_rec(i))
+        assert [r["id"] for r in ring.since(None, 3)] == [5, 6, 7]
+        assert [r["id"] for r in ring.since(5, 10)] == [6, 7]
+
+    def test_wraparound_evicts_oldest(self):
+        ring = EventRing(4)
+        for i in range(1, 11):
+            ring.append(_rec(i))
+        assert len(ring) == 4
+        assert ring.last_id == 10
+        assert [r["id"] for r in ring.since(None)] == [7, 8, 9, 10]
+        assert [r["id"] for r in ring.since(2)] == [7, 8, 9, 10]
+        assert [r["id"] for r in ring.since(8)] == [9, 10]
+
+    def test_clear_restarts_ids(self):
+        ring = EventRing(4)
+        for i in range(1, 4):
+            ring.append(_rec(i))
+        ring.clear()
+        assert ring.since(None) == []
+        ring.append(_rec(1))
+        assert [r["id"] for r in ring.since(None)] == [1]
+
+    def test_non_consecutive_id_rejected(self):
+        ring = EventRing(4)
+        ring.append(_rec(1))
+        with pytest.raises(ValueError, match="does not follow"):
+            ring.append(_rec(3))
+
+
+class TestEventLog:
+    def test_write_and_page(self, tmp_path):
+        path = tmp_path / "run.jsonl"
+        writer = EventLogWriter(path, index_every=10)
+        for i in range(1, 101):
+            writer.append(_rec(i))
+        writer.close()
+
+        index = [json.loads(line) for line in (tmp_path / "run.jsonl.idx").read_text().splitlines()]
+        assert [e["id"] for e in index] == list(range(1, 101, 10))
+
+        page = read_event_log(path, limit=25)
+        assert [e["id"] for e in page["events"]] == list(range(1, 26))
+        page = read_event_log(path, since_id=page["next_since_id"], limit=25)
+        assert page["events"][0]["id"] == 26
+        page = read_event_log(path, since_id=95, limit=25)
+        assert [e["id"] for e in page["events"]] == [96, 97, 98, 99, 100]
+        assert page["next_since_id"] == 100
+        assert read_event_log(path, since_id=100)["events"] == []
+
+    def test_seek_uses_index(self, tmp_path):
+        path = tmp_path / "run.jsonl"
+        writer = EventLogWriter(path, index_every=10)
+        for i in range(1, 51):
+            writer.append(_rec(i))
+        writer.close()
+        # Corrupt the head of the file: a reader that seeks via the index never touches it.
+        data = path.read_bytes()
+        first_line = data.index(b"\n")
+        path.write_bytes(b"x" * first_line + data[first_line:])
+        page = read_event_log(path, since_id=30, limit=5)
+        assert [e["id"] for e in page["events"]] == [31, 32, 33, 34, 35]
+
+    def test_missing_index_falls_back_to_scan(self, tmp_path):
+        path = tmp_path / "run.jsonl"
+        writer = EventLogWriter(path)
+        for i in range(1, 6):
+            writer.append(_rec(i))
+        writer.close()
+        (tmp_path / "run.jsonl.idx").unlink()
+        assert [e["id"] for e in read_event_log(path, since_id=3)["events"]] == [4, 5]
+
+    def test_non_json_payload_is_stringified(self, tmp_path):
+        path = tmp_path / "run.jsonl"
+        writer = EventLogWriter(path)
+        writer.append({"id": 1, "event": "error", "payload": {"error": RuntimeError("boom")}})
+        writer.close()
+        (event,) = read_event_log(path)["events"]
+        assert event["payload"]["error"] == "boom"
@@ -3,7 +3,7 @@ import pytest
 from biosim.simui.graph import (
     Position, GraphNode, GraphEdge, ConfigMeta, ConfigGraph,
     _parse_ref, yaml_to_graph, graph_to_yaml, load_config_file,
-    save_config_file, graph_to_json, json_to_graph, auto_layout,
+    save_config_file, graph_to_json, json_to_graph, auto_layout, diff_graphs,
 )
 
 
@@ -336,3 +336,176 @@ class TestAutoLayout:
         # Both should get positions
         for n in result.nodes:
             assert n.position.x >= 0
+
+    @staticmethod
+    def _graph(node_ids, pairs):
+        return ConfigGraph(
+            nodes=[GraphNode(id=i, type="x") for i in node_ids],
+            edges=[
+                GraphEdge(id=f"e{k}", source=u, source_handle="o", target=v, target_handle="i")
+                for k, (u, v) in enumerate(pairs)
+            ],
+        )
+
+    def test_barycenter_removes_crossings(self):
+        graph = self._graph(["a1", "a2", "a3", "b1", "b2", "b3"], [("a1", "b3"), ("a2", "b2"), ("a3", "b1")])
+        pos = {n.id: n.position for n in auto_layout(graph).nodes}
+        a_order = sorted(["a1", "a2", "a3"], key=lambda i: pos[i].y)
+        b_order = sorted(["b1", "b2", "b3"], key=lambda i: pos[i].y)
+        assert b_order == [{"a1": "b3", "a2": "b2", "a3": "b1"}[a] for a in a_order]
+
+    def test_cycle_is_broken_into_layers(self):
+        graph = self._graph(["a", "b", "c", "d"], [("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")])
+        pos = {n.id: n.position for n in auto_layout(graph).nodes}
+        assert pos["a"].x < pos["b"].x < pos["c"].x < pos["d"].x
+
+    def test_positions_cached_by_structure(self):
+        from unittest.mock import patch
+
+        graph = self._graph(["p", "q", "r"], [("p", "q"), ("q", "r")])
+        first = {n.id: (n.position.x, n.position.y) for n in auto_layout(graph).nodes}
+        moved = self._graph(["p", "q", "r"], [("p", "q"), ("q", "r")])
+        moved.nodes[0].args = {"changed": True}  # args do not affect the layout
+        with patch("biosim.simui.graph._layered_positions", side_effect=AssertionError("recomputed")):
+            assert {n.id: (n.position.x, n.position.y) for n in auto_layout(moved).nodes} == first
+        rewired = auto_layout(self._graph(["p", "q", "r"], [("p", "r"), ("r", "q")]))
+        pos = {n.id: n.position for n in rewired.nodes}
+        assert pos["p"].x < pos["r"].x < pos["q"].x
+
+    def test_large_graph_is_fast(self):
+        import random
+        import time
+
+        rng = random.Random(0)
+        ids = [f"n{i}" for i in range(3000)]
+        pairs = [(ids[rng.randrange(max(0, i - 50), i)], ids[i]) for i in range(1, 3000) for _ in range(2)]
+        pairs += [(ids[rng.randrange(3000)], ids[rng.randrange(3000)]) for _ in range(30)]
+        start = time.perf_counter()
+        result = auto_layout(self._graph(ids, pairs))
+        assert time.perf_counter() - start < 3.0
+        assert len({(n.position.x, n.position.y) for n in result.nodes}) == 3000
+
+
+class TestDiffGraphs:
+    def test_diff(self):
+        old = ConfigGraph(
+            nodes=[GraphNode(id="a", type="x.A"), GraphNode(id="b", type="x.B", args={"k": 1})],
+            edges=[GraphEdge(id="e1", source="a", source_handle="out", target="b", target_handle="in")],
+        )
+        new = ConfigGraph(
+            nodes=[
+                GraphNode(id="a", type="x.A", position=Position(5, 5)),
+                GraphNode(id="b", type="x.B", args={"k": 2}),
+                GraphNode(id="c", type="x.C"),
+            ],
+            edges=[GraphEdge(id="e9", source="a", source_handle="out", target="c", target_handle="in")],
+            meta=ConfigMeta(title="changed"),
+        )
+        assert diff_graphs(old, new) == {
+            "added": ["c"],
+            "removed": [],
+            "changed": ["b"],
+            "added_edges": ["a.out -> c.in"],
+            "removed_edges": ["a.out -> b.in"],
+        }
+        assert not any(diff_graphs(old, old).values())
+
+
+def test_yaml_to_graph_expands_pattern_wiring():
+    from biosim.simui.graph import yaml_to_graph
+
+    graph = yaml_to_graph(
+        """
+modules:
+  pop_a: x.Pop
+  pop_b: x.Pop
+  mon_a: x.Mon
+  mon_b: x.Mon
+wiring:
+  - from: "pop_*.spikes"
+    to: ["mon_{i}.in"]
+  - from: "nope_*.spikes"
+    to: ["mon_{i}.in"]
+"""
+    )
+    assert [(e.source, e.target) for e in graph.edges] == [("pop_a", "mon_a"), ("pop_b", "mon_b")]
+    nodes = {n.id: n for n in graph.nodes}
+    assert nodes["pop_a"].outputs == ["spikes"] and nodes["mon_b"].inputs == ["in"]
+
+
+def test_replica_group_is_one_node_and_round_trips():
+    from biosim.simui.graph import diff_graphs, graph_to_json, graph_to_yaml, json_to_graph, yaml_to_graph
+
+    content = """
+modules:
+  col:
+    class: x.Column
+    replicas: 2000
+    args: {seed: "{i}"}
+  inh: {class: x.Column, replicas: 2000}
+  hub: x.Hub
+wiring:
+  - from: col.out
+    to: [inh.in]
+    rule: random_k
+    k: 3
+    seed: 1
+  - from: col.out
+    to: [hub.in]
+  - from: "inh_*.out"
+    to: [hub.in]
+"""
+    graph = yaml_to_graph(content)
+    nodes = {n.id: n for n in graph.nodes}
+    assert list(nodes) == ["col", "inh", "hub"]
+    assert nodes["col"].replicas == 2000 and nodes["hub"].replicas is None
+    assert [(e.source, e.target, e.rule) for e in graph.edges] == [
+        ("col", "inh", {"rule": "random_k", "k": 3, "seed": 1}),
+        ("col", "hub", None),
+        ("inh", "hub", None),  # pattern over replica names collapses onto the group node
+    ]
+
+    again = yaml_to_graph(graph_to_yaml(graph))
+    assert diff_graphs(graph, again) == {
+        "added": [], "removed": [], "changed": [], "added_edges": [], "removed_edges": []
+    }
+    assert json_to_graph(graph_to_json(graph)) == graph
+
+    resized = yaml_to_graph(content.replace("replicas: 2000}", "replicas: 10}"))
+    assert diff_graphs(graph, resized)["changed"] == ["inh"]
+    reseeded = yaml_to_graph(content.replace("seed: 1", "seed: 2"))
+    assert diff_graphs(graph, reseeded)["added_edges"] == ["col.out -> inh.in (rule=random_k, k=3, seed=2)"]
+
+
+@pytest.mark.parametrize(
+    "wiring, count",
+    [
+        ('- from: "pop_*.out"\n    to: ["mon_{i}.inp"]', 3),
+        ('- from: "pop_*.out"\n    to: ["mon_*.inp"]', 9),
+        ('- from: "pop_*.out"\n    to: [mon_0.inp]', 3),
+    ],
+)
+def test_pattern_wiring_over_replica_groups_round_trips(wiring, count):
+    import yaml
+
+    from biosim.wiring import _expanded_modules, _wiring_entries, expand_wiring
+
+    def connections(content):
+        spec = yaml.safe_load(content)
+        names = list(_expanded_modules(spec))
+        return sorted(pair for src, dst in _wiring_entries(spec) for pair in expand_wiring(src, dst, names))
+
+    content = f"""
+modules:
+  pop: {{class: x.Column, replicas: 3}}
+  mon: {{class: x.Column, replicas: 3}}
+wiring:
+  {wiring}
+"""
+    assert len(connections(content)) == count
+    graph = yaml_to_graph(content)
+    assert len(graph.edges) == 1 and (graph.edges[0].source, graph.edges[0].target) == ("pop", "mon")
+    saved = graph_to_yaml(graph)
+    assert connections(saved) == connections(content)
+    assert connections(graph_to_yaml(json_to_graph(graph_to_json(graph)))) == connections(content)
+    assert diff_graphs(graph, yaml_to_graph(saved))["added_edges"] == []
@@ -1,5 +1,6 @@
 """Tests for biosim.simui.interface – 100% coverage."""
 import json
+import threading
 import time
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -10,6 +11,8 @@ from fastapi.testclient import TestClient
 
 from biosim import __version__
 from biosim.world import BioWorld, WorldEvent
+from biosim.simui import fanout
+from biosim.simui.binary import decode_binary_frame
 from biosim.simui.interface import (
     Interface, Number, Button, EventLog, VisualsPanel,
 )
@@ -339,6 +342,200 @@ class TestVisualsEndpoint:
         assert data[0]["visuals"][0]["description"] == "Test vis"
 
 
+class TestWebSocketEndpoint:
+    def test_ws_snapshot_and_tick_frames(self):
+        world = BioWorld()
+        world.add_biomodule("vis", VisualModule())
+        world.run(duration=0.1)
+        app, ui = _make_app(world=world)
+        client = TestClient(app)
+        with client.websocket_connect("/ui/api/ws?min_elements=1") as ws:
+            snap = decode_binary_frame(ws.receive_bytes())
+            assert snap["type"] == "snapshot"
+            assert snap["data"]["visuals"][0]["visuals"][0]["render"] == "bar"
+            ui._listener(WorldEvent.TICK, {"t": 0.2})
+            ui._publish_frame()
+            tick = decode_binary_frame(ws.receive_bytes())
+            assert tick["type"] == "tick"
+        ui.close()
+
+
+class TestEventLogEndpoints:
+    def test_runs_are_logged_and_paged(self, tmp_path):
+        world = _make_world()
+        app, ui = _make_app(world=world, event_log_dir=tmp_path)
+        client = TestClient(app)
+        ui._listener(WorldEvent.STARTED, {"t": 0.0})
+        for i in range(5):
+            ui._listener(WorldEvent.TICK, {"t": 0.1 * i})
+        ui._listener(WorldEvent.FINISHED, {"t": 0.5})
+        ui._clear_event_buffers()  # next run goes to a new file
+        ui._listener(WorldEvent.STARTED, {"t": 0.0})
+
+        logs = client.get("/ui/api/event-logs").json()["logs"]
+        assert len(logs) == 2
+        first = sorted(log["name"] for log in logs)[0]
+        page = client.get(f"/ui/api/event-logs/{first}?since_id=2&limit=3").json()
+        assert [e["id"] for e in page["events"]] == [3, 4, 5]
+        assert page["events"][0]["event"] == "tick"
+        assert page["next_since_id"] == 5
+        ui.close()
+
+    def test_log_is_written_off_the_calling_thread(self, tmp_path, monkeypatch):
+        from biosim.simui.events import EventLogWriter
+
+        writers = []
+        append = EventLogWriter.append
+
+        def recording_append(self, record):
+            writers.append(threading.current_thread().name)
+            append(self, record)
+
+        monkeypatch.setattr(EventLogWriter, "append", recording_append)
+        app, ui = _make_app(event_log_dir=tmp_path)
+        client = TestClient(app)
+        ui._listener(WorldEvent.STARTED, {"t": 0.0})
+        ui._listener(WorldEvent.FINISHED, {"t": 0.1})
+        (log,) = client.get("/ui/api/event-logs").json()["logs"]
+        assert [e["id"] for e in client.get(f"/ui/api/event-logs/{log['name']}").json()["events"]] == [1, 2]
+        assert writers == ["simui-event-log", "simui-event-log"]
+        ui.close()
+
+    def test_unknown_log_is_404(self, tmp_path):
+        app, ui = _make_app(event_log_dir=tmp_path)
+        client = TestClient(app)
+        assert client.get("/ui/api/event-logs/nope.jsonl").status_code == 404
+        assert client.get("/ui/api/event-logs/..%2Fsecret.jsonl").status_code == 404
+
+    def test_disabled_by_default(self):
+        app, ui = _make_app()
+        client = TestClient(app)
+        assert client.get("/ui/api/event-logs").json() == {"logs": []}
+
+
+class TestConditionalGet:
+    def test_spec_etag_and_304(self):
+        world = _make_world()
+        app, ui = _make_app(world=world)
+        client = TestClient(app)
+        r = client.get("/ui/api/spec")
+        etag = r.headers["etag"]
+        assert r.headers["cache-control"] == "no-cache"
+        with patch.object(ui, "_spec", side_effect=AssertionError("recomputed")):
+            r = client.get("/ui/api/spec", headers={"If-None-Match": etag})
+        assert r.status_code == 304
+        assert r.headers["etag"] == etag
+        world.add_biomodule("m2", SimpleModule())
+        r = client.get("/ui/api/spec", headers={"If-None-Match": etag})
+        assert r.status_code == 200
+        assert "m2" in r.json()["modules"]
+
+    def test_status_etag_changes_with_runner(self):
+        app, ui = _make_app()
+        client = TestClient(app)
+        etag = client.get("/ui/api/status").headers["etag"]
+        assert client.get("/ui/api/status", headers={"If-None-Match": f'W/{etag}'}).status_code == 304
+        ui._runner.pause()  # not running: no change
+        assert client.get("/ui/api/status", headers={"If-None-Match": etag}).status_code == 304
+        ui._runner.resume()
+        assert client.get("/ui/api/status", headers={"If-None-Match": etag}).status_code == 200
+
+    def test_visuals_etag_follows_revisions(self):
+        world = BioWorld()
+        module = VisualModule()
+        world.add_biomodule("vis", module)
+        world.run(duration=0.1)
+        app, ui = _make_app(world=world)
+        client = TestClient(app)
+        etag = client.get("/ui/api/visuals").headers["etag"]
+        assert client.get("/ui/api/visuals", headers={"If-None-Match": etag}).status_code == 304
+        # Running again without changing what visualize() returns keeps the revision
+        world.run(duration=0.1)
+        assert client.get("/ui/api/visuals", headers={"If-None-Match": etag}).status_code == 304
+        module.visualize = lambda: {"render": "bar", "data": {"items": [{"label": "b", "value": 2}]}}
+        world.run(duration=0.1)
+        r = client.get("/ui/api/visuals", headers={"If-None-Match": etag})
+        assert r.status_code == 200
+        assert r.json()[0]["visuals"][0]["data"]["items"][0]["label"] == "b"
+
+    def test_star_matches(self):
+        app, ui = _make_app()
+        client = TestClient(app)
+        assert client.get("/ui/api/spec", headers={"If-None-Match": "*"}).status_code == 304
+
+
+class TestCompression:
+    def _big_world(self):
+        class BigVisual(VisualModule):
+            def visualize(self):
+                items = [{"label": f"item{i}", "value": i} for i in range(500)]
+                return {"render": "bar", "data": {"items": items}}
+
+        world = BioWorld()
+        world.add_biomodule("vis", BigVisual())
+        world.run(duration=0.1)
+        return world
+
+    def test_large_visuals_are_gzipped(self):
+        app, ui = _make_app(world=self._big_world())
+        client = TestClient(app)
+        r = client.get("/ui/api/visuals", headers={"Accept-Encoding": "gzip"})
+        assert r.headers["content-encoding"] == "gzip"
+        assert r.headers["etag"].endswith('-gzip"')
+        assert len(r.json()[0]["visuals"][0]["data"]["items"]) == 500
+        # The encoded ETag still validates
+        r2 = client.get("/ui/api/visuals", headers={"If-None-Match": r.headers["etag"]})
+        assert r2.status_code == 304
+
+    def test_small_or_unaccepted_bodies_are_identity(self):
+        app, ui = _make_app(world=self._big_world())
+        client = TestClient(app)
+        r = client.get("/ui/api/visuals", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in r.headers
+        r = client.get("/ui/api/status", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in r.headers
+
+    def test_compression_can_be_disabled(self):
+        app, ui = _make_app(world=self._big_world(), compress_min_size=0)
+        client = TestClient(app)
+        r = client.get("/ui/api/snapshot", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in r.headers
+
+    def test_snapshot_gzipped(self):
+        app, ui = _make_app(world=self._big_world())
+        client = TestClient(app)
+        r = client.get("/ui/api/snapshot", headers={"Accept-Encoding": "gzip"})
+        assert r.headers["content-encoding"] == "gzip"
+        assert r.json()["visuals"][0]["module"] == "BigVisual"
+
+    def test_gzip_stream_flushes_each_chunk(self):
+        import asyncio
+        import zlib
+
+        from biosim.simui.http_cache import gzip_stream
+
+        closed = []
+
+        async def source():
+            try:
+                yield b"data: 1\n\n"
+                yield b"data: 2\n\n"
+            finally:
+                closed.append(True)
+
+        async def collect():
+            d = zlib.decompressobj(31)
+            out = []
+            async for part in gzip_stream(source()):
+                out.append(d.decompress(part))
+            return out
+
+        parts = asyncio.run(collect())
+        assert parts[0] == b"data: 1\n\n"  # decodable without waiting for the end
+        assert b"".join(parts) == b"data: 1\n\ndata: 2\n\n"
+        assert closed == [True]
+
+
 class TestResetEndpoint:
     def test_reset(self):
         app, ui = _make_app()
@@ -383,6 +580,29 @@ class TestListenerAndSSE:
         assert len(ui._events) == 1
         assert ui._last_step is not None
 
+    def test_concurrent_listeners_get_consecutive_ids(self):
+        import threading
+
+        world = _make_world()
+        ui = Interface(world)
+        errors = []
+
+        def emit():
+            try:
+                for _ in range(500):
+                    ui._listener(WorldEvent.STARTED, {})
+            except Exception as exc:  # pragma: no cover - only on a race
+                errors.append(exc)
+
+        threads = [threading.Thread(target=emit) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert ui._event_seq == 2000
+        assert [e["id"] for e in ui._events.since(None)] == list(range(1801, 2001))
+
     def test_listener_non_tick_event(self):
         world = _make_world()
         ui = Interface(world)
@@ -417,16 +637,60 @@ class TestListenerAndSSE:
             return_value={"running": True, "paused": False, "progress": 0.1, "progress_pct": 10.0},
         ):
             ui._listener(WorldEvent.TICK, {"t": 0.1, "progress": 0.1, "progress_pct": 10.0})
+            ui._publish_frame()
         msg = q.get_nowait()
         assert msg["type"] == "tick"
         assert msg["data"]["status"]["progress_pct"] == pytest.approx(10.0)
         assert msg["data"]["event"]["payload"]["progress_pct"] == pytest.approx(10.0)
         ui._unsubscribe_sse(q)
 
+    def test_tick_sse_delta_subscriber(self):
+        world = BioWorld()
+        world.add_biomodule("vis", VisualModule())
+        world.run(duration=0.1)
+        ui = Interface(world)
+        full_q = ui._subscribe_sse()
+        delta_q = ui._subscribe_sse(delta=True)
+        assert delta_q in ui._sse_delta_subscribers
+        ui._listener(WorldEvent.TICK, {"t": 0.1})
+        ui._publish_frame()
+        ui._listener(WorldEvent.TICK, {"t": 0.1})
+        ui._publish_frame()
+        full = full_q.get_nowait()
+        assert full["data"]["visuals"][0]["module"] == "VisualModule"
+        assert "visuals_delta" not in full["data"]
+        first = delta_q.get_nowait()["data"]["visuals_delta"]
+        assert first["keyframe"] is True
+        assert first["modules"]["vis"]["visuals"][0]["render"] == "bar"
+        second = delta_q.get_nowait()["data"]["visuals_delta"]
+        assert second["modules"] == {}
+        ui._unsubscribe_sse(delta_q)
+        assert delta_q not in ui._sse_delta_subscribers
+        ui._unsubscribe_sse(full_q)
+
+    def test_non_tick_event_reaches_delta_subscribers(self):
+        world = _make_world()
+        ui = Interface(world)
+        q = ui._subscribe_sse(delta=True)
+        ui._listener(WorldEvent.STARTED, {"t": 0.0})
+        ui._publish_frame()
+        assert q.get_nowait()["type"] == "event"
+        ui._unsubscribe_sse(q)
+
+    def test_snapshot_json_delta_keyframe(self):
+        world = BioWorld()
+        world.add_biomodule("vis", VisualModule())
+        world.run(duration=0.1)
+        ui = Interface(world)
+        data = json.loads(ui._snapshot_json(delta=True))
+        assert "visuals" not in data
+        assert data["visuals_delta"]["keyframe"] is True
+        assert data["visuals_delta"]["order"] == ["vis"]
+
     def test_collect_visuals_safe_error(self):
         world = _make_world()
         ui = Interface(world)
-        with patch.object(world, "collect_visuals", side_effect=RuntimeError("oops")):
+        with patch.object(world, "snapshot", side_effect=RuntimeError("oops")):
             result = ui._collect_visuals_safe()
             assert result == []
 
@@ -439,6 +703,53 @@ class TestListenerAndSSE:
         assert len(result) > 0
 
 
+class TestPublisher:
+    def test_listener_does_not_broadcast_on_sim_thread(self):
+        world = _make_world()
+        ui = Interface(world)
+        q = ui._subscribe_sse()
+        ui._publisher_stop.set()  # keep the publisher from draining concurrently
+        ui._publish_wakeup.set()
+        ui._publisher.join(timeout=1.0)
+        with patch.object(ui, "_collect_visuals_safe") as collect:
+            for i in range(5):
+                ui._listener(WorldEvent.TICK, {"t": 0.1 * i})
+            assert collect.call_count == 0
+            assert q.empty()
+            ui._publish_frame()
+            assert collect.call_count == 1
+        msg = q.get_nowait()
+        assert msg["data"]["event"]["payload"]["t"] == pytest.approx(0.4)
+        assert q.empty()
+        ui._unsubscribe_sse(q)
+
+    def test_publish_frame_preserves_event_order(self):
+        world = _make_world()
+        ui = Interface(world)
+        q = ui._subscribe_sse()
+        ui.close()
+        ui._publisher.join(timeout=1.0)
+        ui._listener(WorldEvent.STARTED, {"t": 0.0})
+        ui._listener(WorldEvent.TICK, {"t": 0.1})
+        ui._listener(WorldEvent.FINISHED, {"t": 0.1})
+        ui._publish_frame()
+        kinds = [q.get_nowait()["type"] for _ in range(3)]
+        assert kinds == ["event", "tick", "event"]
+        ui._publish_frame()
+        assert q.empty()
+
+    def test_publisher_thread_delivers_ticks(self):
+        world = _make_world()
+        ui = Interface(world, publish_fps=100.0)
+        q = ui._subscribe_sse()
+        ui._listener(WorldEvent.TICK, {"t": 0.1})
+        msg = q.get(timeout=2.0)
+        assert msg["type"] == "tick"
+        ui.close()
+        ui._publisher.join(timeout=1.0)
+        assert not ui._publisher.is_alive()
+
+
 class TestLaunch:
     def test_launch_calls_uvicorn(self):
         world = _make_world()
@@ -468,6 +779,24 @@ class TestLaunch:
             with patch("webbrowser.open", side_effect=RuntimeError("no browser")):
                 ui.launch(open_browser=True)  # Should not raise
 
+    def test_registry_packs_are_warmed_when_the_editor_asks(self):
+        ui = Interface(_make_world(), registry_packs=[("mypack.neuro", "neuro")])
+        mock_uv = MagicMock()
+        registry = MagicMock()
+        registry.to_json_bytes.return_value = b"{}"
+        with patch.dict("sys.modules", {"uvicorn": mock_uv}):
+            with patch("biosim.simui.interface.get_default_registry", return_value=registry):
+                ui.launch()
+                registry.warm.assert_not_called()
+                app = FastAPI()
+                app.include_router(ui._router, prefix="/ui")
+                with patch("biosim.simui.editor_api.get_default_registry", return_value=registry):
+                    client = TestClient(app)
+                    client.get("/ui/api/editor/modules")
+                    client.get("/ui/api/editor/modules")
+        registry.warm.assert_called_once_with([("mypack.neuro", "neuro")])
+        assert Interface(BioWorld()).warm_registry() is None
+
 
 class TestReloadWorld:
     def test_reload_no_config_path(self):
@@ -521,6 +850,158 @@ class TestSSEStream:
         ui._sse_subscribers.discard(q)
 
 
+class TestAsyncSubscriber:
+    def test_cross_thread_delivery_wakes_consumer(self):
+        import asyncio
+        import threading
+
+        world = _make_world()
+        ui = Interface(world)
+
+        async def consume():
+            q = ui._subscribe_sse(loop=asyncio.get_running_loop())
+            assert q in ui._sse_subscribers
+            threading.Timer(0.05, ui._broadcast_sse, args=({"type": "test"},)).start()
+            frame = await q.next_frame(timeout=2.0)
+            ui._unsubscribe_sse(q)
+            return frame.message
+
+        assert asyncio.run(consume())["type"] == "test"
+        ui.close()
+
+    def test_next_frame_times_out(self):
+        import asyncio
+        from biosim.simui.fanout import Subscriber
+
+        async def wait():
+            q = Subscriber(loop=asyncio.get_running_loop())
+            with pytest.raises(asyncio.TimeoutError):
+                await q.next_frame(timeout=0.01)
+
+        asyncio.run(wait())
+
+    def test_closed_loop_is_ignored(self):
+        import asyncio
+        from biosim.simui.fanout import Frame, Subscriber
+
+        loop = asyncio.new_event_loop()
+        q = Subscriber(loop=loop)
+        loop.close()
+        q.offer(Frame({"type": "late"}))  # Should not raise
+        assert q.get_nowait() == {"type": "late"}
+
+
+class TestFanout:
+    def test_message_encoded_once_for_all_subscribers(self):
+        world = _make_world()
+        ui = Interface(world)
+        subs = [ui._subscribe_sse() for _ in range(5)]
+        with patch("biosim.simui.fanout.encode_message", wraps=fanout.encode_message) as enc:
+            ui._broadcast_sse({"type": "test", "data": {"x": 1}})
+        assert enc.call_count == 1
+        frames = [q.get_frame_nowait() for q in subs]
+        assert all(f is frames[0] for f in frames)
+        assert frames[0].encoded() == b'data: {"type":"test","data":{"x":1}}\n\n'
+        for q in subs:
+            ui._unsubscribe_sse(q)
+
+    def test_binary_subscribers_share_encoding(self):
+        world = _make_world()
+        ui = Interface(world)
+        a = ui._subscribe_sse(encoding=("binary", 4))
+        b = ui._subscribe_sse(encoding=("binary", 4))
+        ui._broadcast_sse({"type": "test", "data": {"xs": [1.0, 2.0, 3.0, 4.0]}})
+        fa, fb = a.get_frame_nowait(), b.get_frame_nowait()
+        assert fa is fb
+        decoded = decode_binary_frame(fa.encoded(("binary", 4)))
+        assert decoded["data"]["xs"].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+    def test_drop_oldest_counts_drops(self):
+        q = fanout.Subscriber(maxsize=2)
+        for i in range(5):
+            q.offer(fanout.Frame({"type": "event", "n": i}))
+        assert [q.get_nowait()["n"] for _ in range(2)] == [3, 4]
+        assert q.dropped == 3
+        assert q.delivered == 2
+
+    def test_keep_latest_replaces_pending_tick(self):
+        q = fanout.Subscriber(policy="keep-latest")
+        q.offer(fanout.Frame({"type": "tick", "n": 1}))
+        q.offer(fanout.Frame({"type": "event", "n": 2}))
+        q.offer(fanout.Frame({"type": "tick", "n": 3}))
+        assert [m["n"] for m in (q.get_nowait(), q.get_nowait())] == [2, 3]
+        assert q.empty()
+        assert q.dropped == 1
+
+    def test_block_waits_for_consumer(self):
+        import threading
+
+        q = fanout.Subscriber(maxsize=1, policy="block")
+        q.offer(fanout.Frame({"type": "tick", "n": 1}))
+        t = threading.Thread(target=q.offer, args=(fanout.Frame({"type": "tick", "n": 2}),))
+        t.start()
+        t.join(timeout=0.2)
+        assert t.is_alive()  # publisher is held until the client catches up
+        assert q.get_nowait()["n"] == 1
+        t.join(timeout=2.0)
+        assert not t.is_alive()
+        assert q.get_nowait()["n"] == 2
+        assert q.dropped == 0
+
+    def test_close_releases_blocked_publisher(self):
+        import threading
+
+        q = fanout.Subscriber(maxsize=1, policy="block")
+        q.offer(fanout.Frame({"type": "tick"}))
+        t = threading.Thread(target=q.offer, args=(fanout.Frame({"type": "tick"}),))
+        t.start()
+        q.close()
+        t.join(timeout=2.0)
+        assert not t.is_alive()
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError, match="policy"):
+            fanout.Subscriber(policy="lossy")
+
+    def test_block_subscriber_makes_sim_lossless(self):
+        world = _make_world()
+        ui = Interface(world, publish_fps=30.0)
+        q = ui._subscribe_sse(policy="block", maxsize=1000)
+        for i in range(20):
+            ui._listener(WorldEvent.TICK, {"t": 0.1 * i})
+        ticks = []
+        while len(ticks) < 20:
+            ticks.append(q.get(timeout=2.0)["data"]["event"]["payload"]["t"])
+        assert ticks == pytest.approx([0.1 * i for i in range(20)])
+        assert q.dropped == 0
+        ui._unsubscribe_sse(q)
+        assert ui._lossless_subscribers == 0
+        ui.close()
+
+    def test_subscribers_endpoint_reports_drops(self):
+        world = _make_world()
+        app, ui = _make_app(world=world)
+        q = ui._subscribe_sse(maxsize=1)
+        ui._broadcast_sse({"type": "a"})
+        ui._broadcast_sse({"type": "b"})
+        client = TestClient(app)
+        r = client.get("/ui/api/subscribers")
+        assert r.status_code == 200
+        (stats,) = r.json()["subscribers"]
+        assert stats["id"] == q.id
+        assert stats["transport"] == "sse"
+        assert stats["policy"] == "drop-oldest"
+        assert stats["dropped"] == 1
+        assert stats["queued"] == 1
+        ui._unsubscribe_sse(q)
+
+    def test_stream_rejects_unknown_policy(self):
+        app, _ = _make_app()
+        client = TestClient(app)
+        r = client.get("/ui/api/stream?policy=bogus")
+        assert r.status_code == 400
+
+
 class TestSpecModuleNamesError:
     def test_module_names_exception(self):
         world = _make_world()
@@ -572,29 +1053,174 @@ class TestResetExceptionPath:
 
 
 class TestReloadWorldSuccess:
+    @staticmethod
+    def _write(path, extra=""):
+        from examples.wiring_builder_demo import Eye, LGN
+
+        path.write_text(f"""
+modules:
+  eye:
+    class: "{Eye.__module__}.{Eye.__name__}"
+    min_dt: 0.1
+  lgn:
+    class: "{LGN.__module__}.{LGN.__name__}"
+    min_dt: 0.1
+{extra}wiring:
+  - from: "eye.visual_stream"
+    to: ["lgn.retina"]
+""")
+
     def test_reload_success(self, tmp_path):
-        """_reload_world should succeed with a valid config file."""
+        """_reload_world keeps unchanged modules (and their state) and rebuilds the rest."""
+        import biosim
+        from examples.wiring_builder_demo import Eye
+
         config = tmp_path / "test.yaml"
-        config.write_text("modules: {}\n")
-        world = _make_world()
-        # Add the internal attributes that _reload_world expects
-        world._biomodule_listeners = {"m": None}
-        world.remove_biomodule = MagicMock()
-        world._signal_routes = {}
+        self._write(config)
+        world = BioWorld()
+        biosim.load_wiring(world, config)
+        world.run(0.3)
+        eye = world.module_spec("eye")["module"]
+        lgn = world.module_spec("lgn")["module"]
         ui = Interface(world, config_path=config)
-        with patch("biosim.load_wiring"):
-            result = ui._reload_world()
-        assert result is True
+
+        self._write(config, extra=f"""  eye2:
+    class: "{Eye.__module__}.{Eye.__name__}"
+    min_dt: 0.2
+""")
+        assert ui._reload_world() is True
+        assert world.module_spec("eye")["module"] is eye
+        assert world.module_spec("lgn")["module"] is lgn
+        assert sorted(world.module_names) == ["eye", "eye2", "lgn"]
+        assert world.connections() == [("eye.visual_stream", "lgn.retina")]
+        # The new module joins the next run from the current time.
+        world.run(0.4)
+        assert world.module_spec("eye2")["module"]._outputs["visual_stream"].time == pytest.approx(0.7)
 
     def test_reload_with_new_path(self, tmp_path):
-        """_reload_world should accept a new config path."""
+        """_reload_world should accept a new config path and drop modules it no longer lists."""
         config = tmp_path / "new.yaml"
         config.write_text("modules: {}\n")
         world = _make_world()
-        world._biomodule_listeners = {}
-        world._signal_routes = {}
         ui = Interface(world)
-        with patch("biosim.load_wiring"):
-            result = ui._reload_world(new_config_path=config)
+        result = ui._reload_world(new_config_path=config)
         assert result is True
         assert ui._config_path == config
+        assert world.module_names == []
+
+    def test_reload_invalid_wiring_leaves_world_untouched(self, tmp_path):
+        import biosim
+
+        config = tmp_path / "test.yaml"
+        self._write(config)
+        world = BioWorld()
+        biosim.load_wiring(world, config)
+        before = world.structure_version
+        ui = Interface(world, config_path=config)
+        config.write_text(config.read_text().replace("lgn.retina", "lgn.nope"))
+        assert ui._reload_world() is False
+        assert world.structure_version == before
+        assert world.connections() == [("eye.visual_stream", "lgn.retina")]
+
+
+class TestJobs:
+    @staticmethod
+    def _wait(client, job_id, timeout=5.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            data = client.get(f"/ui/api/jobs/{job_id}").json()
+            if data["state"] in ("succeeded", "failed", "cancelled"):
+                return data
+            time.sleep(0.01)
+        raise AssertionError("job did not finish")
+
+    def test_submit_and_poll_shared_world(self):
+        app, ui = _make_app()
+        client = TestClient(app)
+        resp = client.post("/ui/api/jobs", json={"duration": 0.05, "tick_dt": 0.01})
+        assert resp.status_code == 202
+        job_id = resp.json()["id"]
+        data = self._wait(client, job_id)
+        assert data["state"] == "succeeded"
+        assert data["result"]["sim_time"] == pytest.approx(0.05)
+        listed = client.get("/ui/api/jobs").json()["jobs"]
+        assert [j["id"] for j in listed] == [job_id]
+        assert "result" not in listed[0]
+        assert client.delete(f"/ui/api/jobs/{job_id}").json() == {"ok": False, "reason": "already_finished"}
+        ui.close()
+
+    def test_validation(self):
+        app, ui = _make_app()
+        client = TestClient(app)
+        assert client.post("/ui/api/jobs", json={"duration": -1}).status_code == 400
+        assert client.post("/ui/api/jobs", json={"duration": 1, "priority": "x"}).status_code == 400
+        assert client.post("/ui/api/jobs", json={"duration": 1, "args": [1]}).status_code == 400
+        assert client.post("/ui/api/jobs", json={"duration": 1, "args": {"nope": {}}}).status_code == 400
+        # Known module, but no config to rebuild worlds from
+        resp = client.post("/ui/api/jobs", json={"duration": 1, "args": {"m": {"x": 1}}})
+        assert resp.status_code == 400
+        assert "world factory" in resp.json()["detail"]
+        assert client.get("/ui/api/jobs/missing").status_code == 404
+        assert client.delete("/ui/api/jobs/missing").status_code == 404
+        ui.close()
+
+    def test_arg_overrides_build_fresh_worlds(self, tmp_path):
+        from examples.wiring_builder_demo import Eye
+
+        cfg = tmp_path / "wiring.yaml"
+        cfg.write_text(f"""
+modules:
+  eye:
+    class: "{Eye.__module__}.{Eye.__name__}"
+    min_dt: 0.1
+""")
+        world = BioWorld()
+        import biosim
+        biosim.load_wiring(world, cfg)
+        app, ui = _make_app(world, config_path=cfg, job_concurrency=2)
+        client = TestClient(app)
+        ok = client.post("/ui/api/jobs", json={"duration": 0.2, "args": {"eye": {}}, "priority": 3}).json()
+        bad = client.post("/ui/api/jobs", json={"duration": 0.2, "args": {"eye": {"bogus": 1}}}).json()
+        assert self._wait(client, ok["id"])["state"] == "succeeded"
+        failed = self._wait(client, bad["id"])
+        assert failed["state"] == "failed"
+        assert "bogus" in failed["error"]["message"]
+        assert world.current_time == 0.0  # the shared world was not used
+        ui.close()
+
+    def test_cancel_running_job(self):
+        world = BioWorld()
+        world.add_biomodule("m", SimpleModule(slow=True))
+        app, ui = _make_app(world)
+        client = TestClient(app)
+        job_id = client.post("/ui/api/jobs", json={"duration": 100.0, "tick_dt": 0.1}).json()["id"]
+        deadline = time.time() + 5
+        while not ui._runner.status()["running"] and time.time() < deadline:
+            time.sleep(0.01)
+        assert client.post("/ui/api/run", json={"duration": 1.0}).status_code == 409
+        assert client.delete(f"/ui/api/jobs/{job_id}").json() == {"ok": True}
+        assert self._wait(client, job_id)["state"] == "cancelled"
+        ui.close()
+
+
+class TestResultsCache:
+    def test_run_restores_cached_result(self, tmp_path):
+        from biosim.results import ResultStore
+
+        store = ResultStore(tmp_path)
+        world = BioWorld()
+        world.add_biomodule("v", VisualModule(), args={})
+        world.result_store = store
+        # Populate the store from an identical world, then run through the UI.
+        seed = BioWorld()
+        seed.add_biomodule("v", VisualModule(), args={})
+        seed.result_store = store
+        seed.run(0.5)
+        app, ui = _make_app(world)
+        client = TestClient(app)
+        assert client.post("/ui/api/run", json={"duration": 0.5}).status_code == 202
+        ui._runner.join(timeout=5)
+        assert world.last_run_cached is True
+        assert world.current_time == pytest.approx(0.5)
+        assert client.get("/ui/api/visuals").json()[0]["module"] == "VisualModule"
+        ui.close()
@@ -7,7 +7,8 @@ from biosim.modules import BioModule
 from biosim.simui.registry import (
     ArgSpec, ModuleSpec, _get_arg_type_str,
     introspect_module, discover_pack_modules,
-    ModuleRegistry, get_default_registry,
+    ModuleRegistry, RegistryCache, get_default_registry,
+    entry_point_specs, pack_manifest,
 )
 
 
@@ -156,6 +157,19 @@ class TestModuleRegistry:
         assert mod_data["name"] == "SimpleModule"
         assert "args" in mod_data
 
+    def test_to_json_bytes_cached_per_version(self):
+        import json
+
+        reg = ModuleRegistry()
+        reg.register_module(SimpleModule, "test.Simple", "test")
+        first = reg.to_json_bytes()
+        assert json.loads(first) == json.loads(json.dumps(reg.to_json(), default=str))
+        assert reg.to_json_bytes() is first
+        version = reg.version
+        reg.register_module(NoArgsModule, "test.NoArgs", "test")
+        assert reg.version == version + 1
+        assert "test.NoArgs" in json.loads(reg.to_json_bytes())["modules"]
+
     def test_get_missing(self):
         reg = ModuleRegistry()
         assert reg.get("nonexistent") is None
@@ -323,3 +337,232 @@ class TestGetDefaultRegistry:
         r1 = get_default_registry()
         r2 = get_default_registry()
         assert r1 is r2
+
+
+PACK_SOURCE = """
+from biosim.modules import BioModule
+
+
+class Neuron(BioModule):
+    \"\"\"A cached neuron.\"\"\"
+
+    def __init__(self, rate: float = 0.5):
+        self.min_dt = rate
+
+    def advance_to(self, t):
+        pass
+
+    def get_outputs(self):
+        return {}
+
+    def inputs(self):
+        return {"current"}
+
+    def outputs(self):
+        return {"spikes"}
+"""
+
+
+@pytest.fixture
+def cached_pack(tmp_path, monkeypatch):
+    """A throwaway importable pack plus a RegistryCache under tmp_path."""
+    import sys
+
+    pkg = tmp_path / "src" / "cachepack"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("from .cells import Neuron\n__all__ = ['Neuron']\n")
+    (pkg / "cells.py").write_text(PACK_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path / "src"))
+    yield pkg, RegistryCache(tmp_path / "registry.json")
+    for name in [m for m in sys.modules if m == "cachepack" or m.startswith("cachepack.")]:
+        del sys.modules[name]
+
+
+class TestRegistryCache:
+    def test_unchanged_pack_is_served_without_import(self, cached_pack):
+        from unittest.mock import patch
+
+        pkg, cache = cached_pack
+        ModuleRegistry(cache=cache).register_pack("cachepack", "neuro")
+        assert cache.path.is_file()
+
+        reg = ModuleRegistry(cache=RegistryCache(cache.path))
+        with patch("biosim.simui.registry.import_module", side_effect=AssertionError("imported")):
+            reg.register_pack("cachepack", "cells")
+        spec = reg.get("cachepack.Neuron")
+        assert spec.category == "cells"
+        assert spec.inputs == {"current"} and spec.outputs == {"spikes"}
+        assert spec.args[0].name == "rate" and spec.args[0].default == 0.5
+        assert reg.to_json()["categories"] == {"cells": ["cachepack.Neuron"]}
+
+    def test_touched_but_identical_file_stays_fresh(self, cached_pack):
+        import os
+
+        pkg, cache = cached_pack
+        ModuleRegistry(cache=cache).register_pack("cachepack", "neuro")
+        st = os.stat(pkg / "cells.py")
+        os.utime(pkg / "cells.py", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert RegistryCache(cache.path).load_pack("cachepack", "neuro") is not None
+
+    def test_edited_module_invalidates_entry(self, cached_pack):
+        pkg, cache = cached_pack
+        ModuleRegistry(cache=cache).register_pack("cachepack", "neuro")
+        (pkg / "cells.py").write_text(PACK_SOURCE.replace('"spikes"', '"spikes", "rate"'))
+        assert RegistryCache(cache.path).load_pack("cachepack", "neuro") is None
+
+    def test_other_version_or_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "registry.json"
+        path.write_text('{"format": 1, "biosim": "0.0.0-other", "packs": {"p": {}}}')
+        assert RegistryCache(path).load_pack("p", "c") is None
+        path.write_text("not json")
+        assert RegistryCache(path).load_pack("p", "c") is None
+
+    def test_failed_import_is_not_cached(self, tmp_path):
+        cache = RegistryCache(tmp_path / "registry.json")
+        ModuleRegistry(cache=cache).register_pack("nonexistent.pack.xyz", "test")
+        assert not cache.path.exists()
+
+    def test_default_path_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("BIOSIM_REGISTRY_CACHE", str(tmp_path / "r.json"))
+        assert RegistryCache().path == tmp_path / "r.json"
+
+    def test_warm_in_background(self, cached_pack):
+        pkg, cache = cached_pack
+        reg = ModuleRegistry(cache=cache)
+        version = reg.version
+        thread = reg.warm([("cachepack", "neuro"), ("nonexistent.pack.xyz", "x")])
+        thread.join(timeout=10)
+        assert reg.get("cachepack.Neuron") is not None
+        assert reg.version > version
+        assert reg.warm([("cachepack", "neuro")], background=False) is None
+        assert reg.by_category()["neuro"] == [reg.get("cachepack.Neuron")]
+
+
+@pytest.fixture
+def pack_dir(tmp_path, monkeypatch):
+    """Write importable packs under tmp_path; returns ``write(name, init_source, cells_source)``."""
+    import sys
+
+    root = tmp_path / "packs"
+    root.mkdir()
+    monkeypatch.syspath_prepend(str(root))
+    names = []
+
+    def write(name, init, cells=PACK_SOURCE):
+        pkg = root / name
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text(init)
+        (pkg / "cells.py").write_text(cells)
+        names.append(name)
+
+    yield write
+    for mod in [m for m in sys.modules if m.split(".")[0] in names]:
+        del sys.modules[mod]
+
+
+class TestRegisterPacks:
+    def test_parallel_discovery_streams_reports(self, pack_dir, tmp_path):
+        pack_dir("fastpack", "from .cells import Neuron\n__all__ = ['Neuron']\n")
+        pack_dir("hangpack", "import time\ntime.sleep(60)\n")
+        pack_dir(
+            "slowclass",
+            "from .cells import Neuron, Stuck\n__all__ = ['Neuron', 'Stuck']\n",
+            PACK_SOURCE + "\n\nclass Stuck(Neuron):\n    def __init__(self):\n        import time\n        time.sleep(60)\n",
+        )
+        cache = RegistryCache(tmp_path / "registry.json")
+        reg = ModuleRegistry(cache=cache)
+        seen = []
+        reports = reg.register_packs(
+            [("fastpack", "a"), ("hangpack", "b"), ("slowclass", "c"), ("nonexistent.pack.xyz", "d")],
+            workers=4,
+            pack_timeout=10.0,
+            class_timeout=1.0,
+            slow_seconds=30.0,
+            on_report=lambda r: seen.append((r.pack_path, reg.get(f"{r.pack_path}.Neuron") is not None)),
+        )
+        by_pack = {r.pack_path: r for r in reports}
+        assert [r.pack_path for r in reports] == [p for p, _ in seen]
+        assert reports[-1].pack_path == "hangpack"  # reported last, after the others streamed in
+        assert by_pack["fastpack"].status == "ok" and by_pack["fastpack"].modules == 1
+        assert ("fastpack", True) in seen  # registered before its report was delivered
+        assert by_pack["hangpack"].status == "timeout"
+        assert by_pack["nonexistent.pack.xyz"].status == "error"
+        assert "ModuleNotFoundError" in by_pack["nonexistent.pack.xyz"].error
+        slow = by_pack["slowclass"]
+        assert slow.status == "ok" and slow.modules == 1
+        assert slow.failures == {"slowclass.Stuck": "timed out after 1s"}
+        assert slow.class_seconds["slowclass.Stuck"] >= 0.9
+        assert reg.get("slowclass.Neuron").category == "c"
+        assert reg.pack_reports()["hangpack"].status == "timeout"
+
+        # Discovered packs are cached; a second pass does not start workers.
+        again = ModuleRegistry(cache=RegistryCache(cache.path))
+        assert [r.status for r in again.register_packs([("fastpack", "a")])] == ["cached"]
+
+    def test_slow_pack_is_flagged(self, pack_dir):
+        pack_dir("plainpack", "from .cells import Neuron\n")
+        (report,) = ModuleRegistry().register_packs([("plainpack", "p")], slow_seconds=0.0)
+        assert report.slow and report.status == "ok"
+        assert report.to_dict()["class_seconds"].keys() == {"plainpack.Neuron"}
+
+
+@pytest.fixture
+def installed_plugin(tmp_path, monkeypatch):
+    """An installed-looking ``neuro-plugin`` distribution whose package must never be imported."""
+    import json
+    import sys
+
+    site = tmp_path / "site"
+    pkg = site / "neuroplug"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("raise RuntimeError('plugin imported')\n")
+    (pkg / "biosim-modules.json").write_text(json.dumps({
+        "category": "neuro",
+        "modules": {
+            "Neuron": {
+                "description": "Spiking neuron.",
+                "inputs": ["current"],
+                "outputs": ["spikes"],
+                "args": [{"name": "rate", "type": "float", "default": 0.5}],
+            }
+        },
+    }))
+    info = site / "neuro_plugin-1.0.dist-info"
+    info.mkdir()
+    (info / "METADATA").write_text("Metadata-Version: 2.1\nName: neuro-plugin\nVersion: 1.0\n")
+    (info / "entry_points.txt").write_text(
+        "[biosim.modules]\nNeuron = neuroplug.cells:Neuron\nSynapse = neuroplug.cells:Synapse\nBroken = neuroplug\n"
+    )
+    (info / "RECORD").write_text(
+        "neuroplug/__init__.py,,\nneuroplug/biosim-modules.json,,\nneuro_plugin-1.0.dist-info/METADATA,,\n"
+    )
+    monkeypatch.syspath_prepend(str(site))
+    yield
+    assert "neuroplug" not in sys.modules
+
+
+class TestEntryPoints:
+    def test_specs_from_manifest_without_import(self, installed_plugin):
+        specs = entry_point_specs()
+        neuron = specs["neuroplug.cells.Neuron"]
+        assert neuron.name == "Neuron" and neuron.category == "neuro"
+        assert neuron.description == "Spiking neuron."
+        assert neuron.inputs == {"current"} and neuron.outputs == {"spikes"}
+        assert neuron.args[0].default == 0.5 and neuron.args[0].type == "float"
+        # Not described in the manifest: listed with unknown ports.
+        synapse = specs["neuroplug.cells.Synapse"]
+        assert synapse.inputs == set() and synapse.category == "neuro"
+        assert "neuroplug.Broken" not in specs and len(specs) == 2
+
+    def test_register_entry_points(self, installed_plugin):
+        reg = ModuleRegistry()
+        assert reg.register_entry_points() == 2
+        assert sorted(reg.to_json()["categories"]["neuro"]) == ["neuroplug.cells.Neuron", "neuroplug.cells.Synapse"]
+        assert ModuleRegistry().register_entry_points("biosim.nothing-here") == 0
+
+    def test_pack_manifest_round_trips(self, cached_pack):
+        manifest = pack_manifest("cachepack", "neuro")
+        assert manifest["category"] == "neuro"
+        neuron = manifest["modules"]["Neuron"]
+        assert neuron["inputs"] == ["current"] and neuron["outputs"] == ["spikes"]
+        assert neuron["args"][0]["name"] == "rate"
@@ -226,3 +226,147 @@ class TestProgressHelpers:
         assert status.sim_remaining == pytest.approx(0.7)
         assert status.progress == pytest.approx(0.3)
         assert status.progress_pct == pytest.approx(30.0)
+
+
+def _wait_job(mgr, job_id, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = mgr.get_job(job_id)
+        if job.done:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+class TestJobQueue:
+    def test_shared_world_jobs_run_in_order(self):
+        world = _make_world_with_module()
+        started = []
+        mgr = SimulationManager(world, on_job_start=lambda: started.append(1))
+        a = mgr.submit_job(duration=0.05, tick_dt=0.01)
+        b = mgr.submit_job(duration=0.05)
+        assert _wait_job(mgr, a.id).state == "succeeded"
+        job_b = _wait_job(mgr, b.id)
+        assert job_b.state == "succeeded"
+        assert job_b.result["sim_time"] == pytest.approx(0.1)
+        assert _wait_job(mgr, a.id).result["tick_count"] > 0
+        assert started == [1, 1]
+        mgr.close_jobs()
+
+    def test_shared_world_rejects_args(self):
+        mgr = SimulationManager(_make_world_with_module())
+        with pytest.raises(ValueError, match="world factory"):
+            mgr.submit_job(duration=0.1, args={"m": {"x": 1}})
+        assert mgr.accepts_job_args is False
+
+    def test_shared_world_waits_for_interactive_run(self):
+        world = _make_world_with_module(slow=True)
+        mgr = SimulationManager(world)
+        assert mgr.start_run(duration=0.2, tick_dt=0.05)
+        job = mgr.submit_job(duration=0.01)
+        time.sleep(0.02)
+        assert mgr.get_job(job.id).state == "running"  # dequeued, waiting for the world
+        assert _wait_job(mgr, job.id).state == "succeeded"
+        mgr.close_jobs()
+
+    def test_priority_order(self):
+        order = []
+        gate = __import__("threading").Event()
+
+        def factory(overrides):
+            order.append(overrides.get("m", {}).get("tag"))
+            if overrides.get("m", {}).get("tag") == "blocker":
+                gate.wait(5)
+            return _make_world_with_module()
+
+        mgr = SimulationManager(BioWorld(), world_factory=factory, job_concurrency=1)
+        blocker = mgr.submit_job(duration=0.01, args={"m": {"tag": "blocker"}})
+        time.sleep(0.05)
+        low = mgr.submit_job(duration=0.01, args={"m": {"tag": "low"}}, priority=0)
+        high = mgr.submit_job(duration=0.01, args={"m": {"tag": "high"}}, priority=5)
+        assert mgr.queue_position(high.id) == 0
+        assert mgr.queue_position(low.id) == 1
+        gate.set()
+        for job in (blocker, low, high):
+            assert _wait_job(mgr, job.id).state == "succeeded"
+        assert order == ["blocker", "high", "low"]
+        assert mgr.queue_position(low.id) is None
+        mgr.close_jobs()
+
+    def test_concurrency_with_factory(self):
+        active, peak = [0], [0]
+        lock = __import__("threading").Lock()
+        import biosim
+
+        class Slow(biosim.BioModule):
+            def __init__(self):
+                self.min_dt = 0.01
+
+            def advance_to(self, t):
+                time.sleep(0.002)
+
+            def get_outputs(self):
+                return {}
+
+        def factory(overrides):
+            world = BioWorld()
+            world.add_biomodule("m", Slow())
+
+            def track(ev, payload):
+                with lock:
+                    if ev.value == "started":
+                        active[0] += 1
+                        peak[0] = max(peak[0], active[0])
+                    elif ev.value in ("finished", "stopped", "error"):
+                        active[0] -= 1
+
+            world.on(track)
+            return world
+
+        mgr = SimulationManager(BioWorld(), world_factory=factory, job_concurrency=3)
+        jobs = [mgr.submit_job(duration=0.1) for _ in range(3)]
+        for job in jobs:
+            assert _wait_job(mgr, job.id).state == "succeeded"
+        assert peak[0] >= 2
+        mgr.close_jobs()
+
+    def test_cancel_queued_and_running(self):
+        world = _make_world_with_module(slow=True)
+        mgr = SimulationManager(world)
+        running = mgr.submit_job(duration=100.0, tick_dt=0.1)
+        queued = mgr.submit_job(duration=0.1)
+        deadline = time.time() + 5
+        while not mgr._status.running and time.time() < deadline:
+            time.sleep(0.01)
+        assert mgr.cancel_job(queued.id)
+        assert mgr.get_job(queued.id).state == "cancelled"
+        assert mgr.cancel_job(running.id)
+        assert _wait_job(mgr, running.id).state == "cancelled"
+        assert mgr.cancel_job(running.id) is False
+        assert mgr.cancel_job("missing") is False
+        mgr.close_jobs()
+
+    def test_factory_error_fails_job(self):
+        def factory(overrides):
+            raise ValueError("bad args")
+
+        mgr = SimulationManager(BioWorld(), world_factory=factory)
+        job = _wait_job(mgr, mgr.submit_job(duration=0.1).id)
+        assert job.state == "failed"
+        assert job.to_dict()["error"] == {"message": "bad args"}
+        mgr.close_jobs()
+
+    def test_history_is_bounded(self):
+        mgr = SimulationManager(_make_world_with_module(), job_history=2)
+        ids = [mgr.submit_job(duration=0.01).id for _ in range(4)]
+        _wait_job(mgr, ids[-1])
+        mgr.submit_job(duration=0.01)
+        assert len(mgr.jobs()) <= 2 + 1
+        assert mgr.get_job(ids[0]) is None
+        mgr.close_jobs()
+
+    def test_closed_queue_rejects(self):
+        mgr = SimulationManager(_make_world_with_module())
+        mgr.close_jobs()
+        with pytest.raises(RuntimeError):
+            mgr.submit_job(duration=0.1)
@@ -0,0 +1,289 @@
+"""Tests for biosim.simui.sessions (multi-session host)."""
+import json
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from biosim.modules import BioModule
+from biosim.simui.sessions import SessionHost, process_rss_mb
+from biosim.world import BioWorld
+
+
+class SlowModule(BioModule):
+    def __init__(self):
+        self.min_dt = 0.01
+
+    def advance_to(self, t):
+        time.sleep(0.002)
+
+    def get_outputs(self):
+        return {}
+
+
+def _world():
+    world = BioWorld()
+    world.add_biomodule("m", SlowModule())
+    return world
+
+
+def _host(**kwargs):
+    host = SessionHost(_world, **kwargs)
+    app = FastAPI()
+    host.mount(app, "/ui")
+    return host, TestClient(app)
+
+
+def test_process_rss_mb():
+    rss = process_rss_mb()
+    assert rss is None or rss > 0
+
+
+def test_sessions_are_isolated():
+    host, client = _host()
+    try:
+        a = client.post("/ui/sessions").json()
+        b = client.post("/ui/sessions").json()
+        assert a["id"] != b["id"]
+        assert a["url"] == f"/ui/s/{a['id']}/"
+        sa, sb = host._sessions[a["id"]], host._sessions[b["id"]]
+        assert sa.interface._world is not sb.interface._world
+        assert sa.interface._runner is not sb.interface._runner
+
+        assert client.get(f"/ui/s/{a['id']}/api/status").json()["running"] is False
+        spec = client.get(f"/ui/s/{a['id']}/api/spec").json()
+        assert spec["title"]
+        assert client.get(f"/ui/s/{a['id']}/").status_code == 200
+        assert client.get(f"/ui/s/{a['id']}", follow_redirects=False).status_code == 307
+        assert client.get("/ui/s/unknown/api/status").status_code == 404
+
+        listed = {s["id"]: s for s in client.get("/ui/sessions").json()["sessions"]}
+        assert listed[a["id"]]["state"] == "idle"
+    finally:
+        host.close()
+
+
+def test_new_redirects_to_session():
+    host, client = _host()
+    try:
+        resp = client.get("/ui/new", follow_redirects=False)
+        assert resp.status_code == 303
+        assert resp.headers["location"].startswith("s/")
+        assert len(host._sessions) == 1
+        assert "BioSim sessions" in client.get("/ui/").text
+    finally:
+        host.close()
+
+
+def test_max_running_returns_429():
+    host, client = _host(max_running=1)
+    try:
+        a = client.post("/ui/sessions").json()["id"]
+        b = client.post("/ui/sessions").json()["id"]
+        assert client.post(f"/ui/s/{a}/api/run", json={"duration": 5.0, "tick_dt": 0.01}).json()["ok"]
+        resp = client.post(f"/ui/s/{b}/api/run", json={"duration": 5.0, "tick_dt": 0.01})
+        assert resp.status_code == 429
+        assert resp.json()["reason"] == "too_many_running"
+    finally:
+        host.close()
+
+
+def test_max_running_covers_jobs_and_concurrent_runs():
+    import threading
+
+    host, client = _host(max_running=1)
+    try:
+        a = client.post("/ui/sessions").json()["id"]
+        b = client.post("/ui/sessions").json()["id"]
+        codes = []
+        barrier = threading.Barrier(2)
+
+        def start(sid):
+            barrier.wait()
+            codes.append(client.post(f"/ui/s/{sid}/api/run", json={"duration": 0.5, "tick_dt": 0.01}).status_code)
+
+        threads = [threading.Thread(target=start, args=(sid,)) for sid in (a, b)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sorted(codes) == [202, 429]
+
+        job = client.post(f"/ui/s/{a}/api/jobs", json={"duration": 0.05, "tick_dt": 0.01}).json()["id"]
+        job_b = client.post(f"/ui/s/{b}/api/jobs", json={"duration": 0.05, "tick_dt": 0.01}).json()["id"]
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            states = [client.get(f"/ui/s/{sid}/api/jobs/{jid}").json()["state"] for sid, jid in ((a, job), (b, job_b))]
+            if states == ["succeeded", "succeeded"]:
+                break
+            assert sum(host._sessions[s].running for s in (a, b)) <= 1  # jobs wait for the slot too
+            time.sleep(0.01)
+        assert states == ["succeeded", "succeeded"]
+    finally:
+        host.close()
+
+
+def test_open_requests_keep_session_alive():
+    host, client = _host(idle_ttl=60)
+    try:
+        sid = client.post("/ui/sessions").json()["id"]
+        session = host._lookup(sid)  # e.g. an open SSE stream
+        assert host.reap(now=time.monotonic() + 120) == []
+        host._release(session)
+        assert host.reap(now=time.monotonic() + 120) == [sid]
+    finally:
+        host.close()
+
+
+def test_world_is_built_outside_the_host_lock():
+    import threading
+
+    building = threading.Event()
+    release = threading.Event()
+    slow = {"on": False}
+
+    def factory():
+        if slow["on"]:
+            building.set()
+            release.wait(5)
+        return _world()
+
+    host = SessionHost(factory)
+    app = FastAPI()
+    host.mount(app, "/ui")
+    client = TestClient(app)
+    try:
+        sid = client.post("/ui/sessions").json()["id"]
+        slow["on"] = True
+        creator = threading.Thread(target=host.create_session)
+        creator.start()
+        assert building.wait(5)
+        assert client.get(f"/ui/s/{sid}/api/status").status_code == 200  # not blocked by the build
+        release.set()
+        creator.join(5)
+        assert len(host._sessions) == 2
+    finally:
+        release.set()
+        host.close()
+
+
+def test_max_sessions_evicts_lru_idle(tmp_path):
+    host, client = _host(max_sessions=2, checkpoint_dir=tmp_path)
+    try:
+        a = client.post("/ui/sessions").json()["id"]
+        b = client.post("/ui/sessions").json()["id"]
+        client.get(f"/ui/s/{a}/api/status")  # touch a, so b is the LRU
+        c = client.post("/ui/sessions").json()["id"]
+        assert set(host._sessions) == {a, c}
+        listed = {s["id"]: s["state"] for s in host.sessions()}
+        assert listed[b] == "evicted"
+        assert (tmp_path / f"{b}.json").is_file()
+    finally:
+        host.close()
+
+
+def test_session_limit_with_all_running_is_503():
+    host, client = _host(max_sessions=1, max_running=4)
+    try:
+        a = client.post("/ui/sessions").json()["id"]
+        client.post(f"/ui/s/{a}/api/run", json={"duration": 5.0, "tick_dt": 0.01})
+        resp = client.post("/ui/sessions")
+        assert resp.status_code == 503
+    finally:
+        host.close()
+
+
+def test_memory_limit_evicts_then_refuses():
+    usage = {"mb": 10.0}
+    host, client = _host(max_memory_mb=100, memory_probe=lambda: usage["mb"])
+    try:
+        a = client.post("/ui/sessions").json()["id"]
+        usage["mb"] = 500.0
+        assert client.post("/ui/sessions").status_code == 503
+        assert a not in host._sessions  # idle session was evicted first
+        usage["mb"] = 10.0
+        assert client.post("/ui/sessions").status_code == 200
+    finally:
+        host.close()
+
+
+def test_reap_checkpoints_and_restores(tmp_path):
+    host, client = _host(idle_ttl=60, checkpoint_dir=tmp_path)
+    try:
+        sid = client.post("/ui/sessions").json()["id"]
+        assert host.reap(now=time.monotonic() + 1) == []
+        assert host.reap(now=time.monotonic() + 120) == [sid]
+        assert sid not in host._sessions
+
+        data = json.loads(client.get(f"/ui/sessions/{sid}/checkpoint").content)
+        assert data["id"] == sid
+        assert "status" in data["snapshot"]
+
+        # Revisiting the id resets the session: rebuilt from the factory, checkpoint dropped.
+        assert client.get(f"/ui/s/{sid}/api/status").status_code == 200
+        assert host._sessions[sid].restored
+        assert not (tmp_path / f"{sid}.json").exists()
+        listed = {s["id"]: s for s in client.get("/ui/sessions").json()["sessions"]}
+        assert listed[sid]["reset"] is True and listed[sid]["state"] == "idle"
+        assert client.get("/ui/sessions/missing/checkpoint").status_code == 404
+    finally:
+        host.close()
+
+
+def test_reap_skips_running_sessions():
+    host, client = _host(idle_ttl=0)
+    try:
+        sid = client.post("/ui/sessions").json()["id"]
+        client.post(f"/ui/s/{sid}/api/run", json={"duration": 5.0, "tick_dt": 0.01})
+        assert host.reap(now=time.monotonic() + 10) == []
+    finally:
+        host.close()
+
+
+def test_delete_session():
+    host, client = _host()
+    try:
+        sid = client.post("/ui/sessions").json()["id"]
+        assert client.delete(f"/ui/sessions/{sid}").json() == {"ok": True}
+        assert client.delete(f"/ui/sessions/{sid}").status_code == 404
+        # Without checkpoints an evicted id can still be revisited.
+        assert client.get(f"/ui/s/{sid}/api/status").status_code == 200
+        assert client.get(f"/ui/sessions/{sid}/checkpoint").status_code == 404
+    finally:
+        host.close()
+
+
+def test_session_lookup_runs_off_the_event_loop():
+    import asyncio
+
+    host, client = _host()
+    on_loop = []
+    lookup = host._lookup
+
+    def spy(session_id):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return lookup(session_id)
+
+    host._lookup = spy
+    try:
+        sid = client.post("/ui/sessions").json()["id"]
+        client.delete(f"/ui/sessions/{sid}")
+        assert client.get(f"/ui/s/{sid}/api/status").status_code == 200  # restored via create_session
+        assert on_loop == [False]
+    finally:
+        host.close()
+
+
+@pytest.mark.parametrize("suffix", ["api/events", "api/visuals"])
+def test_session_read_endpoints(suffix):
+    host, client = _host()
+    try:
+        sid = client.post("/ui/sessions").json()["id"]
+        assert client.get(f"/ui/s/{sid}/{suffix}").status_code == 200
+    finally:
+        host.close()
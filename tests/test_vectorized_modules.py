@@ -0,0 +1,144 @@
+"""VectorizableModule instances fused into batches by BioWorld."""
+import numpy as np
+import pytest
+
+from biosim.modules import BioModule, VectorizableModule
+from biosim.signals import BioSignal
+from biosim.world import BioWorld
+
+
+class Leaky(VectorizableModule):
+    calls = 0
+
+    def __init__(self, v0: float = 0.0, min_dt: float = 0.1):
+        self.min_dt = min_dt
+        self.v0 = v0
+
+    def inputs(self):
+        return {"in"}
+
+    def outputs(self):
+        return {"v"}
+
+    def initial_state(self):
+        return {"v": self.v0}
+
+    @classmethod
+    def advance_batch(cls, states, inputs, t):
+        cls.calls += 1
+        states["v"] += (inputs["in"] - states["v"]) * 0.5
+        return {"v": states["v"].copy()}
+
+    def visualize(self):
+        return {"render": "bar", "data": {"items": [{"label": "v", "value": self.state["v"]}]}}
+
+
+class Drive(BioModule):
+    def __init__(self, value: float):
+        self.min_dt = 0.1
+        self.value = value
+
+    def advance_to(self, t: float) -> None:
+        return
+
+    def get_outputs(self):
+        return {"out": BioSignal(source="drive", name="out", value=self.value, time=0.0)}
+
+
+class Sink(BioModule):
+    def __init__(self):
+        self.min_dt = 0.1
+        self.seen = []
+
+    def set_inputs(self, signals):
+        self.seen.append(signals["in"].value)
+
+    def advance_to(self, t: float) -> None:
+        return
+
+    def get_outputs(self):
+        return {}
+
+
+def _world(n=4, fuse=True):
+    world = BioWorld()
+    world.fuse_batches = fuse
+    world.add_biomodule("drive", Drive(1.0))
+    for i in range(n):
+        world.add_biomodule(f"leaky_{i}", Leaky(v0=float(i)))
+        world.connect("drive.out", f"leaky_{i}.in")
+    world.add_biomodule("sink", Sink())
+    world.connect("leaky_2.v", "sink.in")
+    return world
+
+
+def test_instances_are_fused_and_stay_addressable():
+    world = _world()
+    Leaky.calls = 0
+    world.run(0.3)
+    assert list(world.batch_groups().values()) == [[f"leaky_{i}" for i in range(4)]]
+    assert Leaky.calls == 3  # one call per step for all four
+    assert "leaky_3" in world.module_names
+    v = world.get_outputs("leaky_2")["v"]
+    assert v.source == "leaky_2" and v.value == pytest.approx(1.0 + (2.0 - 1.0) * 0.125)
+    assert world._modules["leaky_2"].module.state == {"v": v.value}
+    assert [mv.name for mv in world.module_visuals()] == [f"leaky_{i}" for i in range(4)]
+    assert world.collect_visuals()[0]["visuals"][0]["data"]["items"][0]["value"] == pytest.approx(0.875)
+
+
+def test_fused_matches_unfused():
+    fused, plain = _world(fuse=True), _world(fuse=False)
+    fused.run(1.0)
+    plain.run(1.0)
+    assert plain.batch_groups() == {}
+    for i in range(4):
+        assert fused.get_outputs(f"leaky_{i}")["v"].value == pytest.approx(plain.get_outputs(f"leaky_{i}")["v"].value)
+    assert fused._modules["sink"].module.seen == pytest.approx(plain._modules["sink"].module.seen)
+
+
+def test_only_homogeneous_instances_fuse():
+    world = BioWorld()
+    world.add_biomodule("a", Leaky())
+    world.add_biomodule("b", Leaky())
+    world.add_biomodule("slow", Leaky(min_dt=0.2))
+    world.add_biomodule("urgent", Leaky(), priority=5)
+    world.run(0.4)
+    assert list(world.batch_groups().values()) == [["a", "b"]]
+    assert world._modules["slow"].last_time == pytest.approx(0.4)
+    assert world.get_outputs("urgent")["v"].value == 0.0  # unfused, unconnected: input defaults to 0
+
+
+def test_remove_fused_member_keeps_its_state():
+    world = _world()
+    world.run(0.2)
+    removed = world.remove_biomodule("leaky_1")
+    assert removed.state["v"] == pytest.approx(world.get_outputs("leaky_0")["v"].value + 0.25)
+    assert list(world.batch_groups().values()) == [["leaky_0", "leaky_2", "leaky_3"]]
+    world.run(0.1)
+    assert world._modules["leaky_3"].module.state["v"] == pytest.approx(1.0 + 2.0 * 0.125)
+    for name in ("leaky_0", "leaky_2", "leaky_3"):
+        world.remove_biomodule(name)
+    assert world.batch_groups() == {}
+    world.run(0.1)
+
+
+def test_array_state_rows():
+    class Vec(Leaky):
+        def initial_state(self):
+            return {"v": np.full(3, self.v0)}
+
+    world = BioWorld()
+    for i in range(3):
+        world.add_biomodule(f"vec_{i}", Vec(v0=float(i)))
+    world.run(0.1)
+    (key,) = world.batch_groups()
+    assert world._batches[key].states["v"].shape == (3, 3)
+    assert world.get_outputs("vec_2")["v"].value.tolist() == [1.0, 1.0, 1.0]
+
+
+def test_advance_batch_is_abstract():
+    class NoBatch(VectorizableModule):
+        min_dt = 0.1
+
+    with pytest.raises(TypeError, match="advance_batch"):
+        NoBatch()
@@ -146,3 +146,132 @@ def test_visuals_description_is_preserved(biosim):
     collected = world.collect_visuals()
     assert collected[0]["module"] == "WithDescription"
     assert collected[0]["visuals"][0]["description"] == "hello"
+
+
+def test_collect_visuals_cached_until_module_advances(biosim):
+    world = biosim.BioWorld()
+
+    class Counting(biosim.BioModule):
+        def __init__(self):
+            self.min_dt = 0.1
+            self.calls = 0
+
+        def advance_to(self, t: float) -> None:
+            return
+
+        def get_outputs(self):
+            return {}
+
+        def visualize(self):
+            self.calls += 1
+            return {"render": "text", "data": {"text": str(self.calls)}}
+
+    mod = Counting()
+    world.add_biomodule("c", mod)
+    world.run(duration=0.1, tick_dt=0.1)
+
+    first = world.collect_visuals()
+    second = world.collect_visuals()
+    assert mod.calls == 1
+    assert first == second
+
+    world.run(duration=0.1, tick_dt=0.1)
+    third = world.collect_visuals()
+    assert mod.calls == 2
+    assert third[0]["visuals"][0]["data"]["text"] == "2"
+
+
+def test_collect_visuals_respects_visual_version(biosim):
+    world = biosim.BioWorld()
+
+    class SlowMonitor(biosim.BioModule):
+        def __init__(self):
+            self.min_dt = 0.1
+            self.calls = 0
+            self.visual_version = 0
+
+        def advance_to(self, t: float) -> None:
+            return
+
+        def get_outputs(self):
+            return {}
+
+        def visualize(self):
+            self.calls += 1
+            return {"render": "text", "data": {"text": "svg"}}
+
+    mod = SlowMonitor()
+    world.add_biomodule("mon", mod)
+    world.run(duration=0.5, tick_dt=0.1)
+    world.collect_visuals()
+    world.run(duration=0.5, tick_dt=0.1)
+    world.collect_visuals()
+    assert mod.calls == 1
+
+    mod.visual_version = 1
+    world.collect_visuals()
+    assert mod.calls == 2
+
+
+def test_collect_visuals_cache_cleared_on_setup(biosim):
+    world = biosim.BioWorld()
+
+    class Stateful(biosim.BioModule):
+        def __init__(self):
+            self.min_dt = 0.1
+            self.label = "before"
+
+        def advance_to(self, t: float) -> None:
+            return
+
+        def get_outputs(self):
+            return {}
+
+        def visualize(self):
+            return {"render": "text", "data": {"text": self.label}}
+
+    mod = Stateful()
+    world.add_biomodule("s", mod)
+    world.setup()
+    assert world.collect_visuals()[0]["visuals"][0]["data"]["text"] == "before"
+    mod.label = "after"
+    world.setup()
+    assert world.collect_visuals()[0]["visuals"][0]["data"]["text"] == "after"
+
+
+def test_collect_visuals_returns_copies_and_invalidates(biosim):
+    world = biosim.BioWorld()
+
+    class Gauge(biosim.BioModule):
+        def __init__(self):
+            self.min_dt = 0.1
+            self.level = 0.0
+
+        def set_inputs(self, signals):
+            if "level" in signals:
+                self.level = float(signals["level"].value)
+
+        def advance_to(self, t: float) -> None:
+            return
+
+        def get_outputs(self):
+            return {}
+
+        def visualize(self):
+            return {"render": "text", "data": {"text": str(self.level)}}
+
+    mod = Gauge()
+    world.add_biomodule("g", mod)
+    world.setup()
+
+    first = world.collect_visuals()
+    first[0]["visuals"][0]["data"]["text"] = "mutated"
+    assert world.collect_visuals()[0]["visuals"][0]["data"]["text"] == "0.0"
+
+    world.set_inputs("g", {"level": biosim.BioSignal(source="ui", name="level", value=2.0, time=0.0)})
+    assert world.collect_visuals()[0]["visuals"][0]["data"]["text"] == "2.0"
+
+    mod.level = 3.0
+    assert world.collect_visuals()[0]["visuals"][0]["data"]["text"] == "2.0"
+    world.invalidate_visuals("g")
+    assert world.collect_visuals()[0]["visuals"][0]["data"]["text"] == "3.0"
@@ -87,3 +87,58 @@ def test_normalize_empty_list():
 def test_normalize_all_invalid():
     result = normalize_visuals([{"bad": True}])
     assert result == []
+
+
+def test_validate_numpy_payload():
+    import numpy as np
+
+    ok, msg = validate_visual_spec(
+        {"render": "heatmap", "data": {"values": np.arange(4.0).reshape(2, 2), "max": np.float64(3.0), "n": np.int64(4)}}
+    )
+    assert ok is True
+    assert msg is None
+
+
+def test_encode_json_numpy_without_orjson(monkeypatch):
+    import json
+    import numpy as np
+    from biosim import visuals
+
+    monkeypatch.setattr(visuals, "_orjson", None)
+    raw = visuals.encode_json({"a": np.array([1, 2]), "b": np.int32(3)})
+    assert json.loads(raw) == {"a": [1, 2], "b": 3}
+    ok, msg = visuals.validate_visual_spec({"render": "bar", "data": {"x": set([1])}})
+    assert ok is False
+    assert "JSON-serializable" in msg
+
+
+def test_normalize_and_encode_matches_normalized():
+    import json
+    from biosim.visuals import normalize_and_encode_visuals
+
+    normed, raw = normalize_and_encode_visuals(
+        [{"render": "bar", "data": {"x": 1}, "extra": True}, {"bad": True}, {"render": "text", "data": {}, "description": "d"}]
+    )
+    assert json.loads(raw) == normed
+    assert normed[0] == {"render": "bar", "data": {"x": 1}}
+
+
+def test_world_collect_visuals_json(biosim):
+    import json
+
+    class Vis(biosim.BioModule):
+        min_dt = 0.1
+
+        def advance_to(self, t):
+            pass
+
+        def get_outputs(self):
+            return {}
+
+        def visualize(self):
+            return {"render": "bar", "data": {"items": [{"label": "a", "value": 1}]}}
+
+    world = biosim.BioWorld()
+    world.add_biomodule("v", Vis())
+    world.run(duration=0.1)
+    assert json.loads(world.collect_visuals_json()) == world.collect_visuals()
@@ -68,3 +68,124 @@ def test_wiring_builder_connects_by_names_and_topics(biosim):
 
     assert calls["lgn"] >= 1
     assert calls["sc"] >= 1
+
+
+def _pattern_world(biosim, n):
+    class Pop(biosim.BioModule):
+        def __init__(self):
+            self.min_dt = 0.1
+
+        def outputs(self):
+            return {"spikes"}
+
+        def advance_to(self, t: float) -> None:
+            return
+
+        def get_outputs(self):
+            return {}
+
+    class Mon(biosim.BioModule):
+        def __init__(self):
+            self.min_dt = 0.1
+            self.port_calls = 0
+
+        def inputs(self):
+            self.port_calls += 1
+            return {"in"}
+
+        def advance_to(self, t: float) -> None:
+            return
+
+        def get_outputs(self):
+            return {}
+
+    world = biosim.BioWorld()
+    builder = biosim.WiringBuilder(world)
+    for i in range(n):
+        builder.add(f"pop_{i}", Pop())
+        builder.add(f"mon_{i}", Mon())
+    return world, builder
+
+
+def test_pattern_wiring_one_to_one(biosim):
+    world, builder = _pattern_world(biosim, 3)
+    builder.connect("pop_*.spikes", ["mon_{i}.in"]).apply()
+    assert world.connections() == [(f"pop_{i}.spikes", f"mon_{i}.in") for i in range(3)]
+
+
+def test_pattern_wiring_fan_out_and_name_placeholder(biosim):
+    from biosim.wiring import expand_wiring
+
+    names = ["pop_a", "pop_b", "mon_a", "mon_b", "log"]
+    assert expand_wiring("pop_?.spikes", ["mon_*.in", "{name}.feedback"], names) == [
+        ("pop_a.spikes", "mon_a.in"),
+        ("pop_a.spikes", "mon_b.in"),
+        ("pop_a.spikes", "pop_a.feedback"),
+        ("pop_b.spikes", "mon_a.in"),
+        ("pop_b.spikes", "mon_b.in"),
+        ("pop_b.spikes", "pop_b.feedback"),
+    ]
+    with pytest.raises(KeyError, match="matches no modules"):
+        expand_wiring("x_*.out", ["log.in"], names)
+    with pytest.raises(KeyError, match="matches no modules"):
+        expand_wiring("log.out", ["mon_z*.in"], names)
+    with pytest.raises(KeyError, match="unknown module 'mon_c'"):
+        expand_wiring("pop_*.spikes", ["mon_{i}.in"], names + ["pop_c"])
+
+
+def test_pattern_wiring_validates_ports_once_per_module(biosim):
+    world, builder = _pattern_world(biosim, 50)
+    builder.connect("pop_*.spikes", ["mon_{i}.in"])
+    builder.connect("pop_*.spikes", ["mon_{i}.in"])
+    builder.apply()
+    assert len(world.connections()) == 100
+    assert {m.port_calls for m in builder.registry.values() if hasattr(m, "port_calls")} == {1}
+
+    _, builder = _pattern_world(biosim, 2)
+    with pytest.raises(ValueError, match="no input port 'bad'"):
+        builder.connect("pop_*.spikes", ["mon_{i}.bad"]).apply()
+
+
+def test_connect_many(biosim):
+    world, builder = _pattern_world(biosim, 3)
+    builder.connect_many([("pop_0.spikes", "mon_1.in"), ("pop_1.spikes", ["mon_0.in", "mon_2.in"])]).apply()
+    assert sorted(world.connections()) == [
+        ("pop_0.spikes", "mon_1.in"),
+        ("pop_1.spikes", "mon_0.in"),
+        ("pop_1.spikes", "mon_2.in"),
+    ]
+    version = world.structure_version
+    assert world.connect_many([]) == 0 and world.structure_version == version
+    # All-or-nothing: a bad entry leaves the world unchanged.
+    with pytest.raises(KeyError):
+        world.connect_many([("pop_2.spikes", "mon_0.in"), ("pop_2.spikes", "nope.in")])
+    with pytest.raises(ValueError):
+        world.connect_many([("pop_2", "mon_0.in")])
+    assert len(world.connections()) == 3
+
+
+def test_pattern_wiring_from_spec(biosim):
+    world = biosim.BioWorld()
+    biosim.build_from_spec(
+        world,
+        {
+            "modules": {
+                "eye_l": "examples.wiring_builder_demo.Eye",
+                "eye_r": "examples.wiring_builder_demo.Eye",
+                "lgn_l": "examples.wiring_builder_demo.LGN",
+                "lgn_r": "examples.wiring_builder_demo.LGN",
+            },
+            "wiring": [{"from": "eye_*.visual_stream", "to": ["lgn_{i}.retina"]}],
+        },
+    )
+    assert world.connections() == [("eye_l.visual_stream", "lgn_l.retina"), ("eye_r.visual_stream", "lgn_r.retina")]
+
+
+def test_wiring_ten_thousand_modules_is_fast(biosim):
+    import time
+
+    world, builder = _pattern_world(biosim, 5000)
+    start = time.perf_counter()
+    builder.connect("pop_*.spikes", ["mon_{i}.in"]).apply()
+    assert time.perf_counter() - start < 2.0
+    assert len(world.connections()) == 5000
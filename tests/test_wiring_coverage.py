@@ -215,3 +215,107 @@ def test_build_from_spec_with_priority_and_min_dt(biosim):
     }
     builder = build_from_spec(world, spec)
     assert "eye" in builder.registry
+
+
+class TestUpdateFromSpec:
+    @staticmethod
+    def _spec(gain=1, wiring=True, extra=None):
+        modules = {
+            "src": {"class": "examples.wiring_builder_demo.Eye", "min_dt": 0.1},
+            "dst": {"class": "examples.wiring_builder_demo.LGN", "min_dt": 0.1},
+        }
+        modules.update(extra or {})
+        spec = {"modules": modules}
+        if wiring:
+            spec["wiring"] = [{"from": "src.visual_stream", "to": ["dst.retina"]}]
+        return spec
+
+    def test_noop_keeps_everything(self, biosim):
+        from biosim.wiring import update_from_spec
+
+        world = BioWorld()
+        build_from_spec(world, self._spec())
+        modules = {n: world.module_spec(n)["module"] for n in world.module_names}
+        version = world.structure_version
+        changes = update_from_spec(world, self._spec())
+        assert changes["kept"] == ["src", "dst"]
+        assert changes["added"] == changes["removed"] == changes["replaced"] == []
+        assert changes["connected"] == changes["disconnected"] == []
+        assert world.structure_version == version
+        assert all(world.module_spec(n)["module"] is m for n, m in modules.items())
+
+    def test_changed_args_and_edges(self, biosim):
+        from biosim.wiring import update_from_spec
+
+        world = BioWorld()
+        build_from_spec(world, self._spec())
+        src = world.module_spec("src")["module"]
+        spec = self._spec(wiring=False)
+        spec["modules"]["dst"]["min_dt"] = 0.2
+        changes = update_from_spec(world, spec)
+        assert changes["replaced"] == ["dst"]
+        assert changes["kept"] == ["src"]
+        assert changes["disconnected"] == ["src.visual_stream -> dst.retina"]
+        assert world.module_spec("src")["module"] is src
+        assert world.module_spec("dst")["min_dt"] == 0.2
+        assert world.connections() == []
+
+        changes = update_from_spec(world, self._spec())
+        assert changes["replaced"] == ["dst"]  # min_dt back to the module default
+        assert changes["connected"] == ["src.visual_stream -> dst.retina"]
+        assert world.connections() == [("src.visual_stream", "dst.retina")]
+
+    def test_added_and_removed(self, biosim):
+        from biosim.wiring import update_from_spec
+
+        world = BioWorld()
+        build_from_spec(world, self._spec())
+        extra = {"other": "examples.wiring_builder_demo.Eye"}
+        changes = update_from_spec(world, {"modules": extra})
+        assert changes["added"] == ["other"]
+        assert sorted(changes["removed"]) == ["dst", "src"]
+        assert world.module_names == ["other"]
+
+    def test_invalid_spec_does_not_modify_world(self, biosim):
+        from biosim.wiring import update_from_spec
+
+        world = BioWorld()
+        build_from_spec(world, self._spec())
+        bad = self._spec()
+        bad["wiring"] = [{"from": "src.visual_stream", "to": ["dst.missing"]}]
+        with pytest.raises(ValueError):
+            update_from_spec(world, bad)
+        assert world.connections() == [("src.visual_stream", "dst.retina")]
+        with pytest.raises(ValueError):
+            update_from_spec(world, {"modules": {"x": 5}})
+        assert sorted(world.module_names) == ["dst", "src"]
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"dst": {"class": "examples.wiring_builder_demo.LGN", "min_dt": 0}},
+            {"dst": {"class": "examples.wiring_builder_demo.Missing"}},
+            {"new": {"class": "examples.wiring_builder_demo.Eye", "min_dt": -1}},
+        ],
+    )
+    def test_bad_module_leaves_world_unchanged(self, biosim, change):
+        from biosim.wiring import update_from_spec
+
+        world = BioWorld()
+        build_from_spec(world, self._spec())
+        modules = {n: world.module_spec(n)["module"] for n in world.module_names}
+        bad = self._spec(extra=change)
+        del bad["modules"]["src"]  # would be removed if the update went ahead
+        with pytest.raises((ValueError, ImportError, AttributeError)):
+            update_from_spec(world, bad)
+        assert world.connections() == [("src.visual_stream", "dst.retina")]
+        assert {n: world.module_spec(n)["module"] for n in world.module_names} == modules
+
+    def test_reload_wiring(self, biosim, tmp_path):
+        from biosim.wiring import reload_wiring
+
+        cfg = tmp_path / "w.yaml"
+        cfg.write_text("modules:\n  e: examples.wiring_builder_demo.Eye\n")
+        world = BioWorld()
+        assert reload_wiring(world, cfg)["added"] == ["e"]
+        assert reload_wiring(world, cfg)["kept"] == ["e"]
@@ -484,3 +484,50 @@ def test_stop_requested_after_wait(biosim):
     world.run(duration=1000.0, tick_dt=0.01)
     t.join(timeout=2.0)
     assert WorldEvent.STOPPED in events
+
+
+def test_remove_biomodule_and_disconnect(biosim):
+    """remove_biomodule drops its schedule, outputs and connections; disconnect removes one edge."""
+    world = BioWorld()
+    for name in ("a", "b", "c"):
+        world.add_biomodule(name, _make_module(biosim))
+    world.connect("a.out", "b.in")
+    world.connect("a.out", "c.in")
+    world.connect("b.out", "c.other")
+    world.run(0.2)
+    version = world.structure_version
+
+    assert world.disconnect("a.out", "c.in") is True
+    assert world.disconnect("a.out", "c.in") is False
+    assert sorted(world.connections()) == [("a.out", "b.in"), ("b.out", "c.other")]
+
+    removed = world.remove_biomodule("b")
+    assert removed is not None
+    assert world.module_names == ["a", "c"]
+    assert world.connections() == []
+    assert all(item[3] != "b" for item in world._queue)
+    assert world.structure_version > version
+    with pytest.raises(KeyError):
+        world.remove_biomodule("b")
+    world.run(0.2)
+    assert world.current_time == pytest.approx(0.4)
+
+
+def test_add_biomodule_after_setup_is_scheduled(biosim):
+    seen = []
+
+    class Late(biosim.BioModule):
+        min_dt = 0.1
+
+        def advance_to(self, t):
+            seen.append(round(t, 6))
+
+        def get_outputs(self):
+            return {}
+
+    world = BioWorld()
+    world.add_biomodule("a", _make_module(biosim))
+    world.run(0.3)
+    world.add_biomodule("late", Late())
+    world.run(0.2)
+    assert seen == [0.4, 0.5]
@@ -0,0 +1,148 @@
+"""Tests for snapshots published by BioWorld at tick boundaries."""
+import threading
+
+import pytest
+from biosim.signals import BioSignal
+from biosim.world import BioWorld, WorldEvent
+
+
+def _counter_module(biosim):
+    class Counter(biosim.BioModule):
+        def __init__(self):
+            self.min_dt = 0.1
+            self.count = 0
+            self.visualize_calls = 0
+            self.t = 0.0
+
+        def advance_to(self, t):
+            self.count += 1
+            self.t = t
+
+        def get_outputs(self):
+            return {"count": BioSignal(source="c", name="count", value=self.count, time=self.t)}
+
+        def visualize(self):
+            self.visualize_calls += 1
+            return {"render": "bar", "data": {"items": [{"label": "n", "value": self.count}]}}
+
+    return Counter()
+
+
+def test_snapshot_disabled_builds_from_live_state(biosim):
+    world = BioWorld()
+    world.add_biomodule("c", _counter_module(biosim))
+    world.run(duration=0.3)
+    snap = world.snapshot()
+    assert snap.signals["c"]["count"].value == 3
+    assert snap.visuals[0].visuals[0]["data"]["items"][0]["value"] == 3
+    assert world.snapshot() is not snap  # not retained while publishing is off
+
+
+def test_snapshot_is_immutable(biosim):
+    world = BioWorld()
+    world.add_biomodule("c", _counter_module(biosim))
+    world.snapshot_interval = 0.0
+    world.run(duration=0.1)
+    snap = world.snapshot()
+    with pytest.raises(TypeError):
+        snap.signals["c"] = {}  # type: ignore[index]
+    with pytest.raises(TypeError):
+        snap.signals["c"]["count"] = None  # type: ignore[index]
+    assert snap.visuals_json == world.collect_visuals_json()
+
+
+def test_published_at_every_tick_when_interval_zero(biosim):
+    world = BioWorld()
+    module = _counter_module(biosim)
+    world.add_biomodule("c", module)
+    world.snapshot_interval = 0.0
+    seen = []
+
+    def listener(ev, payload):
+        if ev == WorldEvent.TICK:
+            snap = world.snapshot()
+            seen.append((snap.time, snap.signals["c"]["count"].value))
+
+    world.on(listener)
+    world.run(duration=0.3)
+    assert seen == [(pytest.approx(0.1), 1), (pytest.approx(0.2), 2), (pytest.approx(0.3), 3)]
+
+
+def test_readers_do_not_touch_live_modules_during_run(biosim):
+    world = BioWorld()
+    module = _counter_module(biosim)
+    world.add_biomodule("c", module)
+    world.snapshot_interval = 3600.0  # only forced publications (start, pause, finish)
+    calls = []
+
+    def listener(ev, payload):
+        if ev == WorldEvent.TICK:
+            before = module.visualize_calls
+            snap = world.snapshot()
+            calls.append(module.visualize_calls - before)
+            assert snap.time == 0.0  # published at STARTED
+
+    world.on(listener)
+    world.run(duration=0.5)
+    assert calls and all(c == 0 for c in calls)
+    # FINISHED publishes the final state
+    assert world.snapshot().signals["c"]["count"].value == 5
+
+
+def test_pause_publishes_current_state(biosim):
+    world = BioWorld()
+    world.add_biomodule("c", _counter_module(biosim))
+    world.snapshot_interval = 3600.0
+    paused = threading.Event()
+
+    def listener(ev, payload):
+        if ev == WorldEvent.TICK and payload["t"] >= 0.2 - 1e-9 and not paused.is_set():
+            paused.set()
+            world.request_pause()
+
+    world.on(listener)
+    t = threading.Thread(target=world.run, kwargs={"duration": 1.0})
+    t.start()
+    assert paused.wait(2.0)
+    for _ in range(200):
+        if world.snapshot().time > 0:
+            break
+        threading.Event().wait(0.01)
+    assert world.snapshot().time == pytest.approx(0.2)
+    world.request_resume()
+    t.join(2.0)
+    assert world.snapshot().time == pytest.approx(1.0)
+
+
+def test_setup_and_add_invalidate_snapshot(biosim):
+    world = BioWorld()
+    world.add_biomodule("c", _counter_module(biosim))
+    world.snapshot_interval = 0.0
+    world.run(duration=0.2)
+    snap = world.snapshot()
+    assert world.snapshot() is snap
+    world.add_biomodule("d", _counter_module(biosim))
+    assert world.snapshot() is not snap
+    assert "d" in [mv.name for mv in world.snapshot().visuals]
+
+
+def test_readers_never_build_snapshots(biosim):
+    world = BioWorld()
+    module = _counter_module(biosim)
+    world.add_biomodule("c", module)
+    world.snapshot_interval = 0.0
+    empty = world.snapshot()
+    assert empty.seq == 0 and empty.visuals == ()
+    assert module.visualize_calls == 0
+
+    world.setup()
+    published = world.snapshot()
+    assert published.seq > 0
+    calls = module.visualize_calls
+    module.visual_version = 1
+    assert world.snapshot() is published
+    assert module.visualize_calls == calls
+
+    world.invalidate_visuals("c")
+    assert world.snapshot() is not published
+    assert module.visualize_calls == calls + 1